@@ -0,0 +1,6 @@
+"""Compatibility wrapper for `pods.cockpit.signal_store`."""
+
+from __future__ import annotations
+
+from services.cockpit.signal_store import *  # type: ignore  # noqa: F401,F403
+
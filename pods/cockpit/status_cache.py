@@ -0,0 +1,6 @@
+"""Compatibility wrapper for `pods.cockpit.status_cache`."""
+
+from __future__ import annotations
+
+from services.cockpit.status_cache import *  # type: ignore  # noqa: F401,F403
+
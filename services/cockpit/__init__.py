@@ -5,6 +5,8 @@ Lightweight observability helpers for Axiom pods.
 Modules:
 - cockpit_reporter: Per‑pod signaling helpers (ready/error/heartbeat/custom JSON)
 - cockpit_aggregator: CLI to summarize pod health from signal files
+- signal_store: optional append-only SQLite backend for custom JSON signals
+  (COCKPIT_SIGNAL_BACKEND=sqlite)
 
 Signals are written under the directory indicated by the environment variable
 COCKPIT_SIGNAL_DIR (defaults to "axiom_boot").
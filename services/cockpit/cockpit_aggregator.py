@@ -13,8 +13,9 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 SIGNAL_DIR = Path(os.environ.get("COCKPIT_SIGNAL_DIR", "axiom_boot"))
@@ -121,13 +122,98 @@ def _read_json(path: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _store() -> Any:
+    """Signal store when COCKPIT_SIGNAL_BACKEND=sqlite, else None (file layout)."""
+    try:
+        from .signal_store import get_store
+
+        return get_store()
+    except Exception:
+        return None
+
+
+def _signals(pattern: str, limit: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """(name, record) pairs oldest→newest, one per key; name keeps the <pod>.<signal>.json form."""
+    st = _store()
+    if st is not None:
+        return [(f"{r['pod']}.{r['signal']}.json", r) for r in st.latest_per_key(pattern, limit=limit)]
+    files = _iter_signal_files(pattern)
+    if limit:
+        files = files[-limit:]
+    return [(fp.name, _read_json(fp) or {}) for fp in files]
+
+
+def _latest(pattern: str) -> Optional[Dict[str, Any]]:
+    """Most recent matching record ({} if unreadable), or None when there is none."""
+    st = _store()
+    if st is not None:
+        return st.latest(pattern)
+    files = _iter_signal_files(pattern)
+    if not files:
+        return None
+    return _read_json(files[-1]) or {}
+
+
+def _count(pattern: str) -> int:
+    # Keys, not writes: the files backend keeps one file per <pod>.<signal>
+    st = _store()
+    if st is not None:
+        return st.count_keys(pattern)
+    return len(_iter_signal_files(pattern))
+
+
+def _count_recent(pattern: str, window_sec: int, cap: int = 500) -> int:
+    st = _store()
+    if st is not None:
+        return st.count_keys(pattern, since=time.time() - window_sec)
+    now = datetime.utcnow()
+    count = 0
+    for _name, data in _signals(pattern, limit=cap):
+        ts = data.get("ts")
+        try:
+            if ts and (now - datetime.fromisoformat(ts)).total_seconds() <= window_sec:
+                count += 1
+        except Exception:
+            # If timestamp missing/invalid, ignore to keep windowed semantics
+            pass
+    return count
+
+
+def _schema_stats_counters(max_age_sec: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+    """Schema registry counters summed over each process's latest rollup.
+
+    Every process publishes its own contracts_v2.schema_stats.<host>-<pid> signal;
+    rollups older than AXIOM_SCHEMA_STATS_MAX_AGE_SEC (default 3600) belong to
+    processes that are gone and are left out.
+    """
+    if max_age_sec is None:
+        try:
+            max_age_sec = int(os.getenv("AXIOM_SCHEMA_STATS_MAX_AGE_SEC", "3600") or 3600)
+        except Exception:
+            max_age_sec = 3600
+    now = datetime.utcnow()
+    out: Dict[str, Dict[str, int]] = {}
+    for _name, rec in _signals("contracts_v2.schema_stats*.json"):
+        try:
+            if (now - datetime.fromisoformat(str(rec.get("ts")))).total_seconds() > max_age_sec:
+                continue
+        except Exception:
+            continue
+        for schema, outcomes in ((rec.get("data") or {}).get("counters") or {}).items():
+            if not isinstance(outcomes, dict):
+                continue
+            slot = out.setdefault(schema, {})
+            for outcome, n in outcomes.items():
+                try:
+                    slot[outcome] = slot.get(outcome, 0) + int(n or 0)
+                except Exception:
+                    continue
+    return out
+
+
 def _vector_recall_samples() -> List[Dict[str, Any]]:
-    files = _iter_signal_files("vector.vector_recall*.json")
     samples: List[Dict[str, Any]] = []
-    for fp in files[-200:]:  # cap read to last 200 to bound cost
-        data = _read_json(fp)
-        if not data:
-            continue
+    for _name, data in _signals("vector.vector_recall*.json", limit=200):  # cap read to last 200 to bound cost
         payload = data.get("data") if isinstance(data, dict) else None
         if not isinstance(payload, dict):
             continue
@@ -136,18 +222,15 @@ def _vector_recall_samples() -> List[Dict[str, Any]]:
 
 
 def _blocked_write_count() -> int:
-    files = _iter_signal_files("*.blocked_write*.json")
-    return len(files)
+    return _count("*.blocked_write*.json")
 
 
 def _journal_write_failures() -> int:
-    files = _iter_signal_files("*.journal_write_failure*.json")
-    return len(files)
+    return _count("*.journal_write_failure*.json")
 
 
 def _belief_insert_failures() -> int:
-    files = _iter_signal_files("*.belief_insert_failure*.json")
-    return len(files)
+    return _count("*.belief_insert_failure*.json")
 
 
 def _detect_vector_blackout(samples: List[Dict[str, Any]]) -> bool:
@@ -237,18 +320,7 @@ def aggregate_status() -> Dict[str, Any]:
     # Schema normalization events (drift window)
     drift_count = 0
     try:
-        now = datetime.utcnow()
-        for fp in _iter_signal_files("*.schema_normalization.*.json"):
-            data = _read_json(fp)
-            if not data:
-                continue
-            ts = data.get("ts")
-            try:
-                if ts and (now - datetime.fromisoformat(ts)).total_seconds() <= DRIFT_WINDOW_SEC:
-                    drift_count += 1
-            except Exception:
-                # If timestamp missing/invalid, ignore
-                pass
+        drift_count = _count_recent("*.schema_normalization.*.json", DRIFT_WINDOW_SEC, cap=0)
     except Exception:
         pass
 
@@ -273,11 +345,10 @@ def aggregate_status() -> Dict[str, Any]:
 
     # Summarize saga begin/end
     try:
-        begins = _iter_signal_files("governor.saga_begin.*.json")
-        ends = _iter_signal_files("governor.saga_end.*.json")
+        begins = _signals("governor.saga_begin.*.json", limit=500)
+        ends = _signals("governor.saga_end.*.json", limit=500)
         # Count by saga type
-        def _saga_name(p: Path) -> str:
-            name = p.name
+        def _saga_name(name: str) -> str:
             # governor.saga_begin.WriteMemorySaga.json
             try:
                 parts = name.split(".")
@@ -290,11 +361,10 @@ def aggregate_status() -> Dict[str, Any]:
         ended_ok: Dict[str, int] = {}
         ended_err: Dict[str, int] = {}
 
-        for fp in begins[-500:]:
-            began[_saga_name(fp)] = began.get(_saga_name(fp), 0) + 1
-        for fp in ends[-500:]:
-            data = _read_json(fp) or {}
-            saga = _saga_name(fp)
+        for name, _data in begins:
+            began[_saga_name(name)] = began.get(_saga_name(name), 0) + 1
+        for name, data in ends:
+            saga = _saga_name(name)
             ok = bool((data.get("data") or {}).get("ok"))
             if ok:
                 ended_ok[saga] = ended_ok.get(saga, 0) + 1
@@ -311,14 +381,12 @@ def aggregate_status() -> Dict[str, Any]:
 
     # Embedding stats per namespace (keep last record)
     try:
-        for fp in _iter_signal_files("governor.embedding_stats.*.json")[-200:]:
-            name = fp.name
+        for name, data in _signals("governor.embedding_stats.*.json", limit=200):
             # governor.embedding_stats.<ns>.json
             try:
                 ns = name.split(".")[2]
             except Exception:
                 ns = "default"
-            data = _read_json(fp) or {}
             payload = data.get("data") or {}
             governor["retrieval"]["embedding_norms"][ns] = {
                 "mean": float(payload.get("mean") or 0.0),
@@ -330,15 +398,13 @@ def aggregate_status() -> Dict[str, Any]:
 
     # Recall cohorts
     try:
-        for fp in _iter_signal_files("governor.recall_cohort.*.json")[-500:]:
-            name = fp.name
+        for name, data in _signals("governor.recall_cohort.*.json", limit=500):
             # governor.recall_cohort.<ns>.<cohort>.json
             try:
                 parts = name.split(".")
                 ns, cohort = parts[2], parts[3]
             except Exception:
                 ns, cohort = "default", "default"
-            data = _read_json(fp) or {}
             payload = data.get("data") or {}
             key = f"{cohort}@{int(payload.get('k') or 0)}"
             rec = float(payload.get("recall") or 0.0)
@@ -349,14 +415,12 @@ def aggregate_status() -> Dict[str, Any]:
         pass
     # Retrieval drift per namespace (keep last record)
     try:
-        for fp in _iter_signal_files("governor.retrieval_drift.*.json")[-200:]:
-            name = fp.name
+        for name, data in _signals("governor.retrieval_drift.*.json", limit=200):
             # governor.retrieval_drift.<ns>.json
             try:
                 ns = name.split(".")[2]
             except Exception:
                 ns = "default"
-            data = _read_json(fp) or {}
             payload = data.get("data") or {}
             governor["retrieval"]["drift"][ns] = {
                 "kl": float(payload.get("kl") or 0.0),
@@ -367,9 +431,8 @@ def aggregate_status() -> Dict[str, Any]:
         pass
     # Re-embed summary (last)
     try:
-        files = _iter_signal_files("governor.reembed.summary.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("governor.reembed.summary.json")
+        if data is not None:
             payload = data.get("data") or {}
             governor["retrieval"]["reembed_summary"] = payload
     except Exception:
@@ -378,39 +441,24 @@ def aggregate_status() -> Dict[str, Any]:
     # Contract violations (soft counters emitted as signals)
     try:
         # Count correlation/idempotency violations
-        corr_missing = _iter_signal_files("governor.contract_violation.missing_correlation_id*.json")
-        idem_missing = _iter_signal_files("governor.contract_violation.missing_idempotency_key*.json")
-        prov_missing = _iter_signal_files("governor.contract_violation.missing_provenance*.json")
-        governor["contract_violations"]["missing_correlation_id"] = int(len(corr_missing))
-        governor["contract_violations"]["missing_idempotency_key"] = int(len(idem_missing))
-        governor["contract_violations"]["missing_provenance"] = int(len(prov_missing))
+        governor["contract_violations"]["missing_correlation_id"] = _count("governor.contract_violation.missing_correlation_id*.json")
+        governor["contract_violations"]["missing_idempotency_key"] = _count("governor.contract_violation.missing_idempotency_key*.json")
+        governor["contract_violations"]["missing_provenance"] = _count("governor.contract_violation.missing_provenance*.json")
         # Belief contradiction count
-        governor["belief"]["contradictions"] = int(len(_iter_signal_files("governor.belief_contradiction*.json")))
+        governor["belief"]["contradictions"] = _count("governor.belief_contradiction*.json")
         # Schema violations
-        governor["contract_violations"]["schema_violation"] = int(len(_iter_signal_files("governor.contract_violation.schema_violation*.json")))
+        governor["contract_violations"]["schema_violation"] = _count("governor.contract_violation.schema_violation*.json")
     except Exception:
         pass
 
     # Prompt Contracts aggregation (violations in last 5 minutes)
     prompt_contracts: Dict[str, Any] = {"violations_last_5m": {"invalid_json": 0, "schema": 0, "unknown_tool": 0}}
     try:
-        now = datetime.utcnow()
-        def _count_recent(kind: str) -> int:
-            files = _iter_signal_files(f"governor.prompt_contracts.violation.{kind}*.json")
-            count = 0
-            for fp in files[-500:]:
-                data = _read_json(fp) or {}
-                ts = data.get("ts")
-                try:
-                    if ts and (now - datetime.fromisoformat(ts)).total_seconds() <= 300:
-                        count += 1
-                except Exception:
-                    # If timestamp missing/invalid, ignore to keep windowed semantics
-                    pass
-            return count
-        v_inv = _count_recent("invalid_json")
-        v_sch = _count_recent("schema")
-        v_unk = _count_recent("unknown_tool")
+        def _count_prompt(kind: str) -> int:
+            return _count_recent(f"governor.prompt_contracts.violation.{kind}*.json", 300)
+        v_inv = _count_prompt("invalid_json")
+        v_sch = _count_prompt("schema")
+        v_unk = _count_prompt("unknown_tool")
         prompt_contracts["violations_last_5m"]["invalid_json"] = int(v_inv)
         prompt_contracts["violations_last_5m"]["schema"] = int(v_sch)
         prompt_contracts["violations_last_5m"]["unknown_tool"] = int(v_unk)
@@ -424,35 +472,30 @@ def aggregate_status() -> Dict[str, Any]:
         "version_mix": {"v2": 0.0, "v1": 0.0},
     }
     try:
-        now = datetime.utcnow()
         def _count_recent_contract(kind: str) -> int:
-            files = _iter_signal_files(f"contracts_v2.violation.{kind}*.json")
-            count = 0
-            for fp in files[-500:]:
-                data = _read_json(fp) or {}
-                ts = data.get("ts")
-                try:
-                    if ts and (now - datetime.fromisoformat(ts)).total_seconds() <= 300:
-                        count += 1
-                except Exception:
-                    pass
-            return count
+            return _count_recent(f"contracts_v2.violation.{kind}*.json", 300)
         contracts_v2["violations_5m"]["journal"] = int(_count_recent_contract("journal"))
         contracts_v2["violations_5m"]["memory"] = int(_count_recent_contract("memory_write"))
         contracts_v2["violations_5m"]["belief"] = int(_count_recent_contract("belief_update"))
-        # Version mix from version_seen signals
-        seen = _iter_signal_files("contracts_v2.version_seen*.json")
+        # Version mix from the schema registry rollup (legacy: per-call version_seen signals)
         v2 = 0
         v1 = 0
         total = 0
-        for fp in seen[-1000:]:
-            data = _read_json(fp) or {}
-            vers = (data.get("data") or {}).get("version")
-            total += 1
-            if vers == "v2":
-                v2 += 1
-            elif vers == "v1":
-                v1 += 1
+        counters = _schema_stats_counters()
+        if counters:
+            contracts_v2["schema_validation"] = counters
+            seen = counters.get("contracts_v2.version") or {}
+            v2 = int(seen.get("v2") or 0)
+            v1 = int(seen.get("v1") or 0)
+            total = sum(int(n or 0) for n in seen.values())
+        else:
+            for _name, data in _signals("contracts_v2.version_seen*.json", limit=1000):
+                vers = (data.get("data") or {}).get("version")
+                total += 1
+                if vers == "v2":
+                    v2 += 1
+                elif vers == "v1":
+                    v1 += 1
         if total > 0:
             contracts_v2["version_mix"]["v2"] = float(v2) / float(total)
             contracts_v2["version_mix"]["v1"] = float(v1) / float(total)
@@ -462,12 +505,11 @@ def aggregate_status() -> Dict[str, Any]:
     # Resilience signals (best-effort)
     try:
         # degraded.active
-        degraded_files = _iter_signal_files("resilience.degraded*.json")
+        degraded = _latest("resilience.degraded*.json")
         degraded_active = False
         degraded_depth = None
-        if degraded_files:
-            data = _read_json(degraded_files[-1]) or {}
-            d = data.get("data") or {}
+        if degraded is not None:
+            d = degraded.get("data") or {}
             degraded_active = bool(d.get("active"))
             try:
                 if d.get("depth") is not None:
@@ -475,10 +517,10 @@ def aggregate_status() -> Dict[str, Any]:
             except Exception:
                 degraded_depth = None
         # budget exceeded counts (windowed by files present)
-        be_tokens = len(_iter_signal_files("resilience.budget_exceeded.tokens*.json"))
-        be_tools = len(_iter_signal_files("resilience.budget_exceeded.tools*.json"))
-        breaker_vector_open = len(_iter_signal_files("resilience.breaker.vector.open*.json"))
-        breaker_memory_open = len(_iter_signal_files("resilience.breaker.memory.open*.json"))
+        be_tokens = _count("resilience.budget_exceeded.tokens*.json")
+        be_tools = _count("resilience.budget_exceeded.tools*.json")
+        breaker_vector_open = _count("resilience.breaker.vector.open*.json")
+        breaker_memory_open = _count("resilience.breaker.memory.open*.json")
         resilience = {
             "budgets": {"tokens_exceeded": be_tokens, "tools_exceeded": be_tools},
             "breakers": {"vector_open_events": breaker_vector_open, "memory_open_events": breaker_memory_open},
@@ -492,9 +534,8 @@ def aggregate_status() -> Dict[str, Any]:
     try:
         for pod in PODS:
             # version banner (attach inside pods map)
-            vb_files = _iter_signal_files(f"{pod}.version_banner.json")
-            if vb_files:
-                data = _read_json(vb_files[-1]) or {}
+            data = _latest(f"{pod}.version_banner.json")
+            if data is not None:
                 payload = data.get("data") or {}
                 try:
                     if pod in pods_status and isinstance(pods_status[pod], dict):
@@ -502,15 +543,13 @@ def aggregate_status() -> Dict[str, Any]:
                 except Exception:
                     pass
             # boot mode
-            bc_files = _iter_signal_files(f"{pod}.boot_complete.json")
-            bi_files = _iter_signal_files(f"{pod}.boot_incomplete.json")
+            bc = _latest(f"{pod}.boot_complete.json")
+            bi = _latest(f"{pod}.boot_incomplete.json")
             rec = None
-            if bc_files:
-                data = _read_json(bc_files[-1]) or {}
-                rec = {"mode": (data.get("data") or {}).get("mode") or "normal", "at": data.get("ts")}
-            elif bi_files:
-                data = _read_json(bi_files[-1]) or {}
-                rec = {"mode": (data.get("data") or {}).get("mode") or "safe", "at": data.get("ts")}
+            if bc is not None:
+                rec = {"mode": (bc.get("data") or {}).get("mode") or "normal", "at": bc.get("ts")}
+            elif bi is not None:
+                rec = {"mode": (bi.get("data") or {}).get("mode") or "safe", "at": bi.get("ts")}
             if rec:
                 boot[pod] = rec
     except Exception:
@@ -523,11 +562,10 @@ def aggregate_status() -> Dict[str, Any]:
     }
     try:
         # compaction: look for last completed/ planned signals
-        comp_files = _iter_signal_files("lifecycle.lifecycle.compaction.completed*.json")
-        if not comp_files:
-            comp_files = _iter_signal_files("lifecycle.compaction.completed*.json")
-        if comp_files:
-            data = _read_json(comp_files[-1]) or {}
+        data = _latest("lifecycle.lifecycle.compaction.completed*.json")
+        if data is None:
+            data = _latest("lifecycle.compaction.completed*.json")
+        if data is not None:
             d = (data.get("data") or {})
             lifecycle["compaction"] = {
                 "last_run": data.get("ts"),
@@ -536,20 +574,18 @@ def aggregate_status() -> Dict[str, Any]:
                 "bytes_saved": int(d.get("bytes_saved") or 0),
             }
         # snapshot: last taken and prune records
-        snap_files = _iter_signal_files("lifecycle.lifecycle.snapshot.taken*.json")
-        if not snap_files:
-            snap_files = _iter_signal_files("lifecycle.snapshot.taken*.json")
-        if snap_files:
-            data = _read_json(snap_files[-1]) or {}
+        data = _latest("lifecycle.lifecycle.snapshot.taken*.json")
+        if data is None:
+            data = _latest("lifecycle.snapshot.taken*.json")
+        if data is not None:
             d = (data.get("data") or {})
             lifecycle["snapshot"]["last_taken_at"] = data.get("ts")
             lifecycle["snapshot"]["last_path"] = d.get("path")
             lifecycle["snapshot"]["size_bytes"] = int(d.get("size_bytes") or 0)
-        prn_files = _iter_signal_files("lifecycle.lifecycle.snapshot.pruned*.json")
-        if not prn_files:
-            prn_files = _iter_signal_files("lifecycle.snapshot.pruned*.json")
-        if prn_files:
-            data = _read_json(prn_files[-1]) or {}
+        data = _latest("lifecycle.lifecycle.snapshot.pruned*.json")
+        if data is None:
+            data = _latest("lifecycle.snapshot.pruned*.json")
+        if data is not None:
             d = (data.get("data") or {})
             lifecycle["snapshot"]["kept"] = int(d.get("kept") or 0)
     except Exception:
@@ -559,15 +595,13 @@ def aggregate_status() -> Dict[str, Any]:
     chaos: Dict[str, Any] = {"last_drill": None}
     try:
         # Prefer ended records for outcome; use latest by mtime
-        files = _iter_signal_files("chaos.drill.ended*.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("chaos.drill.ended*.json")
+        if data is not None:
             chaos["last_drill"] = (data.get("data") or {})
         else:
             # Fallback to began record for visibility
-            files_b = _iter_signal_files("chaos.drill.began*.json")
-            if files_b:
-                data = _read_json(files_b[-1]) or {}
+            data = _latest("chaos.drill.began*.json")
+            if data is not None:
                 chaos["last_drill"] = (data.get("data") or {})
     except Exception:
         pass
@@ -576,17 +610,15 @@ def aggregate_status() -> Dict[str, Any]:
     ci: Dict[str, Any] = {"canary": {"recall": None, "delta": None}}
     try:
         # recall@k
-        files_r = _iter_signal_files("ci.canary.recall_at_k*.json")
-        if files_r:
-            data = _read_json(files_r[-1]) or {}
+        data = _latest("ci.canary.recall_at_k*.json")
+        if data is not None:
             payload = data.get("data") or {}
             ci["canary"]["recall"] = float(payload.get("recall") or 0.0)
             ci["canary"]["k"] = int(payload.get("k") or 0)
             ci["canary"]["n"] = int(payload.get("n") or 0)
         # delta
-        files_d = _iter_signal_files("ci.canary.delta*.json")
-        if files_d:
-            data = _read_json(files_d[-1]) or {}
+        data = _latest("ci.canary.delta*.json")
+        if data is not None:
             payload = data.get("data") or {}
             ci["canary"]["delta"] = float(payload.get("delta") or 0.0)
     except Exception:
@@ -595,9 +627,8 @@ def aggregate_status() -> Dict[str, Any]:
     # Blue/Green snapshot (best-effort)
     bluegreen = {"last_switch": None}
     try:
-        files = _iter_signal_files("bluegreen.switch*.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("bluegreen.switch*.json")
+        if data is not None:
             bluegreen["last_switch"] = data.get("ts")
     except Exception:
         pass
@@ -605,9 +636,8 @@ def aggregate_status() -> Dict[str, Any]:
     # Retrieval snapshot (last hits & fallback)
     retrieval_snapshot = {"last_hits": 0, "fallback_used": False, "embedder": None}
     try:
-        files = _iter_signal_files("memory.retrieval.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("memory.retrieval.json")
+        if data is not None:
             payload = (data.get("data") or {})
             retrieval_snapshot["last_hits"] = int(payload.get("last_hits") or 0)
             retrieval_snapshot["fallback_used"] = bool(payload.get("fallback_used"))
@@ -615,9 +645,8 @@ def aggregate_status() -> Dict[str, Any]:
         pass
     # Governor retrieval embedder snapshot (best-effort)
     try:
-        files = _iter_signal_files("governor.retrieval.embedder.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("governor.retrieval.embedder.json")
+        if data is not None:
             retrieval_snapshot["embedder"] = (data.get("data") or {})
     except Exception:
         pass
@@ -625,25 +654,22 @@ def aggregate_status() -> Dict[str, Any]:
     # Belief backend & patch errors
     beliefs_snapshot = {"backend": None, "patch_errors": 0}
     try:
-        files = _iter_signal_files("beliefs.backend.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("beliefs.backend.json")
+        if data is not None:
             payload = (data.get("data") or {})
             beliefs_snapshot["backend"] = payload.get("backend")
     except Exception:
         pass
     try:
-        files = _iter_signal_files("beliefs.patch_error*.json")
-        beliefs_snapshot["patch_errors"] = int(len(files))
+        beliefs_snapshot["patch_errors"] = _count("beliefs.patch_error*.json")
     except Exception:
         pass
 
     # Boot canary snapshot
     boot_canary = {"k": None, "recall": None, "min": None, "passed": None}
     try:
-        files = _iter_signal_files("memory.boot_canary.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("memory.boot_canary.json")
+        if data is not None:
             payload = (data.get("data") or {})
             boot_canary = {
                 "k": int(payload.get("k") or 0),
@@ -657,9 +683,8 @@ def aggregate_status() -> Dict[str, Any]:
     # Config resolver snapshot (best-effort)
     config_snapshot = {"llm": None, "vector": None}
     try:
-        files = _iter_signal_files("config.resolver_summary.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("config.resolver_summary.json")
+        if data is not None:
             payload = data.get("data") or {}
             config_snapshot["llm"] = payload.get("llm")
             config_snapshot["vector"] = payload.get("vector")
@@ -671,65 +696,36 @@ def aggregate_status() -> Dict[str, Any]:
     eventlog = {"lag": 0, "processed_5m": 0, "errors_5m": 0}
     try:
         # lag latest value
-        files = _iter_signal_files("eventlog.lag*.json")
-        if files:
-            data = _read_json(files[-1]) or {}
+        data = _latest("eventlog.lag*.json")
+        if data is not None:
             eventlog["lag"] = int(((data.get("data") or {}).get("value") or 0))
         # windowed counts
-        now = datetime.utcnow()
-        def _count5(prefix: str) -> int:
-            cnt = 0
-            for fp in _iter_signal_files(prefix)[-1000:]:
-                d = _read_json(fp) or {}
-                ts = d.get("ts")
-                try:
-                    if ts and (now - datetime.fromisoformat(ts)).total_seconds() <= 300:
-                        cnt += 1
-                except Exception:
-                    pass
-            return cnt
-        eventlog["processed_5m"] = _count5("eventlog.processed*.json")
-        eventlog["errors_5m"] = _count5("eventlog.errors*.json")
+        eventlog["processed_5m"] = _count_recent("eventlog.processed*.json", 300, cap=1000)
+        eventlog["errors_5m"] = _count_recent("eventlog.errors*.json", 300, cap=1000)
     except Exception:
         pass
 
     # Quarantine aggregation (best-effort)
     quarantine = {"flagged_5m": 0, "released_5m": 0, "last_ids": []}
     try:
-        now = datetime.utcnow()
-        def _count5_q(sig: str) -> int:
-            cnt = 0
-            for fp in _iter_signal_files(f"quarantine.{sig}*.json")[-500:]:
-                d = _read_json(fp) or {}
-                ts = d.get("ts")
-                try:
-                    if ts and (now - datetime.fromisoformat(ts)).total_seconds() <= 300:
-                        cnt += 1
-                except Exception:
-                    pass
-            return cnt
-        quarantine["flagged_5m"] = _count5_q("flagged")
-        quarantine["released_5m"] = _count5_q("released")
+        quarantine["flagged_5m"] = _count_recent("quarantine.flagged*.json", 300)
+        quarantine["released_5m"] = _count_recent("quarantine.released*.json", 300)
     except Exception:
         pass
     liveness = {"recall_ok": None, "recall": None, "belief_patch_ok": None, "belief_status": None}
     try:
-        ro = _iter_signal_files("liveness.recall_ok.json")
-        rv = _iter_signal_files("liveness.recall_value.json")
-        bo = _iter_signal_files("liveness.belief_patch_ok.json")
-        bs = _iter_signal_files("liveness.belief_patch_status.json")
-        if ro:
-            d = _read_json(ro[-1]) or {}
-            liveness["recall_ok"] = bool((d.get("data") or {}).get("ok"))
-        if rv:
-            d = _read_json(rv[-1]) or {}
-            liveness["recall"] = float((d.get("data") or {}).get("recall") or 0.0)
-        if bo:
-            d = _read_json(bo[-1]) or {}
-            liveness["belief_patch_ok"] = bool((d.get("data") or {}).get("ok"))
-        if bs:
-            d = _read_json(bs[-1]) or {}
-            liveness["belief_status"] = int((d.get("data") or {}).get("status") or 0)
+        ro = _latest("liveness.recall_ok.json")
+        rv = _latest("liveness.recall_value.json")
+        bo = _latest("liveness.belief_patch_ok.json")
+        bs = _latest("liveness.belief_patch_status.json")
+        if ro is not None:
+            liveness["recall_ok"] = bool((ro.get("data") or {}).get("ok"))
+        if rv is not None:
+            liveness["recall"] = float((rv.get("data") or {}).get("recall") or 0.0)
+        if bo is not None:
+            liveness["belief_patch_ok"] = bool((bo.get("data") or {}).get("ok"))
+        if bs is not None:
+            liveness["belief_status"] = int((bs.get("data") or {}).get("status") or 0)
     except Exception:
         pass
 
@@ -28,6 +28,17 @@ from pathlib import Path
 
 # Root directory for signal files (configurable)
 SIGNAL_DIR = Path(os.environ.get("COCKPIT_SIGNAL_DIR", "axiom_boot"))
+_SCHEMA_PATH = Path(__file__).with_name("cockpit_schema.json")
+
+
+def _notify(key: str) -> None:
+    """Push hook for the in-process materialized status (status_cache)."""
+    try:
+        from .status_cache import mark_dirty
+
+        mark_dirty(key)
+    except Exception:
+        pass
 
 
 def _ensure_dir() -> None:
@@ -51,6 +62,7 @@ def mark_ready(pod_name: str) -> None:
             logging.getLogger(__name__).error("[cockpit] mark_ready failed: %s", e)
         except Exception:
             pass
+    _notify(f"{pod_name}.ready")
 
 
 def mark_start(pod_name: str) -> None:
@@ -63,6 +75,7 @@ def mark_start(pod_name: str) -> None:
             logging.getLogger(__name__).warning("[cockpit] mark_start failed: %s", e)
         except Exception:
             pass
+    _notify(f"{pod_name}.start")
 
 
 def mark_error(pod_name: str, message: str) -> None:
@@ -77,6 +90,7 @@ def mark_error(pod_name: str, message: str) -> None:
             logging.getLogger(__name__).error("[cockpit] mark_error failed: %s", e)
         except Exception:
             pass
+    _notify(f"{pod_name}.error")
 
 
 def heartbeat(pod_name: str) -> None:
@@ -91,6 +105,7 @@ def heartbeat(pod_name: str) -> None:
             logging.getLogger(__name__).warning("[cockpit] heartbeat failed: %s", e)
         except Exception:
             pass
+    _notify(f"{pod_name}.last_heartbeat")
 
 
 def write_signal(pod_name: str, signal_name: str, payload: dict) -> None:
@@ -100,6 +115,8 @@ def write_signal(pod_name: str, signal_name: str, payload: dict) -> None:
         {"pod": pod_name, "signal": signal_name, "ts": iso8601, "data": payload}
 
     If schema validation fails (or dependency missing), write anyway (fail-closed).
+    With COCKPIT_SIGNAL_BACKEND=sqlite the record goes to the signal store instead
+    (see signal_store.py); the file is still written when COCKPIT_SIGNAL_EXPORT_FILES=1.
     """
     _ensure_dir()
     record = {
@@ -108,20 +125,17 @@ def write_signal(pod_name: str, signal_name: str, payload: dict) -> None:
         "ts": datetime.utcnow().isoformat(),
         "data": payload or {},
     }
-    # Try to validate against cockpit_schema.json if jsonschema is available
+    # Validate against cockpit_schema.json via the shared (compiled, mtime-reloaded) registry
     try:
-        try:
-            from jsonschema import validate  # type: ignore
-        except Exception:
-            validate = None  # type: ignore
-
-        schema_path = Path(__file__).with_name("cockpit_schema.json")
-        if validate and schema_path.exists():
-            import json as _json
-
-            with open(schema_path, "r") as sf:
-                schema = _json.load(sf)
-            validate(instance=record, schema=schema)
+        from contracts.schema_registry import get_registry  # type: ignore
+
+        reg = get_registry()
+        reg.register("cockpit.signal", _SCHEMA_PATH)
+        ok, _outcome, err = reg.validate("cockpit.signal", record)
+        if not ok:
+            logging.getLogger(__name__).warning("[cockpit] schema validation failed: %s", err)
+    except ImportError:
+        pass
     except Exception as e:
         try:
             logging.getLogger(__name__).warning(
@@ -130,15 +144,31 @@ def write_signal(pod_name: str, signal_name: str, payload: dict) -> None:
         except Exception:
             pass
 
-    # Always write the record (fail-closed)
+    # Always write the record (fail-closed). With COCKPIT_SIGNAL_BACKEND=sqlite it is
+    # appended to the signal store; the per-signal file becomes an optional export.
+    write_file = True
     try:
-        with open(SIGNAL_DIR / f"{pod_name}.{signal_name}.json", "w") as f:
-            json.dump(record, f)
+        from .signal_store import export_files_enabled, get_store
+
+        store = get_store()
+        if store is not None:
+            store.append(record)
+            write_file = export_files_enabled()
     except Exception as e:
         try:
-            logging.getLogger(__name__).warning("[cockpit] write_signal failed: %s", e)
+            logging.getLogger(__name__).warning("[cockpit] signal store append failed: %s", e)
         except Exception:
             pass
+    if write_file:
+        try:
+            with open(SIGNAL_DIR / f"{pod_name}.{signal_name}.json", "w") as f:
+                json.dump(record, f)
+        except Exception as e:
+            try:
+                logging.getLogger(__name__).warning("[cockpit] write_signal failed: %s", e)
+            except Exception:
+                pass
+    _notify(f"{pod_name}.{signal_name}")
 
 
 # ─────────────────────────────────────────────
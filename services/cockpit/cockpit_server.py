@@ -5,6 +5,11 @@ Project Cockpit – Status Server (Phase 2)
 Tiny Flask app exposing GET /status/cockpit returning aggregate_status() JSON.
 Binding via COCKPIT_BIND env (default "0.0.0.0:8088").
 
+Responses are served from the materialized snapshot in status_cache (rebuilt in the
+background on change or after COCKPIT_STATUS_MAX_STALE_SEC; requests never wait on a
+rebuild once a snapshot exists) with an ETag; GET /status/cockpit/stream
+pushes a server-sent event whenever the snapshot changes.
+
 Fail-closed: on aggregator error, returns 503 with {"error":"unavailable"}.
 """
 
@@ -13,16 +18,21 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request
 
 
-def _aggregate_safe():
+def _snapshot_safe():
     try:
-        from .cockpit_aggregator import aggregate_status
+        from .status_cache import get_cache
 
-        return aggregate_status()
+        return get_cache().get()
     except Exception:
-        return None
+        return None, None
+
+
+def _aggregate_safe():
+    status, _etag = _snapshot_safe()
+    return status
 
 
 app = Flask(__name__)
@@ -30,19 +40,39 @@ app = Flask(__name__)
 
 @app.get("/status/cockpit")
 def status_cockpit():
-    status = _aggregate_safe()
+    status, etag = _snapshot_safe()
     if not status:
         return jsonify({"error": "unavailable"}), 503
-    return jsonify(status), 200
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag and etag in (request.headers.get("If-None-Match") or ""):
+        return "", 304, headers
+    return jsonify(status), 200, headers
+
+
+@app.get("/status/cockpit/stream")
+def status_cockpit_stream():
+    from .status_cache import get_cache, sse_events
+
+    try:
+        heartbeat_sec = float(os.environ.get("COCKPIT_SSE_HEARTBEAT_SEC", "15") or 15)
+    except Exception:
+        heartbeat_sec = 15.0
+    last = request.headers.get("Last-Event-ID") or None
+    return Response(
+        sse_events(get_cache(), last_etag=last, heartbeat_sec=heartbeat_sec),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/status/metrics")
 def status_metrics():
     try:
-        from .cockpit_aggregator import aggregate_status
         from .exporters import as_metrics
 
-        snap = aggregate_status()
+        snap = _aggregate_safe()
+        if not snap:
+            return (jsonify({"error": "metrics_unavailable"}), 503)
         lines = [f"{k.replace('.', '_')} {v}" for k, v in as_metrics(snap).items()]
 
         # Optional file export
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Project Cockpit – Signal Store
+
+Append-only SQLite (WAL) backend for custom JSON signals, selected with
+COCKPIT_SIGNAL_BACKEND=sqlite. Every write_signal() call appends one row to
+``signals`` (indexed on pod, signal, ts) and upserts the per-key rollup in
+``signal_latest`` (last record + lifetime total), so the aggregator reads the
+latest row or a count per key instead of globbing and re-parsing files.
+
+Knobs:
+    COCKPIT_SIGNAL_DB              database path (default <COCKPIT_SIGNAL_DIR>/signals.sqlite)
+    COCKPIT_SIGNAL_RETENTION_SEC   raw rows older than this are pruned (default 86400)
+    COCKPIT_SIGNAL_MAX_PER_KEY     raw rows kept per (pod, signal) (default 1000)
+    COCKPIT_SIGNAL_EXPORT_FILES    also write the legacy <pod>.<signal>.json files (default off)
+
+Pruning only trims raw rows; lifetime totals live in ``signal_latest`` and survive it.
+Patterns use the legacy file-glob form ("governor.saga_begin.*.json", "*.blocked_write*.json").
+
+The aggregator reads through latest_per_key()/count_keys(), which see one record per
+(pod, signal) exactly like the one-file-per-key files backend, so dashboard numbers do
+not depend on the backend. records()/count() expose the raw history and lifetime totals.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_PRUNE_EVERY = 500
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _split_pattern(pattern: str) -> Tuple[Optional[str], str]:
+    """"<pod>.<signal glob>.json" → (pod or None for "*", signal GLOB)."""
+    p = pattern[:-5] if pattern.endswith(".json") else pattern
+    pod, _, sig = p.partition(".")
+    return (None if pod == "*" else pod), (sig or "*")
+
+
+def _epoch(ts_iso: Optional[str]) -> float:
+    """Epoch seconds for a signal ts; naive timestamps are UTC (write_signal uses utcnow)."""
+    try:
+        if not ts_iso:
+            return time.time()
+        d = datetime.fromisoformat(str(ts_iso).replace("Z", "+00:00"))
+        return (d if d.tzinfo else d.replace(tzinfo=timezone.utc)).timestamp()
+    except Exception:
+        return time.time()
+
+
+class SignalStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                pod TEXT NOT NULL,
+                signal TEXT NOT NULL,
+                ts REAL NOT NULL,
+                ts_iso TEXT NOT NULL,
+                data TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_signals_key_ts ON signals(pod, signal, ts);
+            CREATE INDEX IF NOT EXISTS idx_signals_signal_ts ON signals(signal, ts);
+            CREATE TABLE IF NOT EXISTS signal_latest (
+                pod TEXT NOT NULL,
+                signal TEXT NOT NULL,
+                ts REAL NOT NULL,
+                ts_iso TEXT NOT NULL,
+                data TEXT,
+                total INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (pod, signal)
+            );
+            """
+        )
+        self._conn.commit()
+        self._writes = 0
+        self.retention_sec = _env_int("COCKPIT_SIGNAL_RETENTION_SEC", 86400)
+        self.max_per_key = _env_int("COCKPIT_SIGNAL_MAX_PER_KEY", 1000)
+
+    # ── writes ────────────────────────────────────────────────────────────
+    def append(self, record: Dict[str, Any]) -> None:
+        pod = str(record.get("pod") or "")
+        sig = str(record.get("signal") or "")
+        ts_iso = str(record.get("ts") or datetime.utcnow().isoformat())
+        ts = _epoch(ts_iso)
+        data = json.dumps(record.get("data") or {})
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO signals (pod, signal, ts, ts_iso, data) VALUES (?, ?, ?, ?, ?)",
+                (pod, sig, ts, ts_iso, data),
+            )
+            self._conn.execute(
+                """
+                INSERT INTO signal_latest (pod, signal, ts, ts_iso, data, total) VALUES (?, ?, ?, ?, ?, 1)
+                ON CONFLICT(pod, signal) DO UPDATE SET
+                    ts=excluded.ts, ts_iso=excluded.ts_iso, data=excluded.data, total=signal_latest.total + 1
+                """,
+                (pod, sig, ts, ts_iso, data),
+            )
+            self._conn.commit()
+            self._writes += 1
+            due = self._writes % _PRUNE_EVERY == 0
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Drop raw rows past retention or beyond the per-key cap; rollups are untouched."""
+        with self._lock:
+            cur = self._conn.cursor()
+            removed = 0
+            if self.retention_sec > 0:
+                cur.execute("DELETE FROM signals WHERE ts < ?", (time.time() - self.retention_sec,))
+                removed += max(0, cur.rowcount)
+            if self.max_per_key > 0:
+                cur.execute(
+                    """
+                    DELETE FROM signals WHERE id IN (
+                        SELECT id FROM (
+                            SELECT id, ROW_NUMBER() OVER (PARTITION BY pod, signal ORDER BY ts DESC, id DESC) AS rn
+                            FROM signals
+                        ) WHERE rn > ?
+                    )
+                    """,
+                    (self.max_per_key,),
+                )
+                removed += max(0, cur.rowcount)
+            self._conn.commit()
+            return removed
+
+    # ── reads ─────────────────────────────────────────────────────────────
+    @staticmethod
+    def _where(pattern: str) -> Tuple[str, List[Any]]:
+        pod, sig = _split_pattern(pattern)
+        if pod is None:
+            return "signal GLOB ?", [sig]
+        return "pod = ? AND signal GLOB ?", [pod, sig]
+
+    @staticmethod
+    def _record(pod: str, sig: str, ts_iso: str, data: Optional[str]) -> Dict[str, Any]:
+        try:
+            payload = json.loads(data) if data else {}
+        except Exception:
+            payload = {}
+        return {"pod": pod, "signal": sig, "ts": ts_iso, "data": payload}
+
+    def records(self, pattern: str, limit: Optional[int] = None, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Matching records oldest→newest (the newest `limit` when given)."""
+        where, params = self._where(pattern)
+        if since is not None:
+            where += " AND ts >= ?"
+            params.append(float(since))
+        sql = f"SELECT pod, signal, ts_iso, data FROM signals WHERE {where} ORDER BY ts DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._record(*r) for r in reversed(rows)]
+
+    def latest(self, pattern: str) -> Optional[Dict[str, Any]]:
+        where, params = self._where(pattern)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT pod, signal, ts_iso, data FROM signal_latest WHERE {where} ORDER BY ts DESC LIMIT 1",
+                params,
+            ).fetchone()
+        return self._record(*row) if row else None
+
+    def count(self, pattern: str, since: Optional[float] = None) -> int:
+        """Lifetime total from the rollup, or raw rows newer than `since`."""
+        where, params = self._where(pattern)
+        with self._lock:
+            if since is None:
+                row = self._conn.execute(f"SELECT SUM(total) FROM signal_latest WHERE {where}", params).fetchone()
+            else:
+                row = self._conn.execute(f"SELECT COUNT(*) FROM signals WHERE {where} AND ts >= ?", params + [float(since)]).fetchone()
+        return int((row[0] if row else 0) or 0)
+
+    def latest_per_key(self, pattern: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Latest record of each matching key oldest→newest (the newest `limit` keys when given)."""
+        where, params = self._where(pattern)
+        sql = f"SELECT pod, signal, ts_iso, data FROM signal_latest WHERE {where} ORDER BY ts DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._record(*r) for r in reversed(rows)]
+
+    def count_keys(self, pattern: str, since: Optional[float] = None) -> int:
+        """Matching keys, optionally only those whose latest record is newer than `since`."""
+        where, params = self._where(pattern)
+        if since is not None:
+            where += " AND ts >= ?"
+            params.append(float(since))
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM signal_latest WHERE {where}", params).fetchone()
+        return int((row[0] if row else 0) or 0)
+
+    def data_version(self) -> int:
+        """Changes whenever another connection (e.g. another pod) commits to the store."""
+        with self._lock:
+            return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def export_files(self, dest: Path) -> int:
+        """Write the latest record per key in the legacy <pod>.<signal>.json layout."""
+        dest.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            rows = self._conn.execute("SELECT pod, signal, ts_iso, data FROM signal_latest").fetchall()
+        for pod, sig, ts_iso, data in rows:
+            with open(dest / f"{pod}.{sig}.json", "w") as f:
+                json.dump(self._record(pod, sig, ts_iso, data), f)
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_STORES: Dict[str, SignalStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def backend() -> str:
+    return (os.environ.get("COCKPIT_SIGNAL_BACKEND", "files") or "files").strip().lower()
+
+
+def export_files_enabled() -> bool:
+    return os.environ.get("COCKPIT_SIGNAL_EXPORT_FILES", "").strip().lower() in ("1", "true", "yes")
+
+
+def get_store() -> Optional[SignalStore]:
+    """Process-wide store for the configured path, or None when the files backend is active."""
+    if backend() != "sqlite":
+        return None
+    path = os.environ.get("COCKPIT_SIGNAL_DB", "").strip() or os.path.join(
+        os.environ.get("COCKPIT_SIGNAL_DIR", "axiom_boot"), "signals.sqlite"
+    )
+    with _STORES_LOCK:
+        st = _STORES.get(path)
+        if st is None:
+            st = SignalStore(path)
+            _STORES[path] = st
+        return st
+
+
+__all__ = ["SignalStore", "backend", "export_files_enabled", "get_store"]
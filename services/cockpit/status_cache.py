@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Project Cockpit – Materialized status
+
+Keeps the last aggregate_status() result in memory so dashboard requests are a dict
+lookup instead of a full re-aggregation. The snapshot is rebuilt only when:
+
+- a signal was written in this process (push hook from cockpit_reporter → mark_dirty),
+- another process changed the signal source (signal-dir mtime, or SQLite data_version
+  for the signal store), or
+- it is older than COCKPIT_STATUS_MAX_STALE_SEC (default 5; covers in-place file
+  overwrites and time-based fields such as heartbeat freshness).
+
+Rebuilds never run on the request thread once a snapshot exists: get() serves the
+current (possibly stale) snapshot and starts a single-flight rebuild on a daemon
+thread. Only the very first get() computes inline, since there is nothing to serve.
+
+Each snapshot carries a content ETag (generated_at excluded) so unchanged polls can be
+answered with 304, and sse_events() streams a new event only when the ETag changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def etag_for(status: Dict[str, Any]) -> str:
+    body = {k: v for k, v in status.items() if k != "generated_at"}
+    digest = hashlib.sha1(json.dumps(body, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def _default_token() -> Any:
+    """Cheap fingerprint of the signal source; changes when another process writes."""
+    try:
+        from .signal_store import get_store
+
+        st = get_store()
+        if st is not None:
+            return ("sqlite", st.data_version())
+    except Exception:
+        pass
+    try:
+        from .cockpit_aggregator import SIGNAL_DIR
+
+        return ("files", os.stat(SIGNAL_DIR).st_mtime_ns)
+    except Exception:
+        return None
+
+
+def _default_compute() -> Dict[str, Any]:
+    from .cockpit_aggregator import aggregate_status
+
+    return aggregate_status()
+
+
+class StatusCache:
+    def __init__(
+        self,
+        compute: Optional[Callable[[], Dict[str, Any]]] = None,
+        token: Optional[Callable[[], Any]] = None,
+        max_stale_sec: Optional[float] = None,
+    ) -> None:
+        self._compute = compute or _default_compute
+        self._token = token or _default_token
+        self.max_stale_sec = (
+            _env_float("COCKPIT_STATUS_MAX_STALE_SEC", 5.0) if max_stale_sec is None else float(max_stale_sec)
+        )
+        self._cond = threading.Condition()
+        self._build_lock = threading.Lock()
+        self._snapshot: Optional[Tuple[Dict[str, Any], str]] = None
+        self._built_at = 0.0
+        self._built_token: Any = None
+        self._dirty: Set[str] = set()
+        self._rebuilding = False
+        self.version = 0
+        self.rebuilds = 0
+
+    def mark_dirty(self, key: str = "*") -> None:
+        """Push hook: a signal changed in this process."""
+        with self._cond:
+            self._dirty.add(str(key))
+            self._cond.notify_all()
+
+    def _fresh(self, now: float) -> bool:
+        if self._snapshot is None or self._dirty:
+            return False
+        if now - self._built_at > self.max_stale_sec:
+            return False
+        try:
+            return self._token() == self._built_token
+        except Exception:
+            return False
+
+    def get(self) -> Tuple[Dict[str, Any], str]:
+        """Current (status, etag); when dirty or stale, serves it and rebuilds in the background."""
+        snap = self._snapshot
+        if snap is not None and self._fresh(time.monotonic()):
+            return snap
+        if snap is None:
+            return self._build()
+        self._schedule_rebuild()
+        return snap
+
+    def _build(self) -> Tuple[Dict[str, Any], str]:
+        with self._build_lock:
+            now = time.monotonic()
+            if self._snapshot is not None and self._fresh(now):
+                return self._snapshot
+            with self._cond:
+                self._dirty.clear()
+            token = self._token()
+            try:
+                status = self._compute()
+            except Exception:
+                with self._cond:
+                    self._dirty.add("*")
+                raise
+            etag = etag_for(status)
+            with self._cond:
+                changed = self._snapshot is None or etag != self._snapshot[1]
+                self._snapshot = (status, etag)
+                self._built_at, self._built_token = now, token
+                self.rebuilds += 1
+                if changed:
+                    self.version += 1
+                    self._cond.notify_all()
+            return status, etag
+
+    def _schedule_rebuild(self) -> None:
+        with self._cond:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        try:
+            threading.Thread(target=self._rebuild_in_background, name="cockpit-status-rebuild", daemon=True).start()
+        except Exception:
+            with self._cond:
+                self._rebuilding = False
+            raise
+
+    def _rebuild_in_background(self) -> None:
+        try:
+            self._build()
+        except Exception as e:
+            log.warning("[cockpit] status rebuild failed, serving the previous snapshot: %s", e)
+        finally:
+            with self._cond:
+                self._rebuilding = False
+                self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no background rebuild is in flight; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._rebuilding, timeout)
+
+    def wait_for_change(self, etag: Optional[str], timeout: float) -> Tuple[Dict[str, Any], str]:
+        """Block until the snapshot's ETag differs from `etag` or `timeout` elapses."""
+        deadline = time.monotonic() + max(0.0, timeout)
+        poll = min(1.0, max(0.05, self.max_stale_sec / 2.0))
+        while True:
+            status, cur = self.get()
+            remaining = deadline - time.monotonic()
+            if cur != etag or remaining <= 0:
+                return status, cur
+            with self._cond:
+                if not self._dirty or self._rebuilding:
+                    self._cond.wait(min(poll, remaining))
+
+
+def sse_events(
+    cache: "StatusCache",
+    last_etag: Optional[str] = None,
+    heartbeat_sec: float = 15.0,
+    max_events: Optional[int] = None,
+) -> Iterator[str]:
+    """Server-sent events: one `status` event per ETag change, comments as keep-alives."""
+    sent = 0
+    while max_events is None or sent < max_events:
+        status, etag = cache.wait_for_change(last_etag, heartbeat_sec)
+        if etag == last_etag:
+            yield ": keep-alive\n\n"
+            continue
+        last_etag = etag
+        sent += 1
+        yield f"id: {etag}\nevent: status\ndata: {json.dumps(status, default=str)}\n\n"
+
+
+_CACHE: Optional[StatusCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_cache() -> StatusCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = StatusCache()
+        return _CACHE
+
+
+def mark_dirty(key: str = "*") -> None:
+    """Notify the process-wide cache (no-op cost when nothing is serving status)."""
+    cache = _CACHE
+    if cache is not None:
+        cache.mark_dirty(key)
+
+
+__all__ = ["StatusCache", "etag_for", "get_cache", "mark_dirty", "sse_events"]
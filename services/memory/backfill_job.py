@@ -0,0 +1,276 @@
+"""
+Resumable, batched vector backfill for the Memory API (`/backfill`).
+
+Memories are streamed from a snapshot in fixed-size batches, each batch is
+pushed to the vector pod in one `/v1/memories` call (embedded and upserted
+batch-wise there), and a bounded worker pool keeps several batches in
+flight. Progress is persisted after every batch so an interrupted job can
+resume from the last contiguous committed offset (at-least-once: batches
+after the cursor that finished before the interruption are pushed again).
+
+Env defaults:
+  BACKFILL_BATCH_SIZE   (128)
+  BACKFILL_WORKERS      (4)
+  BACKFILL_RETRIES      (2)
+  BACKFILL_STATE_PATH   (data/backfill_state.json)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(str(os.getenv(name, str(default))).strip())
+    except Exception:
+        return default
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _mem_id(m: Dict[str, Any]) -> Optional[str]:
+    mid = m.get("uuid") or m.get("id")
+    return str(mid) if mid else None
+
+
+def to_vector_item(m: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Legacy `/backfill` payload shape; None when the memory has no content/id."""
+    content = m.get("content", "")
+    memory_id = _mem_id(m)
+    if not content or not memory_id:
+        return None
+    return {
+        "content": content,
+        "metadata": {
+            "memory_id": memory_id,
+            "tags": m.get("tags", []),
+            "type": m.get("type", "memory"),
+            "timestamp": m.get("timestamp", ""),
+            "speaker": m.get("speaker", ""),
+            "persona": m.get("persona", ""),
+        },
+    }
+
+
+class BackfillJob:
+    """
+    One backfill run over `source()`.
+
+    `push_batch(items) -> int` sends a batch and returns how many were written;
+    it may raise, in which case the batch is retried and then counted as failed.
+    A push that writes fewer items than it was given is treated the same way,
+    so the cursor never moves past memories that did not reach the vector pod.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], Sequence[Dict[str, Any]]],
+        push_batch: Callable[[List[Dict[str, Any]]], int],
+        *,
+        state_path: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        retries: Optional[int] = None,
+    ) -> None:
+        self._source = source
+        self._push = push_batch
+        self.state_path = state_path or os.getenv("BACKFILL_STATE_PATH", "data/backfill_state.json")
+        self.batch_size = max(1, int(batch_size or _env_int("BACKFILL_BATCH_SIZE", 128)))
+        self.workers = max(1, int(workers or _env_int("BACKFILL_WORKERS", 4)))
+        self.retries = max(0, int(retries if retries is not None else _env_int("BACKFILL_RETRIES", 2)))
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state: Dict[str, Any] = {"status": "idle"}
+
+    # ── state ──────────────────────────────────────────────────────
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _save_state(self) -> None:
+        try:
+            d = os.path.dirname(self.state_path)
+            if d:
+                os.makedirs(d, exist_ok=True)
+            tmp = f"{self.state_path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(tmp, self.state_path)
+        except Exception as e:
+            log.warning("[Backfill] failed to persist state: %s", e)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            st = dict(self._state)
+        started = st.get("_t0")
+        if started:
+            elapsed = max(1e-6, (st.get("_t1") or time.monotonic()) - started)
+            done = int(st.get("processed", 0))
+            st["elapsed_sec"] = round(elapsed, 3)
+            st["items_per_sec"] = round(done / elapsed, 2)
+            remaining = max(0, int(st.get("total", 0)) - int(st.get("cursor", 0)))
+            rate = done / elapsed
+            st["eta_sec"] = round(remaining / rate, 1) if rate > 0 else None
+        st["running"] = self.running
+        return {k: v for k, v in st.items() if not k.startswith("_")}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ── control ────────────────────────────────────────────────────
+    def start(self, *, resume: bool = True, background: bool = True) -> Dict[str, Any]:
+        if self.running:
+            return self.status()
+        records = self._source() or []
+        prev = self._load_state() if resume else {}
+        cursor = 0
+        if prev and prev.get("status") != "completed":
+            cursor = int(prev.get("cursor", 0) or 0)
+            # The cursor is an offset; make sure the record before it is unchanged.
+            anchor = prev.get("cursor_id")
+            if cursor and (cursor > len(records) or _mem_id(records[cursor - 1]) != anchor):
+                pos = next((i for i, m in enumerate(records) if _mem_id(m) == anchor), None) if anchor else None
+                cursor = pos + 1 if pos is not None else 0
+        self._cancel.clear()
+        with self._lock:
+            self._state = {
+                "job_id": prev.get("job_id") if cursor else uuid.uuid4().hex,
+                "status": "running",
+                "resumed_from": cursor,
+                "cursor": cursor,
+                "cursor_id": _mem_id(records[cursor - 1]) if cursor else None,
+                "total": len(records),
+                "processed": 0,
+                "pushed": int(prev.get("pushed", 0) or 0) if cursor else 0,
+                "skipped": 0,
+                "failed": 0,
+                "failed_batches": [],
+                "batch_size": self.batch_size,
+                "workers": self.workers,
+                "started_at": _now_iso(),
+                "updated_at": _now_iso(),
+                "_t0": time.monotonic(),
+            }
+        self._save_state()
+        if background:
+            self._thread = threading.Thread(target=self._run, args=(records, cursor), name="memory-backfill", daemon=True)
+            self._thread.start()
+        else:
+            self._run(records, cursor)
+        return self.status()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    # ── worker loop ────────────────────────────────────────────────
+    def _push_with_retry(self, items: List[Dict[str, Any]]) -> int:
+        attempt = 0
+        while True:
+            try:
+                written = int(self._push(items) or 0)
+                if written < len(items):
+                    raise RuntimeError(f"short_push inserted={written} expected={len(items)}")
+                return written
+            except Exception:
+                if attempt >= self.retries or self._cancel.is_set():
+                    raise
+                time.sleep(0.5 * (2 ** attempt))
+                attempt += 1
+
+    def _run(self, records: Sequence[Dict[str, Any]], cursor: int) -> None:
+        starts = range(cursor, len(records), self.batch_size)
+        done: Dict[int, bool] = {}  # batch start -> succeeded
+        watermark = cursor
+        max_inflight = self.workers * 2
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backfill") as pool:
+                pending: Dict[Any, tuple] = {}
+                it = iter(starts)
+                exhausted = False
+                while pending or not exhausted:
+                    while not exhausted and len(pending) < max_inflight and not self._cancel.is_set():
+                        start = next(it, None)
+                        if start is None:
+                            exhausted = True
+                            break
+                        chunk = records[start : start + self.batch_size]
+                        items = [x for x in (to_vector_item(m) for m in chunk) if x is not None]
+                        fut = pool.submit(self._push_with_retry, items) if items else None
+                        if fut is None:
+                            self._complete(start, len(chunk), 0, len(chunk), True)
+                            done[start] = True
+                            continue
+                        pending[fut] = (start, len(chunk), len(chunk) - len(items))
+                    if self._cancel.is_set():
+                        exhausted = True
+                    if not pending:
+                        continue
+                    finished, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        start, n, skipped = pending.pop(fut)
+                        try:
+                            pushed = fut.result()
+                            ok = True
+                        except Exception as e:
+                            log.warning("[Backfill] batch at %d failed: %s", start, e)
+                            pushed, ok = 0, False
+                        done[start] = ok
+                        self._complete(start, n, pushed, skipped, ok)
+                    # Advance the resumable cursor over contiguous successes only
+                    while done.get(watermark):
+                        nxt = watermark + self.batch_size
+                        del done[watermark]
+                        watermark = min(nxt, len(records))
+                    with self._lock:
+                        self._state["cursor"] = watermark
+                        self._state["cursor_id"] = _mem_id(records[watermark - 1]) if watermark else None
+                    self._save_state()
+            with self._lock:
+                if self._cancel.is_set():
+                    self._state["status"] = "cancelled"
+                elif self._state["failed_batches"]:
+                    self._state["status"] = "completed_with_errors"
+                else:
+                    self._state["status"] = "completed"
+        except Exception as e:
+            log.error("[Backfill] job failed: %s", e)
+            with self._lock:
+                self._state["status"] = "failed"
+                self._state["error"] = str(e)
+        with self._lock:
+            self._state["updated_at"] = _now_iso()
+            self._state["_t1"] = time.monotonic()
+        self._save_state()
+
+    def _complete(self, start: int, n: int, pushed: int, skipped: int, ok: bool) -> None:
+        with self._lock:
+            st = self._state
+            st["processed"] += n
+            st["pushed"] += pushed
+            st["skipped"] += skipped
+            if not ok:
+                st["failed"] += n - skipped
+                st["failed_batches"].append(start)
+            st["updated_at"] = _now_iso()
+
+
+__all__ = ["BackfillJob", "to_vector_item"]
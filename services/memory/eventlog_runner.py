@@ -1,14 +1,110 @@
 #!/usr/bin/env python3
+"""
+Eventlog consumer runner.
+
+Default runtime (EVENTLOG_RUNTIME=batched) drains the events table in batches:
+a single dispatcher claims up to EVENTLOG_BATCH_SIZE pending events, a pool of
+EVENTLOG_WORKERS threads applies them grouped by kind (memory.write events are
+embedded with one encode() call and upserted together through a long-lived
+embedder/client), and each batch is acknowledged in one transaction. Lag and
+throughput are reported as eventlog.lag / eventlog.processed / eventlog.errors.
+
+Failed events stay pending and are retried with exponential backoff
+(EVENTLOG_RETRY_BASE_SEC, capped at EVENTLOG_RETRY_MAX_SEC); after
+EVENTLOG_MAX_RETRIES retries they are marked status='error'.
+
+EVENTLOG_RUNTIME=legacy keeps the one-event-at-a-time eventlog.consumer loop.
+EVENTLOG_WORKERS defaults to 1 so batches apply in append order; with more
+workers, batches touching the same memory id may apply out of order.
+"""
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Dict
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
 
 
 def _truthy(name: str, default: bool = False) -> bool:
     return str(os.getenv(name, str(default))).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _signal(name: str, payload: Dict[str, Any]) -> None:
+    try:
+        from pods.cockpit.cockpit_reporter import write_signal  # type: ignore
+
+        write_signal("eventlog", name, payload)
+    except Exception:
+        pass
+
+
+# ── long-lived embedder / vector client ─────────────────────────────────────
+_EMBEDDER: Any = None
+_EMBEDDER_LOCK = threading.Lock()
+_CLIENT: Any = None
+
+
+def _get_embedder():
+    """Process-wide SentenceTransformer; loaded once, shared by all workers."""
+    global _EMBEDDER
+    if _EMBEDDER is None:
+        with _EMBEDDER_LOCK:
+            if _EMBEDDER is None:
+                try:
+                    from sentence_transformers import SentenceTransformer  # type: ignore
+
+                    model_name = os.getenv("AXIOM_EMBEDDER") or os.getenv("EMBEDDING_MODEL") or "all-MiniLM-L6-v2"
+                    _EMBEDDER = SentenceTransformer(model_name)
+                except Exception as e:
+                    raise RuntimeError(f"embedder_unavailable: {e}")
+    return _EMBEDDER
+
+
+def _get_client():
+    global _CLIENT
+    if _CLIENT is None:
+        from axiom_qdrant_client import QdrantClient  # type: ignore
+
+        _CLIENT = QdrantClient()
+    return _CLIENT
+
+
+def _point_models():
+    """qdrant_client.models (for PointStruct), or None when qdrant_client is absent."""
+    try:
+        from qdrant_client import models as qm  # type: ignore
+
+        return qm
+    except Exception:
+        return None
+
+
+def _memory_collection() -> str:
+    try:
+        from memory.memory_collections import memory_collection  # type: ignore
+
+        return memory_collection()
+    except Exception:
+        return "axiom_memories"
+
+
 def _journal_append_handler(ev):
     try:
         # Idempotent journal append; reuse existing helper
@@ -24,50 +120,345 @@ def _journal_append_handler(ev):
 
 
 def _memory_write_handler(ev):
+    errors = _memory_write_batch([ev])
+    if errors:
+        raise RuntimeError(next(iter(errors.values())))
+
+
+def _memory_write_batch(events: List[Any]) -> Dict[Any, str]:
+    """Embed all texts in one encode() call and upsert them together.
+
+    Returns {event key: error} for failed events; empty when all succeeded.
+    """
+    points = []
+    keys = []
+    texts = []
+    for ev in events:
+        payload = ev.payload or {}
+        text = payload.get("text") or payload.get("content") or ""
+        if not text:
+            continue
+        keys.append(getattr(ev, "seq_id", None) or ev.idem_key)
+        texts.append(text)
+        points.append((payload.get("id") or ev.idem_key, {k: v for k, v in payload.items() if k != "text"}))
+    if not texts:
+        return {}
     try:
-        from axiom_qdrant_client import QdrantClient  # type: ignore
-        from memory.memory_collections import memory_collection as _memory_collection
-        from vector.embedder_registry import current as _embedder  # may fail if disabled
-    except Exception:
-        QdrantClient = None  # type: ignore
-        _memory_collection = lambda: "axiom_memories"  # type: ignore
-
-    # Build vector and payload; rely on existing ingestion utils where possible
-    payload = ev.payload or {}
-    text = payload.get("text") or payload.get("content") or ""
-    if not text:
-        return
-    # Embedding best-effort (use existing pipeline if available)
-    try:
-        from sentence_transformers import SentenceTransformer  # type: ignore
-        model_name = os.getenv("AXIOM_EMBEDDER") or os.getenv("EMBEDDING_MODEL") or "all-MiniLM-L6-v2"
-        embedder = SentenceTransformer(model_name)
-        vec = embedder.encode(text, normalize_embeddings=True).tolist()
+        raw = _get_embedder().encode(texts, normalize_embeddings=True)
+        vecs = [v.tolist() if hasattr(v, "tolist") else list(v) for v in raw]
+        if len(vecs) != len(texts):
+            raise RuntimeError("embeddings_count_mismatch")
     except Exception as e:
-        raise RuntimeError(f"embedder_unavailable: {e}")
-    # Upsert
+        err = str(e) if str(e).startswith("embedder_unavailable") else f"embedder_unavailable: {e}"
+        return {k: err for k in keys}
     try:
-        client = QdrantClient()
-        client.upsert_memory(collection_name=_memory_collection(), memory_id=payload.get("id") or ev.idem_key, vector=vec, payload={k: v for k, v in payload.items() if k != "text"})
+        client = _get_client()
+        collection = _memory_collection()
+        batch = [(pid, vec, payload) for (pid, payload), vec in zip(points, vecs)]
+        # Same dispatch as UnifiedVectorClient._upsert_batch: adapter bulk call, else one
+        # QdrantClient.upsert() with PointStructs for the whole batch
+        bulk = getattr(client, "upsert_memories", None)
+        if callable(bulk):
+            if bulk(collection_name=collection, points=batch) is False:
+                raise RuntimeError("upsert_rejected")
+            return {}
+        qm = _point_models()
+        if qm is None or not callable(getattr(client, "upsert", None)):
+            raise RuntimeError("qdrant_models_unavailable")
+        client.upsert(
+            collection_name=collection,
+            points=[qm.PointStruct(id=pid, vector=vec, payload=payload) for pid, vec, payload in batch],
+        )
+        return {}
     except Exception as e:
-        raise RuntimeError(f"vector_upsert_failed: {e}")
+        return {k: f"vector_upsert_failed: {e}" for k in keys}
+
+
+# ── batched runtime ─────────────────────────────────────────────────────────
+class _Event:
+    __slots__ = ("seq_id", "idem_key", "cid", "kind", "payload", "ts")
+
+    def __init__(self, seq_id: int, idem_key: str, cid: str, kind: str, payload: Any, ts: Any) -> None:
+        self.seq_id = seq_id
+        self.idem_key = idem_key
+        self.cid = cid
+        self.kind = kind
+        self.payload = payload
+        self.ts = ts
+
+
+class BatchedEventRuntime:
+    """Batch-claiming, worker-pooled consumer over the eventlog events table.
+
+    `handlers` apply one event (raise on failure); `batch_handlers` take the list of
+    same-kind events in a batch and return {seq_id: error} for the ones that failed.
+    Claims and retry attempts are tracked in memory (events stay `pending` until acked
+    or out of retries), so a crashed runner simply redelivers them; handlers are
+    idempotent on idem_key.
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[Any], None]],
+        batch_handlers: Optional[Dict[str, Callable[[List[Any]], Dict[Any, str]]]] = None,
+        db_path: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_base_sec: Optional[float] = None,
+    ) -> None:
+        self.handlers = dict(handlers)
+        self.batch_handlers = dict(batch_handlers or {})
+        self.db_path = db_path or os.getenv("EVENTLOG_DB", "eventlog/axiom_events.sqlite")
+        self.batch_size = max(1, batch_size or _env_int("EVENTLOG_BATCH_SIZE", 256))
+        self.workers = max(1, workers or _env_int("EVENTLOG_WORKERS", 1))
+        self.max_retries = max(0, max_retries if max_retries is not None else _env_int("EVENTLOG_MAX_RETRIES", 5))
+        self.retry_base_sec = max(
+            0.0, retry_base_sec if retry_base_sec is not None else _env_float("EVENTLOG_RETRY_BASE_SEC", 1.0)
+        )
+        self.retry_max_sec = _env_float("EVENTLOG_RETRY_MAX_SEC", 60.0)
+        self.tick_sec = _env_float("EVENTLOG_TICK_SEC", 2.0)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="eventlog")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._inflight: Set[int] = set()
+        # seq_id -> failed attempts / monotonic time the next attempt is due
+        self._attempts: Dict[int, int] = {}
+        self._retry_at: Dict[int, float] = {}
+        self._futures: Set[Future] = set()
+        self._cursor = 0
+        self._stop = threading.Event()
+        self.processed = 0
+        self.errors = 0
+        self.retries = 0
+        self.batches = 0
+        self._rate = 0.0
+        self._started = time.monotonic()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute("PRAGMA busy_timeout=5000;")
+            self._local.conn = conn
+        return conn
+
+    # ── claim / ack ───────────────────────────────────────────────────────
+    def claim(self, limit: Optional[int] = None) -> List[_Event]:
+        """Due retries, then next pending events past the dispatch cursor, oldest first."""
+        limit = int(limit or self.batch_size)
+        now = time.monotonic()
+        with self._lock:
+            due = sorted(s for s, t in self._retry_at.items() if t <= now and s not in self._inflight)[:limit]
+        try:
+            conn = self._conn()
+            rows = []
+            if due:
+                rows = conn.execute(
+                    "SELECT seq_id, idem_key, cid, kind, payload, ts FROM events"
+                    f" WHERE status='pending' AND seq_id IN ({','.join('?' * len(due))})",
+                    due,
+                ).fetchall()
+            fresh = conn.execute(
+                "SELECT seq_id, idem_key, cid, kind, payload, ts FROM events"
+                " WHERE status='pending' AND seq_id > ? ORDER BY seq_id LIMIT ?",
+                (self._cursor, limit),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []  # events table not created yet
+        out = []
+        with self._lock:
+            for s in due:
+                self._retry_at.pop(s, None)
+            for src, batch in (("due", rows), ("fresh", fresh)):
+                for seq_id, idem_key, cid, kind, payload, ts in batch:
+                    if seq_id in self._inflight or seq_id in self._retry_at:
+                        pass  # running elsewhere, or waiting out its backoff
+                    elif len(out) >= limit:
+                        break
+                    else:
+                        try:
+                            data = json.loads(payload) if isinstance(payload, str) else (payload or {})
+                        except Exception:
+                            data = {}
+                        self._inflight.add(seq_id)
+                        out.append(_Event(seq_id, idem_key, cid, kind, data, ts))
+                    if src == "fresh":
+                        self._cursor = max(self._cursor, seq_id)
+        out.sort(key=lambda ev: ev.seq_id)
+        return out
+
+    def _ack(self, done: List[int], failed: Dict[int, str], retry: Optional[Dict[int, str]] = None) -> None:
+        conn = self._conn()
+        with conn:
+            if done:
+                conn.executemany(
+                    "UPDATE events SET status='done', last_error=NULL WHERE seq_id=?", [(s,) for s in done]
+                )
+            if failed:
+                conn.executemany(
+                    "UPDATE events SET status='error', last_error=? WHERE seq_id=?",
+                    [(str(err)[:500], s) for s, err in failed.items()],
+                )
+            if retry:
+                conn.executemany(
+                    "UPDATE events SET last_error=? WHERE seq_id=?",
+                    [(str(err)[:500], s) for s, err in retry.items()],
+                )
+
+    def _schedule_retries(self, failed: Dict[int, str]) -> Dict[int, str]:
+        """Move retryable failures onto the backoff schedule; returns those given up on."""
+        dead: Dict[int, str] = {}
+        now = time.monotonic()
+        with self._lock:
+            for s, err in failed.items():
+                n = self._attempts.get(s, 0) + 1
+                if n > self.max_retries or str(err).startswith("no_handler:"):
+                    self._attempts.pop(s, None)
+                    dead[s] = err
+                    continue
+                self._attempts[s] = n
+                self._retry_at[s] = now + min(self.retry_max_sec, self.retry_base_sec * (2 ** (n - 1)))
+        return dead
+
+    def lag(self) -> int:
+        try:
+            row = self._conn().execute("SELECT COUNT(*) FROM events WHERE status='pending'").fetchone()
+            return int(row[0] if row else 0)
+        except sqlite3.OperationalError:
+            return 0
+
+    # ── processing ────────────────────────────────────────────────────────
+    def process_batch(self, events: List[_Event]) -> int:
+        """Apply one claimed batch grouped by kind and ack it; returns events done."""
+        t0 = time.monotonic()
+        groups: Dict[str, List[_Event]] = {}
+        for ev in events:
+            groups.setdefault(ev.kind, []).append(ev)
+        failed: Dict[int, str] = {}
+        for kind, evs in groups.items():
+            batch_fn = self.batch_handlers.get(kind)
+            if batch_fn is not None:
+                try:
+                    for key, err in (batch_fn(evs) or {}).items():
+                        failed[key] = err
+                except Exception as e:
+                    failed.update({ev.seq_id: str(e) for ev in evs})
+                continue
+            fn = self.handlers.get(kind)
+            for ev in evs:
+                if fn is None:
+                    failed[ev.seq_id] = f"no_handler:{kind}"
+                    continue
+                try:
+                    fn(ev)
+                except Exception as e:
+                    failed[ev.seq_id] = str(e)
+        done = [ev.seq_id for ev in events if ev.seq_id not in failed]
+        dead = self._schedule_retries(failed)
+        retry = {s: err for s, err in failed.items() if s not in dead}
+        try:
+            self._ack(done, dead, retry)
+        finally:
+            with self._lock:
+                for s in done:
+                    self._attempts.pop(s, None)
+                self._inflight.difference_update(ev.seq_id for ev in events)
+        self._record(len(done), dead, time.monotonic() - t0, retried=len(retry))
+        return len(done)
+
+    def _record(self, ok: int, failed: Dict[int, str], elapsed: float, retried: int = 0) -> None:
+        with self._lock:
+            self.processed += ok
+            self.errors += len(failed)
+            self.retries += retried
+            self.batches += 1
+            rate = (ok + len(failed) + retried) / max(elapsed, 1e-6)
+            self._rate = rate if self.batches == 1 else 0.8 * self._rate + 0.2 * rate
+        if ok:
+            _signal("processed", {"count": ok, "events_per_sec": round(self._rate, 2)})
+        if failed:
+            _signal("errors", {"count": len(failed), "sample": list(failed.values())[:3]})
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            up = max(time.monotonic() - self._started, 1e-6)
+            return {
+                "processed": self.processed,
+                "errors": self.errors,
+                "retries": self.retries,
+                "retrying": len(self._retry_at),
+                "batches": self.batches,
+                "inflight": len(self._inflight),
+                "events_per_sec": round(self._rate, 2),
+                "avg_events_per_sec": round((self.processed + self.errors) / up, 2),
+                "lag": self.lag(),
+            }
+
+    def run_once(self) -> int:
+        """Claim and process one batch on the calling thread."""
+        events = self.claim()
+        return self.process_batch(events) if events else 0
+
+    def _dispatch(self) -> int:
+        """Keep up to `workers` batches in flight; returns batches submitted."""
+        with self._lock:
+            self._futures = {f for f in self._futures if not f.done()}
+            free = self.workers - len(self._futures)
+            if not self._futures and not self._inflight:
+                self._cursor = 0  # idle: rescan from the start
+        submitted = 0
+        while free > 0:
+            events = self.claim()
+            if not events:
+                break
+            fut = self._pool.submit(self.process_batch, events)
+            with self._lock:
+                self._futures.add(fut)
+            free -= 1
+            submitted += 1
+        return submitted
+
+    def run_forever(self) -> None:
+        last_report = 0.0
+        while not self._stop.is_set():
+            submitted = self._dispatch()
+            now = time.monotonic()
+            if now - last_report >= self.tick_sec:
+                last_report = now
+                st = self.stats()
+                _signal("lag", {"value": st.pop("lag"), **st})
+            if not submitted:
+                self._stop.wait(self.tick_sec if not self._futures else 0.05)
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        self._pool.shutdown(wait=wait)
 
 
 def main() -> int:
     if not _truthy("EVENTLOG_ENABLED", True):
         print("[eventlog] disabled")
         return 0
-    from eventlog.consumer import EventConsumer  # type: ignore
 
     handlers: Dict[str, Any] = {
         "journal.append": _journal_append_handler,
         "memory.write": _memory_write_handler,
     }
-    cons = EventConsumer(handlers)
-    cons.run_forever()
+    if (os.getenv("EVENTLOG_RUNTIME", "batched") or "batched").strip().lower() == "legacy":
+        from eventlog.consumer import EventConsumer  # type: ignore
+
+        EventConsumer(handlers).run_forever()
+        return 0
+    runtime = BatchedEventRuntime(handlers, batch_handlers={"memory.write": _memory_write_batch})
+    try:
+        runtime.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runtime.stop()
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
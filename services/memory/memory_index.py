@@ -0,0 +1,191 @@
+"""
+In-memory secondary indexes over `Memory.long_term_memory`.
+
+Positions in the index are list positions: appends take the next slot and
+in-place replacements keep theirs, so every posting list iterates in the same
+order as the underlying list. Deletions (prune, external removal) trigger a
+full rebuild, which is O(n) and no worse than the deletion itself.
+
+Indexes:
+  id -> position, type -> positions, memory_type -> positions, tag -> positions,
+  belief_type -> positions (beliefs only), and sorted (importance, pos) /
+  (confidence, pos) lists for beliefs.
+
+Entries are snapshotted when indexed so they can be unindexed correctly after
+callers mutate them in place; call `refresh()` (done by `Memory._persist`) or
+`invalidate()` after such mutations.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _num(value: Any, default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except Exception:
+        return default
+
+
+def _tags(value: Any) -> Tuple[str, ...]:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(t for t in value if isinstance(t, str))
+    if isinstance(value, str) and value:
+        return (value,)
+    return ()
+
+
+def _key(value: Any) -> Any:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+# (id, type, memory_type, tags, belief_type, importance, confidence)
+_Fields = Tuple[Optional[str], Any, Any, Tuple[str, ...], Any, float, float]
+
+
+def _fields(rec: Dict[str, Any]) -> _Fields:
+    return (
+        _key(rec.get("id") or None),
+        _key(rec.get("type")),
+        _key(rec.get("memory_type")),
+        _tags(rec.get("tags", [])),
+        _key(rec.get("belief_type")),
+        _num(rec.get("importance", 0.0), 0.0),
+        _num(rec.get("confidence", 1.0), 1.0),
+    )
+
+
+class MemoryIndex:
+    def __init__(self) -> None:
+        self.source: Optional[List[Dict[str, Any]]] = None
+        self._dirty = True
+        self._clear()
+
+    def _clear(self) -> None:
+        self.size = 0
+        self._fields: List[_Fields] = []
+        self.by_id: Dict[str, int] = {}
+        self.by_type: Dict[Any, Dict[int, None]] = {}
+        self.by_memory_type: Dict[Any, Dict[int, None]] = {}
+        self.by_tag: Dict[str, Dict[int, None]] = {}
+        self.by_belief_type: Dict[Any, Dict[int, None]] = {}
+        self.belief_importance: List[Tuple[float, int]] = []
+        self.belief_confidence: List[Tuple[float, int]] = []
+
+    # ── maintenance ────────────────────────────────────────────────
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def ensure(self, records: List[Dict[str, Any]]) -> None:
+        """Bring the index in sync with `records` (rebuild or index new tail)."""
+        if self._dirty or records is not self.source or len(records) < self.size:
+            self.rebuild(records)
+        elif len(records) > self.size:
+            for pos in range(self.size, len(records)):
+                self._add(pos, records[pos])
+            self.size = len(records)
+
+    def rebuild(self, records: List[Dict[str, Any]]) -> None:
+        self._clear()
+        self.source = records
+        for pos, rec in enumerate(records):
+            self._add(pos, rec)
+        self.size = len(records)
+        self._dirty = False
+
+    def append(self, rec: Dict[str, Any]) -> None:
+        self._add(self.size, rec)
+        self.size += 1
+
+    def replace(self, pos: int, rec: Dict[str, Any]) -> None:
+        self._remove(pos)
+        self._add(pos, rec)
+
+    def refresh(self, pos: int, rec: Dict[str, Any]) -> None:
+        """Re-index `rec` at `pos` if any indexed field changed."""
+        if pos < len(self._fields) and self._fields[pos] != _fields(rec):
+            self.replace(pos, rec)
+
+    def _add(self, pos: int, rec: Dict[str, Any]) -> None:
+        f = _fields(rec if isinstance(rec, dict) else {})
+        if pos == len(self._fields):
+            self._fields.append(f)
+        else:
+            self._fields[pos] = f
+        mid, typ, mtype, tags, btype, imp, conf = f
+        if mid is not None and mid not in self.by_id:
+            self.by_id[mid] = pos
+        self.by_type.setdefault(typ, {})[pos] = None
+        self.by_memory_type.setdefault(mtype, {})[pos] = None
+        for t in tags:
+            self.by_tag.setdefault(t, {})[pos] = None
+        if typ == "belief":
+            self.by_belief_type.setdefault(btype, {})[pos] = None
+            insort(self.belief_importance, (imp, pos))
+            insort(self.belief_confidence, (conf, pos))
+
+    def _remove(self, pos: int) -> None:
+        mid, typ, mtype, tags, btype, imp, conf = self._fields[pos]
+        if mid is not None and self.by_id.get(mid) == pos:
+            del self.by_id[mid]
+        self.by_type.get(typ, {}).pop(pos, None)
+        self.by_memory_type.get(mtype, {}).pop(pos, None)
+        for t in tags:
+            self.by_tag.get(t, {}).pop(pos, None)
+        if typ == "belief":
+            self.by_belief_type.get(btype, {}).pop(pos, None)
+            for lst, key in ((self.belief_importance, imp), (self.belief_confidence, conf)):
+                i = bisect_left(lst, (key, pos))
+                if i < len(lst) and lst[i] == (key, pos):
+                    del lst[i]
+
+    # ── lookups (positions, in list order) ────────────────────────
+    def position(self, mem_id: str) -> Optional[int]:
+        return self.by_id.get(mem_id)
+
+    @staticmethod
+    def _postings(index: Dict[Any, Dict[int, None]], key: Any) -> List[int]:
+        # Replacements re-insert at the dict tail, so restore list order.
+        return sorted(index.get(key, ()))
+
+    def of_type(self, typ: Any) -> List[int]:
+        return self._postings(self.by_type, typ)
+
+    def of_memory_types(self, mtypes: Iterable[Any]) -> List[int]:
+        out: set = set()
+        for mt in mtypes:
+            out.update(self.by_memory_type.get(mt, ()))
+        return sorted(out)
+
+    def beliefs_with_tag(self, tag: str) -> List[int]:
+        tagged = self.by_tag.get(tag, {})
+        beliefs = self.by_type.get("belief", {})
+        small, big = (tagged, beliefs) if len(tagged) <= len(beliefs) else (beliefs, tagged)
+        return sorted(p for p in small if p in big)
+
+    def beliefs_of_type(self, belief_type: Any) -> List[int]:
+        return self._postings(self.by_belief_type, belief_type)
+
+    def beliefs_importance_at_least(self, threshold: float) -> List[int]:
+        i = bisect_left(self.belief_importance, (threshold, -1))
+        return sorted(p for _, p in self.belief_importance[i:])
+
+    def beliefs_confidence_between(self, lo: float, hi: float) -> List[int]:
+        lst = self.belief_confidence
+        i = bisect_left(lst, (lo, -1))
+        out = []
+        while i < len(lst) and lst[i][0] <= hi:
+            out.append(lst[i][1])
+            i += 1
+        return sorted(out)
+
+
+__all__ = ["MemoryIndex"]
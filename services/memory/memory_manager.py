@@ -123,6 +123,8 @@ import sys
 
 from .decay_policy import decay as decay_score
 from .idempotency import canonical_fingerprint, stable_point_id
+from .memory_index import MemoryIndex
+from .memory_storage import StorageEngine, make_engine
 from .goal_types import Goal  # Adjust import path if necessary
 from .memory_types import (
     MemoryType,
@@ -677,10 +679,26 @@ class FallbackMemoryStore:
         return False
 
 
+def _lexical_index():
+    """BM25 index mirrored from Memory writes, or None unless AXIOM_BM25_INDEX_DIR is set."""
+    if not (os.getenv("AXIOM_BM25_INDEX_DIR") or "").strip():
+        return None
+    try:
+        from retrieval.bm25_index import get_index
+    except Exception:
+        return None
+    return get_index()
+
+
 class Memory:
     def __init__(self):
         self.long_term_memory: list[dict] = []
 
+        # [STORAGE_ENGINE] Persistence backend for long_term_memory (AXIOM_MEMORY_ENGINE)
+        self._engine: StorageEngine | None = None
+        # [INDEXES] id/type/tag/importance lookups over long_term_memory
+        self._index = MemoryIndex()
+
         # [TRANSACTION_SUPPORT] Transaction state management
         self.transaction_active = False
         self.transaction_id = None
@@ -990,26 +1008,78 @@ class Memory:
 
         return entry
 
+    @property
+    def storage(self) -> StorageEngine:
+        """Storage engine bound to the current MEMORY_FILE (rebuilt if it changes)."""
+        if self._engine is None or getattr(self._engine, "path", None) != MEMORY_FILE:
+            self._engine = make_engine(MEMORY_FILE)
+        return self._engine
+
     def load(self):
         try:
-            if os.path.exists(MEMORY_FILE):
-                with open(MEMORY_FILE, "r") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        self.long_term_memory = data
-                    else:
-                        self.long_term_memory = data.get("memories", [])
+            self.long_term_memory = self.storage.load()
         except Exception as e:
             log.error(f"Failed to load memory: {e}")
             self.long_term_memory = []
+            self._index.invalidate()
+            return
+        self._index.invalidate()
+        # Reconcile the lexical index with the loaded store (covers out-of-band writes)
+        self._sync_lexical(flush=True)
 
     def save(self):
+        """Persist the full in-memory state (snapshot for the log engine)."""
+        # Callers may have edited entries in place before saving.
+        self._index.invalidate()
+        try:
+            self.storage.save_all(self.long_term_memory)
+        except Exception as e:
+            log.error(f"Failed to save memory: {e}")
+        self._sync_lexical()
+
+    def _sync_lexical(self, flush: bool = False):
+        """Bring the BM25 index in line with long_term_memory (puts and deletes)."""
+        lexical = _lexical_index()
+        if lexical is None:
+            return
         try:
-            os.makedirs(os.path.dirname(MEMORY_FILE), exist_ok=True)
-            with open(MEMORY_FILE, "w") as f:
-                json.dump(self.long_term_memory, f, indent=2)
+            puts, deletes = lexical.sync(self.long_term_memory)
+            if flush and (puts or deletes):
+                lexical.flush()
+        except Exception as e:
+            log.warning(f"BM25 index sync failed: {e}")
+
+    @property
+    def index(self) -> MemoryIndex:
+        """Secondary indexes, synced with long_term_memory on access."""
+        self._index.ensure(self.long_term_memory)
+        return self._index
+
+    def _at(self, positions: list[int]) -> list[dict]:
+        ltm = self.long_term_memory
+        return [ltm[p] for p in positions]
+
+    def _persist(self, puts: Optional[List[dict]] = None, deletes: Optional[List[str]] = None):
+        """Persist a delta: O(record) on the log engine, full rewrite on json."""
+        index = self.index
+        for rec in puts or ():
+            pos = index.position(rec.get("id")) if rec.get("id") else None
+            if pos is not None and self.long_term_memory[pos] is rec:
+                index.refresh(pos, rec)
+        try:
+            self.storage.commit(self.long_term_memory, puts=puts or (), deletes=deletes or ())
         except Exception as e:
             log.error(f"Failed to save memory: {e}")
+        lexical = _lexical_index()
+        if lexical is not None:
+            try:
+                lexical.apply(puts=puts or (), deletes=deletes or ())
+            except Exception as e:
+                log.warning(f"BM25 index update failed: {e}")
+
+    def export_json(self, path: str | None = None) -> int:
+        """Write long_term_memory as an indented JSON list (legacy file format)."""
+        return self.storage.export_json(path or MEMORY_FILE, self.long_term_memory)
 
     def __len__(self):
         return len(self.long_term_memory)
@@ -1019,7 +1089,13 @@ class Memory:
             return self.long_term_memory[:]
         return self.long_term_memory[-limit:]
 
-    def store(self, entry: dict) -> str:
+    def _prepare_entry(self, entry: dict) -> tuple[dict, Optional[str]]:
+        """
+        Validate, firewall and enrich one entry ahead of persistence.
+
+        Returns ``(record, routed_id)``; ``routed_id`` is set when the entry was
+        handed to the claim store and must not be stored here.
+        """
         # Validate and normalize metadata to prevent .lower() errors
         entry = self.validate_metadata(entry)
 
@@ -1062,7 +1138,7 @@ class Memory:
             try:
                 from claims import route_to_claim_store
 
-                return route_to_claim_store(entry)
+                return entry, route_to_claim_store(entry)
             except Exception as e:
                 log.warning(
                     f"Failed to route to claim store, storing as regular memory: {e}"
@@ -1106,17 +1182,23 @@ class Memory:
         except Exception as e:
             log.warning(f"Failed to enhance memory with causal data: {e}")
 
-        # Check for duplicates by ID
+        return enriched, None
+
+    def _place(self, enriched: dict) -> bool:
+        """Insert or replace `enriched` in long_term_memory; True if it was new."""
+        index = self.index
         entry_id = enriched.get("id")
         if entry_id:
-            for i, existing in enumerate(self.long_term_memory):
-                if existing.get("id") == entry_id:
-                    self.long_term_memory[i] = enriched
-                    self.save()
-                    return entry_id
-
+            i = index.position(entry_id)
+            if i is not None:
+                self.long_term_memory[i] = enriched
+                index.replace(i, enriched)
+                return False
         self.long_term_memory.append(enriched)
+        index.append(enriched)
+        return True
 
+    def _store_in_backend(self, enriched: dict):
         # [QDRANT_BACKEND] Store in vector database if available, or fallback if not
         if self.memory_backend:
             try:
@@ -1145,6 +1227,7 @@ class Memory:
             # Check for extended fallback mode
             self.fallback_store.check_long_fallback_mode()
 
+    def _after_store(self, enriched: dict):
         # [COGNITIVE_LOGGING] Log memory storage
         log_memory_stored(
             memory_id=enriched.get("id", "unknown"),
@@ -1154,7 +1237,7 @@ class Memory:
             source="memory_manager",
         )
 
-        self.save()
+    def _observe(self, enriched: dict):
         # [OBSERVER] Non-blocking, env-gated JSON log to stdout
         try:
             from axiom.hooks.observer import observe
@@ -1171,8 +1254,62 @@ class Memory:
             )
         except Exception:
             pass
+
+    def store(self, entry: dict) -> str:
+        enriched, routed_id = self._prepare_entry(entry)
+        if routed_id is not None:
+            return routed_id
+
+        # Check for duplicates by ID
+        if not self._place(enriched):
+            self._persist(puts=[enriched])
+            return enriched.get("id")
+
+        self._store_in_backend(enriched)
+        self._after_store(enriched)
+        self._persist(puts=[enriched])
+        self._observe(enriched)
         return entry.get("id", "unknown")
 
+    def store_many(self, entries: list[dict]) -> list[dict]:
+        """
+        Group-commit ingest: enrich every entry, then make a single durable
+        commit for the whole batch. Backend writes stay per record.
+
+        Returns one result per input, in order: ``{"id": ...}`` (plus
+        ``"deduped": True`` for replacements) or ``{"error": ...}``.
+        """
+        results: list[dict] = []
+        puts: list[dict] = []
+        fresh: list[dict] = []
+        for raw in entries:
+            try:
+                if not isinstance(raw, dict):
+                    raise TypeError("entry must be an object")
+                enriched, routed_id = self._prepare_entry(raw)
+                if routed_id is not None:
+                    results.append({"id": routed_id, "routed": "claim"})
+                    continue
+                is_new = self._place(enriched)
+                puts.append(enriched)
+                if is_new:
+                    fresh.append(enriched)
+                    results.append({"id": enriched.get("id", "unknown")})
+                else:
+                    results.append({"id": enriched.get("id"), "deduped": True})
+            except Exception as e:
+                log.warning(f"⚠️ store_many: rejected entry: {e}")
+                results.append({"error": str(e)})
+
+        if puts:
+            for rec in fresh:
+                self._store_in_backend(rec)
+                self._after_store(rec)
+            self._persist(puts=puts)
+            for rec in fresh:
+                self._observe(rec)
+        return results
+
     def add_to_long_term(self, entry: dict):
         # [TRANSACTION_SUPPORT] Buffer memory operations during transactions
         if self.transaction_active:
@@ -1189,7 +1326,8 @@ class Memory:
         return [m.get("id", "") for m in self.long_term_memory if m.get("id")]
 
     def get(self, mem_id: str) -> dict | None:
-        result = next((m for m in self.long_term_memory if m.get("id") == mem_id), None)
+        pos = self.index.position(mem_id)
+        result = self.long_term_memory[pos] if pos is not None else None
 
         # [COGNITIVE_LOGGING] Log memory retrieval
         if result:
@@ -1203,7 +1341,7 @@ class Memory:
         return result
 
     def get_goals(self) -> list[dict]:
-        return [m for m in self.long_term_memory if m.get("type") == "goal"]
+        return self._at(self.index.of_type("goal"))
 
     def add_goal(self, goal: Goal):
         self.store(goal.to_dict())
@@ -1216,69 +1354,51 @@ class Memory:
         ]
 
     def find_beliefs_by_tag(self, tag: str) -> list[dict]:
-        return [
-            b
-            for b in self.long_term_memory
-            if b.get("type") == "belief" and tag in b.get("tags", [])
-        ]
+        return self._at(self.index.beliefs_with_tag(tag))
 
     def find_beliefs_by_type(self, belief_type: str) -> list[dict]:
-        return [
-            b
-            for b in self.long_term_memory
-            if b.get("type") == "belief" and b.get("belief_type") == belief_type
-        ]
+        return self._at(self.index.beliefs_of_type(belief_type))
 
     def get_high_importance_beliefs(self, min_importance: float = 0.8) -> list[dict]:
-        return [
-            b
-            for b in self.long_term_memory
-            if b.get("type") == "belief" and b.get("importance", 0.0) >= min_importance
-        ]
+        return self._at(self.index.beliefs_importance_at_least(min_importance))
 
     def get_decayed_beliefs(
         self, min_confidence: float = 0.3, max_confidence: float = 0.7
     ) -> list[dict]:
-        return [
-            b
-            for b in self.long_term_memory
-            if b.get("type") == "belief"
-            and min_confidence <= b.get("confidence", 1.0) <= max_confidence
-        ]
+        return self._at(
+            self.index.beliefs_confidence_between(min_confidence, max_confidence)
+        )
 
     def decay(self, rate: float = 0.01):
         for entry in self.long_term_memory:
             old = entry.get("importance", 1.0)
             entry["importance"] = round(max(0.0, old - rate), 4)
+        self._index.invalidate()
         log.info("🧪 Applied semantic decay to memory.")
         self.save()
 
     def prune(self, threshold: float = 0.2):
         before = len(self.long_term_memory)
-        self.long_term_memory = [
-            m for m in self.long_term_memory if m.get("importance", 1.0) > threshold
-        ]
+        kept, dropped = [], []
+        for m in self.long_term_memory:
+            (kept if m.get("importance", 1.0) > threshold else dropped).append(m)
+        self.long_term_memory = kept
+        self._index.invalidate()
         after = len(self.long_term_memory)
         if after < before:
             log.info(f"🧹 Pruned {before - after} low-importance memory entries.")
-            self.save()
+            if all(m.get("id") for m in dropped):
+                self._persist(deletes=[m["id"] for m in dropped])
+            else:
+                self.save()
 
     def get_memories_by_type(self, memory_type: MemoryType) -> list[dict]:
         """Get all memories of a specific hierarchical type"""
-        return [
-            mem
-            for mem in self.long_term_memory
-            if mem.get("memory_type") == memory_type.value
-        ]
+        return self._at(self.index.of_memory_types([memory_type.value]))
 
     def get_memories_by_types(self, memory_types: list[MemoryType]) -> list[dict]:
         """Get all memories matching any of the specified types"""
-        type_values = [mt.value for mt in memory_types]
-        return [
-            mem
-            for mem in self.long_term_memory
-            if mem.get("memory_type") in type_values
-        ]
+        return self._at(self.index.of_memory_types(mt.value for mt in memory_types))
 
     def promote_memory(self, memory_id: str) -> dict | None:
         """Promote a memory to a higher hierarchical level if applicable"""
@@ -1297,7 +1417,7 @@ class Memory:
                 memory_type_manager.get_default_importance(new_type),
             )
 
-            self.save()
+            self._persist(puts=[memory])
             return {
                 "memory_id": memory_id,
                 "promoted_from": old_type,
@@ -1326,13 +1446,14 @@ class Memory:
             new_importance = current_importance * exp(-rate * days_old)
             mem["importance"] = max(new_importance, 0.01)  # Minimum threshold
 
-        self.save()
+        self._persist(puts=memories)
         return len(memories)
 
 
 def decay_beliefs(self):
     updated = 0
     expired_flagged = 0
+    touched = []
     now_iso = (
         datetime.now(timezone.utc)
         .replace(microsecond=0)
@@ -1353,6 +1474,7 @@ def decay_beliefs(self):
                 entry["temporal_tags"] = temporal_tags
                 entry["updated_at"] = now_iso
                 expired_flagged += 1
+                touched.append(entry)
             continue
 
         # [TEMPORAL] Skip decay if belief is not currently valid (if temporal reasoning is available)
@@ -1373,6 +1495,7 @@ def decay_beliefs(self):
             entry["confidence"] = new_conf
             entry["updated_at"] = now_iso
             updated += 1
+            touched.append(entry)
 
     if TEMPORAL_AVAILABLE and expired_flagged > 0:
         log.info(
@@ -1382,7 +1505,7 @@ def decay_beliefs(self):
         log.info(f"🧠 Decayed {updated} belief confidence values.")
 
     if updated or expired_flagged:
-        self.save()
+        self._persist(puts=touched)
 
 
 Memory.decay_beliefs = decay_beliefs
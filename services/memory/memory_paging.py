@@ -0,0 +1,385 @@
+"""
+Paging helpers for GET /memories (stdlib-only).
+
+- Stable ordering by (timestamp, id); `timestamp` falls back to `created_at`
+  (epoch seconds are normalized to ISO-8601 so both sort together).
+- Opaque cursors: urlsafe base64 of [timestamp, id, order]. A page holds the items
+  strictly after the cursor in the requested order, so inserts between calls never
+  shift or repeat items already returned.
+- Page selection streams the source through a bounded heap (offset + limit + 1),
+  so a page never materializes the filtered corpus.
+- Qdrant scroll helpers: a Weaviate-like filter spec for `qdrant_utils.to_qdrant_filter`
+  and a lazy scroll iterator that fetches only the payload keys a request needs.
+- Ordered Qdrant paging: with a range index on `timestamp`, the scroll runs in page
+  order (`order_by`, starting at the cursor), since/until become a DatetimeRange, and
+  `MemoryQuery.bounded` stops reading once limit + 1 rows (plus timestamp ties) are in.
+"""
+
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+TS_KEYS = ("timestamp", "created_at")
+ID_KEYS = ("uuid", "id", "point_id")
+ORDERS = ("desc", "asc")
+
+SortKey = Tuple[str, str]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def normalize_ts(value: Any) -> str:
+    """Comparable timestamp string: ISO-8601 without zone suffix ('' when missing)."""
+    if value is None or value == "":
+        return ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            return datetime.fromtimestamp(float(value), tz=timezone.utc).replace(tzinfo=None).isoformat()
+        except Exception:
+            return ""
+    s = str(value).strip()
+    if s.endswith("Z"):
+        s = s[:-1]
+    elif s.endswith("+00:00"):
+        s = s[:-6]
+    return s.replace(" ", "T", 1)
+
+
+def item_id(item: Dict[str, Any]) -> str:
+    for k in ID_KEYS:
+        v = item.get(k)
+        if v not in (None, ""):
+            return str(v)
+    return ""
+
+
+def sort_key(item: Dict[str, Any]) -> SortKey:
+    ts = ""
+    for k in TS_KEYS:
+        ts = normalize_ts(item.get(k))
+        if ts:
+            break
+    return (ts, item_id(item))
+
+
+def encode_cursor(key: SortKey, order: str) -> str:
+    raw = json.dumps([key[0], key[1], order], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[SortKey, str]:
+    """(sort key, order) from an opaque cursor; raises ValueError when malformed."""
+    try:
+        pad = "=" * (-len(cursor) % 4)
+        ts, iid, order = json.loads(base64.urlsafe_b64decode(cursor + pad).decode("utf-8"))
+        if order not in ORDERS:
+            raise ValueError(order)
+        return (str(ts), str(iid)), order
+    except Exception as e:
+        raise ValueError("invalid_cursor") from e
+
+
+def _split(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        parts = [str(v) for v in value]
+    else:
+        parts = str(value).split(",")
+    return [p.strip() for p in parts if p and p.strip()]
+
+
+class MemoryQuery:
+    """Parsed GET /memories parameters (filters, projection, ordering, paging)."""
+
+    def __init__(
+        self,
+        speaker: Optional[str] = None,
+        user_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        memory_type: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: int = 25,
+        cursor: Optional[str] = None,
+        page: Optional[int] = None,
+        order: str = "desc",
+    ) -> None:
+        self.speaker = speaker
+        self.user_id = user_id
+        self.tags = list(tags or [])
+        self.memory_type = memory_type
+        self.ids = set(ids) if ids else None
+        self.since = normalize_ts(since) if since else ""
+        self.until = normalize_ts(until) if until else ""
+        self.fields = list(fields) if fields else None
+        self.limit = max(1, min(int(limit), _env_int("MEMORIES_MAX_LIMIT", 1000)))
+        self.after: Optional[SortKey] = None
+        self.order = order if order in ORDERS else "desc"
+        if cursor:
+            self.after, self.order = decode_cursor(cursor)
+        self.page = max(0, int(page or 0)) if not cursor else 0
+
+    @classmethod
+    def from_args(cls, get: Any, default_speaker: Optional[str] = None, default_limit: int = 25) -> "MemoryQuery":
+        """Build from a `request.args.get`-style callable; raises ValueError on bad input."""
+        speaker = get("speaker", default_speaker)
+        if speaker in ("*", ""):
+            speaker = None
+        try:
+            limit = int(get("limit", default_limit) or default_limit)
+            page = int(get("page") or 0)
+        except Exception as e:
+            raise ValueError("invalid_limit_or_page") from e
+        order = str(get("order") or "desc").strip().lower()
+        if order not in ORDERS:
+            raise ValueError("invalid_order")
+        return cls(
+            speaker=speaker,
+            user_id=get("user_id") or None,
+            tags=_split(get("tags")),
+            memory_type=get("type") or None,
+            ids=_split(get("ids") or get("id")) or None,
+            since=get("since") or None,
+            until=get("until") or None,
+            fields=_split(get("fields")) or None,
+            limit=limit,
+            cursor=(get("cursor") or "").strip() or None,
+            page=page,
+            order=order,
+        )
+
+    # ── filtering ───────────────────────────────────────────────────────────
+    def matches(self, item: Any) -> bool:
+        if not isinstance(item, dict):
+            return False
+        if self.speaker is not None and item.get("speaker") != self.speaker:
+            return False
+        if self.user_id is not None and item.get("user_id") != self.user_id:
+            return False
+        if self.memory_type is not None and item.get("type") != self.memory_type:
+            return False
+        if self.tags:
+            tags = item.get("tags")
+            if not isinstance(tags, list) or not set(self.tags).intersection(str(t) for t in tags):
+                return False
+        if self.ids is not None and not self.ids.intersection(str(item.get(k)) for k in ID_KEYS if item.get(k) is not None):
+            return False
+        if self.since or self.until:
+            ts = sort_key(item)[0]
+            if self.since and ts < self.since:
+                return False
+            if self.until and ts >= self.until:
+                return False
+        return True
+
+    def filter_spec(self, time_range: bool = False) -> Dict[str, Any]:
+        """Weaviate-like filter for `qdrant_utils.to_qdrant_filter` (equality and tag filters).
+
+        time_range: also bound `timestamp` by since/until. Only for ordered scrolls, which
+        already skip points without a `timestamp` (the `created_at` fallback is not pushed).
+        """
+        must: List[Dict[str, Any]] = []
+        for key, val in (("speaker", self.speaker), ("user_id", self.user_id), ("type", self.memory_type)):
+            if val is not None:
+                must.append({"key": key, "match": {"value": val}})
+        if self.tags:
+            must.append({"key": "tags", "match": {"any": list(self.tags)}})
+        if time_range and (self.since or self.until):
+            rng = {k: v for k, v in (("gte", self.since), ("lt", self.until)) if v}
+            must.append({"key": "timestamp", "range": rng})
+        return {"must": must} if must else {}
+
+    def start_from(self) -> Optional[str]:
+        """Inclusive order_by start for an ordered scroll: the cursor timestamp, if any."""
+        return self.after[0] if self.after is not None and self.after[0] else None
+
+    def payload_keys(self) -> Any:
+        """Payload selector for scroll: True, or just the keys projection, filters and ordering need."""
+        if self.fields is None:
+            return True
+        keys = {f.split(".", 1)[0] for f in self.fields}
+        keys.update(TS_KEYS)
+        keys.update(ID_KEYS)
+        keys.update(("speaker", "user_id", "type", "tags"))
+        return sorted(keys)
+
+    # ── paging ──────────────────────────────────────────────────────────────
+    def _after_cursor(self, item: Dict[str, Any]) -> bool:
+        if self.after is None:
+            return True
+        key = sort_key(item)
+        return key < self.after if self.order == "desc" else key > self.after
+
+    def select(self, items: Iterable[Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """(page items in order, next cursor or None) from any iterable of memory dicts."""
+        skip = self.page * self.limit
+        want = skip + self.limit + 1
+        pool = (it for it in items if self.matches(it) and self._after_cursor(it))
+        pick = heapq.nlargest if self.order == "desc" else heapq.nsmallest
+        ranked = pick(want, pool, key=sort_key)
+        page = ranked[skip : skip + self.limit]
+        next_cursor = encode_cursor(sort_key(page[-1]), self.order) if page and len(ranked) > skip + self.limit else None
+        return [self.project(it) for it in page], next_cursor
+
+    def bounded(self, items: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """Matching items from a source already ordered by timestamp in `self.order`.
+
+        Stops once offset + limit + 1 items are in and the timestamp moves on, so
+        `select` sees every id tied at the page boundary and nothing past it.
+        """
+        want = self.page * self.limit + self.limit + 1
+        n = 0
+        last = None
+        for it in items:
+            if not (self.matches(it) and self._after_cursor(it)):
+                continue
+            ts = sort_key(it)[0]
+            if n >= want and ts != last:
+                return
+            n += 1
+            last = ts
+            yield it
+
+    def stream(self, items: Iterable[Any], limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Matching items in source order (exports), projected; optionally capped."""
+        n = 0
+        for it in items:
+            if limit is not None and n >= limit:
+                return
+            if self.matches(it) and self._after_cursor(it):
+                n += 1
+                yield self.project(it)
+
+    def project(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        if self.fields is None:
+            return item
+        out: Dict[str, Any] = {}
+        for f in self.fields:
+            head, _, rest = f.partition(".")
+            if head not in item:
+                continue
+            if not rest:
+                out[head] = item[head]
+                continue
+            val: Any = item[head]
+            for part in rest.split("."):
+                if not isinstance(val, dict) or part not in val:
+                    break
+                val = val[part]
+            else:
+                node = out.setdefault(head, {})
+                if isinstance(node, dict):
+                    parts = rest.split(".")
+                    for part in parts[:-1]:
+                        node = node.setdefault(part, {})
+                    node[parts[-1]] = val
+        return out
+
+
+def _item_from_point(point: Any) -> Optional[Dict[str, Any]]:
+    payload = getattr(point, "payload", None)
+    if not payload:
+        return None
+    item = dict(payload)
+    pid = getattr(point, "id", None)
+    if "uuid" not in item and pid is not None:
+        item["uuid"] = str(pid)
+    if "point_id" not in item and pid is not None:
+        item["point_id"] = str(pid)
+    return item
+
+
+def iter_qdrant_items(
+    client: Any,
+    collection: str,
+    scroll_filter: Any = None,
+    with_payload: Any = True,
+    batch: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Lazily scroll a collection (no vectors), yielding payload dicts shaped like the startup cache."""
+    size = max(1, int(batch or _env_int("MEMORIES_SCROLL_BATCH", 256)))
+    offset = None
+    while True:
+        kw = {"collection_name": collection, "limit": size, "offset": offset, "with_payload": with_payload, "with_vectors": False}
+        try:
+            points, offset = client.scroll(scroll_filter=scroll_filter, **kw)
+        except TypeError:
+            # Older clients name the argument 'filter'
+            points, offset = client.scroll(filter=scroll_filter, **kw)
+        for point in points or []:
+            item = _item_from_point(point)
+            if item is not None:
+                yield item
+        if not offset:
+            return
+
+
+def iter_qdrant_ordered(
+    client: Any,
+    collection: str,
+    order_by: Callable[[Any], Any],
+    key: str = "timestamp",
+    start_from: Any = None,
+    scroll_filter: Any = None,
+    with_payload: Any = True,
+    batch: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Scroll in `key` order via `order_by(start)` (e.g. `qdrant_utils.to_qdrant_order_by`).
+
+    Ordered scrolls have no next-page offset, so each page restarts at the last
+    value seen (inclusive) and skips ids already yielded at that value. The
+    payload selector must include `key`.
+    """
+    size = max(1, int(batch or _env_int("MEMORIES_SCROLL_BATCH", 256)))
+    start = start_from
+    seen: set = set()  # ids already yielded whose `key` equals `start`
+    while True:
+        limit = size + len(seen)
+        points, _ = client.scroll(
+            collection_name=collection,
+            scroll_filter=scroll_filter,
+            limit=limit,
+            order_by=order_by(start),
+            with_payload=with_payload,
+            with_vectors=False,
+        )
+        points = list(points or [])
+        for point in points:
+            if getattr(point, "id", None) in seen:
+                continue
+            item = _item_from_point(point)
+            if item is not None:
+                yield item
+        if len(points) < limit:
+            return
+        last = (getattr(points[-1], "payload", None) or {}).get(key)
+        if last is None:
+            return
+        tied = {getattr(p, "id", None) for p in points if (getattr(p, "payload", None) or {}).get(key) == last}
+        seen = seen | tied if last == start else tied
+        start = last
+
+
+__all__ = [
+    "MemoryQuery",
+    "decode_cursor",
+    "encode_cursor",
+    "item_id",
+    "iter_qdrant_items",
+    "iter_qdrant_ordered",
+    "normalize_ts",
+    "sort_key",
+]
@@ -0,0 +1,537 @@
+"""
+Pluggable persistence engines for `Memory.long_term_memory`.
+
+Two engines are available, selected with AXIOM_MEMORY_ENGINE:
+
+- ``json`` (default): legacy behaviour. Every commit rewrites MEMORY_FILE as an
+  indented JSON list, so write cost is O(corpus).
+- ``log``: snapshot + write-ahead log. Each commit appends one JSON line per
+  changed record to the active WAL segment (O(record)). Sealed segments are
+  folded into a new snapshot by a background compactor, and `load()` replays
+  snapshot + remaining segments. MEMORY_FILE stays the import/export format:
+  it is imported on first load and can be regenerated with `export_json()`.
+
+On-disk layout for the log engine (``<MEMORY_FILE>.d/``)::
+
+    MANIFEST.json         {"snapshot": "snapshot-000004.json", "covers_through": 4}
+    snapshot-000004.json  compact JSON list of records
+    wal-000005.log        {"op": "put", "rec": {...}} / {"op": "del", "id": "..."}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+_WAL_RE = re.compile(r"^wal-(\d{6,})\.log$")
+_MANIFEST = "MANIFEST.json"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(str(os.getenv(name, str(default))).strip())
+    except Exception:
+        return default
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    return str(os.getenv(name, "1" if default else "0")).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _atomic_write_json(path: str, obj: Any, *, indent: Optional[int] = None) -> None:
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=indent, separators=None if indent else (",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _read_json_list(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return list(data.get("memories", []) or [])
+    return []
+
+
+def _iter_json_stream(f: IO[str], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON list one at a time (bounded buffer)."""
+    dec = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def _fill() -> None:
+        nonlocal buf, pos, eof
+        more = f.read(chunk_size)
+        eof = not more
+        buf, pos = buf[pos:] + more, 0
+
+    def _skip(chars: str) -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            _fill()
+
+    _skip(" \t\r\n\ufeff")
+    if pos >= len(buf):
+        return
+    if buf[pos] != "[":
+        # {"memories": [...]} and other legacy shapes: fall back to a full parse.
+        buf, pos = buf[pos:] + f.read(), 0
+        data = json.loads(buf)
+        yield from (data.get("memories", []) or []) if isinstance(data, dict) else ()
+        return
+    pos += 1
+    while True:
+        _skip(" \t\r\n,")
+        if pos >= len(buf) or buf[pos] == "]":
+            return
+        while True:
+            try:
+                obj, end = dec.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                _fill()
+                continue
+            if end >= len(buf) and not eof:
+                # A scalar at the buffer edge may be cut short; decode again with more input.
+                _fill()
+                continue
+            break
+        pos = end
+        yield obj
+
+
+def _iter_json_list(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _iter_json_stream(f)
+
+
+class StorageEngine:
+    """Interface shared by the engines.
+
+    `commit()` receives the full in-memory state plus the delta that produced it;
+    each engine persists whichever of the two it needs.
+    """
+
+    name = "base"
+    # True when every `delete_ids` call rewrites the whole store, so callers
+    # should hand it all ids at once rather than in batches.
+    rewrites_on_delete = True
+
+    def load(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def save_all(self, records: Sequence[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def commit(
+        self,
+        state: Sequence[Dict[str, Any]],
+        puts: Iterable[Dict[str, Any]] = (),
+        deletes: Iterable[str] = (),
+    ) -> None:
+        raise NotImplementedError
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream the current records without materializing the corpus (where supported)."""
+        return iter(self.load())
+
+    def delete_ids(self, ids: Iterable[str]) -> List[str]:
+        """Remove records by id as one batch; returns the ids that were present and removed."""
+        drop = {str(i) for i in ids}
+        records = self.load()
+        kept = [r for r in records if str(r.get("id")) not in drop]
+        self.save_all(kept)
+        return [str(r.get("id")) for r in records if str(r.get("id")) in drop]
+
+    def export_json(self, path: str, records: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        recs = list(records) if records is not None else self.load()
+        _atomic_write_json(path, recs, indent=2)
+        return len(recs)
+
+    def close(self) -> None:
+        return None
+
+
+class JsonFileEngine(StorageEngine):
+    """Legacy whole-file JSON persistence."""
+
+    name = "json"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        return _read_json_list(self.path)
+
+    def save_all(self, records: Sequence[Dict[str, Any]]) -> None:
+        d = os.path.dirname(self.path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(list(records), f, indent=2)
+
+    def commit(self, state, puts=(), deletes=()) -> None:  # type: ignore[override]
+        self.save_all(state)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        if os.path.exists(self.path):
+            yield from _iter_json_list(self.path)
+
+    def delete_ids(self, ids: Iterable[str]) -> List[str]:
+        """Streamed rewrite without the dropped ids (constant memory, O(corpus) I/O)."""
+        drop = {str(i) for i in ids}
+        if not drop or not os.path.exists(self.path):
+            return []
+        removed: List[str] = []
+        tmp = f"{self.path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(tmp, "w", encoding="utf-8") as out:
+                out.write("[")
+                first = True
+                for rec in _iter_json_list(self.path):
+                    if isinstance(rec, dict) and str(rec.get("id")) in drop:
+                        removed.append(str(rec.get("id")))
+                        continue
+                    out.write("\n  " if first else ",\n  ")
+                    out.write(json.dumps(rec))
+                    first = False
+                out.write("\n]" if not first else "]")
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(tmp, self.path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return removed
+
+
+class AppendLogEngine(StorageEngine):
+    """Snapshot + write-ahead-log engine with background compaction."""
+
+    name = "log"
+    rewrites_on_delete = False
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        directory: Optional[str] = None,
+        segment_bytes: Optional[int] = None,
+        compact_bytes: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        background: bool = True,
+    ) -> None:
+        self.path = path
+        self.dir = directory or f"{path}.d"
+        self.segment_bytes = segment_bytes or _env_int("AXIOM_MEMORY_WAL_SEGMENT_BYTES", 16 * 1024 * 1024)
+        self.compact_bytes = compact_bytes or _env_int("AXIOM_MEMORY_COMPACT_BYTES", 64 * 1024 * 1024)
+        self.fsync = _env_bool("AXIOM_MEMORY_WAL_FSYNC", False) if fsync is None else bool(fsync)
+        self.background = background
+        # _lock guards the active segment; _compact_lock serialises snapshot rewrites.
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        os.makedirs(self.dir, exist_ok=True)
+
+    # ── layout helpers ──────────────────────────────────────────────
+    def _manifest(self) -> Dict[str, Any]:
+        p = os.path.join(self.dir, _MANIFEST)
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                m = json.load(f)
+            if isinstance(m, dict):
+                return m
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("[MemoryStorage] unreadable manifest %s: %s", p, e)
+        return {}
+
+    def _segments(self) -> List[int]:
+        seqs = []
+        try:
+            for name in os.listdir(self.dir):
+                m = _WAL_RE.match(name)
+                if m:
+                    seqs.append(int(m.group(1)))
+        except FileNotFoundError:
+            return []
+        return sorted(seqs)
+
+    def _seg_path(self, seq: int) -> str:
+        return os.path.join(self.dir, f"wal-{seq:06d}.log")
+
+    def _active_seq(self, covers_through: int) -> int:
+        live = [s for s in self._segments() if s > covers_through]
+        return live[-1] if live else covers_through + 1
+
+    def _wal_bytes(self, covers_through: int) -> int:
+        total = 0
+        for s in self._segments():
+            if s > covers_through:
+                try:
+                    total += os.path.getsize(self._seg_path(s))
+                except OSError:
+                    pass
+        return total
+
+    # ── replay ──────────────────────────────────────────────────────
+    @staticmethod
+    def _replay(records: List[Optional[Dict[str, Any]]], index: Dict[str, int], path: str) -> int:
+        applied = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = json.loads(line)
+                except Exception:
+                    # Torn record from a crash mid-append; skip it.
+                    log.warning("[MemoryStorage] skipping torn WAL record %s:%d", path, lineno)
+                    continue
+                kind = op.get("op")
+                if kind == "put":
+                    rec = op.get("rec") or {}
+                    rid = rec.get("id")
+                    pos = index.get(rid) if rid else None
+                    if pos is not None and records[pos] is not None:
+                        records[pos] = rec
+                    else:
+                        if rid:
+                            index[rid] = len(records)
+                        records.append(rec)
+                elif kind == "del":
+                    pos = index.pop(op.get("id"), None)
+                    if pos is not None:
+                        records[pos] = None
+                applied += 1
+        return applied
+
+    def _materialize(self, manifest: Dict[str, Any], through: Optional[int] = None) -> List[Dict[str, Any]]:
+        covers = int(manifest.get("covers_through", 0) or 0)
+        records: List[Optional[Dict[str, Any]]] = []
+        snap = manifest.get("snapshot")
+        if snap:
+            records = list(_read_json_list(os.path.join(self.dir, snap)))
+        index = {r.get("id"): i for i, r in enumerate(records) if isinstance(r, dict) and r.get("id")}
+        for seq in self._segments():
+            if seq <= covers or (through is not None and seq > through):
+                continue
+            self._replay(records, index, self._seg_path(seq))
+        return [r for r in records if r is not None]
+
+    # ── public API ──────────────────────────────────────────────────
+    def load(self) -> List[Dict[str, Any]]:
+        manifest = self._manifest()
+        if not manifest and not self._segments():
+            # First run: import the legacy JSON file (if any) as the base snapshot.
+            if os.path.exists(self.path):
+                records = _read_json_list(self.path)
+                self.save_all(records)
+                log.info("[MemoryStorage] imported %d records from %s", len(records), self.path)
+                return records
+            return []
+        return self._materialize(manifest)
+
+    def _append(self, ops: List[Dict[str, Any]]) -> None:
+        if not ops:
+            return
+        payload = "".join(json.dumps(op, separators=(",", ":")) + "\n" for op in ops)
+        with self._lock:
+            covers = int(self._manifest().get("covers_through", 0) or 0)
+            seq = self._active_seq(covers)
+            path = self._seg_path(seq)
+            try:
+                if os.path.getsize(path) >= self.segment_bytes:
+                    seq += 1
+                    path = self._seg_path(seq)
+            except OSError:
+                pass
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        self._maybe_compact()
+
+    def commit(self, state, puts=(), deletes=()) -> None:  # type: ignore[override]
+        ops: List[Dict[str, Any]] = [{"op": "put", "rec": r} for r in puts]
+        ops.extend({"op": "del", "id": i} for i in deletes)
+        self._append(ops)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream snapshot records with the live WAL folded in.
+
+        Only the WAL overlay (bounded by AXIOM_MEMORY_COMPACT_BYTES) is held in memory;
+        the snapshot is decoded record by record.
+        """
+        with self._compact_lock:
+            manifest = self._manifest()
+            if not manifest and not self._segments():
+                legacy = open(self.path, "r", encoding="utf-8") if os.path.exists(self.path) else None
+                overlay: Dict[str, Optional[Dict[str, Any]]] = {}
+                extra: List[Dict[str, Any]] = []
+            else:
+                covers = int(manifest.get("covers_through", 0) or 0)
+                overlay, extra = {}, []
+                for seq in self._segments():
+                    if seq > covers:
+                        self._overlay(overlay, extra, self._seg_path(seq))
+                snap = manifest.get("snapshot")
+                # Keep the handle open: a concurrent compaction may unlink the file.
+                legacy = open(os.path.join(self.dir, snap), "r", encoding="utf-8") if snap else None
+        if legacy is not None:
+            with legacy:
+                for rec in _iter_json_stream(legacy):
+                    rid = rec.get("id") if isinstance(rec, dict) else None
+                    if rid in overlay:
+                        rec = overlay.pop(rid)
+                        if rec is None:
+                            continue
+                    yield rec
+        for rec in overlay.values():
+            if rec is not None:
+                yield rec
+        yield from extra
+
+    @staticmethod
+    def _overlay(overlay: Dict[str, Optional[Dict[str, Any]]], extra: List[Dict[str, Any]], path: str) -> None:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = json.loads(line)
+                except Exception:
+                    continue
+                if op.get("op") == "put":
+                    rec = op.get("rec") or {}
+                    if rec.get("id"):
+                        overlay[rec["id"]] = rec
+                    else:
+                        extra.append(rec)
+                elif op.get("op") == "del" and op.get("id"):
+                    overlay[op["id"]] = None
+
+    def delete_ids(self, ids: Iterable[str]) -> List[str]:
+        """Append one del op per present id to the WAL; returns those ids.
+
+        Presence is checked with one streamed pass (constant memory), so ids that are
+        already gone neither grow the WAL nor count as deleted. Writers keep appending.
+        """
+        if not self._manifest() and not self._segments() and os.path.exists(self.path):
+            # Import the legacy file first so the deletes apply on top of it.
+            self.load()
+        drop = {str(i) for i in ids}
+        if not drop:
+            return []
+        present = list(dict.fromkeys(str(r.get("id")) for r in self.iter_records() if isinstance(r, dict) and str(r.get("id")) in drop))
+        if present:
+            self._append([{"op": "del", "id": i} for i in present])
+        return present
+
+    def save_all(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Write a fresh snapshot of `records` and drop every existing segment."""
+        with self._compact_lock, self._lock:
+            manifest = self._manifest()
+            covers = int(manifest.get("covers_through", 0) or 0)
+            through = max([covers] + self._segments())
+            self._install_snapshot(list(records), through, manifest)
+
+    def _install_snapshot(self, records: List[Dict[str, Any]], through: int, old: Dict[str, Any]) -> None:
+        name = f"snapshot-{through:06d}.json"
+        _atomic_write_json(os.path.join(self.dir, name), records)
+        _atomic_write_json(
+            os.path.join(self.dir, _MANIFEST),
+            {"snapshot": name, "covers_through": through, "count": len(records)},
+        )
+        for seq in self._segments():
+            if seq <= through:
+                try:
+                    os.remove(self._seg_path(seq))
+                except OSError:
+                    pass
+        prev = old.get("snapshot")
+        if prev and prev != name:
+            try:
+                os.remove(os.path.join(self.dir, prev))
+            except OSError:
+                pass
+
+    def compact(self) -> int:
+        """Fold all sealed segments into a new snapshot; returns the record count."""
+        with self._compact_lock:
+            with self._lock:
+                manifest = self._manifest()
+                covers = int(manifest.get("covers_through", 0) or 0)
+                live = [s for s in self._segments() if s > covers]
+                if not live:
+                    return int(manifest.get("count", 0) or 0)
+                # Seal the active segment so writers move on while we fold.
+                through = live[-1]
+                open(self._seg_path(through + 1), "a").close()
+            records = self._materialize(manifest, through=through)
+            with self._lock:
+                self._install_snapshot(records, through, manifest)
+            log.info("[MemoryStorage] compacted through segment %d (%d records)", through, len(records))
+            return len(records)
+
+    def _maybe_compact(self) -> None:
+        try:
+            covers = int(self._manifest().get("covers_through", 0) or 0)
+            if self._wal_bytes(covers) < self.compact_bytes:
+                return
+        except Exception:
+            return
+        if not self.background:
+            self.compact()
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_quietly, name="memory-compactor", daemon=True)
+        self._compactor.start()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            log.warning("[MemoryStorage] background compaction failed: %s", e)
+
+    def close(self) -> None:
+        t = self._compactor
+        if t is not None and t.is_alive():
+            t.join(timeout=30)
+
+
+def make_engine(path: str, kind: Optional[str] = None) -> StorageEngine:
+    """Build the engine selected by `kind` or AXIOM_MEMORY_ENGINE (json|log)."""
+    k = (kind or os.getenv("AXIOM_MEMORY_ENGINE", "json") or "json").strip().lower()
+    if k in {"log", "wal", "append"}:
+        return AppendLogEngine(path)
+    if k != "json":
+        log.warning("[MemoryStorage] unknown AXIOM_MEMORY_ENGINE=%s; using json", k)
+    return JsonFileEngine(path)
+
+
+__all__ = ["StorageEngine", "JsonFileEngine", "AppendLogEngine", "make_engine"]
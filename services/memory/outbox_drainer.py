@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Batching outbox drainer.
+
+Claims up to OUTBOX_DRAIN_BATCH items per round and coalesces them by type instead
+of handling each item on its own:
+
+- vector_upsert     → one UnifiedVectorClient.insert() for the whole group
+                      (one chunked embed + bulk upsert), errors mapped back per item
+- belief_recompute  → one recompute per distinct belief, however many memories touched
+                      it in the batch. Items carry memory_id; it is resolved to the
+                      beliefs citing it (belief graph sources) before deduping. Items
+                      with an explicit belief_id / belief_ids skip the lookup; memories
+                      no belief cites yet fall back to one recompute per memory_id
+- anything else     → the per-item handler, as outbox.worker would
+
+Every item is still acked (ack_done) or retried (fail_and_maybe_retry → DLQ after
+OUTBOX_MAX_RETRIES) on its own. Drain rate, batch size and backlog age are kept in
+stats() and reported as the outbox.drain cockpit signal every OUTBOX_DRAIN_REPORT_SEC.
+
+Run: python -m pods.memory.outbox_drainer
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _signal(name: str, payload: Dict[str, Any]) -> None:
+    try:
+        from pods.cockpit.cockpit_reporter import write_signal  # type: ignore
+
+        write_signal("outbox", name, payload)
+    except Exception:
+        pass
+
+
+def _saga_step(cid: str, step: str, ok: bool, info: Dict[str, Any]) -> None:
+    try:
+        from governor.saga import saga_step  # type: ignore
+
+        saga_step(cid, "WriteMemorySaga", step, ok, info)
+    except Exception:
+        pass
+
+
+def _created_epoch(item: Any) -> Optional[float]:
+    for attr in ("created_at", "ts", "enqueued_at"):
+        v = getattr(item, attr, None)
+        if v in (None, ""):
+            continue
+        try:
+            if isinstance(v, (int, float)):
+                return float(v) / (1000.0 if v > 1e12 else 1.0)
+            d = datetime.fromisoformat(str(v).replace("Z", "+00:00"))
+            return (d if d.tzinfo else d.replace(tzinfo=timezone.utc)).timestamp()
+        except Exception:
+            continue
+    return None
+
+
+def _explicit_belief_keys(payload: Dict[str, Any]) -> List[str]:
+    keys = payload.get("belief_ids") or payload.get("belief_keys") or []
+    if isinstance(keys, (str, int)):
+        keys = [keys]
+    one = payload.get("belief_id") or payload.get("belief_key")
+    out = [str(k) for k in keys if k not in (None, "")]
+    if one not in (None, "") and str(one) not in out:
+        out.append(str(one))
+    return out
+
+
+_BELIEF_GRAPH: Any = None
+
+
+def _beliefs_for_memories(memory_ids: List[str]) -> Dict[str, List[str]]:
+    """{memory_id: [belief id, ...]} from the SQLite belief graph; {} when it is absent."""
+    global _BELIEF_GRAPH
+    path = (os.getenv("AXIOM_BELIEF_SQLITE_PATH") or "").strip()
+    if not path or not os.path.exists(path):
+        return {}
+    if _BELIEF_GRAPH is None or getattr(_BELIEF_GRAPH, "db_path", None) != path:
+        from belief_graph.sqlite_backend import SQLiteBeliefGraph  # type: ignore
+
+        _BELIEF_GRAPH = SQLiteBeliefGraph(path)
+    return _BELIEF_GRAPH.beliefs_for_sources(memory_ids)
+
+
+# ── default coalesced handlers ──────────────────────────────────────────────
+_VECTOR_CLIENT: Any = None
+
+
+def _vector_upsert_batch(items: List[Any]) -> Dict[int, str]:
+    """One insert() for all vector_upsert items; returns {item id: error}."""
+    global _VECTOR_CLIENT
+    if _VECTOR_CLIENT is None:
+        from vector.unified_client import UnifiedVectorClient  # type: ignore
+
+        _VECTOR_CLIENT = UnifiedVectorClient(os.environ)
+    docs = []
+    by_pid: Dict[str, List[int]] = {}
+    for it in items:
+        payload = dict(it.payload or {})
+        meta = dict(payload.get("metadata") or {})
+        meta.setdefault("memory_id", str(meta.get("memory_id") or it.idem_key))
+        by_pid.setdefault(str(meta["memory_id"]), []).append(int(it.id))
+        docs.append({"content": payload.get("content") or payload.get("text") or "", "metadata": meta})
+    out = _VECTOR_CLIENT.insert(docs) or {}
+    failed: Dict[int, str] = {}
+    for err in out.get("errors") or []:
+        for item_id in by_pid.get(str(err.get("id")), []):
+            failed[item_id] = str(err.get("error") or "upsert_failed")
+    if not out.get("inserted") and not failed and any(d["content"].strip() for d in docs):
+        failed = {int(it.id): "vector_insert_unavailable" for it in items}
+    return failed
+
+
+class BatchingOutboxDrainer:
+    """Claim → coalesce per type → ack/retry per item.
+
+    `batch_handlers` map a type to fn(items) -> {item id: error}; `handlers` map a type to
+    the legacy per-item fn(payload). belief_recompute uses `belief_recompute(payload)` once
+    per distinct belief; `belief_resolver(memory_ids)` maps memory ids to the beliefs they
+    feed. `store` defaults to outbox.store (claim / ack_done / fail_and_maybe_retry).
+    """
+
+    def __init__(
+        self,
+        handlers: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+        batch_handlers: Optional[Dict[str, Callable[[List[Any]], Dict[int, str]]]] = None,
+        store: Any = None,
+        batch_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        belief_resolver: Optional[Callable[[List[str]], Dict[str, List[str]]]] = None,
+    ) -> None:
+        if store is None:
+            from outbox import store as store  # type: ignore
+        if max_retries is None:
+            try:
+                from outbox import OUTBOX_MAX_RETRIES as max_retries  # type: ignore
+            except Exception:
+                max_retries = _env_int("OUTBOX_MAX_RETRIES", 8)
+        if handlers is None:
+            try:
+                from outbox.worker import build_default_handlers  # type: ignore
+
+                handlers = build_default_handlers()
+            except Exception:
+                handlers = {}
+        self.store = store
+        self.max_retries = int(max_retries)
+        self.handlers = dict(handlers)
+        self.belief_resolver = belief_resolver or _beliefs_for_memories
+        self.batch_handlers = {"vector_upsert": _vector_upsert_batch, "belief_recompute": self._belief_batch}
+        self.batch_handlers.update(batch_handlers or {})
+        self.batch_size = max(1, batch_size or _env_int("OUTBOX_DRAIN_BATCH", 64))
+        self.report_sec = _env_float("OUTBOX_DRAIN_REPORT_SEC", 10.0)
+        self.poll_sec = _env_float("OUTBOX_DRAIN_POLL_SEC", 1.0)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.drained = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_batch_size = 0
+        self.backlog_age_sec = 0.0
+        self._rate = 0.0
+
+    def _belief_batch(self, items: List[Any]) -> Dict[int, str]:
+        fn = self.handlers.get("belief_recompute")
+        if fn is None:
+            return {int(it.id): "no_handler:belief_recompute" for it in items}
+        pending = sorted(
+            {
+                str((it.payload or {}).get("memory_id"))
+                for it in items
+                if not _explicit_belief_keys(it.payload or {}) and (it.payload or {}).get("memory_id")
+            }
+        )
+        try:
+            resolved = self.belief_resolver(pending) if pending else {}
+        except Exception:
+            resolved = {}
+        # key -> (items, is_belief); one recompute per key
+        groups: Dict[str, tuple] = {}
+        for it in items:
+            payload = it.payload or {}
+            keys = _explicit_belief_keys(payload) or resolved.get(str(payload.get("memory_id")), [])
+            if keys:
+                for key in keys:
+                    groups.setdefault("belief:" + key, ([], key))[0].append(it)
+            else:
+                groups.setdefault("memory:" + str(payload.get("memory_id") or it.idem_key), ([], None))[0].append(it)
+        failed: Dict[int, str] = {}
+        for group, belief_id in groups.values():
+            payload = {**(group[-1].payload or {}), "coalesced": len(group)}
+            if belief_id is not None:
+                payload["belief_id"] = belief_id
+                payload["memory_ids"] = sorted({str((it.payload or {}).get("memory_id")) for it in group if (it.payload or {}).get("memory_id")})
+            try:
+                fn(payload)
+            except Exception as e:
+                failed.update({int(it.id): str(e) for it in group})
+        return failed
+
+    def drain_once(self) -> int:
+        """Claim one batch, apply it coalesced per type, ack/retry per item. Returns items claimed."""
+        claimed = list(self.store.claim(max_items=self.batch_size) or [])
+        # Items without an id cannot be acked or retried; leave them to the store
+        items = [it for it in claimed if getattr(it, "id", None) is not None]
+        if not items:
+            return len(claimed)
+        t0 = time.monotonic()
+        ages = [time.time() - c for c in (_created_epoch(it) for it in items) if c is not None]
+        groups: Dict[str, List[Any]] = {}
+        for it in items:
+            groups.setdefault(str(it.type), []).append(it)
+        failed: Dict[int, str] = {}
+        for typ, group in groups.items():
+            batch_fn = self.batch_handlers.get(typ)
+            if batch_fn is not None:
+                try:
+                    failed.update(batch_fn(group) or {})
+                except Exception as e:
+                    failed.update({int(it.id): str(e) for it in group})
+                continue
+            fn = self.handlers.get(typ)
+            for it in group:
+                try:
+                    if fn is None:
+                        raise RuntimeError(f"no_handler:{typ}")
+                    fn(it.payload or {})
+                except Exception as e:
+                    failed[int(it.id)] = str(e)
+        for it in items:
+            item_id = int(it.id)
+            ok = item_id not in failed
+            try:
+                if ok:
+                    self.store.ack_done(item_id)
+                else:
+                    self.store.fail_and_maybe_retry(item_id, failed[item_id], self.max_retries)
+            except Exception:
+                pass
+            _saga_step(str(it.cid), str(it.type), ok, {"batch": len(items)})
+        elapsed = max(time.monotonic() - t0, 1e-6)
+        with self._lock:
+            self.batches += 1
+            self.drained += len(items) - len(failed)
+            self.failed += len(failed)
+            self.last_batch_size = len(items)
+            self.backlog_age_sec = max(ages) if ages else 0.0
+            rate = len(items) / elapsed
+            self._rate = rate if self.batches == 1 else 0.8 * self._rate + 0.2 * rate
+        return len(items)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "drained": self.drained,
+                "failed": self.failed,
+                "batches": self.batches,
+                "last_batch_size": self.last_batch_size,
+                "avg_batch_size": round((self.drained + self.failed) / self.batches, 2) if self.batches else 0.0,
+                "drain_rate_per_sec": round(self._rate, 2),
+                "backlog_age_sec": round(self.backlog_age_sec, 3),
+            }
+
+    def run_forever(self) -> None:
+        last_report = 0.0
+        while not self._stop.is_set():
+            n = self.drain_once()
+            now = time.monotonic()
+            if now - last_report >= self.report_sec:
+                last_report = now
+                _signal("drain", self.stats())
+            if n < self.batch_size:
+                self._stop.wait(self.poll_sec)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def main() -> int:
+    drainer = BatchingOutboxDrainer()
+    try:
+        drainer.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,7 +9,8 @@ Endpoints
 • /summarise    – keyword + fact summary
 • /answer       – simple contextual answer
 • /vector/query – semantic search via Qdrant
-• /backfill     – push all local memory into Qdrant
+• /backfill     – batched, resumable push of local memory into Qdrant
+• /backfill/status – backfill progress and throughput
 • /goals        – list and add goals
 • /beliefs      – list all beliefs
 • /journal/latest – get most recent journal entry
@@ -209,6 +210,7 @@ import json
 import os
 import time
 import threading
+import inspect
 import traceback
 import uuid
 from datetime import datetime
@@ -222,12 +224,13 @@ except Exception:
         return None
 
 
-from flask import Flask, jsonify, request, g, make_response
+from flask import Flask, Response, jsonify, request, g, make_response
 from security import auth as ax_auth
 import re
 import uuid
 
 import memory_response_pipeline
+import retrieval_context
 from flask_cors import CORS
 from qdrant_client import QdrantClient
 # ─────────────────────────────────────────────
@@ -342,10 +345,11 @@ except Exception:
 SentenceTransformer = None  # type: ignore
 
 # Utilities for Qdrant filtering and projection
-from .qdrant_utils import to_qdrant_filter, post_filter_items, project_fields
+from .qdrant_utils import to_qdrant_filter, to_qdrant_order_by, post_filter_items, project_fields
 
 from .goal_types import Goal  # <-- Make sure this exists and is correct
 from .memory_manager import Memory
+from .backfill_job import BackfillJob
 
 # Unified Vector Client (Phase 1 unification)
 try:
@@ -397,8 +401,6 @@ load_dotenv()
 # ――― FEATURE FLAG: Memory Class Switch ―――
 USE_MEMORY_ARCHIVE = True
 
-import asyncio
-
 import requests
 # ─────────────────────────────────────────────
 # Retrieval-aware answers: env toggles (read once at import)
@@ -644,6 +646,23 @@ world_map_obj: dict = {}
 # Keep a lightweight facts index derived from the canonical world map.
 world_map: dict = {}
 
+try:
+    # Read index: id/alias lookup, adjacency by relation type, cached sorted views
+    from world_map_index import WorldMapIndex, file_signature as _wm_file_signature  # type: ignore
+except Exception:  # pragma: no cover
+    WorldMapIndex = None  # type: ignore
+    _wm_file_signature = None  # type: ignore
+
+world_map_index = WorldMapIndex() if WorldMapIndex is not None else None
+
+try:
+    # GET /memories cursors, projection and Qdrant scroll pushdown
+    from memory_paging import MemoryQuery, iter_qdrant_items, iter_qdrant_ordered  # type: ignore
+except Exception:  # pragma: no cover
+    MemoryQuery = None  # type: ignore
+    iter_qdrant_items = None  # type: ignore
+    iter_qdrant_ordered = None  # type: ignore
+
 _WORLD_MAP_LOCK = threading.Lock()
 
 
@@ -716,13 +735,17 @@ def _build_legacy_world_facts_index(obj: dict) -> dict:
 
 
 def _reload_world_map_locked() -> None:
-    global world_map_path_used, world_map_loaded, world_map_obj, world_map
+    global world_map_path_used, world_map_loaded, world_map_obj, world_map, world_map_index
     path = resolve_world_map_path()
+    # Stat before reading so a write racing the load shows up as a change next time.
+    sig = _wm_file_signature(path) if _wm_file_signature is not None else None
     obj = load_world_map(path)
     world_map_path_used = path
     world_map_obj = obj if isinstance(obj, dict) else {}
     world_map_loaded = bool(world_map_obj)
     world_map = _build_legacy_world_facts_index(world_map_obj)
+    if WorldMapIndex is not None:
+        world_map_index = WorldMapIndex(world_map_obj, signature=sig)
     logger.info(
         "[world_map] startup"
         + f" path={world_map_path_used!r}"
@@ -735,16 +758,26 @@ def _reload_world_map_locked() -> None:
 def reload_world_map() -> None:
     """
     Lightweight reload helper.
-    If WORLD_MAP_RELOAD=1, endpoints can call this per-request.
+    Full rebuild of the world map and its index (POST /world_map/reload, external edits).
     """
     with _WORLD_MAP_LOCK:
         _reload_world_map_locked()
 
 
+def _world_map_changed_on_disk() -> bool:
+    if world_map_index is None or _wm_file_signature is None:
+        return True
+    path = resolve_world_map_path()
+    return path != world_map_path_used or _wm_file_signature(path) != world_map_index.signature
+
+
 def _maybe_reload_world_map() -> None:
+    """If WORLD_MAP_RELOAD=1, reload when world_map.json changed on disk (one stat per request)."""
     try:
         if (os.getenv("WORLD_MAP_RELOAD") or "").strip() == "1":
-            reload_world_map()
+            with _WORLD_MAP_LOCK:
+                if _world_map_changed_on_disk():
+                    _reload_world_map_locked()
     except Exception:
         return
 
@@ -853,53 +886,34 @@ def _jsonl_append(path: str, record: dict) -> None:
         fh.write(line + "\n")
 
 
-def _jsonl_load_all(path: str) -> list[dict]:
-    p = str(path or "").strip()
-    if not p or (not os.path.exists(p)):
-        return []
-    out: list[dict] = []
-    try:
-        with open(p, "r", encoding="utf-8") as fh:
-            for ln in fh:
-                s = (ln or "").strip()
-                if not s:
-                    continue
-                try:
-                    obj = json.loads(s)
-                    if isinstance(obj, dict):
-                        out.append(obj)
-                except Exception:
-                    continue
-    except Exception:
-        return []
-    return out
+try:
+    # Append-only proposal log with an id -> offset index (O(1) status updates)
+    from world_map_proposals import ProposalStore  # type: ignore
+except Exception:  # pragma: no cover
+    ProposalStore = None  # type: ignore
 
+_PROPOSAL_STORES: dict = {}
+_PROPOSAL_STORES_LOCK = threading.Lock()
 
-def _jsonl_update_record(path: str, proposal_id: str, updates: dict) -> dict | None:
-    """Rewrite JSONL in-place updating the first matching proposal_id."""
-    p = str(path or "").strip()
-    if not p:
+
+def _world_map_proposal_store():
+    """Process-wide ProposalStore for the configured path (None if the module is unavailable)."""
+    if ProposalStore is None:
         return None
-    items = _jsonl_load_all(p)
-    updated: dict | None = None
-    for i, rec in enumerate(items):
-        if isinstance(rec, dict) and str(rec.get("proposal_id") or "") == str(proposal_id):
-            new_rec = dict(rec)
-            new_rec.update({k: v for k, v in (updates or {}).items()})
-            items[i] = new_rec
-            updated = new_rec
-            break
-    if updated is None:
+    path = _world_map_proposal_store_path()
+    with _PROPOSAL_STORES_LOCK:
+        st = _PROPOSAL_STORES.get(path)
+        if st is None:
+            st = ProposalStore(path)
+            _PROPOSAL_STORES[path] = st
+        return st
+
+
+def _world_map_proposal_update(proposal_id: str, updates: dict) -> dict | None:
+    st = _world_map_proposal_store()
+    if st is None:
         return None
-    parent = os.path.dirname(p) or "."
-    os.makedirs(parent, exist_ok=True)
-    tmp = f"{p}.tmp"
-    with open(tmp, "w", encoding="utf-8") as fh:
-        for rec in items:
-            if isinstance(rec, dict):
-                fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
-    os.replace(tmp, p)
-    return updated
+    return st.update(proposal_id, updates)
 
 
 def _world_map_entity_exists(entity_id: str) -> bool:
@@ -910,8 +924,39 @@ def _world_map_entity_exists(entity_id: str) -> bool:
         return False
 
 
+def _apply_world_map_ops_indexed(*, path: str, entity_id: str, ops: list[dict]) -> tuple[bool, dict]:
+    """Apply ops to one entity of the in-process index, persist, then swap the entity in (no reload)."""
+    global world_map_obj, world_map
+    with _WORLD_MAP_LOCK:
+        # Disk is the source of truth: pick up external edits before applying on top.
+        if _world_map_changed_on_disk():
+            _reload_world_map_locked()
+        index = world_map_index
+        try:
+            new_obj, new_entity, changed_fields = index.apply_entity_ops(entity_id, ops, _wm_apply_ops_in_memory)
+        except Exception as e:
+            return False, {"error": "apply_failed", "detail": f"{type(e).__name__}: {str(e)[:200]}"}
+        try:
+            _tmp, backup = _wm_atomic_write(world_map_path=path, new_obj=new_obj)
+        except Exception as e:
+            return False, {"error": "write_failed", "detail": f"{type(e).__name__}: {str(e)[:200]}"}
+        index.replace_entity(str(new_entity.get("id")), new_entity, new_obj, signature=_wm_file_signature(path))
+        world_map_obj = new_obj
+        if str(new_entity.get("id")) == "example_person":
+            world_map = {"ExamplePerson": new_entity}
+    return True, {
+        "ok": True,
+        "world_map_path": path,
+        "backup_path": backup,
+        "changed_fields": list(changed_fields or []),
+        "world_map_loaded": bool(world_map_loaded),
+        "entities": index.entities_count,
+        "relationships": index.relationships_count,
+    }
+
+
 def _apply_world_map_ops_atomic(*, entity_id: str, ops: list[dict]) -> tuple[bool, dict]:
-    """Apply ops to world_map.json with backup+atomic write, then reload."""
+    """Apply ops to world_map.json with backup+atomic write, then update in-memory caches."""
     if _wm_apply_ops_in_memory is None or _wm_atomic_write is None:
         return False, {"error": "world_map_write_module_unavailable"}
     path = resolve_world_map_path()
@@ -919,6 +964,8 @@ def _apply_world_map_ops_atomic(*, entity_id: str, ops: list[dict]) -> tuple[boo
         return False, {"error": "world_map_path_unresolved"}
     if not os.path.exists(path):
         return False, {"error": "world_map_missing", "path": path}
+    if world_map_index is not None and _wm_file_signature is not None:
+        return _apply_world_map_ops_indexed(path=path, entity_id=entity_id, ops=ops)
 
     # Load from disk (source of truth for writes)
     current = load_world_map(path)
@@ -1146,12 +1193,20 @@ def _get_embedder():
                         return [] if not single else []
                     payload = {"texts": batch, "model": self._model}
                     timeout = float(os.getenv("AXIOM_EMBEDDING_TIMEOUT_SEC", "12") or 12)
-                    r = requests.post(f"{self._base}/embed", json=payload, timeout=timeout)
+                    try:
+                        from vector import embed_wire as _wire  # type: ignore
+                    except Exception:
+                        _wire = None  # type: ignore
+                    headers = {"Accept": _wire.accept_header(_wire.client_dtype())} if _wire else None
+                    r = requests.post(f"{self._base}/embed", json=payload, timeout=timeout, headers=headers)
                     r.raise_for_status()
-                    data = r.json() or {}
-                    vecs = data.get("vectors") or []
-                    if not isinstance(vecs, list) or len(vecs) != len(batch):
+                    # Binary wire decodes into a (rows, dims) matrix, like SentenceTransformer.encode; copied
+                    # below so callers never see the read-only view over the response body
+                    vecs = _wire.vectors_from_response(r) if _wire else (r.json() or {}).get("vectors")
+                    if vecs is None or isinstance(vecs, (str, dict)) or len(vecs) != len(batch):
                         raise RuntimeError("embeddings_invalid_response")
+                    if _wire:
+                        vecs = _wire.owned_vectors(vecs)
                     return vecs[0] if single else vecs
 
             _embedder = _RemoteEmbedderCompat(base_url, model_name)
@@ -1755,6 +1810,8 @@ def _wm_relationships_section() -> Any:
 
 
 def _wm_get_entity(entity_id: str) -> dict | None:
+    if world_map_index is not None:
+        return world_map_index.get_entity(str(entity_id))
     entities = _wm_entities_section()
     if isinstance(entities, list):
         for ent in entities:
@@ -1790,6 +1847,8 @@ def _wm_filter_relationships(entity_id: str, direction: str) -> List[dict]:
     if want not in {"any", "out", "in"}:
         want = "any"
     ent = str(entity_id)
+    if world_map_index is not None:
+        return world_map_index.relationships(world_map_index.resolve(ent) or ent, want)
 
     rels = _wm_list_relationships()
     out: List[dict] = []
@@ -1996,9 +2055,11 @@ def world_map_propose():
         "applied_ts": None,
         "error": None,
     }
-    store_path = _world_map_proposal_store_path()
+    store = _world_map_proposal_store()
+    if store is None:
+        return jsonify({"ok": False, "error": "proposal_store_unavailable"}), 500
     try:
-        _jsonl_append(store_path, rec)
+        store.add(rec)
     except Exception as e:
         return jsonify({"ok": False, "error": "proposal_store_write_failed", "detail": str(e)[:200]}), 500
 
@@ -2030,8 +2091,7 @@ def world_map_propose():
         if can_auto:
             ok, detail = _apply_world_map_ops_atomic(entity_id=entity_id, ops=list(ops or []))
             if ok:
-                _jsonl_update_record(
-                    store_path,
+                _world_map_proposal_update(
                     proposal_id,
                     {
                         "status": "applied",
@@ -2040,8 +2100,7 @@ def world_map_propose():
                     },
                 )
                 return jsonify({"ok": True, "proposal_id": proposal_id, "status": "applied", "detail": detail}), 200
-            _jsonl_update_record(
-                store_path,
+            _world_map_proposal_update(
                 proposal_id,
                 {
                     "status": "rejected",
@@ -2059,7 +2118,7 @@ def world_map_propose():
 
 @app.route("/world_map/pending", methods=["GET"])
 def world_map_pending():
-    """List pending proposals from the JSONL store (last N)."""
+    """List proposals by status (default pending), newest page first; `cursor` pages back."""
     if not _world_map_write_enabled():
         return jsonify({"ok": False, "error": "world_map_write_disabled"}), 403
     try:
@@ -2067,12 +2126,19 @@ def world_map_pending():
     except Exception:
         limit = 50
     limit = max(1, min(limit, 500))
+    status = (request.args.get("status") or "pending").strip().lower()
+    if status == "all":
+        status = ""
+    elif status not in ("pending", "applied", "rejected"):
+        return jsonify({"ok": False, "error": "invalid_status", "status": status}), 400
+    cursor = (request.args.get("cursor") or "").strip() or None
+    entity_id = (request.args.get("entity_id") or "").strip() or None
 
-    store_path = _world_map_proposal_store_path()
-    items = _jsonl_load_all(store_path)
-    pending = [r for r in items if isinstance(r, dict) and r.get("status") == "pending"]
-    pending = pending[-limit:]
-    return jsonify({"ok": True, "count": len(pending), "proposals": pending}), 200
+    store = _world_map_proposal_store()
+    if store is None:
+        return jsonify({"ok": False, "error": "proposal_store_unavailable"}), 500
+    items, next_cursor = store.list(status=status or None, limit=limit, before=cursor, entity_id=entity_id)
+    return jsonify({"ok": True, "count": len(items), "proposals": items, "next_cursor": next_cursor}), 200
 
 
 @app.route("/world_map/apply/<proposal_id>", methods=["POST"])
@@ -2084,13 +2150,10 @@ def world_map_apply(proposal_id: str):
     if not pid:
         return jsonify({"ok": False, "error": "missing_proposal_id"}), 400
 
-    store_path = _world_map_proposal_store_path()
-    items = _jsonl_load_all(store_path)
-    rec = None
-    for r in items:
-        if isinstance(r, dict) and str(r.get("proposal_id") or "") == pid:
-            rec = r
-            break
+    store = _world_map_proposal_store()
+    if store is None:
+        return jsonify({"ok": False, "error": "proposal_store_unavailable"}), 500
+    rec = store.get(pid)
     if rec is None:
         return jsonify({"ok": False, "error": "proposal_not_found", "proposal_id": pid}), 404
     if rec.get("status") != "pending":
@@ -2115,8 +2178,7 @@ def world_map_apply(proposal_id: str):
         for_auto_apply_kurt=False,
     )
     if not getattr(vr, "ok", False):
-        _jsonl_update_record(
-            store_path,
+        _world_map_proposal_update(
             pid,
             {"status": "rejected", "error": {"error": getattr(vr, "error", "invalid_proposal"), "detail": getattr(vr, "detail", None)}},
         )
@@ -2124,15 +2186,13 @@ def world_map_apply(proposal_id: str):
 
     ok, detail = _apply_world_map_ops_atomic(entity_id=entity_id, ops=list(ops or []))
     if ok:
-        _jsonl_update_record(
-            store_path,
+        _world_map_proposal_update(
             pid,
             {"status": "applied", "applied_ts": datetime.utcnow().isoformat() + "Z", "error": None},
         )
         return jsonify({"ok": True, "proposal_id": pid, "status": "applied", "detail": detail}), 200
 
-    _jsonl_update_record(
-        store_path,
+    _world_map_proposal_update(
         pid,
         {"status": "rejected", "error": detail},
     )
@@ -2463,6 +2523,313 @@ def add_memory():
         return jsonify({"error": str(e)}), 500
 
 
+def _json_append_many(recs: List[Dict[str, Any]]) -> List[str]:
+    """Batch form of `_json_append`: one load and one save for the whole batch."""
+    rows = _json_load()
+    now = time.time()
+    ids: List[str] = []
+    for rec in recs:
+        rid = str(uuid.uuid4())
+        rows.append(
+            {
+                "uuid": rid,
+                "user_id": rec.get("user_id"),
+                "source": rec.get("source", "unknown"),
+                "content": rec.get("content") or rec.get("text") or "",
+                "created_at": rec.get("created_at", now),
+                **{
+                    k: v
+                    for k, v in rec.items()
+                    if k not in {"uuid", "user_id", "source", "content", "text", "created_at"}
+                },
+            }
+        )
+        ids.append(rid)
+    _json_save(rows)
+    return ids
+
+
+def _add_batch_max() -> int:
+    try:
+        return max(1, int(os.getenv("MEMORY_ADD_BATCH_MAX", "2000") or 2000))
+    except Exception:
+        return 2000
+
+
+def _add_batch_item_error(data: Any, kind: str) -> str | None:
+    """Per-item checks mirroring `/memory/add`; returns an error code or None."""
+    if not isinstance(data, dict):
+        return "invalid_item"
+    if _extract_provenance(data) is None:
+        if _provenance_required():
+            _record_provenance_event("rejected")
+            return "provenance_required"
+        _record_provenance_event("legacy")
+    else:
+        _record_provenance_event("accepted")
+    try:
+        if os.getenv("CONTRACTS_V2_ENABLED", "true").strip().lower() in {"1","true","yes","y"}:
+            from contracts.v2.validator import validate as _contracts_validate  # type: ignore
+            if kind == "journal":
+                probe = {**data, "schema_version": data.get("schema_version") or "v2"}
+            else:
+                probe = {
+                    "schema_version": data.get("schema_version") or "v1",
+                    "text": data.get("content") or data.get("text") or "",
+                    "tags": data.get("tags") or [],
+                    "metadata": data.get("metadata") or {},
+                }
+            res = _contracts_validate(probe, kind)
+            if not res.get("ok") and os.getenv("CONTRACTS_REJECT_UNKNOWN", "true").strip().lower() in {"1","true","yes","y"}:
+                return "schema_version_invalid"
+    except Exception:
+        pass
+    if not str(data.get("content") or data.get("text") or "").strip():
+        return "missing_content"
+    try:
+        if governor_enabled():
+            ok, detail = _gov_validate(kind, data)
+            if not ok:
+                _gov_write("governor", "contract_violation.schema_violation", {"route": "/memory/add_batch", "detail": detail})
+                if strict_mode():
+                    return "schema_violation"
+    except Exception:
+        pass
+    return None
+
+
+@app.route("/memory/add_batch", methods=["POST"])
+def add_memory_batch():
+    """
+    Group-commit form of `/memory/add`.
+
+    Body: ``{"items": [...]}`` (or a bare list). Each item passes the same
+    governor, provenance and contract gates as `/memory/add` and takes the
+    same hand-off: eventlog (202), outbox (202), degraded 503, or a direct
+    vector push. Accepted items are persisted with a single commit and, on
+    the direct path, pushed to the vector pod in one `/v1/memories` call.
+    Items whose eventlog append fails take the direct path instead. Returns
+    per-item results in input order, or 422 when no item was accepted.
+    """
+    try:
+        body = request.get_json(force=True, silent=True)
+        items = body.get("items") if isinstance(body, dict) else body
+        if not isinstance(items, list):
+            return jsonify({"error": "Missing 'items' list"}), 400
+        if len(items) > _add_batch_max():
+            return jsonify({"error": "batch_too_large", "max": _add_batch_max()}), 413
+
+        # Governor contract enforcement, same gate as /memory/add
+        try:
+            if governor_enabled():
+                headers = ensure_correlation_and_idempotency(
+                    dict(request.headers or {}),
+                    body if isinstance(body, dict) else {},
+                    require_cid=True,
+                    require_idem=True,
+                )
+                if strict_mode():
+                    if not headers.get("X-Correlation-ID"):
+                        _gov_write("governor", "contract_violation.missing_correlation_id", {"route": "/memory/add_batch"})
+                        return jsonify({"error": "missing_correlation_id"}), 400
+                    if not headers.get("Idempotency-Key"):
+                        _gov_write("governor", "contract_violation.missing_idempotency_key", {"route": "/memory/add_batch"})
+                        return jsonify({"error": "missing_idempotency_key"}), 400
+                else:
+                    if not request.headers.get("X-Correlation-ID"):
+                        _gov_write("governor", "contract_violation.missing_correlation_id", {"route": "/memory/add_batch"})
+                    if not request.headers.get("Idempotency-Key"):
+                        _gov_write("governor", "contract_violation.missing_idempotency_key", {"route": "/memory/add_batch"})
+        except Exception:
+            pass
+
+        json_mode = _json_mode_enabled()
+        if not json_mode and args.use_qdrant:
+            return (
+                jsonify(
+                    {
+                        "error": "Adding memory not supported in Qdrant mode. Use vector operations or switch to JSON mode."
+                    }
+                ),
+                400,
+            )
+
+        kind = "journal" if json_mode else "memory_write"
+        results: List[Dict[str, Any]] = [{} for _ in items]
+        accepted: List[int] = []
+        for i, data in enumerate(items):
+            err = _add_batch_item_error(data, kind)
+            if err:
+                results[i] = {"error": err}
+            else:
+                accepted.append(i)
+
+        base_idem = request.headers.get("Idempotency-Key")
+        base_cid = request.headers.get("X-Correlation-ID")
+
+        if items and not accepted:
+            return jsonify({"error": "no_valid_items", "results": results}), 422
+
+        # Eventlog append when enabled: one event per item, applied by the runner.
+        # Items whose append fails continue down the direct path below; appended
+        # items never do, so nothing is written twice.
+        _ev_append = None
+        try:
+            if str(os.getenv("EVENTLOG_ENABLED", "true")).strip().lower() in {"1","true","yes","y"}:
+                from eventlog.store import append as _ev_append  # type: ignore
+        except Exception:
+            _ev_append = None
+        if _ev_append is not None:
+            cid = base_cid or f"cid:{uuid.uuid4()}"
+            unappended: List[int] = []
+            for i in accepted:
+                data = items[i]
+                idem_key = f"{base_idem}:{i}" if base_idem else f"idem:{uuid.uuid4()}"
+                if json_mode:
+                    ev_type = "journal.append"
+                    ev_payload = {
+                        "schema_version": data.get("schema_version") or "v2",
+                        "entry": data.get("content") or data.get("text") or "",
+                        "context": data.get("context") or {},
+                        "tags": data.get("tags") or [],
+                    }
+                else:
+                    ev_type = "memory.write"
+                    ev_payload = {
+                        "schema_version": data.get("schema_version") or "v2",
+                        "text": str(data.get("content") or data.get("text") or "").strip(),
+                        "tags": data.get("tags") or [],
+                        "metadata": {k: v for k, v in data.items() if k not in {"content", "text", "tags"}},
+                    }
+                try:
+                    results[i] = {"event_id": _ev_append(idem_key, cid, ev_type, ev_payload), "idem_key": idem_key}
+                except Exception as ev_err:
+                    logger.warning(f"[add_batch] Eventlog append failed for item {i}: {ev_err}")
+                    unappended.append(i)
+            if not unappended:
+                return jsonify({"status": "accepted", "cid": cid, "results": results}), 202
+            accepted = unappended
+
+        entries: List[Dict[str, Any]] = []
+        if json_mode:
+            ids = _json_append_many([items[i] for i in accepted]) if accepted else []
+            for i, rid in zip(accepted, ids):
+                results[i] = {"id": rid}
+        else:
+            now_iso = datetime.now().isoformat()
+            for i in accepted:
+                data = items[i]
+                entries.append(
+                    {
+                        "content": str(data.get("content") or data.get("text") or "").strip(),
+                        "tags": data.get("tags", []),
+                        "type": data.get("type", "external_import"),
+                        "timestamp": now_iso,
+                    }
+                )
+            try:
+                if str(os.getenv("QUARANTINE_ENABLED", "true")).strip().lower() in {"1","true","yes","y"}:
+                    from moderation.quarantine import score_trust, detect_injection, classify_reason  # type: ignore
+                    inj_on = str(os.getenv("QUARANTINE_INJECTION_FILTER", "true")).strip().lower() in {"1","true","yes","y"}
+                    for entry in entries:
+                        tscore = score_trust(entry["content"], {"source": entry.get("type")})
+                        reason = classify_reason(tscore, bool(detect_injection(entry["content"])) if inj_on else False)
+                        if reason is not None:
+                            entry["quarantined"] = True
+                            entry["quarantine_reason"] = reason
+                            entry["trust_score"] = float(tscore)
+            except Exception:
+                pass
+            stored = memory.store_many(entries) if entries else []
+            for i, res in zip(accepted, stored):
+                results[i] = res
+
+        # Outbox hand-off (flag-gated, forced in degraded mode), one pair per stored item
+        try:
+            from resilience.degraded import is_active as _degraded_active
+        except Exception:
+            def _degraded_active() -> bool:  # type: ignore
+                return False
+        try:
+            from outbox import OUTBOX_ENABLED
+            from outbox.models import OutboxItem
+            from outbox.store import append as outbox_append
+            force_outbox = bool(_degraded_active())
+            if OUTBOX_ENABLED or force_outbox:
+                cid = base_cid or "corr_local"
+                mode = "degraded" if force_outbox else "normal"
+                for i, data in enumerate(items):
+                    mem_id = results[i].get("id")
+                    if not mem_id or results[i].get("deduped"):
+                        continue
+                    idem_key = f"{base_idem}:{i}" if base_idem else f"idem_{mem_id}"
+                    content = data.get("content") or data.get("text")
+                    results[i]["outbox_ids"] = [
+                        outbox_append(OutboxItem(id=None, idem_key=idem_key+":vec", cid=cid, type="vector_upsert", payload={"content": content, "metadata": {"memory_id": mem_id, "tags": data.get("tags", []), "type": data.get("type", "external_import"), "timestamp": datetime.now().isoformat(), "mode": mode}})),
+                        outbox_append(OutboxItem(id=None, idem_key=idem_key+":bel", cid=cid, type="belief_recompute", payload={"memory_id": mem_id, "mode": mode})),
+                    ]
+                return jsonify({"cid": cid, "mode": mode, "results": results}), 202
+        except Exception:
+            pass
+
+        if not json_mode:
+            # If degraded but no outbox, fail-closed with Retry-After
+            try:
+                if _degraded_active():
+                    return jsonify({"error": "degraded_mode", "message": "System in read-only degraded mode. Please retry later."}), 503
+            except Exception:
+                pass
+
+            # Legacy synchronous push when outbox disabled: one call for the whole batch
+            if ENABLE_PUSH and vector_ready:
+                push_items = []
+                for i, entry in zip(accepted, entries):
+                    res = results[i]
+                    if res.get("error") or res.get("deduped"):
+                        continue
+                    push_items.append(
+                        {
+                            "content": entry["content"],
+                            "metadata": {
+                                "memory_id": res.get("id"),
+                                "tags": entry["tags"],
+                                "type": entry["type"],
+                                "timestamp": entry["timestamp"],
+                                "provenance": _extract_provenance(items[i]),
+                            },
+                        }
+                    )
+                if push_items:
+                    try:
+                        headers = {}
+                        rid = getattr(g, "request_id", None)
+                        if isinstance(rid, str) and rid:
+                            headers[_REQID_HEADER] = rid
+                        auth_header = request.headers.get("Authorization")
+                        if isinstance(auth_header, str) and auth_header:
+                            headers["Authorization"] = auth_header
+                        resp = requests.post(
+                            f"{VECTOR_URL}/v1/memories",
+                            json={"items": push_items},
+                            timeout=10 + len(push_items) / 50.0,
+                            headers=headers or None,
+                        )
+                        resp.raise_for_status()
+                    except Exception as push_err:
+                        logger.warning(f"[add_batch] Vector batch push failed: {push_err}")
+
+        ok = sum(1 for r in results if r.get("id") or r.get("event_id"))
+        try:
+            if _metrics is not None:
+                _metrics.inc("memory.add_batch.items", ok)
+        except Exception:
+            pass
+        return jsonify({"status": "ok", "stored": ok, "failed": len(results) - ok, "results": results}), 200
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/goals", methods=["GET"])
 def list_goals():
     try:
@@ -2807,63 +3174,175 @@ def vector_query():
         return resp
 
 
+_BACKFILL_JOB: "BackfillJob | None" = None
+_BACKFILL_LOCK = threading.Lock()
+
+
+def _backfill_source():
+    # Snapshot once per run; batches are sliced lazily from it.
+    return memory_data if args.use_qdrant else memory.snapshot()
+
+
+def _backfill_push(items, request_id=None):
+    headers = {_REQID_HEADER: request_id} if isinstance(request_id, str) and request_id else None
+    resp = requests.post(f"{VECTOR_URL}/v1/memories", json={"items": items}, timeout=60, headers=headers)
+    resp.raise_for_status()
+    try:
+        return int((resp.json() or {}).get("inserted", len(items)))
+    except Exception:
+        return len(items)
+
+
 @app.route("/backfill", methods=["POST"])
 def backfill():
+    """
+    Start (or resume) a batched vector backfill in the background.
+
+    Body (optional): {"resume": true, "batch_size": 128, "workers": 4, "wait": false}
+    Returns 202 with job status; poll GET /backfill/status. With "wait": true
+    the job runs inline and the legacy {"status": "ok", "pushed": N} shape is returned.
+    """
+    global _BACKFILL_JOB
     # Guard against missing vector backend
     if not vector_ready:
         return jsonify({"error": "Vector backend not configured or unavailable"}), 503
 
+    body = request.get_json(silent=True) or {}
+    wait_inline = bool(body.get("wait")) or request.args.get("wait") in ("1", "true")
     try:
-        # Get memory data based on current mode
-        if args.use_qdrant:
-            all_mems = memory_data
-        else:
-            all_mems = memory.snapshot()
+        with _BACKFILL_LOCK:
+            if _BACKFILL_JOB is not None and _BACKFILL_JOB.running:
+                return jsonify({"status": "already_running", "job": _BACKFILL_JOB.status()}), 409
+            # The job outlives the request: capture its id for the vector pod calls
+            rid = getattr(g, "request_id", None)
+            _BACKFILL_JOB = BackfillJob(
+                _backfill_source,
+                lambda items: _backfill_push(items, request_id=rid),
+                batch_size=body.get("batch_size"),
+                workers=body.get("workers"),
+            )
+            job = _BACKFILL_JOB
+            st = job.start(resume=body.get("resume", True) is not False, background=not wait_inline)
+        if wait_inline:
+            return jsonify({"status": "ok", "pushed": st.get("pushed", 0), "job": st})
+        return jsonify({"status": "started", "job": st}), 202
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
 
-        pushed = 0
 
-        for m in all_mems:
-            content = m.get("content", "")
-            memory_id = m.get("uuid") or m.get("id")
-            if not content or not memory_id:
-                continue
-            try:
-                # Push to Qdrant via vector adapter
-                vector_payload = {
-                    "content": content,
-                    "metadata": {
-                        "memory_id": memory_id,
-                        "tags": m.get("tags", []),
-                        "type": m.get("type", "memory"),
-                        "timestamp": m.get("timestamp", ""),
-                        "speaker": m.get("speaker", ""),
-                        "persona": m.get("persona", ""),
-                    },
-                }
-                headers = {}
-                try:
-                    rid = getattr(g, "req_id", None)
-                    if isinstance(rid, str) and rid:
-                        headers[_RID_HEADER] = rid
-                except Exception:
-                    pass
-                resp = requests.post(
-                    f"{VECTOR_URL}/v1/memories", json=vector_payload, timeout=10, headers=headers or None
-                )
-                resp.raise_for_status()
-                pushed += 1
-            except Exception as inner:
-                print(f"[WARN] Skipped memory {memory_id}: {inner}")
+@app.route("/backfill/status", methods=["GET"])
+def backfill_status():
+    job = _BACKFILL_JOB
+    if job is None:
+        # Surface the persisted state of a previous process' run, if any.
+        st = BackfillJob(lambda: [], lambda items: 0)._load_state()
+        return jsonify(st or {"status": "idle"})
+    return jsonify(job.status())
+
+
+@app.route("/backfill/cancel", methods=["POST"])
+def backfill_cancel():
+    job = _BACKFILL_JOB
+    if job is None or not job.running:
+        return jsonify({"status": "idle"}), 409
+    job.cancel()
+    return jsonify({"status": "cancelling", "job": job.status()}), 202
+
+
+# Only parameters the legacy endpoint never had switch to the envelope. Filters such as
+# tags/type (and limit) keep the bare-list response for existing callers, and narrow
+# the page when combined with one of these.
+_MEMORIES_PAGED_ARGS = ("cursor", "order", "page", "fields", "format", "since", "until")
+
 
-        return jsonify({"status": "ok", "pushed": pushed})
+def _memories_paged_request() -> bool:
+    """True when the caller uses the paged/projected API (legacy callers get the bare list)."""
+    return request.method == "GET" and MemoryQuery is not None and any(k in request.args for k in _MEMORIES_PAGED_ARGS)
+
+
+def _chain_first(head, rest):
+    yield head
+    yield from rest
+
+
+def _memories_ordered_source(q, client):
+    """Qdrant scroll in page order, bounded to the rows `q.select` needs; None when unsupported."""
+    if iter_qdrant_ordered is None or os.getenv("MEMORIES_QDRANT_ORDER_BY", "1") != "1":
+        return None
+    if to_qdrant_order_by("timestamp", q.order) is None:
+        return None
+    try:
+        first = iter_qdrant_ordered(
+            client,
+            args.qdrant_collection,
+            order_by=lambda start: to_qdrant_order_by("timestamp", q.order, start),
+            start_from=q.start_from(),
+            scroll_filter=to_qdrant_filter(q.filter_spec(time_range=True)),
+            with_payload=q.payload_keys(),
+            batch=q.page * q.limit + q.limit + 1,
+        )
+        # Qdrant rejects order_by without a range index on `timestamp`; that surfaces here
+        head = next(first, None)
     except Exception as e:
-        traceback.print_exc()
-        return jsonify({"error": str(e)}), 500
+        log.info(f"[memories] Ordered scroll unavailable, scanning: {type(e).__name__}")
+        return None
+    return q.bounded(_chain_first(head, first) if head is not None else [])
+
+
+def _memories_source(q, ordered=False):
+    """Items to page over: a pushed-down Qdrant scroll in Qdrant mode, else the in-process store.
+
+    ordered: the caller only needs `q.select`'s page, so Qdrant may scroll in timestamp
+    order from the cursor and stop after limit + 1 rows instead of reading the collection.
+    """
+    if _json_mode_enabled():
+        return _json_load()
+    if args.use_qdrant:
+        if QDRANT_AVAILABLE and iter_qdrant_items is not None and os.getenv("MEMORIES_QDRANT_PUSHDOWN", "1") == "1":
+            try:
+                client = _get_qdrant()
+                if ordered:
+                    source = _memories_ordered_source(q, client)
+                    if source is not None:
+                        return source
+                scroll_filter = to_qdrant_filter(q.filter_spec())
+                first = iter_qdrant_items(client, args.qdrant_collection, scroll_filter=scroll_filter, with_payload=q.payload_keys())
+                # Surface connection errors here so we can fall back to the cache
+                head = next(first, None)
+                if head is None:
+                    return []
+                return _chain_first(head, first)
+            except Exception as e:
+                log.warning(f"[memories] Qdrant scroll failed, using cached data: {type(e).__name__}")
+        return memory_data
+    return memory.snapshot()
 
 
 @app.route("/memories", methods=["GET", "POST"])
 def get_memories():
     try:
+        if _memories_paged_request():
+            try:
+                q = MemoryQuery.from_args(
+                    request.args.get,
+                    default_speaker=None if _json_mode_enabled() else "axiom",
+                    default_limit=50 if _json_mode_enabled() else 25,
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            if (request.args.get("format") or "").strip().lower() == "ndjson":
+                source = _memories_source(q)
+                cap = q.limit if "limit" in request.args else None
+
+                def _lines():
+                    for item in q.stream(source, limit=cap):
+                        yield json.dumps(item, ensure_ascii=False, default=str) + "\n"
+
+                return Response(_lines(), mimetype="application/x-ndjson")
+            items, next_cursor = q.select(_memories_source(q, ordered=True))
+            return jsonify({"memories": items, "count": len(items), "next_cursor": next_cursor, "limit": q.limit}), 200
+
         if _json_mode_enabled():
             if request.method == "POST":
                 body = request.get_json(force=True, silent=True) or {}
@@ -2895,6 +3374,10 @@ def get_memories():
 
         # Handle both Qdrant and JSON modes
         if args.use_qdrant:
+            if MemoryQuery is not None:
+                # First `limit` matches in scroll order, speaker pushed down to Qdrant
+                q = MemoryQuery(speaker=speaker, limit=limit)
+                return jsonify(list(q.stream(_memories_source(q), limit=limit))), 200
             # Use cached memory_data for Qdrant mode
             results = [m for m in memory_data if m.get("speaker") == speaker]
         else:
@@ -2972,15 +3455,12 @@ def memory_debug():
         return jsonify({"error": "debug disabled"}), 403
     try:
         # Resolve from pipeline single source where possible  # parity
-        profile = getattr(
-            memory_response_pipeline, "_PROFILE", os.getenv("AXIOM_SCORING_PROFILE", "default")
-        )
-        top_k = getattr(memory_response_pipeline, "TOP_K_FRAGMENTS", int(os.getenv("VECTOR_TOPK", "10")))
-        top_n = getattr(memory_response_pipeline, "_TOP_N", int(os.getenv("AXIOM_TOP_N", "8")))
-        lambda_mmr = getattr(memory_response_pipeline, "_MMR", float(os.getenv("AXIOM_MMR_LAMBDA", "0.4")))
-        use_composite = getattr(
-            memory_response_pipeline, "_COMPOSITE", os.getenv("AXIOM_COMPOSITE_SCORING", "0") == "1"
-        )
+        settings = retrieval_context.current(memory_response_pipeline)
+        profile = settings.scoring_profile
+        top_k = settings.top_k
+        top_n = settings.top_n
+        lambda_mmr = settings.mmr_lambda
+        use_composite = settings.composite_enabled
         last = getattr(memory_response_pipeline, "_LAST_MEMORY_DEBUG", None)
         belief_engine = False
         try:
@@ -3236,83 +3716,45 @@ def contradictions_debug():
         return jsonify({"error": str(e)}), 500
 
 
+def _retrieve_timeout_sec() -> float:
+    try:
+        return float(os.getenv("RETRIEVE_TIMEOUT_SEC", "60"))
+    except Exception:
+        return 60.0
+
+
 @app.route("/retrieve", methods=["POST"])
 def retrieve():
     try:
         data = request.get_json(force=True) or {}
-        print("[DEBUG] Incoming retrieve request:", request.json)
+        logger.debug("[retrieve] Incoming retrieve request: %r", data)
         question = (data.get("question") or data.get("query") or "").strip()
         if not question:
             return jsonify({"error": "Empty query"}), 400
 
-        # Per-request overrides
-        composite_enabled = data.get("composite_enabled")
-        profile = data.get("scoring_profile")
-        mmr_lambda = data.get("mmr_lambda")
-        top_k = data.get("top_k")
-        top_n = data.get("top_n")
+        # Per-request overrides live in a request-scoped context; module globals are never touched
+        ctx = retrieval_context.RetrievalContext.defaults(memory_response_pipeline).with_overrides(data)
+        gen = memory_response_pipeline.generate_enhanced_context_response
+        try:
+            accepts_ctx = "retrieval_context" in inspect.signature(gen).parameters
+        except Exception:
+            accepts_ctx = False
 
-        # Run pipeline (async) with overrides via a small helper
         async def _run():
-            return await memory_response_pipeline.generate_enhanced_context_response(user_question=question)
-
-        # Temporarily override globals on memory_response_pipeline for this call only
-        # Capture originals
-        orig_composite = getattr(
-            memory_response_pipeline, "_COMPOSITE", os.getenv("AXIOM_COMPOSITE_SCORING", "0") == "1"
-        )
-        orig_profile = getattr(
-            memory_response_pipeline, "_PROFILE", os.getenv("AXIOM_SCORING_PROFILE", "default")
-        )
-        orig_mmr = getattr(memory_response_pipeline, "_MMR", float(os.getenv("AXIOM_MMR_LAMBDA", "0.4")))
-        orig_top_n = getattr(memory_response_pipeline, "_TOP_N", int(os.getenv("AXIOM_TOP_N", "8")))
-        orig_top_k_frag = getattr(
-            memory_response_pipeline, "TOP_K_FRAGMENTS", int(os.getenv("VECTOR_TOPK", "10"))
-        )
+            if accepts_ctx:
+                return await gen(user_question=question, retrieval_context=ctx)
+            return await gen(user_question=question)
 
         try:
-            # Apply overrides if provided (None means keep original)
-            if composite_enabled is not None:
-                setattr(memory_response_pipeline, "_COMPOSITE", bool(composite_enabled))
-            if profile is not None:
-                setattr(memory_response_pipeline, "_PROFILE", str(profile))
-            if mmr_lambda is not None:
-                try:
-                    val = float(mmr_lambda)
-                    setattr(memory_response_pipeline, "_MMR", max(0.0, min(1.0, val)))
-                except Exception:
-                    pass
-            if top_n is not None:
-                try:
-                    setattr(memory_response_pipeline, "_TOP_N", max(1, int(top_n)))
-                except Exception:
-                    pass
-            if top_k is not None:
-                try:
-                    setattr(memory_response_pipeline, "TOP_K_FRAGMENTS", max(1, int(top_k)))
-                except Exception:
-                    pass
-
-            # Execute
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                raw_results = loop.run_until_complete(_run())
-                print("[DEBUG] Raw Qdrant results:", raw_results)
-            except Exception as e:
-                print("[DEBUG] Retrieval error:", repr(e))
-                return jsonify({"ok": False, "error": str(e)}), 500
-            result = raw_results
-        finally:
-            # Restore originals to avoid leaking overrides
-            setattr(memory_response_pipeline, "_COMPOSITE", orig_composite)
-            setattr(memory_response_pipeline, "_PROFILE", orig_profile)
-            setattr(memory_response_pipeline, "_MMR", orig_mmr)
-            setattr(memory_response_pipeline, "_TOP_N", orig_top_n)
-            setattr(memory_response_pipeline, "TOP_K_FRAGMENTS", orig_top_k_frag)
+            raw_results = retrieval_context.run_with_context(ctx, _run, timeout=_retrieve_timeout_sec())
+            logger.debug("[retrieve] Raw Qdrant results: %r", raw_results)
+        except Exception as e:
+            logger.debug("[retrieve] Retrieval error: %r", e)
+            return jsonify({"ok": False, "error": str(e)}), 500
+        result = raw_results
 
         # Return both the LLM response and the latest memory debug snapshot
-        last = getattr(memory_response_pipeline, "_LAST_MEMORY_DEBUG", None)
+        last = ctx.debug or getattr(memory_response_pipeline, "_LAST_MEMORY_DEBUG", None)
         return (
             jsonify({"ok": True, "response": result, "memory_debug": last or {}}),
             200,
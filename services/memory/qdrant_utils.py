@@ -493,10 +493,16 @@ def to_qdrant_filter(weaviate_like_filter: Dict[str, Any]):
     Supported structure (minimal):
         {
           "must": [
-            { "key": "tags", "match": { "any": ["foo", "bar"] } }
+            { "key": "tags", "match": { "any": ["foo", "bar"] } },
+            { "key": "speaker", "match": { "value": "axiom" } }
           ]
         }
 
+    `any` clauses are supported for any key (tags being the common case) and
+    `value` clauses for scalar payload equality. A clause may carry
+    `"range": {"gte"|"gt"|"lte"|"lt": bound}` instead of `match`; string bounds
+    become a DatetimeRange, numeric ones a Range.
+
     Returns a qdrant_client.models.Filter instance if translation is supported,
     otherwise returns None.
     """
@@ -508,41 +514,68 @@ def to_qdrant_filter(weaviate_like_filter: Dict[str, Any]):
         if not isinstance(must, list) or not must:
             return None
 
-        # Only support tags.any for now
         conds = []
+        should_conds = []
         for clause in must:
             if not isinstance(clause, dict):
                 continue
             key = clause.get("key")
             match = clause.get("match")
-            if key != "tags" or not isinstance(match, dict):
+            rng = clause.get("range")
+            if isinstance(key, str) and key and isinstance(rng, dict) and rng:
+                if qm is None:
+                    return None
+                bounds = {k: rng[k] for k in ("gte", "gt", "lte", "lt") if rng.get(k) not in (None, "")}
+                if bounds:
+                    numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in bounds.values())
+                    if not numeric and not hasattr(qm, "DatetimeRange"):
+                        return None
+                    rcls = qm.Range if numeric else qm.DatetimeRange
+                    conds.append(qm.FieldCondition(key=key, range=rcls(**bounds)))
+                continue
+            if not isinstance(key, str) or not key or not isinstance(match, dict):
+                continue
+            if qm is None:
+                return None
+            if "value" in match and isinstance(match.get("value"), (str, int, bool)):
+                conds.append(qm.FieldCondition(key=key, match=qm.MatchValue(value=match["value"])))
                 continue
             any_values = match.get("any")
             if not isinstance(any_values, list) or not any_values:
                 continue
 
             # Prefer MatchAny if available; otherwise, build OR via should
-            if qm is not None and hasattr(qm, "MatchAny"):
-                conds.append(qm.FieldCondition(key="tags", match=qm.MatchAny(any=any_values)))
+            if hasattr(qm, "MatchAny"):
+                conds.append(qm.FieldCondition(key=key, match=qm.MatchAny(any=any_values)))
+            elif should_conds:
+                # Only one OR group can be expressed without MatchAny
+                return None
             else:
-                # Fallback: we'll return a Filter with should of MatchValue conditions
-                should_conds = [
-                    qm.FieldCondition(key="tags", match=qm.MatchValue(value=v))
-                    for v in any_values
-                ] if qm is not None else []
-                if qm is None or not should_conds:
-                    return None
-                return qm.Filter(should=should_conds)
+                should_conds = [qm.FieldCondition(key=key, match=qm.MatchValue(value=v)) for v in any_values]
 
-        if not conds:
+        if not conds and not should_conds:
             return None
 
-        return qm.Filter(must=conds) if qm is not None else None
+        return qm.Filter(must=conds or None, should=should_conds or None)
     except Exception as _e:  # pragma: no cover - defensive
         logger.warning(f"to_qdrant_filter translation failed: {_e}")
         return None
 
 
+def to_qdrant_order_by(key: str, order: str = "desc", start_from: Any = None):
+    """
+    OrderBy for an ordered scroll on an indexed payload key (e.g. a datetime
+    index on `timestamp`). `start_from` is inclusive. Returns None when the
+    installed client has no order_by support.
+    """
+    if qm is None or not hasattr(qm, "OrderBy"):
+        return None
+    direction = qm.Direction.DESC if order == "desc" else qm.Direction.ASC
+    if start_from in (None, ""):
+        return qm.OrderBy(key=key, direction=direction)
+    return qm.OrderBy(key=key, direction=direction, start_from=start_from)
+
+
 def post_filter_items(items: List[Dict[str, Any]], weaviate_like_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Server-side post-filtering of result items using minimal Weaviate-like filter.
@@ -0,0 +1,154 @@
+"""
+Request-scoped retrieval settings and per-thread event loops for `/retrieve`.
+
+Per-request overrides (composite scoring, scoring profile, MMR lambda, top_k,
+top_n) used to be applied by setattr-ing globals on `memory_response_pipeline`,
+which leaks between concurrent requests. Instead, the handler builds a
+`RetrievalContext` and runs the pipeline with it bound in a ContextVar (and
+passed as `retrieval_context=` when the pipeline accepts it). Pipeline code
+reads `current(module)` rather than its own module globals.
+
+Coroutines run on a long-lived event loop owned by the calling worker thread.
+The pipeline still does blocking I/O inside its coroutines, so a loop shared
+across threads would serialise concurrent requests; one loop per WSGI thread
+keeps them parallel without creating a loop per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetrievalContext:
+    composite_enabled: bool
+    scoring_profile: str
+    mmr_lambda: float
+    top_n: int
+    top_k: int
+    # Filled by the pipeline for this request only (replaces _LAST_MEMORY_DEBUG reads)
+    debug: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def defaults(cls, module: Any = None) -> "RetrievalContext":
+        """Process-wide defaults: pipeline module globals, then env."""
+        return cls(
+            composite_enabled=bool(
+                getattr(module, "_COMPOSITE", os.getenv("AXIOM_COMPOSITE_SCORING", "0") == "1")
+            ),
+            scoring_profile=str(getattr(module, "_PROFILE", os.getenv("AXIOM_SCORING_PROFILE", "default"))),
+            mmr_lambda=float(getattr(module, "_MMR", float(os.getenv("AXIOM_MMR_LAMBDA", "0.4")))),
+            top_n=int(getattr(module, "_TOP_N", int(os.getenv("AXIOM_TOP_N", "8")))),
+            top_k=int(getattr(module, "TOP_K_FRAGMENTS", int(os.getenv("VECTOR_TOPK", "10")))),
+        )
+
+    def with_overrides(self, data: Dict[str, Any]) -> "RetrievalContext":
+        """Apply request overrides; None or unparsable values keep the default."""
+        changes: Dict[str, Any] = {}
+        if data.get("composite_enabled") is not None:
+            changes["composite_enabled"] = bool(data["composite_enabled"])
+        if data.get("scoring_profile") is not None:
+            changes["scoring_profile"] = str(data["scoring_profile"])
+        try:
+            if data.get("mmr_lambda") is not None:
+                changes["mmr_lambda"] = max(0.0, min(1.0, float(data["mmr_lambda"])))
+        except Exception:
+            pass
+        try:
+            if data.get("top_n") is not None:
+                changes["top_n"] = max(1, int(data["top_n"]))
+        except Exception:
+            pass
+        try:
+            if data.get("top_k") is not None:
+                changes["top_k"] = max(1, int(data["top_k"]))
+        except Exception:
+            pass
+        return replace(self, debug={}, **changes)
+
+
+def _loaded_copy() -> Any:
+    """Another already-imported copy of this module, if any.
+
+    Pod scripts put services/memory on sys.path, so this file can load as both
+    `retrieval_context` and `services.memory.retrieval_context`. All copies must
+    share one ContextVar or a binding made through one is invisible to
+    readers that imported the other.
+    """
+    for name in ("retrieval_context", "services.memory.retrieval_context", "pods.memory.retrieval_context"):
+        mod = sys.modules.get(name)
+        if mod is not None and mod.__dict__.get("_CURRENT") is not None:
+            return mod
+    return None
+
+
+_OTHER = _loaded_copy()
+_CURRENT: ContextVar[Optional[RetrievalContext]] = getattr(
+    _OTHER, "_CURRENT", None
+) or ContextVar("axiom_retrieval_context", default=None)
+
+
+def current(module: Any = None) -> RetrievalContext:
+    """The context bound for this request, else process defaults."""
+    ctx = _CURRENT.get()
+    return ctx if ctx is not None else RetrievalContext.defaults(module)
+
+
+@contextmanager
+def bind(ctx: RetrievalContext) -> Iterator[RetrievalContext]:
+    token = _CURRENT.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _CURRENT.reset(token)
+
+
+class ThreadLoops:
+    """One asyncio loop per calling thread, created lazily and reused."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _ensure(self) -> asyncio.AbstractEventLoop:
+        loop = getattr(self._local, "loop", None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._local.loop = loop
+        return loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        loop = self._ensure()
+        if timeout is not None:
+            coro = asyncio.wait_for(coro, timeout)
+        try:
+            return loop.run_until_complete(coro)
+        except asyncio.TimeoutError as e:
+            # Match the concurrent.futures timeout callers already handle
+            raise TimeoutError(str(e) or "retrieve_timeout") from e
+
+
+_LOOPS: ThreadLoops = getattr(_OTHER, "_LOOPS", None) or ThreadLoops()
+
+
+def run_with_context(
+    ctx: RetrievalContext, fn: Callable[[], Awaitable[T]], timeout: Optional[float] = None
+) -> T:
+    """Run `fn()` on this thread's loop with `ctx` bound inside the task."""
+
+    async def _bound() -> T:
+        with bind(ctx):
+            return await fn()
+
+    return _LOOPS.run(_bound(), timeout)
+
+
+__all__ = ["RetrievalContext", "current", "bind", "ThreadLoops", "run_with_context"]
@@ -0,0 +1,198 @@
+"""
+In-process world map index (stdlib-only, deterministic).
+
+Built once per load of world_map.json and kept current by applying writes
+incrementally, so the read endpoints never scan the whole map:
+
+  - entity id → entity, plus a case-insensitive alias → entity id map
+  - per-entity outgoing / incoming adjacency, grouped by relationship type
+  - sorted relationship views per (entity, direction), computed on first use and
+    cached until a write touches that entity
+
+Entity writes go through `world_map_write.apply_ops_in_memory` on a deep copy of the
+single entity; the index swaps that entity in without rebuilding. A full rebuild
+happens only when the file on disk changes underneath us (see `file_signature`).
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+DIRECTIONS = ("any", "out", "in")
+
+
+def file_signature(path: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of `path`, or None when it cannot be stat'ed."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+        return (int(st.st_mtime_ns), int(st.st_size), int(st.st_ino))
+    except OSError:
+        return None
+
+
+def _rel_sort_key(r: dict) -> Tuple[str, str, str, str]:
+    # Same deterministic ordering the endpoints have always returned.
+    return (str(r.get("type") or ""), str(r.get("source") or ""), str(r.get("target") or ""), str(r.get("id") or ""))
+
+
+def _aliases_of(ent: dict) -> List[str]:
+    out: List[str] = []
+    for key in ("alias", "aliases"):
+        val = ent.get(key)
+        if isinstance(val, str) and val.strip():
+            out.append(val.strip().lower())
+        elif isinstance(val, list):
+            out.extend(str(v).strip().lower() for v in val if isinstance(v, str) and v.strip())
+    return out
+
+
+class WorldMapIndex:
+    """Read-optimized view over a world map object ({"entities": ..., "relationships": ...})."""
+
+    def __init__(self, obj: Optional[dict] = None, signature: Optional[Tuple[int, int, int]] = None) -> None:
+        self.obj: dict = obj if isinstance(obj, dict) else {}
+        self.signature = signature
+        self._entities: Dict[str, dict] = {}
+        self._positions: Dict[str, Any] = {}
+        self._aliases: Dict[str, str] = {}
+        self._relationships: List[dict] = []
+        self._out: Dict[str, Dict[str, List[dict]]] = {}
+        self._in: Dict[str, Dict[str, List[dict]]] = {}
+        self._views: Dict[Tuple[str, str], List[dict]] = {}
+        self._build()
+
+    # ── build ───────────────────────────────────────────────────────────────
+    def _build(self) -> None:
+        ents = self.obj.get("entities")
+        if isinstance(ents, list):
+            for pos, ent in enumerate(ents):
+                if isinstance(ent, dict) and ent.get("id") is not None:
+                    eid = str(ent.get("id"))
+                    # First occurrence wins, as with the former linear scan.
+                    if eid not in self._entities:
+                        self._entities[eid] = ent
+                        self._positions[eid] = pos
+        elif isinstance(ents, dict):
+            for eid, val in ents.items():
+                if isinstance(val, dict):
+                    ent = dict(val)
+                    ent.setdefault("id", eid)
+                    self._entities[str(eid)] = ent
+                    self._positions[str(eid)] = eid
+        for eid, ent in self._entities.items():
+            self._index_aliases(eid, ent)
+
+        rels = self.obj.get("relationships")
+        if isinstance(rels, list):
+            self._relationships = [r for r in rels if isinstance(r, dict)]
+        elif isinstance(rels, dict):
+            for rid, rv in rels.items():
+                if isinstance(rv, dict):
+                    r = dict(rv)
+                    r.setdefault("id", rid)
+                    self._relationships.append(r)
+        for r in self._relationships:
+            rtype = str(r.get("type") or "")
+            if r.get("source") is not None:
+                self._out.setdefault(str(r.get("source")), {}).setdefault(rtype, []).append(r)
+            if r.get("target") is not None:
+                self._in.setdefault(str(r.get("target")), {}).setdefault(rtype, []).append(r)
+
+    def _index_aliases(self, eid: str, ent: dict) -> None:
+        for alias in _aliases_of(ent):
+            self._aliases.setdefault(alias, eid)
+
+    # ── reads ───────────────────────────────────────────────────────────────
+    @property
+    def entities_count(self) -> int:
+        return len(self._entities)
+
+    @property
+    def relationships_count(self) -> int:
+        return len(self._relationships)
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Entity id for an id or alias (aliases are case-insensitive)."""
+        key = str(ref or "")
+        if key in self._entities:
+            return key
+        return self._aliases.get(key.strip().lower())
+
+    def get_entity(self, ref: str) -> Optional[dict]:
+        eid = self.resolve(ref)
+        return self._entities.get(eid) if eid is not None else None
+
+    def adjacency(self, entity_id: str, direction: str = "out") -> Dict[str, List[dict]]:
+        """{relationship type: [relationships]} for one side of an entity (unsorted, read-only)."""
+        side = self._in if direction == "in" else self._out
+        return side.get(str(entity_id), {})
+
+    def relationships(self, entity_id: str, direction: str = "any", rel_type: Optional[str] = None) -> List[dict]:
+        """Sorted relationships touching `entity_id` (exact id). The list is cached; treat it as read-only."""
+        want = str(direction or "any").strip().lower() or "any"
+        if want not in DIRECTIONS:
+            want = "any"
+        eid = str(entity_id)
+        key = (eid, want)
+        view = self._views.get(key)
+        if view is None:
+            picked: Dict[int, dict] = {}
+            if want in ("any", "out"):
+                for group in self._out.get(eid, {}).values():
+                    picked.update((id(r), r) for r in group)
+            if want in ("any", "in"):
+                for group in self._in.get(eid, {}).values():
+                    picked.update((id(r), r) for r in group)
+            view = sorted(picked.values(), key=_rel_sort_key)
+            self._views[key] = view
+        if rel_type is not None:
+            return [r for r in view if str(r.get("type") or "") == str(rel_type)]
+        return view
+
+    # ── incremental writes ──────────────────────────────────────────────────
+    def apply_entity_ops(self, entity_id: str, ops: List[dict], apply_fn: Any) -> Tuple[dict, dict, List[str]]:
+        """Apply `ops` to a deep copy of one entity via `apply_fn` (world_map_write.apply_ops_in_memory).
+
+        Returns (new_world_map_obj, new_entity, changed_fields) without touching the
+        index; call `replace_entity` once the new object has been persisted.
+        """
+        eid = self.resolve(entity_id)
+        if eid is None:
+            raise KeyError("entity_not_found")
+        # Deep copy: ops append to list fields in place, and a failed sequence must not leak
+        current = copy.deepcopy(self._entities[eid])
+        _obj, changed = apply_fn(world_map_obj={"entities": [current]}, entity_id=eid, ops=ops)
+        new_obj = dict(self.obj)
+        pos = self._positions[eid]
+        ents = self.obj.get("entities")
+        if isinstance(ents, list):
+            new_ents = list(ents)
+            new_ents[pos] = current
+        else:
+            new_ents = dict(ents or {})
+            stored = dict(current)
+            if "id" not in (ents or {}).get(pos, {}):
+                stored.pop("id", None)
+            new_ents[pos] = stored
+        new_obj["entities"] = new_ents
+        return new_obj, current, list(changed or [])
+
+    def replace_entity(self, entity_id: str, entity: dict, new_obj: dict, signature: Optional[Tuple[int, int, int]] = None) -> None:
+        """Swap in a rewritten entity (relationships are unaffected by entity ops)."""
+        eid = str(entity_id)
+        old = self._entities.get(eid) or {}
+        for alias in _aliases_of(old):
+            if self._aliases.get(alias) == eid:
+                del self._aliases[alias]
+        self._entities[eid] = entity
+        self._index_aliases(eid, entity)
+        self.obj = new_obj
+        if signature is not None:
+            self.signature = signature
+
+
+__all__ = ["WorldMapIndex", "file_signature", "DIRECTIONS"]
@@ -0,0 +1,302 @@
+"""
+World map proposal store (stdlib-only).
+
+Append-only JSONL log plus an in-process id → offset index:
+
+  {"proposal_id": "...", "status": "pending", ...}                     full proposal (as before)
+  {"proposal_id": "...", "_op": "set", "ts": "...", "set": {...}}      status change
+
+Creating or settling a proposal appends one line, so an approval is O(1) instead
+of a whole-file rewrite. The index keeps, per proposal, the byte offset of its
+record, its current status and the merged status changes; listing a status reads
+only those records. Other processes appending to the same file are picked up by
+scanning the new tail (one stat per call); a replaced file triggers a rebuild.
+
+Background compaction folds status changes into their records and moves settled
+proposals older than WORLD_MAP_PROPOSAL_RETENTION_DAYS to ``<path>.archive.jsonl``.
+It starts once WORLD_MAP_PROPOSAL_COMPACT_MIN status lines have accumulated.
+Existing JSONL stores written by the old whole-file rewrite load unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore
+
+SETTLED = ("applied", "rejected")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def _parse_ts(ts: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(str(ts).replace("Z", "")) if ts else None
+    except Exception:
+        return None
+
+
+class _Entry:
+    __slots__ = ("offset", "status", "entity_id", "patch", "settled_ts")
+
+    def __init__(self, offset: int, status: str, entity_id: str) -> None:
+        self.offset = offset
+        self.status = status
+        self.entity_id = entity_id
+        self.patch: Optional[Dict[str, Any]] = None
+        self.settled_ts: Optional[str] = None
+
+
+class ProposalStore:
+    def __init__(self, path: str, retention_days: Optional[int] = None, compact_min: Optional[int] = None, background: bool = True) -> None:
+        self.path = str(path)
+        self.retention_days = _env_int("WORLD_MAP_PROPOSAL_RETENTION_DAYS", 30) if retention_days is None else int(retention_days)
+        self.compact_min = max(1, _env_int("WORLD_MAP_PROPOSAL_COMPACT_MIN", 500) if compact_min is None else int(compact_min))
+        self.background = background
+        self._lock = threading.RLock()
+        self._compactor: Optional[threading.Thread] = None
+        self._reset()
+
+    # ── index maintenance ──────────────────────────────────────────────────
+    def _reset(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+        # Insertion-ordered id sets per status (oldest first)
+        self._by_status: Dict[str, Dict[str, None]] = {}
+        self._end = 0
+        self._ino: Optional[int] = None
+        self._status_lines = 0
+
+    def _move(self, pid: str, entry: _Entry, status: str) -> None:
+        self._by_status.get(entry.status, {}).pop(pid, None)
+        entry.status = status
+        self._by_status.setdefault(status, {})[pid] = None
+
+    def _ingest(self, offset: int, line: bytes) -> None:
+        try:
+            rec = json.loads(line)
+        except Exception:
+            return
+        if not isinstance(rec, dict):
+            return
+        pid = str(rec.get("proposal_id") or "")
+        if not pid:
+            return
+        if rec.get("_op") == "set":
+            self._status_lines += 1
+            entry = self._entries.get(pid)
+            if entry is None:
+                return
+            changes = rec.get("set") or {}
+            entry.patch = {**(entry.patch or {}), **changes}
+            if "status" in changes:
+                self._move(pid, entry, str(changes.get("status") or ""))
+                if entry.status in SETTLED:
+                    entry.settled_ts = str(rec.get("ts") or "")
+            return
+        if pid in self._entries:
+            # First record wins (the old rewrite kept the first match as well)
+            return
+        entry = _Entry(offset, "", str(rec.get("entity_id") or ""))
+        self._entries[pid] = entry
+        self._move(pid, entry, str(rec.get("status") or ""))
+        if entry.status in SETTLED:
+            entry.settled_ts = str(rec.get("applied_ts") or rec.get("ts") or "")
+
+    def _refresh(self) -> None:
+        """Bring the index up to date with the file (new tail, or full rebuild if replaced)."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            if self._ino is not None or self._entries:
+                self._reset()
+            return
+        if st.st_ino != self._ino or st.st_size < self._end:
+            self._reset()
+            self._ino = st.st_ino
+        if st.st_size == self._end:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._end)
+            pos = self._end
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn tail from a concurrent writer; re-read next time
+                if line.strip():
+                    self._ingest(pos, line)
+                pos += len(line)
+            self._end = pos
+
+    def _append(self, rec: Dict[str, Any]) -> None:
+        parent = os.path.dirname(self.path) or "."
+        os.makedirs(parent, exist_ok=True)
+        data = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._file_lock():
+            with open(self.path, "ab") as f:
+                f.write(data)
+        self._refresh()
+
+    def _file_lock(self) -> Any:
+        return _FileLock(self.path + ".lock")
+
+    def _read(self, entry: _Entry) -> Optional[Dict[str, Any]]:
+        with open(self.path, "rb") as f:
+            f.seek(entry.offset)
+            rec = json.loads(f.readline())
+        if entry.patch:
+            rec.update(entry.patch)
+        return rec
+
+    # ── public API ─────────────────────────────────────────────────────────
+    def add(self, rec: Dict[str, Any]) -> None:
+        with self._lock:
+            self._append(dict(rec))
+
+    def get(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(str(proposal_id))
+            return self._read(entry) if entry is not None else None
+
+    def update(self, proposal_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Append a status change for `proposal_id`; returns the merged record (None if unknown)."""
+        pid = str(proposal_id)
+        with self._lock:
+            self._refresh()
+            if pid not in self._entries:
+                return None
+            self._append({"proposal_id": pid, "_op": "set", "ts": _now_iso(), "set": dict(updates or {})})
+            rec = self._read(self._entries[pid])
+        self.maybe_compact()
+        return rec
+
+    def list(
+        self,
+        status: Optional[str] = "pending",
+        limit: int = 50,
+        before: Optional[str] = None,
+        entity_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Newest `limit` proposals with `status` (oldest first in the page), optionally before a cursor.
+
+        Returns (records, next_cursor); pass next_cursor as `before` for the previous page.
+        Only records of the requested status are read from disk.
+        """
+        limit = max(1, int(limit))
+        with self._lock:
+            self._refresh()
+            if status:
+                ids = list(self._by_status.get(str(status), {}))
+            else:
+                ids = list(self._entries)
+            if before is not None:
+                try:
+                    ids = ids[: ids.index(str(before))]
+                except ValueError:
+                    ids = []
+            if entity_id is not None:
+                ids = [i for i in ids if self._entries[i].entity_id == str(entity_id)]
+            page = ids[-limit:]
+            records = [r for r in (self._read(self._entries[i]) for i in page) if r is not None]
+            next_cursor = page[0] if len(ids) > len(page) else None
+        return records, next_cursor
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            self._refresh()
+            return {k: len(v) for k, v in self._by_status.items() if v}
+
+    # ── compaction ─────────────────────────────────────────────────────────
+    def maybe_compact(self) -> None:
+        if self._status_lines < self.compact_min:
+            return
+        if not self.background:
+            self.compact()
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_quietly, name="proposal-compactor", daemon=True)
+        self._compactor.start()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except Exception:
+            pass
+
+    def compact(self) -> Dict[str, int]:
+        """Fold status lines into records; archive settled proposals past retention."""
+        cutoff = datetime.utcnow() - timedelta(days=int(self.retention_days))
+        tmp = f"{self.path}.compact.tmp"
+        kept = archived = 0
+        with self._lock, self._file_lock():
+            self._refresh()
+            if self._ino is None:
+                return {"kept": 0, "archived": 0}
+            archive_lines: List[bytes] = []
+            with open(tmp, "wb") as out:
+                for pid, entry in self._entries.items():
+                    rec = self._read(entry)
+                    if rec is None:
+                        continue
+                    line = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+                    settled_at = _parse_ts(entry.settled_ts)
+                    if entry.status in SETTLED and settled_at is not None and settled_at < cutoff:
+                        archive_lines.append(line)
+                        archived += 1
+                    else:
+                        out.write(line)
+                        kept += 1
+                out.flush()
+                os.fsync(out.fileno())
+            if archive_lines:
+                with open(self.path + ".archive.jsonl", "ab") as arch:
+                    arch.writelines(archive_lines)
+                    arch.flush()
+                    os.fsync(arch.fileno())
+            os.replace(tmp, self.path)
+            self._reset()
+            self._refresh()
+        return {"kept": kept, "archived": archived}
+
+
+class _FileLock:
+    """Cross-process exclusive lock on a sidecar file (no-op without fcntl)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fh: Any = None
+
+    def __enter__(self) -> "_FileLock":
+        if fcntl is not None:
+            parent = os.path.dirname(self.path) or "."
+            os.makedirs(parent, exist_ok=True)
+            self._fh = open(self.path, "a+")
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._fh is not None:
+            try:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            finally:
+                self._fh.close()
+                self._fh = None
+
+
+__all__ = ["ProposalStore", "SETTLED"]
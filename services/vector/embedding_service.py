@@ -4,8 +4,16 @@ Minimal HTTP embedding service for the Vector pod.
 Endpoints:
 - GET /healthz
 - POST /embed  { "texts": [...], "model": "BAAI/bge-small-en-v1.5" } -> { "vectors": [[...], ...] }
+  With `Accept: application/x-axiom-vectors; dtype=float32|float16` the vectors come back as a
+  packed little-endian buffer instead (see `vector.embed_wire`).
 
 This lets the LLM pod do embedding-based recall without installing torch/sentence-transformers.
+
+Concurrent /embed requests are coalesced: each request is queued, a single worker merges
+queued requests (same model) into one backend call of up to AXIOM_EMBED_BATCH_MAX texts,
+waiting at most AXIOM_EMBED_BATCH_WAIT_MS for more to arrive, then fans results back out.
+A request waits at most AXIOM_EMBED_BATCH_TIMEOUT_SEC for its batch before embedding
+directly on the request thread. Set AXIOM_EMBED_BATCHING=false to always embed there.
 """
 
 from __future__ import annotations
@@ -13,12 +21,19 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+import queue
 import threading
 import time
+from concurrent.futures import Future, TimeoutError as _FutTimeout
 from typing import Any
 
 from flask import Flask, jsonify, request
 
+try:
+    from vector import embed_wire as _wire  # type: ignore
+except Exception:  # pragma: no cover - binary transport is optional; JSON always works
+    _wire = None  # type: ignore
+
 app = Flask(__name__)
 
 log = logging.getLogger("axiom.embedding_service")
@@ -247,6 +262,172 @@ class _EmbedBackend:
 
 _BACKEND = _EmbedBackend()
 
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(str(os.getenv(name) or default).strip())
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(str(os.getenv(name) or default).strip())
+    except Exception:
+        return default
+
+
+class _MicroBatcher:
+    """
+    Server-side request coalescer in front of `_BACKEND.embed`.
+
+    Requests are queued as (texts, model, hint, future). One worker thread drains the queue,
+    merges requests for the same (hint, model) until `max_batch` texts or `max_wait_ms` has
+    elapsed since the first request was taken, embeds them in one call and resolves each
+    request's future with its slice. A single request larger than `max_batch` runs alone.
+
+    A caller that waits longer than `timeout_s` (a wedged or backlogged worker) cancels
+    its request and embeds directly instead; the worker skips cancelled requests.
+    """
+
+    def __init__(
+        self,
+        backend: _EmbedBackend,
+        *,
+        max_batch: int,
+        max_wait_ms: float,
+        enabled: bool = True,
+        timeout_s: float | None = 30.0,
+    ) -> None:
+        self._backend = backend
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait_s = max(0.0, float(max_wait_ms) / 1000.0)
+        self.enabled = bool(enabled)
+        self.timeout_s = float(timeout_s) if timeout_s and timeout_s > 0 else None
+        self._queue: "queue.Queue[tuple[list[str], str, str, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._pid: int | None = None
+        # Metrics (guarded by _lock)
+        self._queued_texts = 0
+        self._batches = 0
+        self._batched_requests = 0
+        self._batched_texts = 0
+        self._last_batch_size = 0
+        self._max_batch_seen = 0
+        self._timeouts = 0
+
+    def embed(self, *, texts: list[str], model_name: str, backend_hint: str) -> list[list[float]]:
+        if not self.enabled or not texts:
+            return self._backend.embed(texts=texts, model_name=model_name, backend_hint=backend_hint)
+        fut: Future = Future()
+        with self._lock:
+            self._queued_texts += len(texts)
+        self._ensure_worker()
+        self._queue.put((list(texts), str(model_name), str(backend_hint), fut))
+        try:
+            return fut.result(self.timeout_s)
+        except _FutTimeout:
+            # Still queued: the worker will skip it. Already running: its result is dropped.
+            fut.cancel()
+        with self._lock:
+            self._timeouts += 1
+        log.warning("[embed] batch wait exceeded %.1fs; embedding %d text(s) directly", self.timeout_s, len(texts))
+        return self._backend.embed(texts=texts, model_name=model_name, backend_hint=backend_hint)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_batch": self.max_batch,
+                "max_wait_ms": round(self.max_wait_s * 1000.0, 3),
+                "queue_depth_requests": self._queue.qsize(),
+                "queue_depth_texts": self._queued_texts,
+                "batches": self._batches,
+                "avg_batch_size": round(self._batched_texts / self._batches, 2) if self._batches else 0.0,
+                "avg_requests_per_batch": round(self._batched_requests / self._batches, 2) if self._batches else 0.0,
+                "last_batch_size": self._last_batch_size,
+                "max_batch_size": self._max_batch_seen,
+                "timeout_sec": self.timeout_s,
+                "timeouts": self._timeouts,
+            }
+
+    def _ensure_worker(self) -> None:
+        # Re-create after fork (gunicorn pre-fork workers do not inherit threads).
+        pid = os.getpid()
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive() and self._pid == pid:
+                return
+            self._pid = pid
+            self._worker = threading.Thread(target=self._run, name="embed-batcher", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        carry: tuple[list[str], str, str, Future] | None = None
+        while True:
+            first = carry if carry is not None else self._queue.get()
+            carry = None
+            key = (first[2], first[1])
+            batch = [first]
+            size = len(first[0])
+            deadline = time.monotonic() + self.max_wait_s
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    nxt = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if (nxt[2], nxt[1]) != key or size + len(nxt[0]) > self.max_batch:
+                    carry = nxt
+                    break
+                batch.append(nxt)
+                size += len(nxt[0])
+            self._run_batch(batch, model_name=key[1], backend_hint=key[0], size=size)
+
+    def _run_batch(self, batch: list[tuple[list[str], str, str, Future]], *, model_name: str, backend_hint: str, size: int) -> None:
+        with self._lock:
+            self._queued_texts = max(0, self._queued_texts - size)
+        # Drop requests whose callers timed out and embedded directly
+        batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        size = sum(len(texts) for texts, _, _, _ in batch)
+        with self._lock:
+            self._batches += 1
+            self._batched_requests += len(batch)
+            self._batched_texts += size
+            self._last_batch_size = size
+            self._max_batch_seen = max(self._max_batch_seen, size)
+        merged = [t for texts, _, _, _ in batch for t in texts]
+        try:
+            vectors = self._backend.embed(texts=merged, model_name=model_name, backend_hint=backend_hint)
+        except BaseException as e:  # fan the failure out to every waiter
+            for _, _, _, fut in batch:
+                fut.set_exception(e)
+            return
+        if len(vectors) != len(merged):
+            if len(batch) == 1:
+                # Unmerged: let /embed report the mismatch exactly as before.
+                batch[0][3].set_result(vectors)
+                return
+            err = RuntimeError(f"count_mismatch expected={len(merged)} got={len(vectors)}")
+            for _, _, _, fut in batch:
+                fut.set_exception(err)
+            return
+        off = 0
+        for texts, _, _, fut in batch:
+            fut.set_result(vectors[off : off + len(texts)])
+            off += len(texts)
+
+
+_BATCHER = _MicroBatcher(
+    _BACKEND,
+    max_batch=_env_int("AXIOM_EMBED_BATCH_MAX", 256),
+    max_wait_ms=_env_float("AXIOM_EMBED_BATCH_WAIT_MS", 5.0),
+    enabled=(os.getenv("AXIOM_EMBED_BATCHING", "true").strip().lower() in {"1", "true", "yes", "y", "on"}),
+    timeout_s=_env_float("AXIOM_EMBED_BATCH_TIMEOUT_SEC", 30.0),
+)
+
 def _startup_init_backend() -> None:
     # Best-effort init to surface backend selection early and emit safe startup logs.
     try:
@@ -278,6 +459,7 @@ def healthz():
                     "model": model,
                     "dims": EXPECTED_DIMS,
                     "error": _BACKEND.init_error or "backend_unavailable",
+                    "batching": _BATCHER.stats(),
                 }
             ),
             503,
@@ -289,6 +471,7 @@ def healthz():
                 "backend": _BACKEND.kind,
                 "model": _BACKEND.model_name,
                 "dims": EXPECTED_DIMS,
+                "batching": _BATCHER.stats(),
             }
         ),
         200,
@@ -312,7 +495,7 @@ def embed():
         return jsonify({"error": "invalid_request: expected JSON {texts:[...], model?:...}"}), 400
 
     try:
-        vectors = _BACKEND.embed(texts=texts, model_name=str(model), backend_hint=backend_hint)
+        vectors = _BATCHER.embed(texts=texts, model_name=str(model), backend_hint=backend_hint)
 
         if len(vectors) != len(texts):
             return (
@@ -353,6 +536,13 @@ def embed():
         except Exception:
             pass
 
+        wire_dtype = _wire.negotiate(request.headers.get("Accept")) if _wire is not None else None
+        if wire_dtype:
+            return app.response_class(
+                _wire.encode_vectors(vectors, wire_dtype),
+                status=200,
+                content_type=_wire.content_type(wire_dtype),
+            )
         return jsonify({"vectors": vectors}), 200
     except Exception as e:
         msg = str(e)[:220]
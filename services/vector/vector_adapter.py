@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import random
+import sys
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as _FutTimeout
@@ -106,6 +107,12 @@ AXIOM_EMBEDDING_URL = (
 AXIOM_EMBEDDING_MODEL = (os.getenv("AXIOM_EMBEDDING_MODEL", "") or "").strip() or "BAAI/bge-small-en-v1.5"
 
 
+try:
+    from vector import embed_wire as _embed_wire  # type: ignore
+except Exception:  # pragma: no cover - fall back to the JSON wire
+    _embed_wire = None  # type: ignore
+
+
 class EmbedderError(RuntimeError):
     pass
 
@@ -184,17 +191,21 @@ class RemoteHttpEmbedder(Embedder):
         # Keep payload minimal; never log texts/vectors.
         body = {"texts": texts, "model": self._model}
         try:
-            r = requests.post(self.endpoint, json=body, timeout=self._timeout)
+            headers = {"Accept": _embed_wire.accept_header(_embed_wire.client_dtype())} if _embed_wire else None
+            r = requests.post(self.endpoint, json=body, timeout=self._timeout, headers=headers)
             r.raise_for_status()
-            data = r.json() or {}
-            vecs = data.get("vectors")
+            vecs = _embed_wire.vectors_from_response(r) if _embed_wire else (r.json() or {}).get("vectors")
+            binary = hasattr(vecs, "tolist")
+            if binary:
+                # Packed float buffer: one C-level conversion, no per-float re-cast
+                vecs = vecs.tolist()
             if not isinstance(vecs, list):
                 raise EmbedderError("remote_embedder_invalid_response: missing 'vectors' list")
             # Defensive normalization to list[list[float]]
             out: list[list[float]] = []
             for v in vecs:
                 if isinstance(v, list):
-                    out.append([float(x) for x in v])
+                    out.append(v if binary else [float(x) for x in v])
             if len(out) != len(texts):
                 raise EmbedderError(
                     f"remote_embedder_count_mismatch: expected={len(texts)} got={len(out)}"
@@ -327,6 +338,29 @@ except Exception as _e:  # pragma: no cover
         logger.warning("[VectorAdapter] Qdrant client unavailable: %s", str(_e)[:160])
     except Exception:
         pass
+try:
+    from qdrant_client.models import PointStruct  # type: ignore
+except Exception:  # pragma: no cover
+    PointStruct = None  # type: ignore
+
+# Request-scoped retrieval settings bound by the memory pod's /retrieve handler
+try:
+    import retrieval_context as _retrieval_context  # type: ignore
+except Exception:
+    try:
+        from pods.memory import retrieval_context as _retrieval_context  # type: ignore
+    except Exception:  # pragma: no cover
+        _retrieval_context = None  # type: ignore
+
+
+def _default_top_k() -> int:
+    """top_k from the bound RetrievalContext, else TOP_K_FRAGMENTS."""
+    if _retrieval_context is None:
+        return TOP_K_FRAGMENTS
+    try:
+        return int(_retrieval_context.current(sys.modules[__name__]).top_k)
+    except Exception:
+        return TOP_K_FRAGMENTS
 
 
 # ─────────────────────────────────────────────────────────────
@@ -999,6 +1033,101 @@ class VectorAdapter:
             logger.error(f"❌ Exception inserting {class_name}: {e}")
         return False
 
+    async def insert_many(self, class_name: str, items: list[dict]) -> int:
+        """
+        Batch form of `insert`: one `embed_texts` call and one upsert for the
+        whole batch. Items that need ingest chunking go through `insert`.
+        Returns the number of items written.
+        """
+        if self.qdrant_unavailable or getattr(self, "qdrant_client", None) is None:
+            self._log_unavailable_once("disabled_or_unavailable")
+            return 0
+        if not items:
+            return 0
+        collection_name = MEMORY_COLLECTION if class_name == "Memory" else BELIEF_COLLECTION
+        if class_name != "Memory":
+            from memory.memory_collections import (
+                beliefs_collection as _beliefs_collection,
+            )
+
+            collection_name = _beliefs_collection()
+        content_field = "content" if class_name == "Memory" else "statement"
+        from qdrant_payload_schema import PayloadConverter
+
+        inserted = 0
+        batch: list[tuple[str, dict, str]] = []
+        for data in items:
+            text_content = (data or {}).get(content_field, "")
+            if not text_content:
+                logger.warning(f"Empty {content_field} for {class_name} insertion")
+                continue
+            payload = PayloadConverter.validate_payload(await self._format_payload(class_name, data))
+            if class_name == "Memory":
+                mem_type = str(payload.get("memory_type") or payload.get("type") or "memory").lower()
+                if mem_type in _INGEST_CHUNK_TYPES and len(
+                    _chunk_text_by_tokens(text_content, _INGEST_MAX_TOKENS_PER_CHUNK, _INGEST_CHUNK_OVERLAP)
+                ) > 1:
+                    if await self.insert(class_name, data):
+                        inserted += 1
+                    continue
+            batch.append((str(data.get("id", str(uuid4()))), payload, text_content))
+        if not batch:
+            return inserted
+
+        try:
+            vectors = self.embedder.embed_texts([t for _, _, t in batch])
+        except EmbedderError as e:
+            self.embedder_unavailable = True
+            logger.error("[RECALL][Vector] insert requires embeddings: %s", e)
+            raise
+
+        global _DRIFT_COUNTER
+        for vec in vectors:
+            _DRIFT_COUNTER += 1
+            if RETRIEVAL_DRIFT_ENABLED and _DRIFT_SAMPLE_EVERY_N > 0 and (_DRIFT_COUNTER % _DRIFT_SAMPLE_EVERY_N == 0):
+                try:
+                    from retrieval.drift import record_vector_sample, maybe_emit_drift  # type: ignore
+
+                    record_vector_sample(collection_name, vec)
+                    maybe_emit_drift(collection_name)
+                except Exception:
+                    pass
+
+        client = self.qdrant_client
+        points = [(pid, vec, payload) for (pid, payload, _), vec in zip(batch, vectors)]
+
+        def _call_upsert_batch():
+            bulk = getattr(client, "upsert_memories", None)
+            if callable(bulk):
+                return bulk(collection_name=collection_name, points=points)
+            if PointStruct is not None and callable(getattr(client, "upsert", None)):
+                client.upsert(
+                    collection_name=collection_name,
+                    points=[PointStruct(id=pid, vector=vec, payload=payload) for pid, vec, payload in points],
+                )
+                return True
+            return all(
+                client.upsert_memory(collection_name=collection_name, memory_id=pid, vector=vec, payload=payload)
+                for pid, vec, payload in points
+            )
+
+        try:
+            ok = _with_resiliency(
+                _call_upsert_batch,
+                request_id=None,
+                timeout_sec=VECTOR_ADAPTER_TIMEOUT_SEC,
+                retries=VECTOR_ADAPTER_RETRIES,
+            )
+        except Exception as e:
+            logger.error(f"❌ Exception batch-inserting {class_name}: {e}")
+            ok = False
+        if ok:
+            logger.info(f"✅ {len(points)} {class_name} items inserted into Qdrant collection {collection_name}")
+            inserted += len(points)
+        else:
+            logger.warning(f"⚠️ Failed to batch-insert {len(points)} {class_name} items into Qdrant")
+        return inserted
+
     async def _format_payload(self, class_name: str, data: dict) -> dict:
         """Format data into Qdrant payload structure"""
         timestamp = data.get("timestamp", datetime.utcnow().isoformat())
@@ -1042,7 +1171,7 @@ class VectorAdapter:
     async def recall_relevant_memories(
         self,
         query: str,
-        top_k: int = TOP_K_FRAGMENTS,
+        top_k: int | None = None,
         certainty_min: float = CERTAINTY_MIN,
         include_metadata: bool = False,
         *,
@@ -1050,7 +1179,12 @@ class VectorAdapter:
     ) -> list[dict]:
         """
         Enhanced recall method using Qdrant that NEVER returns None - always returns a list.
+
+        When `top_k` is omitted it comes from the request's RetrievalContext
+        (see `retrieval_context.current`), falling back to TOP_K_FRAGMENTS.
         """
+        if top_k is None:
+            top_k = _default_top_k()
         if self.qdrant_unavailable or getattr(self, "qdrant_client", None) is None:
             self._log_unavailable_once("qdrant_unavailable")
             return []
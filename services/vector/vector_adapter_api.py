@@ -243,21 +243,18 @@ def create_app() -> Flask:
             pass
 
         adapter = VectorAdapter()
-        inserted = 0
+        batch = []
         for it in items:
-            try:
-                content = it.get("content") or (it.get("payload", {}) or {}).get("content") or ""
-                metadata = it.get("metadata") or it.get("payload") or {}
-                ok = asyncio.run(
-                    adapter.insert(
-                        class_name="Memory",
-                        data={"content": content, **({} if not isinstance(metadata, dict) else metadata)},
-                    )
-                )
-                if ok:
-                    inserted += 1
-            except Exception:
+            if not isinstance(it, dict):
                 continue
+            content = it.get("content") or (it.get("payload", {}) or {}).get("content") or ""
+            metadata = it.get("metadata") or it.get("payload") or {}
+            batch.append({"content": content, **({} if not isinstance(metadata, dict) else metadata)})
+        try:
+            # One embed call + one upsert for the whole request
+            inserted = asyncio.run(adapter.insert_many(class_name="Memory", items=batch))
+        except Exception:
+            inserted = 0
 
         resp = jsonify({"inserted": inserted})
         try:
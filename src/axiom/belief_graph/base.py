@@ -42,6 +42,44 @@ class BeliefGraphBase(abc.ABC):
     def link_beliefs(self, id1: str, id2: str, relation: str) -> Optional[str]:
         """Create a typed relation between two belief records. Returns relation ID or None."""
 
+    # Bulk writes (optional; default loops over the single-item API)
+    def upsert_many(self, beliefs: Iterable[Any]) -> List[Optional[str]]:
+        """Upsert many triples; returns IDs aligned with the input (None on failure).
+
+        Items are dicts with subject/predicate/object (and optional confidence/sources)
+        or ``(subject, predicate, object)`` tuples. Backends should override this to
+        write the batch in a single transaction.
+        """
+        out: List[Optional[str]] = []
+        for b in beliefs or []:
+            try:
+                if isinstance(b, dict):
+                    out.append(
+                        self.upsert_belief(
+                            b.get("subject"),
+                            b.get("predicate"),
+                            b.get("object", b.get("obj")),
+                            confidence=b.get("confidence", 0.5),
+                            sources=b.get("sources"),
+                        )
+                    )
+                else:
+                    out.append(self.upsert_belief(b[0], b[1], b[2]))
+            except Exception:
+                out.append(None)
+        return out
+
+    def link_many(self, links: Iterable[Any]) -> int:
+        """Create many ``(id1, id2, relation)`` links; returns the number created."""
+        n = 0
+        for link in links or []:
+            try:
+                if self.link_beliefs(*link):
+                    n += 1
+            except Exception:
+                continue
+        return n
+
     # Phase 4: Graph traversal API (optional for backends)
     def get_related_beliefs(self, subject: str, depth: int = 1) -> List[Dict[str, Any]]:
         """Traverse the belief graph starting from a subject string.
@@ -5,6 +5,7 @@ import os
 import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Iterable, List, Optional
 import logging
 
@@ -23,6 +24,93 @@ except Exception:  # fallback if module unavailable
 from .base import BeliefGraphBase
 
 
+# Bumped whenever _init_schema gains a migration that must run once per database.
+_SCHEMA_VERSION = 1
+
+_INVERSE_RELATIONS = {
+    "cause_of": "effect_of",
+    "effect_of": "cause_of",
+    "enables": "results_in",
+    "results_in": "enables",
+}
+
+# Native upsert keyed on the unique (subject, predicate, object) index. On conflict the
+# existing row is reinforced; confidence and source merging run in Python via SQL
+# functions registered on the connection so the whole thing stays one prepared statement.
+_UPSERT_SQL = """
+    INSERT INTO beliefs (subject, predicate, object, confidence, recency, created_at, sources, reinforcement_count, last_updated, inactive, state)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, 0, 'active')
+    ON CONFLICT(subject, predicate, object) DO UPDATE SET
+        confidence=CASE WHEN ? THEN axiom_reinforced_confidence(beliefs.reinforcement_count + 1, excluded.recency)
+                        ELSE excluded.confidence END,
+        reinforcement_count=beliefs.reinforcement_count + 1,
+        recency=excluded.recency,
+        last_updated=excluded.last_updated,
+        sources=axiom_merge_sources(beliefs.sources, excluded.sources),
+        created_at=COALESCE(NULLIF(beliefs.created_at, 0), excluded.created_at)
+"""
+
+_LINK_SQL = """
+    INSERT INTO belief_relations (belief_id1, belief_id2, relation_type, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+_FORWARD_CAUSAL = ("cause_of", "enables", "results_in")
+
+# One recursive walk per traversal. Each step follows outgoing edges whose type is in
+# the "out" filter and incoming edges whose type is in the "in" filter ({out}/{in} are
+# replaced with SQL fragments by _walk). UNION de-duplicates (id, depth, parent, rel),
+# bounding work to O(edges * depth); the depth limit, no-backtrack and seed exclusion
+# are the cycle guards.
+_WALK_SQL = """
+    WITH RECURSIVE
+    seeds(id) AS (SELECT id FROM beliefs WHERE subject = ? OR object = ?),
+    walk(id, depth, parent, rel) AS (
+        SELECT id, 0, NULL, NULL FROM seeds
+        UNION
+        SELECT CASE WHEN r.belief_id1 = w.id THEN r.belief_id2 ELSE r.belief_id1 END,
+               w.depth + 1, w.id, r.relation_type
+        FROM walk w
+        JOIN belief_relations r
+          ON (r.belief_id1 = w.id AND {out}) OR (r.belief_id2 = w.id AND {in})
+        WHERE w.depth < ?
+          AND CASE WHEN r.belief_id1 = w.id THEN r.belief_id2 ELSE r.belief_id1 END
+              NOT IN (w.id, IFNULL(w.parent, -1))
+          AND CASE WHEN r.belief_id1 = w.id THEN r.belief_id2 ELSE r.belief_id1 END
+              NOT IN (SELECT id FROM seeds)
+    )
+    SELECT id, depth, parent, rel FROM walk ORDER BY depth, id, parent
+"""
+
+
+def _confidence_enabled() -> bool:
+    return str(os.getenv("AXIOM_CONFIDENCE_ENABLED", "1")).strip().lower() in {"1", "true", "yes"}
+
+
+def _min_threshold() -> float:
+    try:
+        return float(os.getenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2") or 0.2)
+    except Exception:
+        return 0.2
+
+
+def _reinforced_confidence(rcount: Any, ts: Any) -> float:
+    belief_ctx = {"recency": int(ts), "last_updated": int(ts), "reinforcement_count": int(rcount or 0)}
+    return float(calculate_confidence(belief_ctx, context={"source_reliability": 0.5}))
+
+
+def _merge_sources(old: Optional[str], new: Optional[str]) -> str:
+    try:
+        existing = json.loads(old) if old else []
+    except Exception:
+        existing = []
+    try:
+        return json.dumps(list(set((existing or []) + (json.loads(new) if new else []))))
+    except Exception:
+        return json.dumps(existing or [])
+
+
 def _ensure_dir(path: str) -> None:
     d = os.path.dirname(path)
     if d and not os.path.exists(d):
@@ -40,8 +128,40 @@ class SQLiteBeliefGraph(BeliefGraphBase):
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL;")
         self._conn.execute("PRAGMA synchronous=NORMAL;")
-        self._init_schema()
+        self._conn.create_function("axiom_reinforced_confidence", 2, _reinforced_confidence)
+        self._conn.create_function("axiom_merge_sources", 2, _merge_sources)
         self._logger = logging.getLogger(__name__)
+        try:
+            self._max_depth = max(1, int(os.getenv("AXIOM_BELIEF_TRAVERSAL_MAX_DEPTH", "6") or 6))
+        except Exception:
+            self._max_depth = 6
+        try:
+            self._walk_cache_size = max(0, int(os.getenv("AXIOM_BELIEF_TRAVERSAL_CACHE", "0") or 0))
+        except Exception:
+            self._walk_cache_size = 0
+        # Walk results for hot subjects, keyed by (subject, out, in, depth); dropped on any graph write
+        self._walk_cache: "OrderedDict[tuple, Dict[int, tuple]]" = OrderedDict()
+        # Read-side decay is queued here and flushed in batches (see flush_decay)
+        self._local = threading.local()
+        self._decay_lock = threading.Lock()
+        self._pending_decay: Dict[int, tuple] = {}
+        self._decay_flushed_at = time.monotonic()
+        try:
+            self._decay_flush_sec = max(0.0, float(os.getenv("AXIOM_BELIEF_DECAY_FLUSH_SEC", "5") or 5))
+        except Exception:
+            self._decay_flush_sec = 5.0
+        try:
+            self._decay_batch = max(1, int(os.getenv("AXIOM_BELIEF_DECAY_BATCH", "256") or 256))
+        except Exception:
+            self._decay_batch = 256
+        # Memory id -> confidence, rebuilt from one Memory snapshot at most every TTL seconds
+        self._child_conf_map: Optional[Dict[str, float]] = None
+        self._child_conf_at = 0.0
+        try:
+            self._child_conf_ttl = max(0.0, float(os.getenv("AXIOM_BELIEF_CHILD_CONF_TTL_SEC", "5") or 5))
+        except Exception:
+            self._child_conf_ttl = 5.0
+        self._init_schema()
 
     def _init_schema(self) -> None:
         with self._lock:
@@ -118,8 +238,66 @@ class SQLiteBeliefGraph(BeliefGraphBase):
             cur.execute(
                 "CREATE INDEX IF NOT EXISTS idx_beliefs_object ON beliefs(object)"
             )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_belief_relations_src ON belief_relations(belief_id1, relation_type)"
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_belief_relations_dst ON belief_relations(belief_id2, relation_type)"
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_belief_relations_type ON belief_relations(relation_type)"
+            )
+            version = int(cur.execute("PRAGMA user_version").fetchone()[0] or 0)
+            if version < 1:
+                self._dedupe_triples(cur)
+                cur.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_beliefs_triple ON beliefs(subject, predicate, object)"
+                )
+            if version < _SCHEMA_VERSION:
+                cur.execute(f"PRAGMA user_version = {int(_SCHEMA_VERSION)}")
             self._conn.commit()
 
+    def _dedupe_triples(self, cur: sqlite3.Cursor) -> None:
+        """Collapse duplicate triples left by pre-index databases into the oldest row.
+
+        Relations are re-pointed at the survivor; reinforcement counts are summed and
+        sources merged so no evidence is lost before the unique index is created.
+        """
+        dupes = cur.execute(
+            "SELECT subject, predicate, object FROM beliefs GROUP BY subject, predicate, object HAVING COUNT(*) > 1"
+        ).fetchall()
+        for subj, pred, obj in dupes:
+            rows = cur.execute(
+                "SELECT id, reinforcement_count, recency, last_updated, sources, confidence FROM beliefs "
+                "WHERE subject=? AND predicate=? AND object=? ORDER BY id",
+                (subj, pred, obj),
+            ).fetchall()
+            keep = int(rows[0][0])
+            drop = [int(r[0]) for r in rows[1:]]
+            sources = rows[0][4]
+            for r in rows[1:]:
+                sources = _merge_sources(sources, r[4])
+            cur.execute(
+                "UPDATE beliefs SET reinforcement_count=?, recency=?, last_updated=?, sources=?, confidence=? WHERE id=?",
+                (
+                    sum(int(r[1] or 0) for r in rows),
+                    max(int(r[2] or 0) for r in rows),
+                    max(int(r[3] or 0) for r in rows),
+                    sources,
+                    max(float(r[5] or 0.0) for r in rows),
+                    keep,
+                ),
+            )
+            placeholders = ",".join(["?"] * len(drop))
+            cur.execute(f"UPDATE belief_relations SET belief_id1=? WHERE belief_id1 IN ({placeholders})", [keep] + drop)
+            cur.execute(f"UPDATE belief_relations SET belief_id2=? WHERE belief_id2 IN ({placeholders})", [keep] + drop)
+            cur.execute(f"DELETE FROM beliefs WHERE id IN ({placeholders})", drop)
+        if dupes:
+            try:
+                self._logger.info(f"[BeliefGraph][Migrate] merged {len(dupes)} duplicate triples")
+            except Exception:
+                pass
+
     def upsert_belief(
         self,
         subject: str,
@@ -132,99 +310,130 @@ class SQLiteBeliefGraph(BeliefGraphBase):
         if not subject or not predicate or not obj:
             return None
         try:
-            ts = int(time.time())
-            src = json.dumps(list(sources) if sources is not None else [])
             with self._lock:
+                self.flush_decay()
                 cur = self._conn.cursor()
-                # Try to find existing triple
+                # Native upsert on the (subject, predicate, object) unique index:
+                # one statement, one commit, no SELECT-then-write race.
+                cur.execute(
+                    _UPSERT_SQL,
+                    self._upsert_params(subject, predicate, obj, confidence, sources, int(time.time()), _confidence_enabled()),
+                )
                 cur.execute(
-                    "SELECT id, confidence, reinforcement_count, recency, last_updated, sources, inactive, state, created_at FROM beliefs WHERE subject=? AND predicate=? AND object=?",
+                    "SELECT id FROM beliefs WHERE subject=? AND predicate=? AND object=?",
                     (subject.strip(), predicate.strip(), obj.strip()),
                 )
                 row = cur.fetchone()
-                if row:
-                    bid, conf_old, rcount_old, rec_old, last_upd_old, src_old, inactive_old, state_old, created_old = row
-                    # Merge sources (best-effort JSON arrays)
-                    try:
-                        existing_sources = json.loads(src_old or "[]") if src_old else []
-                    except Exception:
-                        existing_sources = []
-                    try:
-                        new_sources = list(set((existing_sources or []) + (json.loads(src) if src else [])))
-                    except Exception:
-                        new_sources = existing_sources or []
+                self._conn.commit()
+                self._walk_cache.clear()
+                return str(row[0]) if row else None
+        except Exception:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+            return None
 
-                    rcount_new = int(rcount_old or 0) + 1
-                    belief_ctx = {
-                        "recency": ts,
-                        "last_updated": ts,
-                        "reinforcement_count": rcount_new,
-                    }
-                    # Respect flag gating
-                    enabled = str(os.getenv("AXIOM_CONFIDENCE_ENABLED", "1")).strip().lower() in {"1", "true", "yes"}
-                    if enabled:
-                        conf_new = calculate_confidence(belief_ctx, context={"source_reliability": 0.5})
-                    else:
-                        conf_new = float(confidence)
+    def upsert_many(self, beliefs: Iterable[Any]) -> List[Optional[str]]:
+        """Upsert many triples in a single transaction.
 
-                    cur.execute(
-                        """
-                        UPDATE beliefs
-                        SET confidence=?, reinforcement_count=?, recency=?, last_updated=?, sources=?, inactive=?, state=?, created_at=COALESCE(NULLIF(created_at,0), ?)
-                        WHERE id=?
-                        """,
-                        (
-                            float(conf_new),
-                            int(rcount_new),
-                            ts,
-                            ts,
-                            json.dumps(new_sources),
-                            int(inactive_old or 0),
-                            str(state_old or "active"),
-                            int(created_old or 0) or ts,
-                            int(bid),
-                        ),
+        Each item is a dict with subject/predicate/object (``obj`` accepted) and optional
+        confidence/sources, or a ``(subject, predicate, object[, confidence[, sources]])``
+        tuple. Returns IDs aligned with the input; invalid items map to None.
+        On any database error the whole batch is rolled back and all IDs are None.
+        """
+        items: List[Optional[tuple]] = []
+        for b in beliefs or []:
+            try:
+                if isinstance(b, dict):
+                    t = (
+                        b.get("subject"),
+                        b.get("predicate"),
+                        b.get("object", b.get("obj")),
+                        b.get("confidence", 0.5),
+                        b.get("sources"),
                     )
-                    self._conn.commit()
-                    return str(bid)
                 else:
-                    # Insert fresh belief
-                    # Initial reinforcement_count = 1 (first observation counts as reinforcement)
-                    rcount_init = 1
-                    belief_ctx = {
-                        "recency": ts,
-                        "last_updated": ts,
-                        "reinforcement_count": rcount_init,
-                    }
-                    enabled = str(os.getenv("AXIOM_CONFIDENCE_ENABLED", "1")).strip().lower() in {"1", "true", "yes"}
-                    if enabled:
-                        conf_init = calculate_confidence(belief_ctx, context={"source_reliability": 0.5})
-                    else:
-                        conf_init = float(confidence)
-
+                    t = tuple(b)
+                    if not 3 <= len(t) <= 5:
+                        raise ValueError("belief tuple must have 3-5 fields")
+                    t = t + (0.5, None)[len(t) - 3 :]
+                ok = all(isinstance(x, str) and x.strip() for x in t[:3])
+                items.append(t if ok else None)
+            except Exception:
+                items.append(None)
+        valid = [t for t in items if t is not None]
+        if not valid:
+            return [None] * len(items)
+        try:
+            ts = int(time.time())
+            enabled = _confidence_enabled()
+            with self._lock:
+                self.flush_decay()
+                cur = self._conn.cursor()
+                cur.executemany(
+                    _UPSERT_SQL,
+                    [self._upsert_params(s, p, o, c if c is not None else 0.5, src, ts, enabled) for s, p, o, c, src in valid],
+                )
+                out: List[Optional[str]] = []
+                for t in items:
+                    if t is None:
+                        out.append(None)
+                        continue
                     cur.execute(
-                        """
-                        INSERT INTO beliefs (subject, predicate, object, confidence, recency, created_at, sources, reinforcement_count, last_updated, inactive, state)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 'active')
-                        """,
-                        (
-                            subject.strip(),
-                            predicate.strip(),
-                            obj.strip(),
-                            float(conf_init),
-                            ts,
-                            ts,
-                            src,
-                            int(rcount_init),
-                            ts,
-                        ),
+                        "SELECT id FROM beliefs WHERE subject=? AND predicate=? AND object=?",
+                        (t[0].strip(), t[1].strip(), t[2].strip()),
                     )
-                    self._conn.commit()
-                    return str(cur.lastrowid)
+                    row = cur.fetchone()
+                    out.append(str(row[0]) if row else None)
+                self._conn.commit()
+                self._walk_cache.clear()
+            return out
         except Exception:
-            return None
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+            return [None] * len(items)
+
+    @staticmethod
+    def _upsert_params(
+        subject: str,
+        predicate: str,
+        obj: str,
+        confidence: Any,
+        sources: Optional[Iterable[str]],
+        ts: int,
+        enabled: bool,
+    ) -> tuple:
+        # Initial reinforcement_count = 1 (first observation counts as reinforcement)
+        if enabled:
+            conf_init = calculate_confidence(
+                {"recency": ts, "last_updated": ts, "reinforcement_count": 1},
+                context={"source_reliability": 0.5},
+            )
+        else:
+            conf_init = float(confidence)
+        src = json.dumps(list(sources) if sources is not None else [])
+        return (
+            subject.strip(),
+            predicate.strip(),
+            obj.strip(),
+            float(conf_init),
+            ts,
+            ts,
+            src,
+            ts,
+            1 if enabled else 0,
+        )
 
     def get_beliefs(self, subjects: List[str], *, hops: int = 1) -> List[Dict[str, Any]]:
+        """Read beliefs for subjects without writing on the read path.
+
+        Decay and episode/procedure aggregation are applied to the returned hits at read
+        time; the resulting confidence/inactive changes are queued and persisted in one
+        batched transaction by flush_decay() (see AXIOM_BELIEF_DECAY_FLUSH_SEC).
+        """
         if not subjects:
             return []
         try:
@@ -237,85 +446,15 @@ class SQLiteBeliefGraph(BeliefGraphBase):
                 f"FROM beliefs WHERE subject IN ({placeholders}) OR object IN ({placeholders}) "
                 f"ORDER BY confidence DESC, recency DESC LIMIT 20"
             )
-            with self._lock:
-                cur = self._conn.cursor()
-                cur.execute(sql, params + params)
-                rows = cur.fetchall()
+            rows = self._reader().execute(sql, params + params).fetchall()
             hits: List[Dict[str, Any]] = []
-            for r in rows:
-                bid, subj, pred, obj, conf, rec, created_at, src, rcount, last_upd, inactive_flag, state_val, time_start, time_end = r
-                try:
-                    sources = json.loads(src) if src else []
-                except Exception:
-                    sources = []
-                content = f"{subj} {pred} {obj}"
-                # Phase 25: mark episodes inactive when all children decayed
-                try:
-                    if str(state_val or "").strip().lower() == "episode":
-                        self._maybe_mark_episode_inactive(int(bid), sources)
-                        # Reload inactive flag if it changed
-                        with self._lock:
-                            cur3 = self._conn.cursor()
-                            cur3.execute("SELECT inactive FROM beliefs WHERE id=?", (int(bid),))
-                            row_in = cur3.fetchone()
-                            if row_in:
-                                inactive_flag = int(row_in[0] or 0)
-                    # Phase 26: update procedure confidence from supporting evidence
-                    if str(state_val or "").strip().lower() == "procedure":
-                        self._maybe_update_procedure_confidence(int(bid), sources)
-                        # Reload updated confidence/inactive after procedure aggregation
-                        with self._lock:
-                            cur3b = self._conn.cursor()
-                            cur3b.execute("SELECT confidence, inactive FROM beliefs WHERE id=?", (int(bid),))
-                            row_pc = cur3b.fetchone()
-                            if row_pc:
-                                try:
-                                    conf = float(row_pc[0] if row_pc[0] is not None else conf)
-                                except Exception:
-                                    pass
-                                try:
-                                    inactive_flag = int(row_pc[1] or inactive_flag)
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
-                # Optional retrieval-time decay and inactive tagging
-                enabled = str(os.getenv("AXIOM_CONFIDENCE_ENABLED", "1")).strip().lower() in {"1", "true", "yes"}
-                conf_val = float(conf)
-                if enabled:
-                    # Compute decayed confidence
-                    belief_ctx = {
-                        "recency": int(rec),
-                        "last_updated": int(last_upd or rec),
-                        "reinforcement_count": int(rcount or 0),
-                    }
-                    conf_new = float(calculate_confidence(belief_ctx, context={"source_reliability": 0.5}))
-                    min_thr = float(os.getenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2") or 0.2)
-                    if conf_new < conf_val or (inactive_flag and conf_new >= min_thr):
-                        try:
-                            # Persist decay and possibly mark inactive
-                            new_inactive = 1 if conf_new < min_thr else 0
-                            with self._lock:
-                                cur2 = self._conn.cursor()
-                                cur2.execute(
-                                    "UPDATE beliefs SET confidence=?, inactive=? WHERE id=?",
-                                    (conf_new, new_inactive, int(bid)),
-                                )
-                                self._conn.commit()
-                            try:
-                                self._logger.info(
-                                    f"[Confidence] Decayed belief {bid} from {conf_val:.3f} → {conf_new:.3f}"
-                                )
-                            except Exception:
-                                pass
-                            conf_val = conf_new
-                            inactive_flag = new_inactive
-                        except Exception:
-                            pass
+            evaluated, updates = self._evaluate_rows(rows, reactivate=True)
+            for r, sources, conf_val, inactive_val in evaluated:
+                bid, subj, pred, obj, conf, rec, created_at, _src, rcount, last_upd, inactive_flag, state_val, time_start, time_end = r
                 hits.append(
                     {
                         "id": str(bid),
-                        "content": content,
+                        "content": f"{subj} {pred} {obj}",
                         "type": "belief",
                         "subject": subj,
                         "predicate": pred,
@@ -328,7 +467,7 @@ class SQLiteBeliefGraph(BeliefGraphBase):
                             t
                             for t in (
                                 "belief",
-                                ("inactive" if inactive_flag else None),
+                                ("inactive" if inactive_val else None),
                                 (state_val if (state_val and state_val != "active") else None),
                             )
                             if t is not None
@@ -340,10 +479,197 @@ class SQLiteBeliefGraph(BeliefGraphBase):
                         "time_end": int(time_end) if time_end is not None else None,
                     }
                 )
+            if updates:
+                self._queue_decay(updates)
+            hits.sort(key=lambda h: (h["confidence"], h["recency"]), reverse=True)
             return hits
         except Exception:
             return []
 
+    def _evaluate_rows(
+        self, rows: List[tuple], *, procedures: bool = True, reactivate: bool = False
+    ) -> tuple:
+        """Apply read-time episode/procedure aggregation and decay to belief rows.
+
+        Flags and child-memory confidences are resolved once for the whole call.
+        Returns ([(row, sources, confidence, inactive)], updates) where updates are
+        (confidence, inactive, id, last_updated) tuples for rows whose stored values
+        changed. With reactivate=True a decayed-but-recovered belief is cleared of
+        its inactive flag (get_beliefs semantics).
+        """
+        enabled = _confidence_enabled()
+        min_thr = _min_threshold()
+        aggregated = {"episode", "procedure"} if procedures else {"episode"}
+
+        parsed = []
+        child_ids: set = set()
+        for r in rows:
+            try:
+                sources = json.loads(r[7]) if r[7] else []
+            except Exception:
+                sources = []
+            state_norm = str(r[11] or "").strip().lower()
+            if state_norm in aggregated and sources:
+                child_ids.update(str(x) for x in sources if x)
+            parsed.append((r, sources, state_norm))
+        # One Memory-derived map per call covers every episode/procedure in the result
+        child_conf = self._child_confidences(child_ids) if child_ids else {}
+
+        out: List[tuple] = []
+        updates: List[tuple] = []
+        for r, sources, state_norm in parsed:
+            bid, conf, rec, rcount, last_upd, inactive_flag = r[0], r[4], r[5], r[8], r[9], r[10]
+            conf_val = float(conf)
+            inactive_val = int(inactive_flag or 0)
+            kids = [child_conf[str(x)] for x in sources if str(x) in child_conf] if state_norm in aggregated else []
+            # Phase 25: episodes go inactive when all children decayed
+            if state_norm == "episode" and kids and all(c < min_thr for c in kids):
+                inactive_val = 1
+            # Phase 26: procedure confidence follows its supporting evidence
+            if state_norm == "procedure" and kids:
+                agg = max(0.0, min(1.0, sum(kids) / float(len(kids))))
+                if agg < conf_val or agg < min_thr:
+                    conf_val = agg
+                    inactive_val = 1 if agg < min_thr else 0
+            # Retrieval-time decay and inactive tagging
+            if enabled:
+                belief_ctx = {
+                    "recency": int(rec),
+                    "last_updated": int(last_upd or rec),
+                    "reinforcement_count": int(rcount or 0),
+                }
+                conf_new = float(calculate_confidence(belief_ctx, context={"source_reliability": 0.5}))
+                if conf_new < conf_val:
+                    conf_val = conf_new
+                    inactive_val = 1 if conf_new < min_thr else (0 if reactivate else inactive_val)
+                elif reactivate and inactive_val and conf_new >= min_thr:
+                    conf_val = conf_new
+                    inactive_val = 0
+            if conf_val != float(conf) or inactive_val != int(inactive_flag or 0):
+                updates.append((conf_val, inactive_val, int(bid), last_upd))
+            out.append((r, sources, conf_val, inactive_val))
+        return out, updates
+
+    def _write_decay(self, batch: List[tuple]) -> int:
+        """Write (confidence, inactive, id, last_updated) rows in one transaction.
+
+        Rows reinforced since they were read (last_updated moved) are skipped so a
+        stale decay never overwrites a fresh upsert. Caller must hold self._lock.
+        """
+        try:
+            cur = self._conn.cursor()
+            cur.executemany(
+                "UPDATE beliefs SET confidence=?, inactive=? WHERE id=? AND last_updated IS ?",
+                batch,
+            )
+            self._conn.commit()
+            return int(cur.rowcount if cur.rowcount is not None and cur.rowcount >= 0 else len(batch))
+        except Exception:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+            return 0
+
+    def _persist_read_updates(self, updates: List[tuple]) -> None:
+        """Write traversal-time decay synchronously, as one executemany."""
+        if not updates:
+            return
+        with self._lock:
+            written = self._write_decay(updates)
+        try:
+            self._logger.info(f"[Confidence] Persisted decay for {written} beliefs")
+        except Exception:
+            pass
+
+    # ---- Deferred decay writer ----
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread read-only connection so reads never wait on the write lock (WAL)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA query_only=ON;")
+            self._local.conn = conn
+        return conn
+
+    def _queue_decay(self, updates: List[tuple]) -> None:
+        with self._decay_lock:
+            for conf_val, inactive_val, bid, last_upd in updates:
+                self._pending_decay[bid] = (conf_val, inactive_val, bid, last_upd)
+            due = (
+                len(self._pending_decay) >= self._decay_batch
+                or time.monotonic() - self._decay_flushed_at >= self._decay_flush_sec
+            )
+        if due:
+            self.flush_decay(blocking=False)
+
+    def flush_decay(self, *, blocking: bool = True) -> int:
+        """Persist queued decay updates in one transaction; returns rows written.
+
+        Rows reinforced since they were read (last_updated moved) are skipped so a stale
+        decay never overwrites a fresh upsert. With blocking=False the flush is skipped
+        when a writer holds the graph lock.
+        """
+        if not self._lock.acquire(blocking=blocking):
+            return 0
+        try:
+            with self._decay_lock:
+                batch = list(self._pending_decay.values())
+                self._pending_decay.clear()
+                self._decay_flushed_at = time.monotonic()
+            if not batch:
+                return 0
+            written = self._write_decay(batch)
+            if not written:
+                return 0
+            try:
+                self._logger.info(f"[Confidence] Persisted decay for {written} beliefs")
+            except Exception:
+                pass
+            return written
+        finally:
+            self._lock.release()
+
+    def _child_confidences(self, ids: Iterable[str]) -> Dict[str, float]:
+        """Confidence of child memories by id, from the cached Memory-derived map."""
+        conf_map = self._child_conf_map
+        if conf_map is None or time.monotonic() - self._child_conf_at >= self._child_conf_ttl:
+            conf_map = self._load_child_conf_map()
+            if conf_map is None:
+                return {}
+            self._child_conf_map = conf_map
+            self._child_conf_at = time.monotonic()
+        return {i: conf_map[i] for i in (str(x) for x in ids if x) if i in conf_map}
+
+    @staticmethod
+    def _load_child_conf_map() -> Optional[Dict[str, float]]:
+        """One Memory snapshot folded into {memory_id: confidence}; None if unavailable."""
+        # Import Memory lazily to avoid hard dependency
+        Memory = None
+        try:
+            from pods.memory.memory_manager import Memory as _Mem  # type: ignore
+            Memory = _Mem
+        except Exception:
+            try:
+                from memory_manager import Memory as _Mem2  # type: ignore
+                Memory = _Mem2
+            except Exception:
+                Memory = None
+        if Memory is None:
+            return None
+        try:
+            mem = Memory()
+            snap = mem.snapshot() if hasattr(mem, "snapshot") else []
+        except Exception:
+            return None
+        out: Dict[str, float] = {}
+        for m in snap or []:
+            try:
+                out[str(m.get("id"))] = float(m.get("confidence", 0.0) or 0.0)
+            except Exception:
+                continue
+        return out
+
     def link_beliefs(self, id1: str, id2: str, relation: str) -> Optional[str]:
         try:
             if not id1 or not id2 or not relation:
@@ -352,37 +678,56 @@ class SQLiteBeliefGraph(BeliefGraphBase):
                 cur = self._conn.cursor()
                 ts = int(time.time())
                 rel = relation.strip()
-                cur.execute(
-                    """
-                    INSERT INTO belief_relations (belief_id1, belief_id2, relation_type, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (int(id1), int(id2), rel, ts),
-                )
+                cur.execute(_LINK_SQL, (int(id1), int(id2), rel, ts))
+                rid = cur.lastrowid
                 # Phase 13: insert inverse where defined
                 try:
-                    inverse_map = {
-                        "cause_of": "effect_of",
-                        "effect_of": "cause_of",
-                        "enables": "results_in",
-                        "results_in": "enables",
-                    }
-                    inv = inverse_map.get(rel)
+                    inv = _INVERSE_RELATIONS.get(rel)
                     if inv:
-                        cur.execute(
-                            """
-                            INSERT INTO belief_relations (belief_id1, belief_id2, relation_type, created_at)
-                            VALUES (?, ?, ?, ?)
-                            """,
-                            (int(id2), int(id1), inv, ts),
-                        )
+                        cur.execute(_LINK_SQL, (int(id2), int(id1), inv, ts))
+                        rid = cur.lastrowid
                 except Exception:
                     pass
                 self._conn.commit()
-                return str(cur.lastrowid)
+                self._walk_cache.clear()
+                return str(rid)
         except Exception:
             return None
 
+    def link_many(self, links: Iterable[Any]) -> int:
+        """Create many ``(id1, id2, relation)`` links (plus inverses) in one transaction.
+
+        Returns the number of relation rows written (0 on failure; the batch is rolled back).
+        """
+        rows: List[tuple] = []
+        ts = int(time.time())
+        for link in links or []:
+            try:
+                id1, id2, relation = link
+                rel = str(relation or "").strip()
+                if not id1 or not id2 or not rel:
+                    continue
+                rows.append((int(id1), int(id2), rel, ts))
+                inv = _INVERSE_RELATIONS.get(rel)
+                if inv:
+                    rows.append((int(id2), int(id1), inv, ts))
+            except Exception:
+                continue
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                self._conn.executemany(_LINK_SQL, rows)
+                self._conn.commit()
+                self._walk_cache.clear()
+            return len(rows)
+        except Exception:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+            return 0
+
     # Phase 14: Counterfactual simulation
     def simulate_counterfactual(self, node: str, remove_edge: tuple[str, str, str] | None = None) -> List[Dict[str, Any]]:  # type: ignore[override]
         try:
@@ -569,8 +914,77 @@ class SQLiteBeliefGraph(BeliefGraphBase):
         except Exception:
             return []
 
+    # Traversal engine shared by related/causal lookups
+    def _walk(
+        self,
+        subject: str,
+        depth: int,
+        out_types: Optional[Iterable[str]] = None,
+        in_types: Optional[Iterable[str]] = None,
+    ) -> Dict[int, tuple]:
+        """Walk the relation graph from beliefs mentioning `subject` in one recursive query.
+
+        out_types/in_types filter outgoing/incoming edges by relation type (None = any,
+        empty = none). Returns {belief_id: (hops, parent_id, relation)} keeping the
+        shortest discovery of each node; seeds have hops 0 and no parent.
+        Caller must hold self._lock.
+        """
+        depth = max(1, min(int(depth), self._max_depth))
+        out_key = tuple(sorted(out_types)) if out_types is not None else None
+        in_key = tuple(sorted(in_types)) if in_types is not None else None
+        key = (subject, out_key, in_key, depth)
+        cached = self._walk_cache.get(key)
+        if cached is not None:
+            self._walk_cache.move_to_end(key)
+            return cached
+
+        def _filter(types: Optional[tuple]) -> tuple:
+            if types is None:
+                return "1", []
+            if not types:
+                return "0", []
+            return f"r.relation_type IN ({','.join(['?'] * len(types))})", list(types)
+
+        out_sql, out_params = _filter(out_key)
+        in_sql, in_params = _filter(in_key)
+        sql = _WALK_SQL.replace("{out}", out_sql).replace("{in}", in_sql)
+        rows = self._conn.execute(sql, [subject, subject] + out_params + in_params + [depth]).fetchall()
+        meta: Dict[int, tuple] = {}
+        for nid, hops, parent, rel in rows:
+            nid = int(nid)
+            if nid not in meta:
+                meta[nid] = (int(hops), int(parent) if parent is not None else None, rel)
+        if self._walk_cache_size:
+            self._walk_cache[key] = meta
+            while len(self._walk_cache) > self._walk_cache_size:
+                self._walk_cache.popitem(last=False)
+        return meta
+
+    @staticmethod
+    def _path_fields(meta: Dict[int, tuple], bid: int) -> Dict[str, Any]:
+        hops, _parent, rel = meta.get(bid, (0, None, None))
+        path: List[str] = []
+        node: Optional[int] = bid
+        while node is not None and len(path) <= hops:
+            path.append(str(node))
+            node = meta.get(node, (0, None, None))[1]
+        return {"hops": int(hops), "path": list(reversed(path)), "via": rel}
+
+    def _fetch_walk_rows(self, meta: Dict[int, tuple]) -> List[tuple]:
+        placeholders = ",".join(["?"] * len(meta))
+        return self._conn.execute(
+            f"SELECT id, subject, predicate, object, confidence, recency, created_at, sources, reinforcement_count, last_updated, inactive, state, time_start, time_end FROM beliefs WHERE id IN ({placeholders}) ORDER BY confidence DESC, recency DESC LIMIT 50",
+            list(meta),
+        ).fetchall()
+
     # Phase 4: traversal by subject
-    def get_related_beliefs(self, subject: str, depth: int = 1) -> List[Dict[str, Any]]:
+    def get_related_beliefs(
+        self,
+        subject: str,
+        depth: int = 1,
+        *,
+        relation_types: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
         if not isinstance(subject, str) or not subject.strip():
             return []
         try:
@@ -579,117 +993,19 @@ class SQLiteBeliefGraph(BeliefGraphBase):
             depth = 1
 
         try:
+            types = [str(t).strip() for t in relation_types] if relation_types is not None else None
             with self._lock:
-                cur = self._conn.cursor()
-                # Seed: beliefs where subject or object matches input subject
-                cur.execute(
-                    """
-                    SELECT id FROM beliefs WHERE subject = ? OR object = ?
-                    """,
-                    (subject.strip(), subject.strip()),
-                )
-                seed_rows = cur.fetchall()
-                frontier = {int(r[0]) for r in seed_rows}
-                visited = set(frontier)
-
-                # BFS over belief_relations up to depth
-                for _ in range(depth):
-                    if not frontier:
-                        break
-                    placeholders = ",".join(["?"] * len(frontier))
-                    params = list(frontier)
-                    # Explore both directions
-                    cur.execute(
-                        f"SELECT belief_id1, belief_id2 FROM belief_relations WHERE belief_id1 IN ({placeholders}) OR belief_id2 IN ({placeholders})",
-                        params + params,
-                    )
-                    rows = cur.fetchall()
-                    next_frontier = set()
-                    for a, b in rows:
-                        a = int(a)
-                        b = int(b)
-                        if a in frontier and b not in visited:
-                            next_frontier.add(b)
-                        if b in frontier and a not in visited:
-                            next_frontier.add(a)
-                    visited.update(next_frontier)
-                    frontier = next_frontier
-
-                if not visited:
+                meta = self._walk(subject.strip(), depth, types, types)
+                if not meta:
                     return []
+                rows = self._fetch_walk_rows(meta)
 
-                placeholders = ",".join(["?"] * len(visited))
-                cur.execute(
-                    f"SELECT id, subject, predicate, object, confidence, recency, created_at, sources, reinforcement_count, last_updated, inactive, state, time_start, time_end FROM beliefs WHERE id IN ({placeholders}) ORDER BY confidence DESC, recency DESC LIMIT 50",
-                    list(visited),
-                )
-                rows = cur.fetchall()
-
+            evaluated, updates = self._evaluate_rows(rows)
+            self._persist_read_updates(updates)
             hits: List[Dict[str, Any]] = []
-            for r in rows:
-                bid, subj, pred, obj, conf, rec, created_at, src, rcount, last_upd, inactive_flag, state_val, time_start, time_end = r
-                try:
-                    sources = json.loads(src) if src else []
-                except Exception:
-                    sources = []
+            for r, sources, conf_val, inactive_flag in evaluated:
+                bid, subj, pred, obj, conf, rec, created_at, _src, rcount, last_upd, _inactive, state_val, time_start, time_end = r
                 content = f"{subj} {pred} {obj}"
-                # Phase 25: episode inactivity propagation
-                try:
-                    if str(state_val or "").strip().lower() == "episode":
-                        self._maybe_mark_episode_inactive(int(bid), sources)
-                        with self._lock:
-                            cur3 = self._conn.cursor()
-                            cur3.execute("SELECT inactive FROM beliefs WHERE id=?", (int(bid),))
-                            row_in = cur3.fetchone()
-                            if row_in:
-                                inactive_flag = int(row_in[0] or 0)
-                    # Phase 26: procedure confidence aggregation from evidence
-                    if str(state_val or "").strip().lower() == "procedure":
-                        self._maybe_update_procedure_confidence(int(bid), sources)
-                        # Refresh local confidence so returned hit reflects update
-                        with self._lock:
-                            cur3b = self._conn.cursor()
-                            cur3b.execute("SELECT confidence, inactive FROM beliefs WHERE id=?", (int(bid),))
-                            row_pc = cur3b.fetchone()
-                            if row_pc:
-                                try:
-                                    conf_val = float(row_pc[0] if row_pc[0] is not None else conf_val)
-                                except Exception:
-                                    pass
-                                try:
-                                    inactive_flag = int(row_pc[1] or inactive_flag)
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
-                enabled = str(os.getenv("AXIOM_CONFIDENCE_ENABLED", "1")).strip().lower() in {"1", "true", "yes"}
-                conf_val = float(conf)
-                if enabled:
-                    belief_ctx = {
-                        "recency": int(rec),
-                        "last_updated": int(last_upd or rec),
-                        "reinforcement_count": int(rcount or 0),
-                    }
-                    conf_new = float(calculate_confidence(belief_ctx, context={"source_reliability": 0.5}))
-                    if conf_new < conf_val:
-                        min_thr = float(os.getenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2") or 0.2)
-                        try:
-                            with self._lock:
-                                cur2 = self._conn.cursor()
-                                cur2.execute(
-                                    "UPDATE beliefs SET confidence=?, inactive=? WHERE id=?",
-                                    (conf_new, int(1 if conf_new < min_thr else (inactive_flag or 0)), int(bid)),
-                                )
-                                self._conn.commit()
-                            try:
-                                self._logger.info(
-                                    f"[Confidence] Decayed belief {bid} from {conf_val:.3f} → {conf_new:.3f}"
-                                )
-                            except Exception:
-                                pass
-                            conf_val = conf_new
-                        except Exception:
-                            pass
                 hits.append(
                     {
                         "id": str(bid),
@@ -716,6 +1032,7 @@ class SQLiteBeliefGraph(BeliefGraphBase):
                         "resolution_state": str(state_val or "active"),
                         "time_start": int(time_start) if time_start is not None else None,
                         "time_end": int(time_end) if time_end is not None else None,
+                        **self._path_fields(meta, int(bid)),
                     }
                 )
             return hits
@@ -747,115 +1064,23 @@ class SQLiteBeliefGraph(BeliefGraphBase):
             except Exception:
                 depth = 1
 
+            # forward: causes→effects, plus incoming results_in; backward: effect_of either way
+            if str(direction or "").strip().lower() == "backward":
+                out_types, in_types = ("effect_of",), ("effect_of",)
+            else:
+                out_types, in_types = _FORWARD_CAUSAL, ("results_in",)
             with self._lock:
-                cur = self._conn.cursor()
-                cur.execute(
-                    """
-                    SELECT id FROM beliefs WHERE subject = ? OR object = ?
-                    """,
-                    (entity.strip(), entity.strip()),
-                )
-                seed_rows = cur.fetchall()
-                frontier = {int(r[0]) for r in seed_rows}
-                visited = set(frontier)
-
-                forward_types = {"cause_of", "enables", "results_in"}
-                backward_types = {"effect_of"}
-
-                for _ in range(depth):
-                    if not frontier:
-                        break
-                    placeholders = ",".join(["?"] * len(frontier))
-                    params = list(frontier)
-                    if str(direction or "").strip().lower() == "backward":
-                        rel_types = ",".join(["?"] * len(backward_types))
-                        cur.execute(
-                            f"SELECT belief_id1, belief_id2, relation_type FROM belief_relations WHERE relation_type IN ({rel_types}) AND (belief_id1 IN ({placeholders}) OR belief_id2 IN ({placeholders}))",
-                            list(backward_types) + params + params,
-                        )
-                    else:
-                        rel_types = ",".join(["?"] * len(forward_types))
-                        cur.execute(
-                            f"SELECT belief_id1, belief_id2, relation_type FROM belief_relations WHERE relation_type IN ({rel_types}) AND (belief_id1 IN ({placeholders}) OR belief_id2 IN ({placeholders}))",
-                            list(forward_types) + params + params,
-                        )
-                    rows = cur.fetchall()
-                    next_frontier = set()
-                    for a, b, rtyp in rows:
-                        a = int(a)
-                        b = int(b)
-                        if str(direction or "").strip().lower() == "backward":
-                            if b in frontier and a not in visited:
-                                next_frontier.add(a)
-                            if a in frontier and b not in visited and (rtyp == "effect_of"):
-                                next_frontier.add(b)
-                        else:
-                            if a in frontier and b not in visited:
-                                next_frontier.add(b)
-                            if b in frontier and a not in visited and (rtyp in {"results_in"}):
-                                next_frontier.add(a)
-                    visited.update(next_frontier)
-                    frontier = next_frontier
-
-                if not visited:
+                meta = self._walk(entity.strip(), depth, out_types, in_types)
+                if not meta:
                     return []
+                rows = self._fetch_walk_rows(meta)
 
-                placeholders = ",".join(["?"] * len(visited))
-                cur.execute(
-                    f"SELECT id, subject, predicate, object, confidence, recency, created_at, sources, reinforcement_count, last_updated, inactive, state, time_start, time_end FROM beliefs WHERE id IN ({placeholders}) ORDER BY confidence DESC, recency DESC LIMIT 50",
-                    list(visited),
-                )
-                rows = cur.fetchall()
-
+            evaluated, updates = self._evaluate_rows(rows, procedures=False)
+            self._persist_read_updates(updates)
             hits: List[Dict[str, Any]] = []
-            for r in rows:
-                bid, subj, pred, obj, conf, rec, created_at, src, rcount, last_upd, inactive_flag, state_val, time_start, time_end = r
-                try:
-                    sources = json.loads(src) if src else []
-                except Exception:
-                    sources = []
+            for r, sources, conf_val, _inactive in evaluated:
+                bid, subj, pred, obj, conf, rec, created_at, _src, rcount, last_upd, _flag, state_val, time_start, time_end = r
                 content = f"{subj} {pred} {obj}"
-                # Phase 25: episode inactivity propagation
-                try:
-                    if str(state_val or "").strip().lower() == "episode":
-                        self._maybe_mark_episode_inactive(int(bid), sources)
-                        with self._lock:
-                            cur3 = self._conn.cursor()
-                            cur3.execute("SELECT inactive FROM beliefs WHERE id=?", (int(bid),))
-                            row_in = cur3.fetchone()
-                            if row_in:
-                                inactive_flag = int(row_in[0] or 0)
-                except Exception:
-                    pass
-                enabled = str(os.getenv("AXIOM_CONFIDENCE_ENABLED", "1")).strip().lower() in {"1", "true", "yes"}
-                conf_val = float(conf)
-                if enabled:
-                    belief_ctx = {
-                        "recency": int(rec),
-                        "last_updated": int(last_upd or rec),
-                        "reinforcement_count": int(rcount or 0),
-                    }
-                    conf_new = float(calculate_confidence(belief_ctx, context={"source_reliability": 0.5}))
-                    if conf_new < conf_val:
-                        try:
-                            min_thr = float(os.getenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2") or 0.2)
-                            with self._lock:
-                                cur2 = self._conn.cursor()
-                                cur2.execute(
-                                    "UPDATE beliefs SET confidence=?, inactive=? WHERE id=?",
-                                    (conf_new, int(1 if conf_new < min_thr else (inactive_flag or 0)), int(bid)),
-                                )
-                                self._conn.commit()
-                            try:
-                                self._logger.info(
-                                    f"[Confidence] Decayed belief {bid} from {conf_val:.3f} → {conf_new:.3f}"
-                                )
-                            except Exception:
-                                pass
-                            conf_val = conf_new
-                        except Exception:
-                            pass
-            
                 hits.append(
                     {
                         "id": str(bid),
@@ -874,6 +1099,7 @@ class SQLiteBeliefGraph(BeliefGraphBase):
                         "resolution_state": str(state_val or "active"),
                         "time_start": int(time_start) if time_start is not None else None,
                         "time_end": int(time_end) if time_end is not None else None,
+                        **self._path_fields(meta, int(bid)),
                     }
                 )
             return hits
@@ -886,6 +1112,7 @@ class SQLiteBeliefGraph(BeliefGraphBase):
             if not belief_id:
                 return False
             with self._lock:
+                self.flush_decay()
                 cur = self._conn.cursor()
                 cur.execute("SELECT confidence FROM beliefs WHERE id=?", (int(belief_id),))
                 row = cur.fetchone()
@@ -911,6 +1138,28 @@ class SQLiteBeliefGraph(BeliefGraphBase):
         except Exception:
             return False
 
+    def beliefs_for_sources(self, memory_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """Belief ids whose sources cite each memory id, resolved in one query."""
+        ids = sorted({str(m) for m in memory_ids if m})
+        if not ids:
+            return {}
+        placeholders = ",".join(["?"] * len(ids))
+        try:
+            rows = self._reader().execute(
+                "SELECT j.value, b.id FROM beliefs b, "
+                "json_each(CASE WHEN json_valid(b.sources) THEN b.sources ELSE '[]' END) j "
+                f"WHERE j.value IN ({placeholders}) ORDER BY b.id",
+                ids,
+            ).fetchall()
+        except Exception:
+            return {}
+        out: Dict[str, List[str]] = {}
+        for mid, bid in rows:
+            keys = out.setdefault(str(mid), [])
+            if str(bid) not in keys:
+                keys.append(str(bid))
+        return out
+
     # Phase 7/24: set belief state (active|superseded|uncertain|archived|retired)
     def set_belief_state(self, belief_id: str, state: str) -> bool:  # type: ignore[override]
         try:
@@ -930,128 +1179,3 @@ class SQLiteBeliefGraph(BeliefGraphBase):
             return True
         except Exception:
             return False
-
-    # ---- Phase 25 helpers ----
-    def _maybe_mark_episode_inactive(self, belief_id: int, sources: List[Any]) -> None:
-        """If all child memories' confidence < threshold, mark episode inactive.
-
-        Safe no-op on any error. Looks up child memories via Memory snapshot when available.
-        """
-        try:
-            if not sources:
-                return
-            try:
-                thr = float(os.getenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2") or 0.2)
-            except Exception:
-                thr = 0.2
-            # Import Memory lazily to avoid hard dependency
-            Memory = None
-            try:
-                from pods.memory.memory_manager import Memory as _Mem  # type: ignore
-                Memory = _Mem
-            except Exception:
-                try:
-                    from memory_manager import Memory as _Mem2  # type: ignore
-                    Memory = _Mem2
-                except Exception:
-                    Memory = None
-            if Memory is None:
-                return
-            mem = Memory()
-            snap = mem.snapshot() if hasattr(mem, "snapshot") else []
-            idset = {str(s) for s in sources if s}
-            if not idset:
-                return
-            child_confs: List[float] = []
-            for m in snap:
-                try:
-                    mid = str(m.get("id"))
-                    if mid not in idset:
-                        continue
-                    child_confs.append(float(m.get("confidence", 0.0) or 0.0))
-                except Exception:
-                    continue
-            if not child_confs:
-                return
-            if all(c < thr for c in child_confs):
-                with self._lock:
-                    cur = self._conn.cursor()
-                    cur.execute("UPDATE beliefs SET inactive=? WHERE id=?", (1, int(belief_id)))
-                    self._conn.commit()
-                try:
-                    self._logger.info(f"[RECALL][Loop25] episode_inactivated id={belief_id} children_below_thr={len(child_confs)}")
-                except Exception:
-                    pass
-        except Exception:
-            return
-
-    # ---- Phase 26 helpers ----
-    def _maybe_update_procedure_confidence(self, belief_id: int, sources: List[Any]) -> None:
-        """Update procedure belief confidence based on supporting evidence average.
-
-        Computes the average confidence of child memory entries referenced by `sources`.
-        If the aggregate is lower than the stored belief confidence, update it and mark
-        inactive when falling below AXIOM_CONFIDENCE_MIN_THRESHOLD.
-        """
-        try:
-            if not sources:
-                return
-            try:
-                thr = float(os.getenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2") or 0.2)
-            except Exception:
-                thr = 0.2
-            # Read current confidence
-            with self._lock:
-                cur = self._conn.cursor()
-                cur.execute("SELECT confidence FROM beliefs WHERE id=?", (int(belief_id),))
-                row = cur.fetchone()
-            if not row:
-                return
-            conf_old = float(row[0] or 0.0)
-
-            # Import Memory lazily
-            Memory = None
-            try:
-                from pods.memory.memory_manager import Memory as _Mem  # type: ignore
-                Memory = _Mem
-            except Exception:
-                try:
-                    from memory_manager import Memory as _Mem2  # type: ignore
-                    Memory = _Mem2
-                except Exception:
-                    Memory = None
-            if Memory is None:
-                return
-            mem = Memory()
-            snap = mem.snapshot() if hasattr(mem, "snapshot") else []
-            idset = {str(s) for s in sources if s}
-            vals: List[float] = []
-            for m in snap:
-                try:
-                    mid = str(m.get("id"))
-                    if mid not in idset:
-                        continue
-                    vals.append(float(m.get("confidence", 0.0) or 0.0))
-                except Exception:
-                    continue
-            if not vals:
-                return
-            conf_new = sum(vals) / float(len(vals))
-            conf_new = max(0.0, min(1.0, conf_new))
-            if conf_new < conf_old or conf_new < thr:
-                with self._lock:
-                    cur2 = self._conn.cursor()
-                    cur2.execute(
-                        "UPDATE beliefs SET confidence=?, inactive=? WHERE id=?",
-                        (conf_new, int(1 if conf_new < thr else 0), int(belief_id)),
-                    )
-                    self._conn.commit()
-                try:
-                    self._logger.info(
-                        f"[RECALL][Loop26] procedure_conf_updated id={belief_id} {conf_old:.3f}→{conf_new:.3f}"
-                    )
-                except Exception:
-                    pass
-        except Exception:
-            return
-
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 # Additive namespace for contracts-related helpers.
 # v2 validator is available under contracts.v2.validator
+# Shared compiled JSON-schema cache is available under contracts.schema_registry
 
 __all__ = [
+    "schema_registry",
     "v2",
 ]
 
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Process-wide JSON-schema registry shared by contracts v2, LLM contracts, the
+governor validator and the cockpit reporter.
+
+Each named schema is read and compiled once (jsonschema ``validator_for``) and
+re-read only when its file mtime changes; the file is stat'ed at most every
+AXIOM_SCHEMA_RELOAD_CHECK_SEC (default 2). Validation outcomes are tallied in
+memory per (schema, outcome) and published as one rollup signal per process
+(``contracts_v2.schema_stats.<host>-<pid>``) on the first outcome, then at most
+every AXIOM_SCHEMA_STATS_FLUSH_SEC (default 60; 0 disables), and once more at
+interpreter exit, instead of one signal file per call. Readers sum the
+per-process rollups.
+
+Outcomes: ok | schema_violation | schema_missing | schema_unreadable |
+jsonschema_unavailable. Only schema_violation is not ok here; callers may treat
+schema_unreadable as a failure (the governor validator does).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from jsonschema.exceptions import best_match  # type: ignore
+    from jsonschema.validators import validator_for  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    best_match = None  # type: ignore
+    validator_for = None  # type: ignore
+
+
+def _process_key() -> str:
+    """Signal-name-safe id of this process, so concurrent processes keep separate rollups."""
+    try:
+        host = socket.gethostname().split(".", 1)[0] or "host"
+    except Exception:
+        host = "host"
+    return f"{host}-{os.getpid()}"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+class _Entry:
+    __slots__ = ("path", "mtime_ns", "validator", "outcome", "checked_at")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.mtime_ns: Optional[int] = None
+        self.validator: Any = None
+        self.outcome = "schema_missing"
+        self.checked_at = float("-inf")
+
+
+class SchemaRegistry:
+    def __init__(self, check_interval: Optional[float] = None, flush_interval: Optional[float] = None) -> None:
+        self.check_interval = (
+            _env_float("AXIOM_SCHEMA_RELOAD_CHECK_SEC", 2.0) if check_interval is None else float(check_interval)
+        )
+        self.flush_interval = (
+            _env_float("AXIOM_SCHEMA_STATS_FLUSH_SEC", 60.0) if flush_interval is None else float(flush_interval)
+        )
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._counts: Dict[Tuple[str, str], int] = {}
+        # None until the first flush, so the first outcome is published right away
+        self._last_flush: Optional[float] = None
+        self._flushing = False
+        self._dirty = False
+        self.loads = 0
+
+    def register(self, name: str, path: Path | str) -> None:
+        """Bind `name` to a schema file; re-registering the same path is a no-op."""
+        p = Path(path)
+        with self._lock:
+            cur = self._entries.get(name)
+            if cur is None or cur.path != p:
+                self._entries[name] = _Entry(p)
+
+    def _refresh(self, entry: _Entry, now: float) -> None:
+        if now - entry.checked_at < self.check_interval:
+            return
+        entry.checked_at = now
+        try:
+            mtime = entry.path.stat().st_mtime_ns
+        except OSError:
+            entry.mtime_ns, entry.validator, entry.outcome = None, None, "schema_missing"
+            return
+        if mtime == entry.mtime_ns:
+            return
+        entry.mtime_ns = mtime
+        try:
+            with open(entry.path, "r", encoding="utf-8") as f:
+                schema = json.load(f)
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            entry.validator, entry.outcome = cls(schema), "ok"
+        except Exception:
+            entry.validator, entry.outcome = None, "schema_unreadable"
+        self.loads += 1
+
+    def validator(self, name: str) -> Any:
+        """Compiled validator for `name`, or None (unknown, missing, unreadable, no jsonschema)."""
+        if validator_for is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            self._refresh(entry, time.monotonic())
+            return entry.validator
+
+    def validate(self, name: str, instance: Any) -> Tuple[bool, str, Optional[str]]:
+        """Returns (ok, outcome, error); only a schema_violation is not ok."""
+        if validator_for is None:
+            return self._done(name, True, "jsonschema_unavailable", None)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                v, outcome = None, "schema_missing"
+            else:
+                self._refresh(entry, time.monotonic())
+                v, outcome = entry.validator, entry.outcome
+        if v is None:
+            return self._done(name, True, outcome, None)
+        try:
+            err = best_match(v.iter_errors(instance))
+        except Exception as e:
+            return self._done(name, False, "schema_violation", f"{e.__class__.__name__}: {e}")
+        if err is None:
+            return self._done(name, True, "ok", None)
+        return self._done(name, False, "schema_violation", f"{err.__class__.__name__}: {err}")
+
+    # ── outcome counters ──────────────────────────────────────────────────
+    def _done(self, name: str, ok: bool, outcome: str, error: Optional[str]) -> Tuple[bool, str, Optional[str]]:
+        self.record(name, outcome)
+        return ok, outcome, error
+
+    def record(self, name: str, outcome: str) -> None:
+        """Count an outcome; also used for non-validation tallies (e.g. version seen)."""
+        key = (name, outcome)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._dirty = True
+            due = (
+                self.flush_interval > 0
+                and not self._flushing
+                and (self._last_flush is None or time.monotonic() - self._last_flush >= self.flush_interval)
+            )
+            if due:
+                self._flushing = True
+        if due:
+            self.flush()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            out: Dict[str, Dict[str, int]] = {}
+            for (name, outcome), n in self._counts.items():
+                out.setdefault(name, {})[outcome] = n
+            return out
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def flush(self) -> None:
+        """Publish this process's cumulative counters as its own cockpit signal (best-effort)."""
+        with self._lock:
+            self._dirty = False
+        try:
+            from pods.cockpit.cockpit_reporter import write_signal  # type: ignore
+
+            write_signal(
+                "contracts_v2",
+                f"schema_stats.{_process_key()}",
+                {"pid": os.getpid(), "process": _process_key(), "counters": self.stats()},
+            )
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._last_flush = time.monotonic()
+                self._flushing = False
+
+
+_REGISTRY: Optional[SchemaRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> SchemaRegistry:
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = SchemaRegistry()
+        return _REGISTRY
+
+
+def _flush_at_exit() -> None:
+    """Publish counters recorded since the last flush (short-lived processes never hit the interval)."""
+    reg = _REGISTRY
+    if reg is not None and reg.flush_interval > 0 and reg._dirty:
+        reg.flush()
+
+
+atexit.register(_flush_at_exit)
+
+
+def register(name: str, path: Path | str) -> None:
+    get_registry().register(name, path)
+
+
+def validate(name: str, instance: Any) -> Tuple[bool, str, Optional[str]]:
+    return get_registry().validate(name, instance)
+
+
+def record(name: str, outcome: str) -> None:
+    get_registry().record(name, outcome)
+
+
+__all__ = ["SchemaRegistry", "get_registry", "record", "register", "validate"]
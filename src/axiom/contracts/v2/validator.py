@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from ..schema_registry import record, register
+from ..schema_registry import validate as validate_schema
+
 
 def _env_truthy(name: str, default: bool = False) -> bool:
     v = os.getenv(name)
@@ -29,18 +31,8 @@ _KIND_TO_SCHEMA = {
 }
 
 
-def _schema_for(kind: str) -> Dict[str, Any] | None:
-    fname = _KIND_TO_SCHEMA.get(kind)
-    if not fname:
-        return None
-    path = _SCHEMA_DIR / fname
-    try:
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except Exception:
-        return None
-    return None
+for _kind, _fname in _KIND_TO_SCHEMA.items():
+    register(f"contracts_v2.{_kind}", _SCHEMA_DIR / _fname)
 
 
 def _emit_violation(kind: str, reason: str, detail: Dict[str, Any] | None = None) -> None:
@@ -57,28 +49,18 @@ def _emit_violation(kind: str, reason: str, detail: Dict[str, Any] | None = None
 
 
 def _emit_version_seen(kind: str, version: str | None) -> None:
+    # Tallied in memory; published with the registry's periodic schema_stats rollup
     try:
-        from pods.cockpit.cockpit_reporter import write_signal  # type: ignore
-
-        write_signal("contracts_v2", "version_seen", {"kind": kind, "version": version or "unknown"})
+        record("contracts_v2.version", version or "unknown")
     except Exception:
         pass
 
 
-def _validate_jsonschema(instance: Dict[str, Any], schema: Dict[str, Any] | None) -> Tuple[bool, List[str], str]:
-    if schema is None:
+def _validate_jsonschema(instance: Dict[str, Any], kind: str) -> Tuple[bool, List[str], str]:
+    ok, outcome, err = validate_schema(f"contracts_v2.{kind}", instance)
+    if outcome == "schema_missing":
         return True, [], "no_schema"
-    try:
-        from jsonschema import validate  # type: ignore
-    except Exception:
-        # Soft-accept but emit violation so Cockpit can track jsonschema absence
-        _emit_violation(str(instance.get("tool_name") or "unknown"), "jsonschema_unavailable")
-        return True, [], "jsonschema_unavailable"
-    try:
-        validate(instance=instance, schema=schema)
-        return True, [], "ok"
-    except Exception as e:
-        return False, [f"{e.__class__.__name__}: {str(e)}"], "schema_violation"
+    return ok, ([err] if err else []), outcome
 
 
 def validate(payload: Dict[str, Any], kind: str) -> Dict[str, Any]:
@@ -91,8 +73,9 @@ def validate(payload: Dict[str, Any], kind: str) -> Dict[str, Any]:
     - If CONTRACTS_V2_ENABLED is true: require payload["schema_version"] == "v2".
       If CONTRACTS_REJECT_UNKNOWN is true and version != "v2" → ok False, error schema_version_invalid.
       Otherwise, emit a Cockpit violation and accept (ok True).
-    - If version is v2, validate against the v2 jsonschema. If jsonschema is missing,
-      soft-accept but emit a Cockpit violation.
+    - If version is v2, validate against the v2 jsonschema (compiled once by the shared
+      schema_registry). If jsonschema or the schema is missing, soft-accept; the outcome
+      is counted in the registry's schema_stats rollup.
     - If CONTRACTS_V2_ENABLED is false: returns ok True (no-op).
     """
     if not CONTRACTS_V2_ENABLED:
@@ -109,8 +92,7 @@ def validate(payload: Dict[str, Any], kind: str) -> Dict[str, Any]:
         return {"ok": True, "errors": [], "version": version}
 
     # version == v2 → jsonschema validation
-    schema = _schema_for(kind)
-    ok, errs, tag = _validate_jsonschema(payload, schema)
+    ok, errs, tag = _validate_jsonschema(payload, kind)
     if not ok:
         _emit_violation(kind, tag, {"errors": errs[:3]})
     return {"ok": bool(ok), "errors": errs, "version": "v2"}
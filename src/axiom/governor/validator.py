@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import Any, Dict, Optional, Tuple
+
+_KINDS = ("journal", "belief", "memory_write", "vector_write")
+_REGISTERED = False
+_REGISTER_LOCK = threading.Lock()
 
 
 def _schema_path(kind: str) -> Path:
@@ -20,13 +25,25 @@ def _schema_path(kind: str) -> Path:
     return base / fname
 
 
-def validate_payload(kind: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
-    """
-    Validate payload against Governor v1 schema.
+def _registry() -> Optional[Any]:
+    """Shared schema registry with the governor schemas registered, or None if unavailable."""
+    global _REGISTERED
+    try:
+        from contracts.schema_registry import get_registry  # type: ignore
+    except Exception:
+        return None
+    reg = get_registry()
+    if not _REGISTERED:
+        with _REGISTER_LOCK:
+            if not _REGISTERED:
+                for kind in _KINDS:
+                    reg.register(f"governor.v1.{kind}", _schema_path(kind))
+                _REGISTERED = True
+    return reg
 
-    Returns (ok, detail). On validator import error or missing schema file,
-    returns (True, "validator_unavailable").
-    """
+
+def _validate_direct(kind: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
+    """Uncached fallback when contracts.schema_registry cannot be imported."""
     try:
         from jsonschema import validate  # type: ignore
     except Exception:
@@ -43,3 +60,31 @@ def validate_payload(kind: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
     except Exception as e:
         return False, f"schema_violation:{e.__class__.__name__}"
 
+
+def validate_payload(kind: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
+    """
+    Validate payload against Governor v1 schema.
+
+    Returns (ok, detail). On validator import error or missing schema file,
+    returns (True, "validator_unavailable") / (True, "schema_missing"). A schema
+    file that exists but cannot be read or compiled fails closed as
+    (False, "schema_violation:schema_unreadable"). Schemas are compiled once by
+    the shared contracts.schema_registry when it is importable.
+    """
+    try:
+        _schema_path(kind)
+    except Exception as e:
+        return False, f"schema_violation:{e.__class__.__name__}"
+    reg = _registry()
+    if reg is None:
+        return _validate_direct(kind, payload)
+    ok, outcome, err = reg.validate(f"governor.v1.{kind}", payload or {})
+    if outcome == "jsonschema_unavailable":
+        return True, "validator_unavailable"
+    if outcome == "schema_missing":
+        return True, "schema_missing"
+    if outcome == "schema_unreadable":
+        return False, "schema_violation:schema_unreadable"
+    if not ok:
+        return False, f"schema_violation:{(err or '').split(':', 1)[0] or 'ValidationError'}"
+    return True, "ok"
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import tempfile
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, Iterator, List, Set, Tuple
 
 
 # ---- Env and Cockpit helpers (fail-closed) ----
@@ -51,58 +52,97 @@ JOURNAL_MANIFEST_PATH = Path(
 )
 
 
-# ---- Journal model integration ----
-def _load_all_memories() -> List[Dict[str, Any]]:
-    """Use Memory().snapshot() as journal source. Fail-closed on errors."""
-    try:
-        from pods.memory.memory_manager import Memory
+# Streaming knobs: ids per delete batch, records between checkpoints, pin filter size
+JOURNAL_COMPACTION_BATCH = max(1, _env_int("JOURNAL_COMPACTION_BATCH", 5000))
+JOURNAL_COMPACTION_CHECKPOINT_EVERY = max(1, _env_int("JOURNAL_COMPACTION_CHECKPOINT_EVERY", 10000))
+JOURNAL_COMPACTION_PIN_BLOOM_BITS = max(1024, _env_int("JOURNAL_COMPACTION_PIN_BLOOM_BITS", 1 << 24))
 
-        m = Memory()
-        m.load()
-        return list(m.snapshot())
-    except Exception:
-        return []
+_CHECKPOINT_NAME = "compaction.checkpoint.json"
 
 
-def _pinned_ids() -> Set[str]:
-    """Collect journal IDs pinned by beliefs/provenance, active goals, or open sagas.
+# ---- Journal model integration (streamed) ----
+def _memory_path() -> str:
+    return os.getenv("MEMORY_FILE", "memory/long_term_memory.json")
 
-    - beliefs: entries may have related_journal_id in memory store
-    - provenance: use known fields such as source_ids on journal entries
-    - goals: Memory().get_goals() returns goal dicts that may reference journal IDs
-    - open sagas: Cockpit signals contain saga steps with info referencing journal IDs
-    """
-    pinned: Set[str] = set()
+
+def _memory_engine() -> Any:
+    """Storage engine behind MEMORY_FILE; records are streamed, never loaded as a whole."""
+    from pods.memory.memory_storage import make_engine
+
+    return make_engine(_memory_path())
+
+
+def _lexical_index() -> Any:
+    """BM25 index mirrored from Memory writes (None unless AXIOM_BM25_INDEX_DIR is set)."""
     try:
-        from pods.memory.memory_manager import Memory
-
-        mem = Memory()
-        mem.load()
-        # Beliefs referencing journals
-        for rec in mem.snapshot():
-            if not isinstance(rec, dict):
-                continue
-            # Any explicit links
-            rjid = rec.get("related_journal_id")
-            if rjid:
-                pinned.add(str(rjid))
-            # Journal entries with source_ids that might reference earlier journal ids
-            for sid in (rec.get("source_ids") or []):
-                try:
-                    if sid:
-                        pinned.add(str(sid))
-                except Exception:
-                    pass
-        # Goals may carry references as metadata
-        for g in mem.get_goals():
-            for key in ("related_journal_id", "journal_id", "source_id"):
-                val = g.get(key)
-                if val:
-                    pinned.add(str(val))
+        from retrieval.bm25_index import get_index
     except Exception:
-        pass
+        return None
+    return get_index()
+
+
+class _PinFilter:
+    """Fixed-size Bloom filter over pinned journal ids.
+
+    Memory stays constant however many pins the corpus holds. A false positive
+    only keeps an entry that could have been archived, never the reverse.
+    """
+
+    def __init__(self, bits: int | None = None, hashes: int = 7, data: bytes | None = None) -> None:
+        self.bits = int(bits or JOURNAL_COMPACTION_PIN_BLOOM_BITS)
+        self.hashes = int(hashes)
+        self.array = bytearray(data) if data is not None else bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, key: Any) -> None:
+        for p in self._positions(str(key)):
+            self.array[p >> 3] |= 1 << (p & 7)
 
-    # Saga signals: scan signal dir for recent saga files and pick IDs
+    def __contains__(self, key: Any) -> bool:
+        return all(self.array[p >> 3] & (1 << (p & 7)) for p in self._positions(str(key)))
+
+    def dump(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(self.array)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, bits: int, hashes: int) -> "_PinFilter":
+        return cls(bits=bits, hashes=hashes, data=path.read_bytes())
+
+
+def _pin_refs(rec: Dict[str, Any]) -> List[str]:
+    """Journal IDs a record pins.
+
+    - beliefs: related_journal_id
+    - provenance: source_ids on journal entries
+    - goals: related_journal_id / journal_id / source_id
+    """
+    refs: List[str] = []
+    rjid = rec.get("related_journal_id")
+    if rjid:
+        refs.append(str(rjid))
+    sids = rec.get("source_ids")
+    if isinstance(sids, (list, tuple)):
+        refs.extend(str(sid) for sid in sids if sid)
+    if rec.get("type") == "goal":
+        for key in ("journal_id", "source_id"):
+            val = rec.get(key)
+            if val:
+                refs.append(str(val))
+    return refs
+
+
+def _add_saga_pins(pins: _PinFilter) -> None:
+    """Open sagas: recent saga step signals may reference journal IDs in info."""
     try:
         signal_dir = Path(os.environ.get("COCKPIT_SIGNAL_DIR", "axiom_boot"))
         if signal_dir.exists():
@@ -113,57 +153,64 @@ def _pinned_ids() -> Set[str]:
                     # Convention: info may include {"id": "<journal_id>"}
                     jid = info.get("id") or info.get("journal_id")
                     if jid:
-                        pinned.add(str(jid))
+                        pins.add(str(jid))
                 except Exception:
                     continue
     except Exception:
         pass
 
-    return pinned
 
+def _cutoff(now: datetime | None = None) -> datetime:
+    return (now or datetime.now(timezone.utc)) - timedelta(days=int(JOURNAL_RETENTION_DAYS))
 
-def _classify_entries(memories: List[Dict[str, Any]], now: datetime) -> Tuple[Set[str], Set[str]]:
-    keep: Set[str] = set()
-    archive: Set[str] = set()
-    cutoff = now - timedelta(days=int(JOURNAL_RETENTION_DAYS))
-    pinned = _pinned_ids()
 
-    for rec in memories:
-        if not isinstance(rec, dict):
-            continue
-        rid = rec.get("id")
-        if not rid:
-            continue
-        # Always keep pinned
-        if str(rid) in pinned:
-            keep.add(str(rid))
-            continue
-        # Keep recent within retention window
-        ts = rec.get("timestamp") or rec.get("created_at") or rec.get("updated_at")
-        try:
-            dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00")) if ts else None
-        except Exception:
-            dt = None
-        if dt and dt >= cutoff:
-            keep.add(str(rid))
-            continue
-        # Else eligible for archive
-        archive.add(str(rid))
+def _archivable(rec: Any, cutoff: datetime) -> bool:
+    """True for entries with an id that are older than the retention window (or undated)."""
+    if not isinstance(rec, dict) or not rec.get("id"):
+        return False
+    ts = rec.get("timestamp") or rec.get("created_at") or rec.get("updated_at")
+    try:
+        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00")) if ts else None
+    except Exception:
+        dt = None
+    if dt is not None and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return not (dt and dt >= cutoff)
 
-    return keep, archive
+
+def _collect_pins(engine: Any) -> Tuple[_PinFilter, int]:
+    pins = _PinFilter()
+    _add_saga_pins(pins)
+    total = 0
+    for rec in engine.iter_records():
+        if isinstance(rec, dict):
+            total += 1 if rec.get("id") else 0
+            for ref in _pin_refs(rec):
+                pins.add(ref)
+    return pins, total
 
 
 def plan_compaction(now: datetime | None = None) -> dict:
-    """Compute compaction plan.
+    """Compute compaction plan with two streamed passes (pins, then classification).
 
     Returns: {keep_ids:set, archive_ids:set, stats:{...}}
     """
-    now = now or datetime.now(timezone.utc)
-    memories = _load_all_memories()
-    keep_ids, archive_ids = _classify_entries(memories, now)
+    cutoff = _cutoff(now)
+    engine = _memory_engine()
+    pins, total = _collect_pins(engine)
+    keep_ids: Set[str] = set()
+    archive_ids: Set[str] = set()
+    for rec in engine.iter_records():
+        if not isinstance(rec, dict) or not rec.get("id"):
+            continue
+        rid = str(rec["id"])
+        if rid in pins or not _archivable(rec, cutoff):
+            keep_ids.add(rid)
+        else:
+            archive_ids.add(rid)
 
     stats = {
-        "total": len([m for m in memories if isinstance(m, dict) and m.get("id")]),
+        "total": total,
         "kept": len(keep_ids),
         "archived": len(archive_ids),
     }
@@ -188,77 +235,213 @@ def _write_atomic(path: Path, data: Any) -> None:
             pass
 
 
-def _rotate_to_archive(memories: List[Dict[str, Any]], archive_ids: Set[str]) -> Tuple[int, int]:
-    """Write archived entries into rotated file under JOURNAL_ARCHIVE_DIR.
+# ---- Checkpointed execution ----
+#
+# Phases, each resumable from the checkpoint in JOURNAL_ARCHIVE_DIR:
+#   scan    one pass over the store: pins go into the Bloom filter, entries past
+#           retention are spooled (full record) to <run>.candidates.jsonl; resumes
+#           after the last checkpointed record id
+#   archive spooled candidates that are not pinned → <run>.jsonl.part, renamed to
+#           journal_archive_<ts>_<run>.jsonl when complete
+#   remove  archived ids are deleted from the store and the BM25 index,
+#           JOURNAL_COMPACTION_BATCH at a time
+def _checkpoint_path() -> Path:
+    return JOURNAL_ARCHIVE_DIR / _CHECKPOINT_NAME
 
-    Returns: (archived_count, bytes_written)
-    """
-    if not archive_ids:
-        return 0, 0
-    recs = [m for m in memories if str(m.get("id")) in archive_ids]
-    if not recs:
-        return 0, 0
-    JOURNAL_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
-    run_id = uuid.uuid4().hex[:12]
-    out_path = JOURNAL_ARCHIVE_DIR / f"journal_archive_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{run_id}.jsonl"
-    # Write to temp and atomically rename
-    tmp_fd, tmp_path = tempfile.mkstemp(dir=str(JOURNAL_ARCHIVE_DIR), prefix=".tmp_archive_")
-    total_bytes = 0
+
+def _run_file(ck: Dict[str, Any], suffix: str) -> Path:
+    return JOURNAL_ARCHIVE_DIR / f".compaction_{ck['run_id']}{suffix}"
+
+
+def _load_checkpoint() -> Dict[str, Any] | None:
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
-            for rec in recs:
-                line = json.dumps(rec, ensure_ascii=False)
-                f.write(line + "\n")
-                total_bytes += len(line) + 1
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp_path, str(out_path))
+        ck = json.loads(_checkpoint_path().read_text())
+        if isinstance(ck, dict) and ck.get("memory_file") == _memory_path():
+            return ck
     except Exception:
-        # Abort on any error; leave journal untouched by returning zero
+        pass
+    return None
+
+
+def _save_checkpoint(ck: Dict[str, Any], pins: _PinFilter | None = None) -> None:
+    if pins is not None:
+        pins.dump(_run_file(ck, ".pins"))
+    _write_atomic(_checkpoint_path(), ck)
+    _cockpit_signal("lifecycle.compaction.progress", {k: ck.get(k) for k in ("run_id", "phase", "scanned", "archived", "removed")})
+
+
+def _discard_run(ck: Dict[str, Any] | None) -> None:
+    for p in ([_run_file(ck, s) for s in (".candidates.jsonl", ".pins", ".jsonl.part")] if ck else []) + [_checkpoint_path()]:
         try:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-        except Exception:
+            p.unlink()
+        except FileNotFoundError:
             pass
-        raise
-    return len(recs), total_bytes
 
 
-def _remove_archived_from_memory(archive_ids: Set[str]) -> int:
-    """Persist Memory file without archived IDs. Atomic write.
-    Returns number removed.
-    """
-    from pods.memory.memory_manager import Memory
-
-    mem = Memory()
-    mem.load()
-    before = len(mem.long_term_memory)
-    mem.long_term_memory = [m for m in mem.long_term_memory if str(m.get("id")) not in archive_ids]
-    after = len(mem.long_term_memory)
-    # Atomic save of MEMORY_FILE
-    try:
-        path = Path(os.getenv("MEMORY_FILE", "memory/long_term_memory.json"))
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp_memory_")
-        try:
-            with os.fdopen(tmp_fd, "w") as f:
-                json.dump(mem.long_term_memory, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp_path, str(path))
-        finally:
-            try:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-            except Exception:
-                pass
-    except Exception:
-        # Fail-closed: abort removal if we couldn't write
-        raise
-    return before - after
+def _new_checkpoint(now: datetime) -> Dict[str, Any]:
+    run_id = uuid.uuid4().hex[:12]
+    return {
+        "run_id": run_id,
+        "memory_file": _memory_path(),
+        "cutoff": _cutoff(now).isoformat(),
+        "started_at": datetime.utcnow().isoformat(),
+        "archive_path": str(JOURNAL_ARCHIVE_DIR / f"journal_archive_{now.strftime('%Y%m%d_%H%M%S')}_{run_id}.jsonl"),
+        "bloom_bits": JOURNAL_COMPACTION_PIN_BLOOM_BITS,
+        "phase": "scan",
+        "scanned": 0,
+        "last_id": None,
+        "total": 0,
+        "candidates": 0,
+        "spool_bytes": 0,
+        "spool_offset": 0,
+        "archived": 0,
+        "archive_bytes": 0,
+        "remove_offset": 0,
+        "removed": 0,
+    }
+
 
+def _restart_scan(ck: Dict[str, Any], pins: _PinFilter) -> None:
+    ck.update(scanned=0, last_id=None, total=0, candidates=0, spool_bytes=0)
+    pins.array[:] = bytes(len(pins.array))
+    _add_saga_pins(pins)
 
-def run_compaction(dry_run: bool = True) -> dict:
+
+def _phase_scan(engine: Any, ck: Dict[str, Any], pins: _PinFilter) -> None:
+    """Spool candidates and collect pins, resuming after the checkpointed `last_id`.
+
+    Checkpoints are taken only on records with an id, so resume does not depend on
+    positions staying put between runs. If `last_id` has since been removed from the
+    store, the scan starts over.
+    """
+    cutoff = datetime.fromisoformat(ck["cutoff"])
+    spool = _run_file(ck, ".candidates.jsonl")
+    if ck.get("last_id") is None and ck["scanned"]:
+        # Position-based checkpoint from an older run: nothing to resume after
+        _restart_scan(ck, pins)
+    since_ck = 0
+    with open(spool, "a+b") as f:
+        while True:
+            resume_after = ck.get("last_id")
+            f.truncate(int(ck["spool_bytes"]))
+            f.seek(0, os.SEEK_END)
+            for rec in engine.iter_records():
+                rid = str(rec.get("id")) if isinstance(rec, dict) and rec.get("id") else None
+                if resume_after is not None:
+                    if rid == resume_after:
+                        resume_after = None
+                    continue
+                if isinstance(rec, dict):
+                    ck["total"] += 1 if rid else 0
+                    for ref in _pin_refs(rec):
+                        pins.add(ref)
+                    if _archivable(rec, cutoff):
+                        f.write(json.dumps(rec, ensure_ascii=False).encode("utf-8") + b"\n")
+                        ck["candidates"] += 1
+                ck["scanned"] += 1
+                since_ck += 1
+                if rid is not None and since_ck >= JOURNAL_COMPACTION_CHECKPOINT_EVERY:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    ck["spool_bytes"] = f.tell()
+                    ck["last_id"] = rid
+                    _save_checkpoint(ck, pins)
+                    since_ck = 0
+            if resume_after is None:
+                break
+            _restart_scan(ck, pins)
+        f.flush()
+        os.fsync(f.fileno())
+        ck["spool_bytes"] = f.tell()
+    ck["phase"] = "archive"
+    _save_checkpoint(ck, pins)
+
+
+def _phase_archive(ck: Dict[str, Any], pins: _PinFilter) -> None:
+    part = _run_file(ck, ".jsonl.part")
+    if not part.exists() and Path(ck["archive_path"]).exists():
+        # Interrupted between the rename and the checkpoint: the archive is complete.
+        ck["phase"] = "remove"
+        _save_checkpoint(ck)
+        return
+    with open(_run_file(ck, ".candidates.jsonl"), "rb") as src, open(part, "a+b") as out:
+        out.truncate(int(ck["archive_bytes"]))
+        out.seek(0, os.SEEK_END)
+        src.seek(int(ck["spool_offset"]))
+        n = 0
+        for line in iter(src.readline, b""):
+            rid = str(json.loads(line).get("id"))
+            if rid not in pins:
+                out.write(line)
+                ck["archived"] += 1
+            n += 1
+            if n % JOURNAL_COMPACTION_CHECKPOINT_EVERY == 0:
+                out.flush()
+                os.fsync(out.fileno())
+                ck["spool_offset"], ck["archive_bytes"] = src.tell(), out.tell()
+                _save_checkpoint(ck)
+        out.flush()
+        os.fsync(out.fileno())
+        ck["archive_bytes"] = out.tell()
+    if ck["archived"]:
+        os.replace(part, ck["archive_path"])
+    else:
+        part.unlink()
+    ck["phase"] = "remove"
+    _save_checkpoint(ck)
+
+
+def _archived_id_batches(path: str, offset: int) -> Iterator[Tuple[List[str], int]]:
+    """(ids, offset after them) batches of archived ids, starting at `offset`."""
+    with open(path, "rb") as src:
+        src.seek(offset)
+        batch: List[str] = []
+        while True:
+            line = src.readline()
+            if line:
+                batch.append(str(json.loads(line).get("id")))
+            if batch and (len(batch) >= JOURNAL_COMPACTION_BATCH or not line):
+                yield batch, src.tell()
+                batch = []
+            if not line:
+                break
+
+
+def _phase_remove(engine: Any, ck: Dict[str, Any]) -> None:
+    """Delete archived ids from the store and from the BM25 index.
+
+    Engines that rewrite the whole store per `delete_ids` call (the JSON file)
+    get every archived id in one streamed rewrite; the WAL engine is fed batch
+    by batch so progress is checkpointed as it goes.
+    """
+    if ck["archived"]:
+        lexical = _lexical_index()
+        batches = _archived_id_batches(ck["archive_path"], int(ck["remove_offset"]))
+        if getattr(engine, "rewrites_on_delete", False):
+            drop: Set[str] = set()
+            end = int(ck["remove_offset"])
+            for batch, end in batches:
+                drop.update(batch)
+            if drop:
+                ck["removed"] += len(engine.delete_ids(drop) or ())
+                if lexical is not None:
+                    lexical.apply(deletes=sorted(drop))
+            ck["remove_offset"] = end
+            _save_checkpoint(ck)
+        else:
+            for batch, end in batches:
+                ck["removed"] += len(engine.delete_ids(batch) or ())
+                if lexical is not None:
+                    # Whole batch: ids already gone from the store must not linger in the index
+                    lexical.apply(deletes=batch)
+                ck["remove_offset"] = end
+                _save_checkpoint(ck)
+        if lexical is not None:
+            lexical.flush()
+    ck["phase"] = "done"
+
+
+def run_compaction(dry_run: bool = True, resume: bool = True) -> dict:
     if not JOURNAL_COMPACTION_ENABLED:
         reason = "disabled"
         _cockpit_signal("lifecycle.compaction.skipped", {"reason": reason})
@@ -267,14 +450,11 @@ def run_compaction(dry_run: bool = True) -> dict:
     # Honor global dry-run default if caller did not override
     dry_run = bool(dry_run) if dry_run is not None else JOURNAL_COMPACTION_DRY_RUN
 
-    plan = plan_compaction()
-    keep_ids: Set[str] = set(plan["keep_ids"]) if isinstance(plan.get("keep_ids"), set) else set(plan.get("keep_ids") or [])
-    archive_ids: Set[str] = set(plan["archive_ids"]) if isinstance(plan.get("archive_ids"), set) else set(plan.get("archive_ids") or [])
-
     if dry_run or _env_flag("JOURNAL_COMPACTION_DRY_RUN", JOURNAL_COMPACTION_DRY_RUN):
+        stats = plan_compaction()["stats"]
         summary = {
-            "kept": len(keep_ids),
-            "archived": len(archive_ids),
+            "kept": stats["kept"],
+            "archived": stats["archived"],
             "bytes_saved": 0,
             "run_id": uuid.uuid4().hex[:12],
             "ts": datetime.utcnow().isoformat(),
@@ -283,41 +463,55 @@ def run_compaction(dry_run: bool = True) -> dict:
         _cockpit_signal("lifecycle.compaction.completed", summary)
         return summary
 
-    # Execute compaction: write archive, then remove from memory atomically
+    # Execute compaction: stream → archive → batched removal, resuming a prior run if one was interrupted
     try:
-        memories = _load_all_memories()
-        archived_count, bytes_written = _rotate_to_archive(memories, archive_ids)
-        if archived_count != len(archive_ids):
-            # Sanity check: if mismatch, abort removal to keep journal intact
-            raise RuntimeError("archived_count_mismatch")
-        removed = _remove_archived_from_memory(archive_ids)
-        if removed != archived_count:
-            # Extremely defensive: mismatch indicates partial failure; abort
-            raise RuntimeError("removed_count_mismatch")
+        JOURNAL_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        ck = _load_checkpoint() if resume else None
+        if ck is None:
+            _discard_run(_load_checkpoint())
+            ck = _new_checkpoint(datetime.now(timezone.utc))
+        resumed = ck["phase"] != "scan" or ck["scanned"] > 0
+        pins_path = _run_file(ck, ".pins")
+        if pins_path.exists():
+            pins = _PinFilter.load(pins_path, ck["bloom_bits"], 7)
+        else:
+            pins = _PinFilter(bits=ck["bloom_bits"])
+            _add_saga_pins(pins)
+        engine = _memory_engine()
+        if ck["phase"] == "scan":
+            _phase_scan(engine, ck, pins)
+        if ck["phase"] == "archive":
+            _phase_archive(ck, pins)
+        if ck["phase"] == "remove":
+            _phase_remove(engine, ck)
         manifest = {
-            "kept": len(keep_ids),
-            "archived": int(archived_count),
-            "bytes_saved": int(bytes_written),
-            "run_id": uuid.uuid4().hex[:12],
+            "kept": int(ck["total"]) - int(ck["archived"]),
+            "archived": int(ck["archived"]),
+            "removed": int(ck["removed"]),
+            "bytes_saved": int(ck["archive_bytes"]),
+            "run_id": ck["run_id"],
+            "resumed": resumed,
             "ts": datetime.utcnow().isoformat(),
         }
+        if ck["archived"]:
+            manifest["archive_path"] = ck["archive_path"]
         # Best-effort manifest write
         try:
             _write_atomic(JOURNAL_MANIFEST_PATH, manifest)
         except Exception:
             pass
+        _discard_run(ck)
         _cockpit_signal("lifecycle.compaction.completed", manifest)
         return manifest
     except Exception as e:
         _cockpit_signal("lifecycle.compaction.skipped", {"reason": str(e)})
-        # Fail-closed: leave journal untouched
-        return {"skipped": True, "reason": str(e)}
+        # Fail-closed: the checkpoint is kept, so the next run resumes where this one stopped
+        return {"skipped": True, "reason": str(e), "resumable": _checkpoint_path().exists()}
 
 
 if __name__ == "__main__":
     import sys
 
     dry = "--execute" not in sys.argv
-    res = run_compaction(dry_run=dry)
+    res = run_compaction(dry_run=dry, resume="--fresh" not in sys.argv)
     print(json.dumps(res, indent=2))
-
@@ -2,12 +2,19 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import json
 import os
+import shutil
+import sys
 import tarfile
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 def _env_flag(name: str, default: bool) -> bool:
@@ -82,7 +89,328 @@ def _collection_names(client) -> list[str]:
             return ["axiom_memories"]
 
 
-def take_snapshot(output_dir: str) -> dict:
+# ---- Packed format (axsnap/1) ----
+#
+# <collection>.<stamp>.axsnap/
+#     manifest.json           format, kind (full|incremental), parent, since/watermark, chunks[]
+#     chunk-000001.f32        packed little-endian float32 rows, one per point with a plain vector
+#     chunk-000001.ndjson.gz  {"id", "payload"} per point in the same order; points whose vector
+#                             is not a flat float list (named/sparse) carry it inline as "vector"
+#     ids.json.gz             every point id in the collection when the snapshot was taken
+#     tombstones.json.gz      incremental only: ids present in the parent but gone now
+#
+# Chunks are encoded, compressed and written by a worker pool while the next scroll page is
+# fetched. Each chunk records its point count and sha256 digests, verified before restore.
+# Restore applies each snapshot's chunks, then deletes its tombstones.
+#
+# An incremental is only taken on top of a parent chain shorter than
+# QDRANT_SNAPSHOT_MAX_CHAIN and shorter than the retention count; otherwise a full snapshot
+# starts a new chain so prune_snapshots(keep=N) can actually release old chains.
+QDRANT_SNAPSHOT_FORMAT = _env_str("QDRANT_SNAPSHOT_FORMAT", "jsonl")
+QDRANT_SNAPSHOT_WORKERS = max(1, _env_int("QDRANT_SNAPSHOT_WORKERS", 4))
+QDRANT_SNAPSHOT_CHUNK_POINTS = max(1, _env_int("QDRANT_SNAPSHOT_CHUNK_POINTS", 5000))
+QDRANT_SNAPSHOT_VERSION_FIELD = _env_str("QDRANT_SNAPSHOT_VERSION_FIELD", "updated_at")
+QDRANT_RESTORE_WORKERS = max(1, _env_int("QDRANT_RESTORE_WORKERS", 4))
+QDRANT_RESTORE_BATCH = max(1, _env_int("QDRANT_RESTORE_BATCH", 256))
+QDRANT_SNAPSHOT_MAX_CHAIN = max(1, _env_int("QDRANT_SNAPSHOT_MAX_CHAIN", 6))
+
+_PACKED_FORMAT = "axsnap/1"
+_PACKED_SUFFIX = ".axsnap"
+
+
+def _version_of(payload: Dict[str, Any]) -> Optional[float]:
+    """Point version as epoch seconds from the version field (ISO string or number)."""
+    val = (payload or {}).get(QDRANT_SNAPSHOT_VERSION_FIELD)
+    if val in (None, ""):
+        return None
+    try:
+        if isinstance(val, (int, float)):
+            return float(val) / (1000.0 if val > 1e12 else 1.0)
+        dt = datetime.fromisoformat(str(val).replace("Z", "+00:00"))
+        return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+    except Exception:
+        return None
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _write_chunk(snap_dir: Path, seq: int, points: List[Any]) -> Dict[str, Any]:
+    """Encode one chunk: float32 rows + gzip NDJSON payloads. Runs on a worker thread."""
+    name = f"chunk-{seq:06d}"
+    rows = array("f")
+    dim = 0
+    vec_path = snap_dir / f"{name}.f32"
+    pay_path = snap_dir / f"{name}.ndjson.gz"
+    with gzip.open(pay_path, "wt", encoding="utf-8", compresslevel=6) as out:
+        for p in points:
+            rec: Dict[str, Any] = {"id": getattr(p, "id", None), "payload": getattr(p, "payload", {}) or {}}
+            vec = getattr(p, "vector", None)
+            packed = None
+            if isinstance(vec, list) and vec and (not dim or len(vec) == dim):
+                try:
+                    packed = array("f", vec)
+                except TypeError:
+                    packed = None
+            if packed is not None:
+                dim = dim or len(packed)
+                rows.extend(packed)
+            elif vec is not None:
+                rec["vector"] = vec
+            out.write(json.dumps(rec, separators=(",", ":")) + "\n")
+    if sys.byteorder != "little":  # pragma: no cover
+        rows.byteswap()
+    with open(vec_path, "wb") as f:
+        f.write(rows.tobytes())
+    return {
+        "name": name,
+        "count": len(points),
+        "dim": dim,
+        "rows": len(rows) // dim if dim else 0,
+        "vectors": vec_path.name,
+        "payloads": pay_path.name,
+        "sha256_vectors": _sha256(vec_path),
+        "sha256_payloads": _sha256(pay_path),
+    }
+
+
+def _write_ids(path: Path, ids: List[Any]) -> str:
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+        json.dump(ids, f, separators=(",", ":"))
+    return _sha256(path)
+
+
+def _read_ids(snap_dir: Path, manifest: Dict[str, Any], key: str) -> List[Any]:
+    """Load an id list named by manifest[key], verifying its digest."""
+    entry = manifest.get(key)
+    if not entry:
+        return []
+    path = snap_dir / entry["file"]
+    if _sha256(path) != entry["sha256"]:
+        raise RuntimeError(f"checksum_mismatch:{snap_dir.name}/{entry['file']}")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _id_key(pid: Any) -> str:
+    # Point ids are ints or UUID strings; keep 1 and "1" distinct
+    return json.dumps(pid)
+
+
+def _read_manifest(snap_dir: Path) -> Dict[str, Any]:
+    m = json.loads((snap_dir / "manifest.json").read_text())
+    if m.get("format") != _PACKED_FORMAT:
+        raise RuntimeError(f"unsupported_snapshot_format:{m.get('format')}")
+    return m
+
+
+def _latest_packed(out_dir: Path, collection: str) -> Optional[Path]:
+    found = []
+    for d in out_dir.glob(f"{collection}.*{_PACKED_SUFFIX}"):
+        try:
+            found.append((_read_manifest(d).get("created_at") or "", d))
+        except Exception:
+            continue
+    return max(found)[1] if found else None
+
+
+def _incremental_parent(out_dir: Path, name: str, keep: int) -> Optional[Path]:
+    """Latest packed snapshot to build a delta on, or None when a full snapshot is due."""
+    parent = _latest_packed(out_dir, name)
+    if parent is None:
+        return None
+    try:
+        chain = _snapshot_chain(parent)
+        manifest = _read_manifest(parent)
+    except Exception:
+        return None
+    # Deltas since the last full one, including the one about to be taken
+    deltas = len(chain)
+    if deltas > QDRANT_SNAPSHOT_MAX_CHAIN or deltas >= max(1, int(keep)):
+        return None
+    # Snapshots without an id list cannot be diffed for deletions
+    if not manifest.get("ids"):
+        return None
+    return parent
+
+
+def _take_packed(
+    client: Any, name: str, out_dir: Path, stamp: str, incremental: bool, workers: int, keep: int = QDRANT_SNAPSHOT_KEEP
+) -> Path:
+    parent = _incremental_parent(out_dir, name, keep) if incremental else None
+    since = _read_manifest(parent).get("watermark") if parent is not None else None
+    snap_dir = out_dir / f"{name}.{stamp}{_PACKED_SUFFIX}"
+    n = 1
+    while snap_dir.exists():
+        snap_dir = out_dir / f"{name}.{stamp}_{n}{_PACKED_SUFFIX}"
+        n += 1
+    tmp_dir = out_dir / f".{snap_dir.name}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    watermark = since
+    live_ids: List[Any] = []
+    futures = []
+    # Bound in-flight chunks so a slow disk cannot buffer the whole collection
+    slots = threading.BoundedSemaphore(workers * 2)
+
+    def _submit(pool: ThreadPoolExecutor, seq: int, pts: List[Any]) -> None:
+        slots.acquire()
+        fut = pool.submit(_write_chunk, tmp_dir, seq, pts)
+        fut.add_done_callback(lambda _f: slots.release())
+        futures.append(fut)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot") as pool:
+            pending: List[Any] = []
+            offset = None
+            while True:
+                try:
+                    points, offset = client.scroll(
+                        collection_name=name,
+                        offset=offset,
+                        limit=1000,
+                        with_payload=True,
+                        with_vectors=True,
+                    )
+                except Exception as e:
+                    raise RuntimeError(f"scroll_failed:{e}")
+                for p in points or []:
+                    live_ids.append(getattr(p, "id", None))
+                    ver = _version_of(getattr(p, "payload", {}) or {})
+                    if ver is not None:
+                        watermark = ver if watermark is None else max(watermark, ver)
+                    # Delta: keep changed points and points without a version (conservative)
+                    if since is not None and ver is not None and ver <= since:
+                        continue
+                    pending.append(p)
+                    if len(pending) >= QDRANT_SNAPSHOT_CHUNK_POINTS:
+                        _submit(pool, len(futures) + 1, pending)
+                        pending = []
+                if not points or offset is None:
+                    break
+            if pending:
+                _submit(pool, len(futures) + 1, pending)
+            chunks = [f.result() for f in futures]
+        ids_entry = {"file": "ids.json.gz", "count": len(live_ids)}
+        ids_entry["sha256"] = _write_ids(tmp_dir / ids_entry["file"], live_ids)
+        tombstones_entry = None
+        if parent is not None:
+            live = {_id_key(i) for i in live_ids}
+            gone = [i for i in _read_ids(parent, _read_manifest(parent), "ids") if _id_key(i) not in live]
+            tombstones_entry = {"file": "tombstones.json.gz", "count": len(gone)}
+            tombstones_entry["sha256"] = _write_ids(tmp_dir / tombstones_entry["file"], gone)
+        manifest = {
+            "format": _PACKED_FORMAT,
+            "collection": name,
+            "kind": "incremental" if parent is not None else "full",
+            "parent": parent.name if parent is not None else None,
+            "version_field": QDRANT_SNAPSHOT_VERSION_FIELD,
+            "since": since,
+            "watermark": watermark,
+            "count": sum(c["count"] for c in chunks),
+            "ids": ids_entry,
+            "tombstones": tombstones_entry,
+            "deleted": tombstones_entry["count"] if tombstones_entry else 0,
+            "dtype": "float32",
+            "created_at": datetime.utcnow().isoformat(),
+            "chunks": chunks,
+        }
+        (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_dir, snap_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return snap_dir
+
+
+def _snapshot_chain(snap_dir: Path) -> List[Path]:
+    """Full snapshot first, then each incremental up to `snap_dir`."""
+    chain = [snap_dir]
+    parent = _read_manifest(snap_dir).get("parent")
+    while parent:
+        prev = snap_dir.parent / parent
+        if not prev.exists() or prev in chain:
+            raise RuntimeError(f"snapshot_parent_missing:{parent}")
+        chain.append(prev)
+        parent = _read_manifest(prev).get("parent")
+    return list(reversed(chain))
+
+
+def _restore_chunk(client: Any, collection: str, snap_dir: Path, chunk: Dict[str, Any]) -> int:
+    """Verify a chunk's digests, then upsert it in QDRANT_RESTORE_BATCH batches."""
+    vec_path = snap_dir / chunk["vectors"]
+    pay_path = snap_dir / chunk["payloads"]
+    if _sha256(vec_path) != chunk["sha256_vectors"] or _sha256(pay_path) != chunk["sha256_payloads"]:
+        raise RuntimeError(f"checksum_mismatch:{snap_dir.name}/{chunk['name']}")
+    rows = array("f")
+    rows.frombytes(vec_path.read_bytes())
+    if sys.byteorder != "little":  # pragma: no cover
+        rows.byteswap()
+    dim = int(chunk.get("dim") or 0)
+    row = 0
+    restored = 0
+    batch: List[Dict[str, Any]] = []
+    with gzip.open(pay_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            rec = json.loads(line)
+            vector = rec.get("vector")
+            if vector is None and dim:
+                vector = rows[row * dim : (row + 1) * dim].tolist()
+                row += 1
+            batch.append({"id": rec.get("id"), "payload": rec.get("payload") or {}, "vector": vector})
+            if len(batch) >= QDRANT_RESTORE_BATCH:
+                client.upsert(collection_name=collection, points=batch)
+                restored += len(batch)
+                batch = []
+    if batch:
+        client.upsert(collection_name=collection, points=batch)
+        restored += len(batch)
+    if restored != int(chunk["count"]) or row != int(chunk.get("rows") or 0):
+        raise RuntimeError(f"count_mismatch:{snap_dir.name}/{chunk['name']}")
+    return restored
+
+
+def _restore_packed(client: Any, snap_dir: Path, collection: str, workers: int) -> Dict[str, Any]:
+    chain = _snapshot_chain(snap_dir)
+    restored = 0
+    chunks = 0
+    deleted = 0
+    # Snapshots apply in order (later deltas win); chunks within one snapshot upsert concurrently.
+    # A delta's tombstones are deleted after its chunks land.
+    for d in chain:
+        manifest = _read_manifest(d)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restore") as pool:
+            futs = [pool.submit(_restore_chunk, client, collection, d, c) for c in manifest.get("chunks") or []]
+            for fut in futs:
+                restored += fut.result()
+                chunks += 1
+        gone = _read_ids(d, manifest, "tombstones")
+        for i in range(0, len(gone), QDRANT_RESTORE_BATCH):
+            batch = gone[i : i + QDRANT_RESTORE_BATCH]
+            client.delete(collection_name=collection, points_selector=batch)
+            deleted += len(batch)
+    return {"points": restored, "deleted": deleted, "chunks_verified": chunks, "chain": [d.name for d in chain]}
+
+
+def take_snapshot(
+    output_dir: str,
+    fmt: str | None = None,
+    incremental: bool = False,
+    workers: int | None = None,
+    keep: int | None = None,
+) -> dict:
+    """Snapshot every memory collection into `output_dir`.
+
+    fmt: "jsonl" (native snapshot or tarred JSONL, default) or "packed" (axsnap/1).
+    incremental: packed only; store points changed since the latest packed snapshot,
+    plus tombstones for deleted ids. Falls back to a full snapshot once the chain
+    reaches QDRANT_SNAPSHOT_MAX_CHAIN or `keep` (default QDRANT_SNAPSHOT_KEEP).
+    """
     if not QDRANT_SNAPSHOT_ENABLED:
         reason = "disabled"
         _cockpit_signal("lifecycle.snapshot.failed", {"reason": reason})
@@ -94,8 +422,31 @@ def take_snapshot(output_dir: str) -> dict:
     taken = []
     total_size = 0
     stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    fmt = (fmt or QDRANT_SNAPSHOT_FORMAT or "jsonl").strip().lower()
     for name in ns:
         try:
+            if fmt == "packed":
+                snap_dir = _take_packed(
+                    client,
+                    name,
+                    out_dir,
+                    stamp,
+                    incremental,
+                    workers or QDRANT_SNAPSHOT_WORKERS,
+                    QDRANT_SNAPSHOT_KEEP if keep is None else keep,
+                )
+                manifest = _read_manifest(snap_dir)
+                size_bytes = sum(p.stat().st_size for p in snap_dir.iterdir())
+                taken.append({
+                    "collection": name,
+                    "path": str(snap_dir),
+                    "size_bytes": size_bytes,
+                    "kind": manifest["kind"],
+                    "points": manifest["count"],
+                    "deleted": manifest.get("deleted", 0),
+                })
+                total_size += size_bytes
+                continue
             # Prefer native snapshot API when available
             api = getattr(client, "_client", None)
             tar_path: Optional[Path] = None
@@ -181,12 +532,30 @@ def prune_snapshots(dir: str, keep: int) -> dict:
             deleted += 1
         except Exception:
             pass
-    rec = {"deleted": int(deleted), "kept": int(len(items) - deleted)}
+    kept = len(items) - deleted
+    # Packed snapshots: keep the newest per collection, plus every parent a kept delta needs
+    packed = sorted([p for p in base.iterdir() if p.is_dir() and p.suffix == _PACKED_SUFFIX], key=lambda p: p.stat().st_mtime)
+    by_collection: Dict[str, List[Path]] = {}
+    for p in packed:
+        by_collection.setdefault(p.name.split(".")[0], []).append(p)
+    for dirs in by_collection.values():
+        needed = set()
+        for d in dirs[-int(keep):] if int(keep) > 0 else []:
+            try:
+                needed.update(_snapshot_chain(d))
+            except Exception:
+                needed.add(d)
+        for d in dirs:
+            if d not in needed:
+                shutil.rmtree(d, ignore_errors=True)
+                deleted += 1
+        kept += len(needed)
+    rec = {"deleted": int(deleted), "kept": int(kept)}
     _cockpit_signal("lifecycle.snapshot.pruned", rec)
     return rec
 
 
-def restore_snapshot(path: str, ns_alias: str | None = None) -> dict:
+def restore_snapshot(path: str, ns_alias: str | None = None, workers: int | None = None) -> dict:
     client = _make_client()
     # Safety: do not auto-restore in prod; require explicit operator step
     if _env_flag("PROD_ENV", False):
@@ -202,6 +571,13 @@ def restore_snapshot(path: str, ns_alias: str | None = None) -> dict:
         collection = ns_alias or stem
     except Exception:
         collection = ns_alias or None
+    if snap_path.is_dir() and (snap_path / "manifest.json").exists():
+        try:
+            res = _restore_packed(client, snap_path, collection, workers or QDRANT_RESTORE_WORKERS)
+        except Exception as e:
+            _cockpit_signal("lifecycle.snapshot.failed", {"reason": str(e)})
+            raise
+        return {"restored_to": collection, "path": str(snap_path), **res}
     # If tar.gz, extract JSONL if present
     tmp_dir = snap_path.parent / f"restore_{snap_path.stem}"
     tmp_dir.mkdir(parents=True, exist_ok=True)
@@ -255,16 +631,21 @@ if __name__ == "__main__":
     parser.add_argument("--output", default=str(QDRANT_SNAPSHOT_DIR))
     parser.add_argument("--keep", type=int, default=QDRANT_SNAPSHOT_KEEP)
     parser.add_argument("--alias", default=None)
+    parser.add_argument("--format", default=None, choices=["jsonl", "packed"])
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
     args = parser.parse_args()
 
     if args.take:
-        res = take_snapshot(args.output)
+        res = take_snapshot(
+            args.output, fmt=args.format, incremental=args.incremental, workers=args.workers, keep=args.keep
+        )
         print(json.dumps(res, indent=2))
     elif args.drill:
         res = drill_snapshot_cycle(args.output, args.keep, ns_alias=args.alias)
         print(json.dumps(res, indent=2))
     elif args.restore:
-        res = restore_snapshot(args.restore, ns_alias=args.alias)
+        res = restore_snapshot(args.restore, ns_alias=args.alias, workers=args.workers)
         print(json.dumps(res, indent=2))
     else:
         parser.print_help()
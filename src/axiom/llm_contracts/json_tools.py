@@ -33,37 +33,25 @@ def _cockpit_signal(signal_name: str, payload: dict) -> None:
         pass
 
 
-def _load_schema(tool_name: str) -> dict | None:
-    try:
-        here = Path(__file__).parent
-        schema_path = here / "schemas" / "v1" / f"{tool_name}.json"
-        if not schema_path.exists():
-            return None
-        import json as _json
-
-        with open(schema_path, "r", encoding="utf-8") as f:
-            return _json.load(f)
-    except Exception:
-        return None
+_SCHEMA_DIR = Path(__file__).parent / "schemas" / "v1"
 
 
-def _validate(instance: dict, schema: dict | None) -> tuple[bool, str | None]:
-    if schema is None:
-        return True, None
+def _validate(tool_name: str, instance: dict) -> tuple[bool, str | None]:
+    """Validate against schemas/v1/<tool_name>.json via the shared schema registry.
+
+    Missing schema or jsonschema → accept; the outcome is counted in the registry
+    rather than emitted as a signal per call.
+    """
     try:
-        try:
-            from jsonschema import validate  # type: ignore
-        except Exception:
-            # jsonschema missing → accept but emit violation (fail‑closed)
-            _cockpit_signal(
-                "prompt_contracts.violation.schema",
-                {"reason": "jsonschema_unavailable", "tool": instance.get("tool_name")},
-            )
-            return True, None
-        validate(instance=instance, schema=schema)  # may raise
+        from contracts.schema_registry import get_registry  # type: ignore
+
+        reg = get_registry()
+        name = f"llm_contracts.v1.{tool_name}"
+        reg.register(name, _SCHEMA_DIR / f"{tool_name}.json")
+        ok, _outcome, err = reg.validate(name, instance)
+        return ok, err
+    except Exception:
         return True, None
-    except Exception as e:  # ValidationError or other
-        return False, f"{e.__class__.__name__}: {str(e)}"
 
 
 def _normalize_fields(tool_name: str, payload: dict) -> dict:
@@ -126,8 +114,8 @@ def call(tool_name: str, raw_text: str) -> Dict[str, Any]:
     if still invalid, raise ContractViolation("invalid_json").
 
     Validate against schemas/v1/<tool_name>.json (jsonschema if available). If
-    schema absent or jsonschema unavailable → accept but emit
-    governor/prompt_contracts violation. Normalize fields and attach metadata.
+    schema absent or jsonschema unavailable → accept (counted in the shared
+    schema registry). Normalize fields and attach metadata.
     """
     # Unknown tool detection (emit signal but continue)
     stateful_tools = os.getenv("STATEFUL_TOOLS") or ""
@@ -156,8 +144,7 @@ def call(tool_name: str, raw_text: str) -> Dict[str, Any]:
             raise ContractViolation("invalid_json", detail="no_json_found")
 
     # Validate (best‑effort)
-    schema = _load_schema(tool_name)
-    ok, detail = _validate(payload, schema)
+    ok, detail = _validate(tool_name, payload)
     if not ok:
         _cockpit_signal(
             "prompt_contracts.violation.schema",
@@ -184,6 +184,7 @@ class BeliefReflectionSession:
             memories_url = urljoin(MEMORY_POD_URL, "/memories")
 
             page = 0
+            cursor = None
             while total_fetched < self.limit:
                 remaining = self.limit - total_fetched
                 current_page_size = min(page_size, remaining)
@@ -193,6 +194,9 @@ class BeliefReflectionSession:
                     "limit": current_page_size,
                     "include_content": "true",
                 }
+                if cursor:
+                    # Cursor pages are stable under concurrent inserts; page numbers are not
+                    params = {"cursor": cursor, "limit": current_page_size, "include_content": "true"}
 
                 resp = self.session.get(memories_url, params=params)
                 if resp.status_code != 200:
@@ -213,6 +217,10 @@ class BeliefReflectionSession:
 
                 logger.debug(f"Fetched page {page}: {len(page_memories)} memories")
                 page += 1
+                if "next_cursor" in data:
+                    cursor = data.get("next_cursor")
+                    if not cursor:
+                        break
 
                 # Avoid infinite loops
                 if page > 100:
@@ -428,12 +428,20 @@ class _RemoteEmbedderCompat:
         if not batch:
             return [] if not single else []
         payload = {"texts": batch, "model": self._model}
-        r = requests.post(f"{self._base}/embed", json=payload, timeout=self._timeout)
+        try:
+            from vector import embed_wire as _wire  # type: ignore
+        except Exception:
+            _wire = None  # type: ignore
+        headers = {"Accept": _wire.accept_header(_wire.client_dtype())} if _wire else None
+        r = requests.post(f"{self._base}/embed", json=payload, timeout=self._timeout, headers=headers)
         r.raise_for_status()
-        data = r.json() or {}
-        vecs = data.get("vectors") or []
-        if not isinstance(vecs, list) or len(vecs) != len(batch):
+        # Binary wire decodes into a (rows, dims) matrix, like SentenceTransformer.encode; copied
+        # below so callers never see the read-only view over the response body
+        vecs = _wire.vectors_from_response(r) if _wire else (r.json() or {}).get("vectors")
+        if vecs is None or isinstance(vecs, (str, dict)) or len(vecs) != len(batch):
             raise RuntimeError("embeddings_invalid_response")
+        if _wire:
+            vecs = _wire.owned_vectors(vecs)
         return vecs[0] if single else vecs
 
 
@@ -15,6 +15,11 @@ try:
 except Exception:
     _YAML_OK = False
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 try:
     from memory.belief_engine import ENGINE_ENABLED as _BELIEF_ENGINE_ENABLED
     from memory.belief_engine import ActiveBeliefs as _ActiveBeliefs
@@ -255,35 +260,68 @@ def load_weights(
         return weights
 
 
-def composite_score(
-    m: Any,
-    qv: Sequence[float],
-    selected: Optional[List[Any]] = None,
-    w: Optional[Dict[str, float]] = None,
-    now_fn=utc_now,
-) -> Tuple[float, Dict[str, float]]:
-    """Compute composite score and return (score, components)."""
-    weights = w or DEFAULT_WEIGHTS
-    mv = _as_vector(m)
-    if mv is None:
-        return 0.0, {
-            "sim": 0.0,
-            "rec": 0.0,
-            "cred": 0.0,
-            "conf": 0.0,
-            "bel": 0.0,
-            "use": 0.0,
-            "nov": 0.0,
-        }
+_ZERO_COMPONENTS = ("sim", "rec", "cred", "conf", "bel", "use", "nov")
+
+
+def _field(m: Any, name: str, default: Any = None) -> Any:
+    return m.get(name, default) if isinstance(m, dict) else getattr(m, name, default)
+
+
+def _contradictions_enabled() -> bool:
+    _contra_enabled_env = os.getenv("AXIOM_CONTRADICTION_ENABLED")
+    if _contra_enabled_env is None and os.getenv("AXIOM_CONTRADICTIONS") is not None:
+        # Legacy fallback with deprecation log; map into canonical for this process
+        try:
+            import logging as _logging  # local to avoid global top deps
+            _logging.getLogger(__name__).warning("[RECALL][Deprecation] AXIOM_CONTRADICTIONS is deprecated; use AXIOM_CONTRADICTION_ENABLED")
+        except Exception:
+            pass
+        try:
+            os.environ.setdefault("AXIOM_CONTRADICTION_ENABLED", os.getenv("AXIOM_CONTRADICTIONS", "0"))
+        except Exception:
+            pass
+        _contra_enabled_env = os.getenv("AXIOM_CONTRADICTION_ENABLED")
+    return str(_contra_enabled_env or "0").strip() in {"1", "true", "True"}
+
+
+@dataclass
+class _BatchEnv:
+    """Per-batch settings hoisted out of the per-item loop."""
+
+    weights: Dict[str, Any]
+    now: datetime
+    active: Optional[set]
+    conflict_policy: str
+    w_conflict: float
+    contradictions: bool
+
 
-    # Similarity
-    sim = cosine(mv, qv)
+def _batch_env(weights: Dict[str, Any], now_fn) -> _BatchEnv:
+    active = None
+    try:
+        if bool(weights.get("beliefs_enabled", True)):
+            active = load_active_beliefs()
+    except Exception:
+        active = None
+    policy = os.getenv("AXIOM_CONFLICT_POLICY", "penalize").lower()
+    w_conflict = 0.0
+    if policy == "explore":
+        w_conflict = min(0.05, float(os.getenv("AXIOM_W_CONFLICT", "0.03")))
+    try:
+        contra = bool(weights.get("contradictions_enabled", True)) and _contradictions_enabled()
+    except Exception:
+        contra = False
+    return _BatchEnv(weights, now_fn(), active, policy, w_conflict, contra)
+
+
+def _payload_components(m: Any, env: _BatchEnv) -> Dict[str, float]:
+    """Vector-independent components: recency, credibility, confidence, beliefs, usage, conflicts."""
+    weights = env.weights
+    now = env.now
     # Recency exponential decay
     try:
         # Allow dict or attribute access
-        ts = (
-            m.get("timestamp") if isinstance(m, dict) else getattr(m, "timestamp", None)
-        )
+        ts = _field(m, "timestamp")
         if isinstance(ts, str):
             # Normalize Z
             if ts.endswith("Z"):
@@ -292,52 +330,36 @@ def composite_score(
         elif isinstance(ts, datetime):
             dt = ts
         else:
-            dt = now_fn()
+            dt = now
         age_days = max(
             0.0,
-            (
-                now_fn() - (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc))
-            ).total_seconds()
-            / 86400.0,
+            (now - (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc))).total_seconds() / 86400.0,
         )
     except Exception:
         age_days = 0.0
     rec = math.exp(-float(weights["decay_lambda"]) * age_days)
 
     # Credibility/confidence/belief alignment/usage
-    cred_val = (
-        m.get("source_trust")
-        if isinstance(m, dict)
-        else getattr(m, "source_trust", 0.6)
-    )
+    cred_val = m.get("source_trust") if isinstance(m, dict) else getattr(m, "source_trust", 0.6)
     cred = clamp(float(cred_val if cred_val is not None else 0.6), 0.0, 1.0)
-    conf_val = (
-        m.get("confidence") if isinstance(m, dict) else getattr(m, "confidence", 0.5)
-    )
+    conf_val = m.get("confidence") if isinstance(m, dict) else getattr(m, "confidence", 0.5)
     conf = clamp(float(conf_val if conf_val is not None else 0.5), 0.0, 1.0)
 
     # Belief alignment (v1, lightweight, env-backed)
     bel = 1.0
     try:
-        flag_enabled = bool(weights.get("beliefs_enabled", True))
-        if flag_enabled:
-            active = load_active_beliefs()
+        if env.active is not None:
             # Extract memory beliefs (list[str]) in a tolerant way
             mem_beliefs: List[str] = []
             try:
-                if isinstance(m, dict):
-                    mem_beliefs = m.get("beliefs", []) or []
-                else:
-                    mem_beliefs = getattr(m, "beliefs", []) or []
+                mem_beliefs = _field(m, "beliefs", []) or []
                 if not mem_beliefs and hasattr(m, "payload"):
                     payload = getattr(m, "payload")
                     if isinstance(payload, dict):
                         mem_beliefs = payload.get("beliefs", []) or []
             except Exception:
                 mem_beliefs = []
-            bel = _belief_alignment_score(
-                [b for b in mem_beliefs if isinstance(b, str)], active
-            )
+            bel = _belief_alignment_score([b for b in mem_beliefs if isinstance(b, str)], env.active)
             bel = clamp(bel, 0.0, 1.0)
         else:
             bel = 0.5  # neutral when disabled
@@ -345,108 +367,178 @@ def composite_score(
         bel = 0.5
 
     # Explore policy safeguard: cap contradictory boosts
-    policy = os.getenv("AXIOM_CONFLICT_POLICY", "penalize").lower()
-    if policy == "explore" and bel < 0.5:
+    if env.conflict_policy == "explore" and bel < 0.5:
         # tiny positive factor to avoid drowning relevance
-        w_conflict = min(0.05, float(os.getenv("AXIOM_W_CONFLICT", "0.03")))
-        bel = 0.5 + (bel - 0.5) * w_conflict / max(1e-6, abs(bel - 0.5))
+        bel = 0.5 + (bel - 0.5) * env.w_conflict / max(1e-6, abs(bel - 0.5))
 
-    use = usage_norm(
-        (m.get("times_used") if isinstance(m, dict) else getattr(m, "times_used", 0))
-        or 0
-    )
-    nov = novelty_bonus(mv, selected or [])
+    use = usage_norm(_field(m, "times_used", 0) or 0)
 
     # Optional contradictions penalty via payload flags (lightweight)
     conflict_penalty = 0.0
     try:
-        _contra_enabled_env = os.getenv("AXIOM_CONTRADICTION_ENABLED")
-        if _contra_enabled_env is None and os.getenv("AXIOM_CONTRADICTIONS") is not None:
-            # Legacy fallback with deprecation log; map into canonical for this process
-            try:
-                import logging as _logging  # local to avoid global top deps
-                _logging.getLogger(__name__).warning("[RECALL][Deprecation] AXIOM_CONTRADICTIONS is deprecated; use AXIOM_CONTRADICTION_ENABLED")
-            except Exception:
-                pass
-            try:
-                os.environ.setdefault("AXIOM_CONTRADICTION_ENABLED", os.getenv("AXIOM_CONTRADICTIONS", "0"))
-            except Exception:
-                pass
-            _contra_enabled_env = os.getenv("AXIOM_CONTRADICTION_ENABLED")
-        if bool(weights.get("contradictions_enabled", True)) and str(_contra_enabled_env or "0").strip() in {"1","true","True"}:
-            cf = None
-            cs = None
-            if isinstance(m, dict):
-                cf = m.get("contradiction_flag")
-                cs = m.get("conflict_score")
-            else:
-                cf = getattr(m, "contradiction_flag", None)
-                cs = getattr(m, "conflict_score", None)
+        if env.contradictions:
+            cf = _field(m, "contradiction_flag")
+            cs = _field(m, "conflict_score")
             if cf is True or (isinstance(cs, (int, float)) and cs > 0):
                 conflict_penalty = float(weights.get("belief_conflict_penalty", 0.05))
     except Exception:
         conflict_penalty = 0.0
+    return {"rec": rec, "cred": cred, "conf": conf, "bel": bel, "use": use, "conflict_penalty": conflict_penalty}
+
+
+def _unit_rows(vecs: List[Sequence[float]], dim: int):
+    """Stack vectors into an (n, dim) matrix of unit rows (zero rows stay zero)."""
+    mat = np.asarray(vecs, dtype=np.float64).reshape(len(vecs), dim)
+    norms = np.linalg.norm(mat, axis=1)
+    safe = np.where(norms > 0, norms, 1.0)
+    return mat / safe[:, None]
+
+
+def _similarities(
+    vecs: List[Sequence[float]], qv: Sequence[float], sel_vecs: List[Sequence[float]], want_pairwise: bool
+) -> Tuple[List[float], List[float], Any]:
+    """
+    Return (query cosine per vector, mean cosine to `sel_vecs` per vector,
+    pairwise cosine matrix or None). Dimensions are validated like `cosine`.
+    """
+    dim = len(qv)
+    for v in list(vecs) + list(sel_vecs):
+        if len(v) != dim:
+            raise ValueError(f"Vector dim mismatch: {len(v)} vs {dim}")
+    if np is None:
+        sims = [cosine(v, qv) for v in vecs]
+        novs = [avg_cosine(v, sel_vecs) for v in vecs] if sel_vecs else [0.0] * len(vecs)
+        pair = [[cosine(a, b) for b in vecs] for a in vecs] if want_pairwise else None
+        return sims, novs, pair
+    if not vecs:
+        return [], [], None
+    unit = _unit_rows(vecs, dim)
+    q = np.asarray(qv, dtype=np.float64)
+    qn = float(np.linalg.norm(q))
+    sims = unit @ (q / qn) if qn > 0 else np.zeros(len(vecs))
+    if sel_vecs:
+        novs = (unit @ _unit_rows(sel_vecs, dim).T).mean(axis=1)
+    else:
+        novs = np.zeros(len(vecs))
+    pair = unit @ unit.T if want_pairwise else None
+    return sims.tolist(), novs.tolist(), pair
+
+
+def _mmr_from(rel: List[float], pair: Any, valid: List[int], k: int, lambda_: float) -> List[int]:
+    """Greedy MMR over precomputed relevance and pairwise similarity.
+
+    Keeps a running max-similarity-to-selected per candidate, so each step is
+    O(n) instead of recomputing similarities against every selected item.
+    """
+    k = min(k, len(valid))
+    if k <= 0:
+        return []
+    if np is not None:
+        rel_a = np.asarray(rel, dtype=np.float64)
+        max_sim = np.zeros(len(valid))
+        open_ = np.ones(len(valid), dtype=bool)
+        out: List[int] = []
+        for _ in range(k):
+            score = lambda_ * rel_a - (1.0 - lambda_) * max_sim
+            score[~open_] = -np.inf
+            j = int(np.argmax(score))
+            out.append(valid[j])
+            open_[j] = False
+            # No selection yet means zero diversity penalty, so seed with the first row
+            max_sim = pair[j].copy() if len(out) == 1 else np.maximum(max_sim, pair[j])
+        return out
+    max_sim_l = [0.0] * len(valid)
+    remaining = list(range(len(valid)))
+    out = []
+    for step in range(k):
+        best = max(remaining, key=lambda i: (lambda_ * rel[i] - (1.0 - lambda_) * max_sim_l[i], -i))
+        out.append(valid[best])
+        remaining.remove(best)
+        row = pair[best]
+        max_sim_l = [row[i] if step == 0 else max(max_sim_l[i], row[i]) for i in range(len(valid))]
+    return out
+
+
+@dataclass
+class BatchScores:
+    """Result of `score_batch`: per-item (score, components) plus MMR order."""
+
+    scores: List[float]
+    components: List[Dict[str, float]]
+    selected: List[int]
+
+
+def score_batch(
+    items: Sequence[Any],
+    qv: Sequence[float],
+    *,
+    selected: Optional[List[Any]] = None,
+    w: Optional[Dict[str, float]] = None,
+    now_fn=utc_now,
+    k: Optional[int] = None,
+    lambda_: float = 0.5,
+) -> BatchScores:
+    """Score all candidates against `qv` in one pass.
+
+    Query similarity and novelty come from a single matrix product over
+    precomputed unit rows (NumPy when available). When `k` is given, MMR
+    selection reuses the same similarity matrix.
+    """
+    weights = w or DEFAULT_WEIGHTS
+    vecs = [_as_vector(m) for m in items]
+    valid = [i for i, v in enumerate(vecs) if v is not None]
+    sel_vecs = [v for v in (_as_vector(s) for s in (selected or [])) if v is not None]
+    sims, novs, pair = _similarities([vecs[i] for i in valid], qv, sel_vecs, k is not None)
+
+    env = _batch_env(weights, now_fn) if valid else None
+    scores = [0.0] * len(items)
+    comps: List[Dict[str, float]] = [dict.fromkeys(_ZERO_COMPONENTS, 0.0) for _ in items]
+    for row, i in enumerate(valid):
+        c = _payload_components(items[i], env)
+        sim = float(sims[row])
+        nov = max(0.0, 1.0 - float(novs[row])) if sel_vecs else 0.0
+        base = float(weights["w_sim"]) * sim
+        mult = (
+            (1 + float(weights["w_rec"]) * c["rec"])
+            * (1 + float(weights["w_cred"]) * (c["cred"] - 0.5))
+            * (1 + float(weights["w_conf"]) * (c["conf"] - 0.5))
+            * (1 + float(weights["w_bel"]) * (c["bel"] - 0.5))
+            * (1 + float(weights["w_use"]) * c["use"])
+            * (1 + float(weights["w_nov"]) * nov)
+        )
+        if c["conflict_penalty"]:
+            mult = max(0.0, mult * (1.0 - c["conflict_penalty"]))
+        scores[i] = base * mult
+        comps[i] = {
+            "sim": sim,
+            "rec": c["rec"],
+            "cred": c["cred"],
+            "conf": c["conf"],
+            "bel": c["bel"],
+            "use": c["use"],
+            "nov": nov,
+            "conflict_penalty": c["conflict_penalty"],
+        }
+    chosen = _mmr_from(sims, pair, valid, k, lambda_) if k is not None else []
+    return BatchScores(scores=scores, components=comps, selected=chosen)
 
-    base = float(weights["w_sim"]) * sim
-    mult = (
-        (1 + float(weights["w_rec"]) * rec)
-        * (1 + float(weights["w_cred"]) * (cred - 0.5))
-        * (1 + float(weights["w_conf"]) * (conf - 0.5))
-        * (1 + float(weights["w_bel"]) * (bel - 0.5))
-        * (1 + float(weights["w_use"]) * use)
-        * (1 + float(weights["w_nov"]) * nov)
-    )
-    if conflict_penalty:
-        mult = max(0.0, mult * (1.0 - conflict_penalty))
-    final = base * mult
-    return final, {
-        "sim": sim,
-        "rec": rec,
-        "cred": cred,
-        "conf": conf,
-        "bel": bel,
-        "use": use,
-        "nov": nov,
-        "conflict_penalty": conflict_penalty,
-    }
+
+def composite_score(
+    m: Any,
+    qv: Sequence[float],
+    selected: Optional[List[Any]] = None,
+    w: Optional[Dict[str, float]] = None,
+    now_fn=utc_now,
+) -> Tuple[float, Dict[str, float]]:
+    """Compute composite score and return (score, components)."""
+    res = score_batch([m], qv, selected=selected, w=w, now_fn=now_fn)
+    return res.scores[0], res.components[0]
 
 
 def mmr_select(
     items: List[Any], query_vec: Sequence[float], k: int, lambda_: float = 0.5
 ) -> List[int]:
     """Maximal Marginal Relevance selection over provided items using cosine."""
-    k = min(k, len(items))
-    if k <= 0:
+    if min(k, len(items)) <= 0:
         return []
-    selected: List[int] = []
-    candidates = list(range(len(items)))
-    item_vecs = [_as_vector(it) for it in items]
-
-    for _ in range(k):
-        best_idx = None
-        best_score = -1e9
-        for i in candidates:
-            v = item_vecs[i]
-            if v is None:
-                continue
-            rel = cosine(v, query_vec)
-            div = 0.0
-            if selected:
-                div = (
-                    max(
-                        cosine(v, item_vecs[j])
-                        for j in selected
-                        if item_vecs[j] is not None
-                    )
-                    if any(item_vecs[j] is not None for j in selected)
-                    else 0.0
-                )
-            score = lambda_ * rel - (1.0 - lambda_) * div
-            if score > best_score:
-                best_score = score
-                best_idx = i
-        if best_idx is None:
-            break
-        selected.append(best_idx)
-        candidates.remove(best_idx)
-    return selected
+    return score_batch(items, query_vec, k=k, lambda_=lambda_).selected
@@ -0,0 +1,455 @@
+"""
+Incremental on-disk BM25 index over memory text.
+
+Layout under the index directory:
+- ``manifest.json``     segment list + highest flushed sequence number (atomic replace)
+- ``seg-<n>.json``      immutable segment: stored docs + term postings
+- ``tombstones.json``   doc id -> delete sequence (atomic replace at flush/merge)
+- ``ops.log``           JSONL of puts/deletes not yet flushed; replayed on open
+
+Every put gets a monotonically increasing sequence number. A posting is live when its
+sequence is the current one for its doc id, so re-adding a doc shadows older copies and
+deletes only need a tombstone. Unflushed writes live in an in-memory segment backed by
+``ops.log``; once it reaches ``flush_docs`` it is written out as a new segment. When the
+segment count exceeds ``max_segments`` a background thread merges them, dropping dead
+postings and tombstones that no longer shadow anything.
+
+Tokenization is shared with ``vector.recall_utils.keyword_boost``.
+
+Environment:
+- AXIOM_BM25_INDEX_DIR       enables the index (unset → lexical search disabled)
+- AXIOM_BM25_FLUSH_DOCS      docs buffered before a segment flush (default 512)
+- AXIOM_BM25_MAX_SEGMENTS    segment count that triggers a background merge (default 8)
+- AXIOM_BM25_K1 / AXIOM_BM25_B  BM25 parameters (defaults 1.2 / 0.75)
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from vector.recall_utils import tokenize
+
+log = logging.getLogger(__name__)
+
+# Payload fields kept alongside each doc so lexical hits need no vector round-trip
+STORED_FIELDS = ("tags", "type", "memory_type", "timestamp", "speaker", "source", "importance")
+
+
+def _env_int(name: str, default: int) -> int:
+	try:
+		return int(str(os.getenv(name, str(default))).strip())
+	except Exception:
+		return int(default)
+
+
+def _env_float(name: str, default: float) -> float:
+	try:
+		return float(str(os.getenv(name, str(default))).strip())
+	except Exception:
+		return float(default)
+
+
+def _atomic_write_json(path: str, obj: Any) -> None:
+	tmp = f"{path}.tmp"
+	with open(tmp, "w", encoding="utf-8") as f:
+		json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+		f.flush()
+		os.fsync(f.fileno())
+	os.replace(tmp, path)
+
+
+def _canonical(stored: Dict[str, Any]) -> str:
+	# Stored fields round-trip through JSON (default=str) on disk; compare in that form
+	return json.dumps(stored, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class _Doc:
+	__slots__ = ("seq", "id", "length", "stored")
+
+	def __init__(self, seq: int, doc_id: str, length: int, stored: Dict[str, Any]):
+		self.seq = seq
+		self.id = doc_id
+		self.length = length
+		self.stored = stored
+
+
+class _Segment:
+	"""Docs and postings (term -> [(seq, tf)]) for one segment or the memtable."""
+
+	def __init__(self, name: Optional[str] = None):
+		self.name = name
+		self.docs: Dict[int, _Doc] = {}
+		self.postings: Dict[str, List[Tuple[int, int]]] = {}
+
+	def add(self, doc: _Doc, tf: Dict[str, int]) -> None:
+		self.docs[doc.seq] = doc
+		for term, n in tf.items():
+			self.postings.setdefault(term, []).append((doc.seq, n))
+
+	def to_json(self) -> Dict[str, Any]:
+		return {
+			"docs": [[d.seq, d.id, d.length, d.stored] for d in self.docs.values()],
+			"postings": {t: [[s, n] for s, n in p] for t, p in self.postings.items()},
+		}
+
+	@classmethod
+	def from_json(cls, name: str, data: Dict[str, Any]) -> "_Segment":
+		seg = cls(name)
+		for seq, doc_id, length, stored in data.get("docs") or []:
+			seg.docs[int(seq)] = _Doc(int(seq), str(doc_id), int(length), dict(stored or {}))
+		for term, plist in (data.get("postings") or {}).items():
+			seg.postings[term] = [(int(s), int(n)) for s, n in plist]
+		return seg
+
+
+class BM25Index:
+	"""Segmented BM25 inverted index with tombstones and background merge."""
+
+	def __init__(
+		self,
+		path: str,
+		*,
+		flush_docs: int = 512,
+		max_segments: int = 8,
+		k1: float = 1.2,
+		b: float = 0.75,
+		background_merge: bool = True,
+	):
+		self.path = path
+		self.flush_docs = max(1, int(flush_docs))
+		self.max_segments = max(1, int(max_segments))
+		self.k1 = float(k1)
+		self.b = float(b)
+		self.background_merge = bool(background_merge)
+		self._lock = threading.RLock()
+		self._merge_lock = threading.Lock()
+		self._merge_thread: Optional[threading.Thread] = None
+		self._segments: List[_Segment] = []
+		self._mem = _Segment()
+		self._live: Dict[str, _Doc] = {}
+		self._tombstones: Dict[str, int] = {}
+		self._total_len = 0
+		self._seq = 0
+		self._flushed_seq = 0
+		self._seg_counter = 0
+		os.makedirs(path, exist_ok=True)
+		self._open()
+
+	# ── Public API ─────────────────────────────────────────────
+	def add(self, doc_id: str, text: str, stored: Optional[Dict[str, Any]] = None) -> None:
+		self.apply(puts=[{"id": doc_id, "content": text, **(stored or {})}])
+
+	def delete(self, doc_id: str) -> None:
+		self.apply(deletes=[doc_id])
+
+	def apply(self, puts: Iterable[Dict[str, Any]] = (), deletes: Iterable[str] = ()) -> None:
+		"""Index a batch of memory records and deletions with one ops.log append."""
+		lines: List[str] = []
+		with self._lock:
+			for rec in puts or ():
+				doc_id = rec.get("id") if isinstance(rec, dict) else None
+				if not doc_id:
+					continue
+				text = str(rec.get("content") or rec.get("text") or "")
+				stored = {k: rec[k] for k in STORED_FIELDS if k in rec}
+				self._seq += 1
+				op = {"op": "put", "seq": self._seq, "id": str(doc_id), "text": text, "stored": stored}
+				self._apply_put(op)
+				lines.append(json.dumps(op, ensure_ascii=False, default=str))
+			for doc_id in deletes or ():
+				if not doc_id:
+					continue
+				self._seq += 1
+				op = {"op": "del", "seq": self._seq, "id": str(doc_id)}
+				self._apply_del(op)
+				lines.append(json.dumps(op))
+			if not lines:
+				return
+			with open(self._ops_path, "a", encoding="utf-8") as f:
+				f.write("\n".join(lines) + "\n")
+			if len(self._mem.docs) >= self.flush_docs:
+				self._flush_locked()
+
+	def sync(self, records: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+		"""Reconcile the index with a full record set; returns (puts, deletes) applied.
+
+		Records whose text or stored fields differ from the live doc are re-put, live
+		ids absent from ``records`` are deleted. Used after whole-state saves and on
+		startup, when the store may have been written without going through apply().
+		"""
+		puts: List[Dict[str, Any]] = []
+		seen = set()
+		with self._lock:
+			for rec in records or ():
+				doc_id = rec.get("id") if isinstance(rec, dict) else None
+				if not doc_id:
+					continue
+				doc_id = str(doc_id)
+				seen.add(doc_id)
+				cur = self._live.get(doc_id)
+				want = {k: rec[k] for k in STORED_FIELDS if k in rec}
+				want["content"] = str(rec.get("content") or rec.get("text") or "")
+				if cur is None or _canonical(cur.stored) != _canonical(want):
+					puts.append(rec)
+			deletes = [i for i in self._live if i not in seen]
+			if puts or deletes:
+				self.apply(puts=puts, deletes=deletes)
+		return len(puts), len(deletes)
+
+	def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+		"""Top-k live docs by BM25, as memory-shaped dicts with a ``_bm25`` score."""
+		terms = list(dict.fromkeys(tokenize(query or "")))
+		if not terms or k <= 0:
+			return []
+		with self._lock:
+			n_docs = len(self._live)
+			if not n_docs:
+				return []
+			avgdl = (self._total_len / n_docs) or 1.0
+			segments = self._segments + [self._mem]
+			scores: Dict[int, float] = {}
+			docs: Dict[int, _Doc] = {}
+			for term in terms:
+				live_postings: List[Tuple[_Doc, int]] = []
+				for seg in segments:
+					for seq, tf in seg.postings.get(term, ()):
+						doc = seg.docs[seq]
+						if self._live.get(doc.id) is doc:
+							live_postings.append((doc, tf))
+				if not live_postings:
+					continue
+				df = len(live_postings)
+				idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+				for doc, tf in live_postings:
+					norm = tf + self.k1 * (1.0 - self.b + self.b * doc.length / avgdl)
+					scores[doc.seq] = scores.get(doc.seq, 0.0) + idf * tf * (self.k1 + 1.0) / norm
+					docs[doc.seq] = doc
+		out: List[Dict[str, Any]] = []
+		for seq in heapq.nlargest(k, scores, key=scores.__getitem__):
+			doc = docs[seq]
+			hit = dict(doc.stored)
+			hit["id"] = doc.id
+			hit["_bm25"] = scores[seq]
+			out.append(hit)
+		return out
+
+	def flush(self) -> None:
+		with self._lock:
+			self._flush_locked()
+
+	def merge(self) -> None:
+		"""Merge all flushed segments into one, dropping dead postings."""
+		with self._merge_lock:
+			with self._lock:
+				victims = list(self._segments)
+			if len(victims) < 2 and not self._tombstones:
+				return
+			merged = _Segment(self._next_segment_name())
+			with self._lock:
+				live = dict(self._live)
+			for seg in victims:
+				for seq, doc in seg.docs.items():
+					if live.get(doc.id) is doc:
+						merged.docs[seq] = doc
+				for term, plist in seg.postings.items():
+					kept = [(s, n) for s, n in plist if s in merged.docs]
+					if kept:
+						merged.postings.setdefault(term, []).extend(kept)
+			_atomic_write_json(os.path.join(self.path, merged.name), merged.to_json())
+			with self._lock:
+				names = {s.name for s in victims}
+				self._segments = [merged] + [s for s in self._segments if s.name not in names]
+				# A tombstone only matters while an older copy of that id is still on disk.
+				oldest: Dict[str, int] = {}
+				for seg in self._segments + [self._mem]:
+					for doc in seg.docs.values():
+						oldest[doc.id] = min(oldest.get(doc.id, doc.seq), doc.seq)
+				self._tombstones = {i: d for i, d in self._tombstones.items() if oldest.get(i, d) < d}
+				_atomic_write_json(self._tombstones_path, self._tombstones)
+				self._write_manifest()
+			for name in names:
+				try:
+					os.remove(os.path.join(self.path, name))
+				except OSError:
+					pass
+
+	def doc_count(self) -> int:
+		with self._lock:
+			return len(self._live)
+
+	def stats(self) -> Dict[str, Any]:
+		with self._lock:
+			return {
+				"docs": len(self._live),
+				"segments": len(self._segments),
+				"buffered": len(self._mem.docs),
+				"tombstones": len(self._tombstones),
+				"avgdl": (self._total_len / len(self._live)) if self._live else 0.0,
+			}
+
+	def close(self) -> None:
+		t = self._merge_thread
+		if t is not None:
+			t.join(timeout=30)
+		self.flush()
+
+	# ── Internals (callers hold _lock) ─────────────────────────
+	@property
+	def _ops_path(self) -> str:
+		return os.path.join(self.path, "ops.log")
+
+	@property
+	def _tombstones_path(self) -> str:
+		return os.path.join(self.path, "tombstones.json")
+
+	def _set_live(self, doc: _Doc) -> None:
+		cur = self._live.get(doc.id)
+		if cur is not None and cur.seq > doc.seq:
+			return
+		if self._tombstones.get(doc.id, 0) > doc.seq:
+			return
+		if cur is not None:
+			self._total_len -= cur.length
+		self._live[doc.id] = doc
+		self._total_len += doc.length
+
+	def _apply_put(self, op: Dict[str, Any]) -> None:
+		tokens = tokenize(op.get("text") or "")
+		stored = dict(op.get("stored") or {})
+		stored["content"] = op.get("text") or ""
+		doc = _Doc(int(op["seq"]), str(op["id"]), len(tokens), stored)
+		self._mem.add(doc, Counter(tokens))
+		self._set_live(doc)
+
+	def _apply_del(self, op: Dict[str, Any]) -> None:
+		doc_id, seq = str(op["id"]), int(op["seq"])
+		self._tombstones[doc_id] = max(seq, self._tombstones.get(doc_id, 0))
+		cur = self._live.get(doc_id)
+		if cur is not None and cur.seq < seq:
+			self._total_len -= cur.length
+			del self._live[doc_id]
+
+	def _next_segment_name(self) -> str:
+		with self._lock:
+			self._seg_counter += 1
+			return f"seg-{self._seg_counter:06d}.json"
+
+	def _write_manifest(self) -> None:
+		_atomic_write_json(
+			os.path.join(self.path, "manifest.json"),
+			{
+				"segments": [s.name for s in self._segments],
+				"flushed_seq": self._flushed_seq,
+				"seg_counter": self._seg_counter,
+			},
+		)
+
+	def _flush_locked(self) -> None:
+		if self._mem.docs or self._seq > self._flushed_seq:
+			if self._mem.docs:
+				self._mem.name = self._next_segment_name()
+				_atomic_write_json(os.path.join(self.path, self._mem.name), self._mem.to_json())
+				self._segments.append(self._mem)
+				self._mem = _Segment()
+			_atomic_write_json(self._tombstones_path, self._tombstones)
+			self._flushed_seq = self._seq
+			self._write_manifest()
+			with open(self._ops_path, "w", encoding="utf-8"):
+				pass
+		if len(self._segments) > self.max_segments:
+			self._schedule_merge()
+
+	def _schedule_merge(self) -> None:
+		if not self.background_merge:
+			self.merge()
+			return
+		if self._merge_thread is not None and self._merge_thread.is_alive():
+			return
+
+		def _run() -> None:
+			try:
+				self.merge()
+			except Exception as e:  # pragma: no cover - best-effort background work
+				log.warning("[BM25] merge failed: %s", e)
+
+		self._merge_thread = threading.Thread(target=_run, name="bm25-merge", daemon=True)
+		self._merge_thread.start()
+
+	def _open(self) -> None:
+		manifest: Dict[str, Any] = {}
+		try:
+			with open(os.path.join(self.path, "manifest.json"), "r", encoding="utf-8") as f:
+				manifest = json.load(f) or {}
+		except FileNotFoundError:
+			manifest = {}
+		except Exception as e:
+			log.warning("[BM25] unreadable manifest, starting empty: %s", e)
+		self._flushed_seq = int(manifest.get("flushed_seq") or 0)
+		self._seg_counter = int(manifest.get("seg_counter") or 0)
+		self._seq = self._flushed_seq
+		try:
+			with open(self._tombstones_path, "r", encoding="utf-8") as f:
+				self._tombstones = {str(k): int(v) for k, v in (json.load(f) or {}).items()}
+		except Exception:
+			self._tombstones = {}
+		for name in manifest.get("segments") or []:
+			try:
+				with open(os.path.join(self.path, name), "r", encoding="utf-8") as f:
+					seg = _Segment.from_json(name, json.load(f))
+			except Exception as e:
+				log.warning("[BM25] skipping unreadable segment %s: %s", name, e)
+				continue
+			self._segments.append(seg)
+			for doc in seg.docs.values():
+				self._set_live(doc)
+				self._seq = max(self._seq, doc.seq)
+		# Replay unflushed ops (skip anything a completed flush already covers)
+		try:
+			with open(self._ops_path, "r", encoding="utf-8") as f:
+				for line in f:
+					try:
+						op = json.loads(line)
+					except Exception:
+						continue  # torn tail write
+					seq = int(op.get("seq") or 0)
+					if seq <= self._flushed_seq:
+						continue
+					if op.get("op") == "put":
+						self._apply_put(op)
+					elif op.get("op") == "del":
+						self._apply_del(op)
+					self._seq = max(self._seq, seq)
+		except FileNotFoundError:
+			pass
+
+
+_INDEX: Optional[BM25Index] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_index() -> Optional[BM25Index]:
+	"""Process-wide index at AXIOM_BM25_INDEX_DIR, or None when lexical search is disabled."""
+	global _INDEX
+	path = (os.getenv("AXIOM_BM25_INDEX_DIR") or "").strip()
+	if not path:
+		return None
+	with _INDEX_LOCK:
+		if _INDEX is None or os.path.abspath(_INDEX.path) != os.path.abspath(path):
+			_INDEX = BM25Index(
+				path,
+				flush_docs=_env_int("AXIOM_BM25_FLUSH_DOCS", 512),
+				max_segments=_env_int("AXIOM_BM25_MAX_SEGMENTS", 8),
+				k1=_env_float("AXIOM_BM25_K1", 1.2),
+				b=_env_float("AXIOM_BM25_B", 0.75),
+			)
+		return _INDEX
+
+
+__all__ = ["BM25Index", "get_index"]
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+import array
+import atexit
 import json
 import math
 import os
 import random
 import statistics
+import struct
+import sys
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+	import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+	np = None  # type: ignore
+
+try:
+	import fcntl  # type: ignore
+except Exception:  # pragma: no cover - non-POSIX
+	fcntl = None  # type: ignore
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -40,6 +54,9 @@ DRIFT_ALERT_KL = _env_float("DRIFT_ALERT_KL", 0.15)
 DRIFT_ALERT_COSINE_SHIFT = _env_float("DRIFT_ALERT_COSINE_SHIFT", 0.08)
 DRIFT_WINDOW_DOCS = max(100, _env_int("DRIFT_WINDOW_DOCS", 5000))
 DRIFT_DIR = Path(os.getenv("DRIFT_STATE_DIR", "drift"))
+# Accumulator flush policy: samples since last flush, or seconds since last flush
+DRIFT_FLUSH_EVERY = max(1, _env_int("DRIFT_FLUSH_EVERY", 256))
+DRIFT_FLUSH_SEC = max(0.0, _env_float("DRIFT_FLUSH_SEC", 30.0))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -70,18 +87,23 @@ def sample_vector_norms(vectors: List[List[float]]) -> Dict[str, float]:
 			p95_val = float(s[idx])
 		return {"mean": float(mean_val), "p95": float(p95_val), "n": int(len(norms))}
 	except Exception:
-	return {"mean": 0.0, "p95": 0.0, "n": 0}
+		return {"mean": 0.0, "p95": 0.0, "n": 0}
 
 
 def _cosine(a: List[float], b: List[float]) -> float:
 	try:
-		if not a or not b:
+		if a is None or b is None or len(a) == 0 or len(b) == 0:
 			return 0.0
 		if len(a) != len(b):
 			# best-effort: truncate to min length
 			m = min(len(a), len(b))
 			a = a[:m]
 			b = b[:m]
+		if np is not None:
+			va = np.asarray(a, dtype=np.float32)
+			vb = np.asarray(b, dtype=np.float32)
+			den = float(np.linalg.norm(va)) * float(np.linalg.norm(vb))
+			return float(np.dot(va, vb) / den) if den > 0.0 else 0.0
 		dot = 0.0
 		norm_a = 0.0
 		norm_b = 0.0
@@ -95,7 +117,7 @@ def _cosine(a: List[float], b: List[float]) -> float:
 			return 0.0
 		return float(dot / (da * db))
 	except Exception:
-	return 0.0
+		return 0.0
 
 
 def cosine_histogram(sample_pairs: List[Tuple[List[float], List[float]]], bins: int = 21) -> List[float]:
@@ -136,7 +158,7 @@ def kl_divergence(p_hist: List[float], q_hist: List[float], eps: float = 1e-9) -
 			kl += p * math.log(p / q)
 		return float(max(0.0, kl))
 	except Exception:
-	return 0.0
+		return 0.0
 
 
 def compute_cosine_shift(prev_hist: List[float], curr_hist: List[float]) -> float:
@@ -159,7 +181,7 @@ def compute_cosine_shift(prev_hist: List[float], curr_hist: List[float]) -> floa
 			return float(sum(h * c for h, c in zip(hist[:m], centers)))
 		return float(abs(_exp(curr_hist) - _exp(prev_hist)))
 	except Exception:
-	return 0.0
+		return 0.0
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -199,43 +221,413 @@ def emit_drift(ns: str, kl: float, cos_shift: float) -> None:
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# Local rolling state (histograms + norms), idempotent and bounded
+# Accumulator: running norm stats, norm/cosine histograms, vector reservoir
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+_COS_BINS = 21
+# Log-spaced norm histogram over [1e-3, 1e4] (~6% bucket width)
+_NORM_BINS = 128
+_NORM_LO = math.log(1e-3)
+_NORM_HI = math.log(1e4)
+_MAGIC = b"AXDRIFT1"
+
+
+def _reservoir_cap() -> int:
+	# sqrt of window, min 50, max 500 (as before)
+	return max(50, min(500, int(math.sqrt(DRIFT_WINDOW_DOCS))))
+
+
+def _norm_bin(norm: float) -> int:
+	if norm <= 0.0:
+		return 0
+	pos = int((math.log(norm) - _NORM_LO) / (_NORM_HI - _NORM_LO) * _NORM_BINS)
+	return max(0, min(_NORM_BINS - 1, pos))
+
+
+def _norm_bin_center(i: int) -> float:
+	return math.exp(_NORM_LO + (i + 0.5) * (_NORM_HI - _NORM_LO) / _NORM_BINS)
+
+
+class DriftAccumulator:
+	"""Mergeable drift statistics for one namespace.
+
+	- norms: running count/mean/M2 (Welford) + log-spaced histogram for p95; counts
+	  are halved once they exceed 2×DRIFT_WINDOW_DOCS so recent docs dominate
+	- cosine histogram: one reservoir pair per recorded vector
+	- reservoir: uniform sample (Algorithm R) of up to `cap` vectors, float32
+
+	merge() combines accumulators from different processes (Chan et al. for the
+	moments, element-wise sums for histograms, seen-weighted reservoir sampling).
+	"""
+
+	def __init__(self, cap: Optional[int] = None) -> None:
+		self.cap = int(cap or _reservoir_cap())
+		self.n = 0
+		self.mean = 0.0
+		self.m2 = 0.0
+		self.norm_counts = [0] * _NORM_BINS
+		self.cos_counts = [0] * _COS_BINS
+		self.cos_seen = 0
+		self.seen = 0
+		self.dim = 0
+		# With NumPy: a cap × dim float32 buffer allocated once, rows [0, _filled) in use
+		self._buf: Any = []
+		self._filled = 0
+		self.baseline: Dict[str, Any] = {}
+		self.updated_at = ""
+
+	@property
+	def reservoir(self) -> Any:
+		"""Sampled vectors: an (rows, dim) view of the buffer, or a list without NumPy."""
+		if np is not None and not isinstance(self._buf, list):
+			return self._buf[: self._filled]
+		return self._buf
+
+	@reservoir.setter
+	def reservoir(self, rows: Any) -> None:
+		self._buf = rows
+		self._filled = len(rows)
+
+	# ── updates ────────────────────────────────────────────────────────────
+	def _rows(self) -> int:
+		return self._filled
+
+	def _row(self, i: int) -> Any:
+		return self._buf[i]
+
+	def add(self, vector: Any, rng: Optional[random.Random] = None) -> None:
+		rng = rng or random
+		if np is not None:
+			vec = np.asarray(vector, dtype=np.float32).ravel()
+			norm_val = float(np.linalg.norm(vec))
+		else:
+			vec = array.array("f", (float(v or 0.0) for v in vector))
+			norm_val = math.sqrt(sum(v * v for v in vec))
+		if not self.dim:
+			self.dim = len(vec)
+		elif len(vec) != self.dim:
+			return
+		# Norm moments + histogram
+		self.n += 1
+		delta = norm_val - self.mean
+		self.mean += delta / self.n
+		self.m2 += delta * (norm_val - self.mean)
+		self.norm_counts[_norm_bin(norm_val)] += 1
+		if self.n > 2 * DRIFT_WINDOW_DOCS:
+			self._decay()
+		# Cosine vs one reservoir member
+		rows = self._rows()
+		if rows >= 1:
+			c = _cosine(vec, self._row(rng.randint(0, rows - 1)))
+			pos = int((c + 1.0) / 2.0 * (_COS_BINS - 1))
+			self.cos_counts[max(0, min(_COS_BINS - 1, pos))] += 1
+			self.cos_seen += 1
+		# Reservoir (Algorithm R)
+		self.seen += 1
+		if rows < self.cap:
+			self._append_row(vec)
+		else:
+			j = rng.randint(0, self.seen - 1)
+			if j < self.cap:
+				self._buf[j] = vec
+		self.updated_at = _now_iso()
+
+	def _append_row(self, vec: Any) -> None:
+		rows = self._filled
+		if np is not None:
+			if isinstance(self._buf, list) or rows >= self._buf.shape[0]:
+				# Allocate the full reservoir once; later appends write a row in place
+				buf = np.empty((max(self.cap, rows + 1), self.dim), dtype=np.float32)
+				if rows:
+					buf[:rows] = np.asarray(self._buf[:rows], dtype=np.float32)
+				self._buf = buf
+			self._buf[rows] = vec
+		else:
+			self._buf.append(vec)
+		self._filled = rows + 1
+
+	def _decay(self) -> None:
+		self.n = max(1, self.n // 2)
+		self.m2 /= 2.0
+		self.norm_counts = [c // 2 for c in self.norm_counts]
+
+	def maybe_set_baseline(self) -> None:
+		if not self.baseline and self.n >= min(200, DRIFT_WINDOW_DOCS // 10):
+			self.baseline = {"cos_hist": self.cos_hist(), "created_at": _now_iso()}
+
+	# ── views ──────────────────────────────────────────────────────────────
+	def cos_hist(self) -> List[float]:
+		total = float(max(1, sum(self.cos_counts)))
+		return [float(c) / total for c in self.cos_counts]
+
+	def norm_stats(self) -> Dict[str, float]:
+		if self.n <= 0:
+			return {"mean": 0.0, "p95": 0.0, "n": 0}
+		total = sum(self.norm_counts)
+		p95 = 0.0
+		if total > 0:
+			target = 0.95 * total
+			run = 0
+			for i, c in enumerate(self.norm_counts):
+				run += c
+				if run >= target:
+					p95 = _norm_bin_center(i)
+					break
+		return {
+			"mean": float(self.mean),
+			"p95": float(p95),
+			"n": int(self.n),
+			"std": float(math.sqrt(self.m2 / self.n)) if self.n > 1 else 0.0,
+		}
+
+	def empty(self) -> bool:
+		return self.n == 0 and self.seen == 0
+
+	# ── merge ──────────────────────────────────────────────────────────────
+	def merge(self, other: "DriftAccumulator", rng: Optional[random.Random] = None) -> "DriftAccumulator":
+		"""Fold `other` into self (in place) and return self."""
+		rng = rng or random
+		if other.empty():
+			return self
+		if self.dim and other.dim and self.dim != other.dim:
+			return self
+		n = self.n + other.n
+		if n > 0:
+			delta = other.mean - self.mean
+			self.mean += delta * other.n / n
+			self.m2 += other.m2 + delta * delta * self.n * other.n / n
+		self.n = n
+		self.norm_counts = [a + b for a, b in zip(self.norm_counts, other.norm_counts)]
+		self.cos_counts = [a + b for a, b in zip(self.cos_counts, other.cos_counts)]
+		self.cos_seen += other.cos_seen
+		# Reservoir: draw from each side in proportion to how many vectors it has seen
+		seen = self.seen + other.seen
+		rows_a = [self._row(i) for i in range(self._rows())]
+		rows_b = [other._row(i) for i in range(other._rows())]
+		take_a = min(len(rows_a), int(round(self.cap * (self.seen / float(seen))))) if seen else 0
+		take_b = min(len(rows_b), self.cap - take_a)
+		take_a = min(len(rows_a), self.cap - take_b)
+		picked = rng.sample(rows_a, take_a) + rng.sample(rows_b, take_b)
+		self.dim = self.dim or other.dim
+		self.reservoir = []
+		for vec in picked:
+			self._append_row(vec)
+		self.seen = seen
+		if not self.baseline and other.baseline:
+			self.baseline = dict(other.baseline)
+		self.updated_at = max(self.updated_at, other.updated_at)
+		if self.n > 2 * DRIFT_WINDOW_DOCS:
+			self._decay()
+		return self
+
+	# ── binary (de)serialization ───────────────────────────────────────────
+	def to_bytes(self) -> bytes:
+		"""AXDRIFT1 | u32 header length | JSON header | float32 reservoir rows (little endian)."""
+		rows = self._rows()
+		header = json.dumps(
+			{
+				"cap": self.cap,
+				"n": self.n,
+				"mean": self.mean,
+				"m2": self.m2,
+				"norm_counts": self.norm_counts,
+				"cos_counts": self.cos_counts,
+				"cos_seen": self.cos_seen,
+				"seen": self.seen,
+				"dim": self.dim,
+				"rows": rows,
+				"baseline": self.baseline,
+				"updated_at": self.updated_at,
+			},
+			separators=(",", ":"),
+		).encode("utf-8")
+		if np is not None and not isinstance(self.reservoir, list):
+			body = np.ascontiguousarray(self.reservoir, dtype="<f4").tobytes()
+		else:
+			flat = array.array("f")
+			for vec in self.reservoir:
+				flat.extend(vec)
+			if sys.byteorder != "little":  # pragma: no cover
+				flat.byteswap()
+			body = flat.tobytes()
+		return _MAGIC + struct.pack("<I", len(header)) + header + body
+
+	@classmethod
+	def from_bytes(cls, data: bytes) -> "DriftAccumulator":
+		if not data.startswith(_MAGIC):
+			raise ValueError("not a drift state file")
+		off = len(_MAGIC)
+		(hlen,) = struct.unpack_from("<I", data, off)
+		off += 4
+		h = json.loads(data[off : off + hlen].decode("utf-8"))
+		off += hlen
+		acc = cls(cap=int(h.get("cap") or 0) or None)
+		acc.n = int(h.get("n") or 0)
+		acc.mean = float(h.get("mean") or 0.0)
+		acc.m2 = float(h.get("m2") or 0.0)
+		nc = list(h.get("norm_counts") or [])
+		acc.norm_counts = nc if len(nc) == _NORM_BINS else [0] * _NORM_BINS
+		cc = list(h.get("cos_counts") or [])
+		acc.cos_counts = cc if len(cc) == _COS_BINS else [0] * _COS_BINS
+		acc.cos_seen = int(h.get("cos_seen") or 0)
+		acc.seen = int(h.get("seen") or 0)
+		acc.dim = int(h.get("dim") or 0)
+		acc.baseline = dict(h.get("baseline") or {})
+		acc.updated_at = str(h.get("updated_at") or "")
+		rows = int(h.get("rows") or 0)
+		if rows and acc.dim:
+			body = data[off : off + rows * acc.dim * 4]
+			if np is not None:
+				acc.reservoir = np.frombuffer(body, dtype="<f4").astype(np.float32).reshape(rows, acc.dim)
+			else:
+				flat = array.array("f")
+				flat.frombytes(body)
+				if sys.byteorder != "little":  # pragma: no cover
+					flat.byteswap()
+				acc.reservoir = [flat[i * acc.dim : (i + 1) * acc.dim] for i in range(rows)]
+		return acc
+
+	@classmethod
+	def from_legacy(cls, state: Dict[str, Any]) -> "DriftAccumulator":
+		"""Seed from the old <ns>.hist.json layout (norm window, counts, baseline)."""
+		acc = cls()
+		for norm in state.get("norms") or []:
+			try:
+				v = float(norm)
+			except Exception:
+				continue
+			acc.n += 1
+			d = v - acc.mean
+			acc.mean += d / acc.n
+			acc.m2 += d * (v - acc.mean)
+			acc.norm_counts[_norm_bin(v)] += 1
+		cc = list(state.get("cos_counts") or [])
+		if len(cc) == _COS_BINS:
+			acc.cos_counts = [int(c) for c in cc]
+			acc.cos_seen = int(state.get("cos_seen") or sum(acc.cos_counts))
+		for vec in state.get("_reservoir") or []:
+			if isinstance(vec, list) and vec and (not acc.dim or len(vec) == acc.dim):
+				acc.dim = acc.dim or len(vec)
+				if acc._rows() < acc.cap:
+					acc._append_row(np.asarray(vec, dtype=np.float32) if np is not None else array.array("f", vec))
+		acc.seen = max(acc._rows(), acc.n)
+		acc.baseline = dict(state.get("baseline") or {})
+		acc.updated_at = str(state.get("updated_at") or "")
+		return acc
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Process-level state per namespace, flushed to <ns>.drift with atomic rename
 # ──────────────────────────────────────────────────────────────────────────────
 
 
 _LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
 
 
 def _ns_lock(ns: str) -> threading.Lock:
-	lock = _LOCKS.get(ns)
-	if lock is None:
-		lock = threading.Lock()
-		_LOCKS[ns] = lock
-	return lock
+	with _LOCKS_GUARD:
+		lock = _LOCKS.get(ns)
+		if lock is None:
+			lock = threading.Lock()
+			_LOCKS[ns] = lock
+		return lock
+
+
+class _NsState:
+	__slots__ = ("state_dir", "view", "delta", "last_flush", "last_emit_ts")
+
+	def __init__(self, state_dir: Path, view: DriftAccumulator) -> None:
+		self.state_dir = state_dir
+		self.view = view  # on-disk state at last flush + local samples since
+		self.delta = DriftAccumulator(cap=view.cap)  # local samples since last flush
+		self.last_flush = time.monotonic()
+		self.last_emit_ts = 0.0
+
+
+_STATES: Dict[str, _NsState] = {}
 
 
-def _state_path(ns: str) -> Path:
-	DRIFT_DIR.mkdir(parents=True, exist_ok=True)
-	return DRIFT_DIR / f"{ns}.hist.json"
+def _state_dir() -> Path:
+	return Path(os.getenv("DRIFT_STATE_DIR") or DRIFT_DIR)
 
 
-def _load_state(ns: str) -> Dict[str, Any]:
-	path = _state_path(ns)
+def _state_path(ns: str, state_dir: Optional[Path] = None) -> Path:
+	d = state_dir or _state_dir()
+	d.mkdir(parents=True, exist_ok=True)
+	return d / f"{ns}.drift"
+
+
+def load_accumulator(ns: str, state_dir: Optional[Path] = None) -> DriftAccumulator:
+	"""Read the flushed accumulator for `ns` (legacy <ns>.hist.json state is migrated on read)."""
 	try:
+		path = _state_path(ns, state_dir)
 		if path.exists():
-			with open(path, "r") as f:
-				return json.load(f) or {}
+			return DriftAccumulator.from_bytes(path.read_bytes())
+		legacy = path.with_name(f"{ns}.hist.json")
+		if legacy.exists():
+			with open(legacy, "r") as f:
+				return DriftAccumulator.from_legacy(json.load(f) or {})
 	except Exception:
-		return {}
-	return {}
+		pass
+	return DriftAccumulator()
+
 
+def _write_atomic(path: Path, data: bytes) -> None:
+	tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+	with open(tmp, "wb") as f:
+		f.write(data)
+		f.flush()
+		os.fsync(f.fileno())
+	os.replace(tmp, path)
 
-def _save_state(ns: str, state: Dict[str, Any]) -> None:
+
+def _flush_locked(ns: str, st: _NsState) -> None:
+	"""Merge this process's delta into the on-disk state (cross-process safe)."""
+	path = _state_path(ns, st.state_dir)
+	lock_f = None
 	try:
-		with open(_state_path(ns), "w") as f:
-			json.dump(state, f)
-	except Exception:
-		pass
+		if fcntl is not None:
+			lock_f = open(path.with_name(path.name + ".lock"), "a+")
+			fcntl.flock(lock_f.fileno(), fcntl.LOCK_EX)
+		merged = load_accumulator(ns, st.state_dir).merge(st.delta)
+		merged.maybe_set_baseline()
+		_write_atomic(path, merged.to_bytes())
+		st.view = merged
+		st.delta = DriftAccumulator(cap=merged.cap)
+	finally:
+		if lock_f is not None:
+			try:
+				fcntl.flock(lock_f.fileno(), fcntl.LOCK_UN)
+			finally:
+				lock_f.close()
+		st.last_flush = time.monotonic()
+
+
+def _get_state(ns: str) -> _NsState:
+	st = _STATES.get(ns)
+	if st is None:
+		state_dir = _state_dir()
+		st = _NsState(state_dir, load_accumulator(ns, state_dir))
+		_STATES[ns] = st
+	return st
+
+
+def flush(ns: Optional[str] = None) -> None:
+	"""Flush one namespace (or all) to disk now; fail-closed."""
+	for name in [ns] if ns else list(_STATES):
+		st = _STATES.get(name)
+		if st is None or st.delta.empty():
+			continue
+		with _ns_lock(name):
+			try:
+				_flush_locked(name, st)
+			except Exception:
+				pass
+
+
+atexit.register(flush)
 
 
 def _now_iso() -> str:
@@ -246,11 +638,12 @@ def _now_iso() -> str:
 
 
 def record_vector_sample(ns: str, vector: List[float]) -> None:
-	"""Record a single vector into rolling drift state (fail-closed).
+	"""Record a single vector into the process-level drift accumulator (fail-closed).
 
-	- Tracks last DRIFT_WINDOW_DOCS norms (for mean/p95 computation)
-	- Maintains a small ring buffer of recent vectors to create cosine pairs
-	- Updates cosine histogram counts incrementally
+	- Updates running norm mean/variance and the norm histogram
+	- Pairs the vector with one reservoir member to update the cosine histogram
+	- Flushes to <DRIFT_STATE_DIR>/<ns>.drift every DRIFT_FLUSH_EVERY samples or
+	  DRIFT_FLUSH_SEC seconds, merging with whatever other processes flushed
 	"""
 	if not RETRIEVAL_DRIFT_ENABLED:
 		return
@@ -258,125 +651,72 @@ def record_vector_sample(ns: str, vector: List[float]) -> None:
 		return
 	lock = _ns_lock(ns)
 	with lock:
-		state = _load_state(ns)
-		# Norms buffer (bounded)
-		norms = state.get("norms") or []
-		if not isinstance(norms, list):
-			norms = []
-		# Compute norm quickly
 		try:
-			norm_val = math.sqrt(sum((v or 0.0) * (v or 0.0) for v in vector))
+			st = _get_state(ns)
+			st.view.add(vector)
+			st.view.maybe_set_baseline()
+			st.delta.add(vector)
+			due = st.delta.seen >= DRIFT_FLUSH_EVERY or (time.monotonic() - st.last_flush) >= DRIFT_FLUSH_SEC
+			if due:
+				_flush_locked(ns, st)
 		except Exception:
-			norm_val = 0.0
-		norms.append(float(norm_val))
-		if len(norms) > DRIFT_WINDOW_DOCS:
-			norms = norms[-DRIFT_WINDOW_DOCS:]
-		state["norms"] = norms
-		# Vector reservoir for cosine pairing
-		reservoir = state.get("_reservoir") or []
-		if not isinstance(reservoir, list):
-			reservoir = []
-		# Keep small reservoir (sqrt of window, min 50, max 500)
-		cap = max(50, min(500, int(math.sqrt(DRIFT_WINDOW_DOCS))))
-		if len(reservoir) < cap:
-			reservoir.append(vector)
-		else:
-			# Reservoir sampling: replace with probability cap/seen (approx via random idx)
-			idx = random.randint(0, cap - 1)
-			reservoir[idx] = vector
-		state["_reservoir"] = reservoir
-		# Update cosine histogram counts using one random pair
-		bins = int(state.get("bins") or 21)
-		if bins <= 1:
-			bins = 21
-		counts = state.get("cos_counts") or [0] * bins
-		if len(counts) != bins:
-			counts = [0] * bins
-		if len(reservoir) >= 2:
-			try:
-				other = reservoir[random.randint(0, len(reservoir) - 2)]
-				c = _cosine(vector, other)
-				pos = int((c + 1.0) / 2.0 * (bins - 1))
-				pos = max(0, min(bins - 1, pos))
-				counts[pos] += 1
-				state["cos_counts"] = counts
-				state["cos_seen"] = int(state.get("cos_seen") or 0) + 1
-			except Exception:
-				pass
-		# Initialize baseline snapshot if missing and we have some data
-		if not state.get("baseline") and len(norms) >= min(200, DRIFT_WINDOW_DOCS // 10):
-			# Take a conservative early baseline
-			try:
-				p = [float(c) / float(max(1, sum(counts))) for c in counts]
-				state["baseline"] = {
-					"cos_hist": p,
-					"created_at": _now_iso(),
-				}
-			except Exception:
-				state["baseline"] = {"cos_hist": [0.0] * bins, "created_at": _now_iso()}
-		state["updated_at"] = _now_iso()
-		_save_state(ns, state)
+			pass
 
 
 def maybe_emit_drift(ns: str) -> None:
 	"""Compute and emit drift if enough data and throttled by a local timer.
 
-	This function reads the local state, compares current histogram to baseline,
-	and emits a Cockpit signal with KL and cosine_shift. Emission is throttled to
-	once every ~5 minutes per namespace.
+	Compares the in-memory cosine histogram to the baseline and emits a Cockpit
+	signal with KL and cosine_shift. Emission is throttled to once every ~5
+	minutes per namespace; no state file is read or written.
 	"""
 	if not RETRIEVAL_DRIFT_ENABLED:
 		return
 	lock = _ns_lock(ns)
 	with lock:
-		state = _load_state(ns)
-		if not state:
-			return
-		last_emit_ts = float(state.get("_last_emit_ts") or 0.0)
+		st = _get_state(ns)
 		now = time.time()
-		if now - last_emit_ts < 300.0:  # 5 minutes
+		if now - st.last_emit_ts < 300.0:  # 5 minutes
 			return
-		counts: List[int] = state.get("cos_counts") or []
-		if not counts or sum(counts) <= 0:
+		acc = st.view
+		if sum(acc.cos_counts) <= 0:
 			return
-		curr = [float(c) / float(max(1, sum(counts))) for c in counts]
-		baseline = (state.get("baseline") or {}).get("cos_hist") or []
+		baseline = (acc.baseline or {}).get("cos_hist") or []
 		if not baseline:
 			return
+		curr = acc.cos_hist()
 		kl = kl_divergence(baseline, curr)
 		shift = compute_cosine_shift(baseline, curr)
 		emit_drift(ns, kl, shift)
-		state["_last_emit_ts"] = now
-		_save_state(ns, state)
+		st.last_emit_ts = now
 
 
 def snapshot_stats(ns: str) -> Dict[str, Any]:
 	"""Return current stats summary for diagnostics/tests (no I/O except read)."""
-	state = _load_state(ns)
 	try:
-		norms = state.get("norms") or []
-		stats = sample_vector_norms([[n] for n in norms])
-		counts = state.get("cos_counts") or []
-		p = [float(c) / float(max(1, sum(counts))) for c in counts] if counts else []
-		b = (state.get("baseline") or {}).get("cos_hist") or []
-		return {
-			"stats": stats,
-			"cos_hist": p,
-			"baseline": b,
-		}
+		with _ns_lock(ns):
+			st = _STATES.get(ns)
+			acc = st.view if st is not None else load_accumulator(ns)
+			return {
+				"stats": acc.norm_stats(),
+				"cos_hist": acc.cos_hist() if sum(acc.cos_counts) else [],
+				"baseline": (acc.baseline or {}).get("cos_hist") or [],
+			}
 	except Exception:
 		return {"stats": {"mean": 0.0, "p95": 0.0, "n": 0}, "cos_hist": [], "baseline": []}
 
 
 __all__ = [
+	"DriftAccumulator",
 	"sample_vector_norms",
 	"cosine_histogram",
 	"kl_divergence",
 	"compute_cosine_shift",
 	"emit_embedding_stats",
 	"emit_drift",
+	"flush",
+	"load_accumulator",
 	"record_vector_sample",
 	"maybe_emit_drift",
 	"snapshot_stats",
 ]
-
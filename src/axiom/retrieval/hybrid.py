@@ -15,23 +15,64 @@ HYBRID_WEIGHTS = {
 	"lexical": float((os.getenv("HYBRID_WEIGHTS_LEXICAL", "0.3")).strip() or "0.3"),
 	"dense": float((os.getenv("HYBRID_WEIGHTS_DENSE", "0.7")).strip() or "0.7"),
 }
+# Reciprocal Rank Fusion constant (Cormack et al. use 60)
+HYBRID_RRF_K = max(1, int((os.getenv("HYBRID_RRF_K", "60")).strip() or "60"))
 
 
 async def bm25_search(query: str, k: int) -> List[Dict[str, Any]]:
-	# Minimal lexical search placeholder; integrate proper BM25 if available later
-	from pods.vector.vector_adapter import VectorAdapter  # reuse qdrant text filter if any
-	va = VectorAdapter()
-	# No true BM25 available; return empty for now (fail-closed)
-	return []
-
-
-	async def dense_search(query: str, k: int) -> List[Dict[str, Any]]:
-		# Delegate to existing vector recall path to avoid code duplication
-		import memory_response_pipeline  # type: ignore
-		try:
-			return await memory_response_pipeline.fetch_vector_hits(query, top_k=k)
-		except Exception:
+	# Served from the local BM25 index (AXIOM_BM25_INDEX_DIR); hits carry stored
+	# content/tags so no vector round-trip is needed. Disabled index → [] (fail-closed).
+	from .bm25_index import get_index
+
+	try:
+		index = get_index()
+		if index is None:
 			return []
+		return index.search(query, k)
+	except Exception:
+		return []
+
+
+async def dense_search(query: str, k: int) -> List[Dict[str, Any]]:
+	# Delegate to existing vector recall path to avoid code duplication
+	import memory_response_pipeline  # type: ignore
+	try:
+		return await memory_response_pipeline.fetch_vector_hits(query, top_k=k)
+	except Exception:
+		return []
+
+
+def _key(it: Dict[str, Any]) -> Any:
+	return it.get("id") or it.get("uuid") or it.get("content")
+
+
+def rrf_fuse(
+	ranked: List[Tuple[str, List[Dict[str, Any]]]],
+	weights: Dict[str, float],
+	k: int,
+	rrf_k: int = HYBRID_RRF_K,
+) -> List[Dict[str, Any]]:
+	"""Weighted Reciprocal Rank Fusion: score = sum_w w / (rrf_k + rank)."""
+	fused: Dict[Any, Dict[str, Any]] = {}
+	for source, items in ranked:
+		w = float(weights.get(source, 1.0))
+		for rank, it in enumerate(items, start=1):
+			key = _key(it)
+			if key is None:
+				continue
+			contrib = w / (rrf_k + rank)
+			cur = fused.get(key)
+			if cur is None:
+				fused[key] = {**it, "_source": source, "_score": contrib, "_ranks": {source: rank}}
+			else:
+				# Keep the dense payload when both lists return the same memory
+				if source == "dense":
+					cur = {**cur, **it, "_score": cur["_score"], "_ranks": cur["_ranks"]}
+					fused[key] = cur
+				cur["_score"] += contrib
+				cur["_ranks"][source] = rank
+				cur["_source"] = "hybrid"
+	return sorted(fused.values(), key=lambda x: x.get("_score", 0.0), reverse=True)[:k]
 
 
 async def search_hybrid(query: str, k: int, weights: Dict[str, float] | None = None) -> List[Dict[str, Any]]:
@@ -42,17 +83,4 @@ async def search_hybrid(query: str, k: int, weights: Dict[str, float] | None = N
 	k_dense = max(1, int(os.getenv("HYBRID_K_DENSE", "16")))
 	lex = await bm25_search(query, k_lex)
 	dense = await dense_search(query, k_dense)
-	# Simple union with naive score normalization
-	seen = {}
-	for it in lex:
-		key = it.get("id") or it.get("uuid") or it.get("content")
-		if key not in seen:
-			seen[key] = {**it, "_source": "lex", "_score": w.get("lexical", 0.3)}
-	for it in dense:
-		key = it.get("id") or it.get("uuid") or it.get("content")
-		if key in seen:
-			seen[key]["_score"] = seen[key].get("_score", 0.0) + w.get("dense", 0.7)
-			seen[key]["_source"] = "hybrid"
-		else:
-			seen[key] = {**it, "_source": "dense", "_score": w.get("dense", 0.7)}
-	return sorted(seen.values(), key=lambda x: x.get("_score", 0.0), reverse=True)[:k]
\ No newline at end of file
+	return rrf_fuse([("lexical", lex), ("dense", dense)], w, k)
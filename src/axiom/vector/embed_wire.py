@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Binary wire format for embedding vectors (/embed).
+
+JSON remains the default. A client that sends
+``Accept: application/x-axiom-vectors; dtype=float32`` (or ``float16``) gets a packed
+little-endian buffer instead:
+
+    offset  size  field
+    0       4     magic  b"AXVE"
+    4       1     version (1)
+    5       1     dtype code (1 = float32, 2 = float16)
+    6       2     reserved (0)
+    8       4     rows   (uint32)
+    12      4     dims   (uint32)
+    16      ...   rows * dims values, row-major
+
+With NumPy installed the body is decoded zero-copy via ``numpy.frombuffer`` into a
+read-only (rows, dims) float32/float16 matrix; otherwise into lists via ``array``/``struct``.
+Callers that hand the matrix outside the client (the SentenceTransformer-style
+``encode`` shims) take a writable copy with ``owned_vectors``.
+
+Clients pick the wire via AXIOM_EMBEDDING_WIRE = float32 (default) | float16 | json.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from array import array
+from typing import Any, List, Optional, Sequence
+
+try:  # optional fast path
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover - numpy-less environments
+    _np = None  # type: ignore
+
+MEDIA_TYPE = "application/x-axiom-vectors"
+_MAGIC = b"AXVE"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBHII")
+_DTYPES = {"float32": 1, "float16": 2}
+_CODES = {v: k for k, v in _DTYPES.items()}
+_ITEMSIZE = {"float32": 4, "float16": 2}
+
+
+class WireFormatError(ValueError):
+    pass
+
+
+def client_dtype(env: Optional[dict] = None) -> Optional[str]:
+    """Preferred binary dtype for clients, or None to stay on JSON."""
+    raw = ((env if env is not None else os.environ).get("AXIOM_EMBEDDING_WIRE") or "float32")
+    v = str(raw).strip().lower()
+    return v if v in _DTYPES else None
+
+
+def accept_header(dtype: Optional[str]) -> str:
+    """Accept header advertising the binary format with JSON as fallback."""
+    if not dtype:
+        return "application/json"
+    return f"{MEDIA_TYPE}; dtype={dtype}, application/json;q=0.5"
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """Return the binary dtype requested by an Accept header, or None for JSON."""
+    for part in str(accept or "").split(","):
+        fields = [f.strip() for f in part.split(";")]
+        if not fields or fields[0].lower() != MEDIA_TYPE:
+            continue
+        dtype = "float32"
+        for f in fields[1:]:
+            k, _, v = f.partition("=")
+            if k.strip().lower() == "dtype" and v.strip().lower() in _DTYPES:
+                dtype = v.strip().lower()
+        return dtype
+    return None
+
+
+def content_type(dtype: str) -> str:
+    return f"{MEDIA_TYPE}; dtype={dtype}"
+
+
+def encode_vectors(vectors: Sequence[Sequence[float]], dtype: str = "float32") -> bytes:
+    if dtype not in _DTYPES:
+        raise WireFormatError(f"unsupported_dtype: {dtype}")
+    rows = len(vectors)
+    dims = len(vectors[0]) if rows else 0
+    header = _HEADER.pack(_MAGIC, _VERSION, _DTYPES[dtype], 0, rows, dims)
+    if not rows:
+        return header
+    if _np is not None:
+        try:
+            mat = _np.asarray(vectors, dtype=("<f4" if dtype == "float32" else "<f2"))
+        except ValueError as e:
+            raise WireFormatError("ragged_vectors") from e
+        if mat.shape != (rows, dims):
+            raise WireFormatError("ragged_vectors")
+        return header + mat.tobytes()
+    flat: List[float] = []
+    for v in vectors:
+        if len(v) != dims:
+            raise WireFormatError("ragged_vectors")
+        flat.extend(float(x) for x in v)
+    if dtype == "float16":
+        return header + struct.pack(f"<{len(flat)}e", *flat)
+    arr = array("f", flat)
+    if sys.byteorder != "little":  # pragma: no cover
+        arr.byteswap()
+    return header + arr.tobytes()
+
+
+def decode_vectors(buf: bytes) -> Any:
+    """Decode a packed body into a (rows, dims) matrix (ndarray with NumPy, else lists)."""
+    if len(buf) < _HEADER.size:
+        raise WireFormatError("short_header")
+    magic, version, code, _reserved, rows, dims = _HEADER.unpack_from(buf, 0)
+    if magic != _MAGIC or version != _VERSION or code not in _CODES:
+        raise WireFormatError("bad_header")
+    dtype = _CODES[code]
+    count = rows * dims
+    if len(buf) != _HEADER.size + count * _ITEMSIZE[dtype]:
+        raise WireFormatError("length_mismatch")
+    if _np is not None:
+        mat = _np.frombuffer(buf, dtype=("<f4" if dtype == "float32" else "<f2"), count=count, offset=_HEADER.size)
+        return mat.reshape(rows, dims)
+    body = memoryview(buf)[_HEADER.size :]
+    if dtype == "float16":
+        flat = list(struct.unpack(f"<{count}e", body))
+    else:
+        arr = array("f")
+        arr.frombytes(body)
+        if sys.byteorder != "little":  # pragma: no cover
+            arr.byteswap()
+        flat = arr.tolist()
+    return [flat[i * dims : (i + 1) * dims] for i in range(rows)]
+
+
+def vectors_from_response(resp: Any) -> Any:
+    """Vectors from a requests-style /embed response in either wire format.
+
+    Returns the decoded matrix for binary bodies and the JSON ``vectors`` list otherwise.
+    """
+    ctype = ""
+    try:
+        ctype = str(resp.headers.get("Content-Type") or "")
+    except Exception:
+        ctype = ""
+    if ctype.split(";", 1)[0].strip().lower() == MEDIA_TYPE:
+        return decode_vectors(resp.content)
+    data = resp.json() or {}
+    return data.get("vectors")
+
+
+def owned_vectors(vecs: Any) -> Any:
+    """Writable copy of a decoded matrix for code outside the embedding clients.
+
+    ``decode_vectors`` returns a read-only view over the response body; the compat
+    ``encode`` shims hand results to callers that may mutate them in place (e.g.
+    normalising), so they copy here. Lists are already private to the caller.
+    """
+    if _np is not None and isinstance(vecs, _np.ndarray):
+        return vecs.copy()
+    return vecs
+
+
+__all__ = [
+    "MEDIA_TYPE",
+    "WireFormatError",
+    "accept_header",
+    "client_dtype",
+    "content_type",
+    "decode_vectors",
+    "encode_vectors",
+    "negotiate",
+    "owned_vectors",
+    "vectors_from_response",
+]
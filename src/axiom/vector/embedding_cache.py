@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Query embedding cache
+─────────────────────
+
+Bounded cache for query vectors, keyed by (model name, normalized text).
+
+- In-memory LRU tier with a byte budget (not an entry count) and a TTL.
+- Optional on-disk tier (SQLite) so warm restarts keep previously seen queries.
+- Hit/miss/eviction counters go through `observability.metrics` when available.
+
+Environment:
+- AXIOM_EMBED_CACHE_ENABLED   (default: true)
+- AXIOM_EMBED_CACHE_MAX_BYTES (default: 16 MiB)
+- AXIOM_EMBED_CACHE_TTL_SEC   (default: 3600; <= 0 disables expiry)
+- AXIOM_EMBED_CACHE_PATH      (optional SQLite file for the persistent tier)
+
+Vectors are stored as packed float64 so cached results are bit-identical to the
+original encoder output.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+_DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+_DEFAULT_TTL_SEC = 3600.0
+# Rough per-entry bookkeeping overhead (OrderedDict node, tuple, floats)
+_ENTRY_OVERHEAD = 96
+
+
+def _env_truthy(env: Dict[str, str], name: str, default: bool) -> bool:
+    v = env.get(name)
+    if v is None or str(v).strip() == "":
+        return bool(default)
+    return str(v).strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def _metric(name: str) -> None:
+    with contextlib.suppress(Exception):
+        from observability import metrics as _m  # type: ignore
+
+        _m.inc(name)
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys: NFC, trimmed, whitespace collapsed."""
+    s = unicodedata.normalize("NFC", str(text or ""))
+    return " ".join(s.split())
+
+
+class EmbeddingCache:
+    """Thread-safe LRU + TTL cache of embedding vectors with an optional disk tier."""
+
+    def __init__(
+        self,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        ttl_sec: float = _DEFAULT_TTL_SEC,
+        path: Optional[str] = None,
+    ):
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_sec = float(ttl_sec)
+        self.path = path or None
+        self._lock = threading.Lock()
+        # key -> (expires_at, packed vector, size in bytes)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, array, int]]" = OrderedDict()
+        self._bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path:
+            self._open_disk()
+
+    # ── Public API ─────────────────────────────────────────────
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = (str(model or ""), normalize_text(text))
+        now = time.time()
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None:
+                expires_at, vec, size = ent
+                if expires_at and expires_at <= now:
+                    self._drop(key)
+                else:
+                    self._entries.move_to_end(key)
+                    _metric("vector.embed_cache.hit")
+                    return vec.tolist()
+            disk = self._disk_get(key, now)
+            if disk is not None:
+                expires_at, vec = disk
+                self._put(key, vec, expires_at)
+                _metric("vector.embed_cache.hit")
+                _metric("vector.embed_cache.disk_hit")
+                return vec.tolist()
+        _metric("vector.embed_cache.miss")
+        return None
+
+    def put(self, model: str, text: str, vector: Any) -> None:
+        key = (str(model or ""), normalize_text(text))
+        try:
+            vec = array("d", (float(x) for x in vector))
+        except Exception:
+            return
+        if not vec:
+            return
+        expires_at = (time.time() + self.ttl_sec) if self.ttl_sec > 0 else 0.0
+        with self._lock:
+            self._put(key, vec, expires_at)
+            self._disk_put(key, vec, expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._db is not None:
+                with contextlib.suppress(Exception):
+                    self._db.execute("DELETE FROM embed_cache")
+                    self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_sec": self.ttl_sec,
+                "persistent": self._db is not None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                with contextlib.suppress(Exception):
+                    self._db.close()
+                self._db = None
+
+    # ── Memory tier (caller holds the lock) ────────────────────
+    def _put(self, key: Tuple[str, str], vec: array, expires_at: float) -> None:
+        size = vec.itemsize * len(vec) + len(key[0]) + len(key[1]) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (expires_at, vec, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            old_key = next(iter(self._entries))
+            self._drop(old_key)
+            _metric("vector.embed_cache.evict")
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        ent = self._entries.pop(key, None)
+        if ent is not None:
+            self._bytes -= ent[2]
+
+    # ── Disk tier (caller holds the lock) ──────────────────────
+    def _open_disk(self) -> None:
+        try:
+            parent = os.path.dirname(os.path.abspath(self.path or ""))
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            db = sqlite3.connect(self.path or "", check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embed_cache ("
+                " model TEXT NOT NULL, text TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, vec BLOB NOT NULL,"
+                " PRIMARY KEY (model, text))"
+            )
+            db.execute(
+                "DELETE FROM embed_cache WHERE expires_at > 0 AND expires_at <= ?",
+                (time.time(),),
+            )
+            db.commit()
+            self._db = db
+        except Exception:
+            self._db = None
+
+    def _disk_get(self, key: Tuple[str, str], now: float) -> Optional[Tuple[float, array]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT expires_at, vec FROM embed_cache WHERE model = ? AND text = ?", key
+            ).fetchone()
+        except Exception:
+            return None
+        if not row:
+            return None
+        expires_at, blob = float(row[0] or 0.0), row[1]
+        if expires_at and expires_at <= now:
+            with contextlib.suppress(Exception):
+                self._db.execute("DELETE FROM embed_cache WHERE model = ? AND text = ?", key)
+                self._db.commit()
+            return None
+        vec = array("d")
+        try:
+            vec.frombytes(bytes(blob))
+        except Exception:
+            return None
+        return expires_at, vec
+
+    def _disk_put(self, key: Tuple[str, str], vec: array, expires_at: float) -> None:
+        if self._db is None:
+            return
+        with contextlib.suppress(Exception):
+            self._db.execute(
+                "INSERT OR REPLACE INTO embed_cache (model, text, expires_at, vec) VALUES (?, ?, ?, ?)",
+                (key[0], key[1], float(expires_at), sqlite3.Binary(vec.tobytes())),
+            )
+            self._db.commit()
+
+
+_SHARED: Dict[Tuple[int, float, str], EmbeddingCache] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def cache_from_env(env: Dict[str, str]) -> Optional[EmbeddingCache]:
+    """Return the process-wide cache for this configuration, or None when disabled.
+
+    Clients are often constructed per call, so instances with the same settings
+    share one cache rather than each starting cold.
+    """
+    env = env or {}
+    if not _env_truthy(env, "AXIOM_EMBED_CACHE_ENABLED", True):
+        return None
+    try:
+        max_bytes = int(str(env.get("AXIOM_EMBED_CACHE_MAX_BYTES", "") or _DEFAULT_MAX_BYTES).strip())
+    except Exception:
+        max_bytes = _DEFAULT_MAX_BYTES
+    try:
+        ttl_sec = float(str(env.get("AXIOM_EMBED_CACHE_TTL_SEC", "") or _DEFAULT_TTL_SEC).strip())
+    except Exception:
+        ttl_sec = _DEFAULT_TTL_SEC
+    if max_bytes <= 0:
+        return None
+    path = str(env.get("AXIOM_EMBED_CACHE_PATH", "") or "").strip()
+    cfg = (max_bytes, ttl_sec, path)
+    with _SHARED_LOCK:
+        cache = _SHARED.get(cfg)
+        if cache is None:
+            cache = EmbeddingCache(max_bytes=max_bytes, ttl_sec=ttl_sec, path=path or None)
+            _SHARED[cfg] = cache
+        return cache
+
+
+__all__ = ["EmbeddingCache", "cache_from_env", "normalize_text"]
@@ -161,12 +161,16 @@ def top1_fallback(hits: Sequence[RecallHit]) -> List[RecallHit]:
 _TOKEN_RE = re.compile(r"\w+", re.UNICODE)
 
 
-def _tokenize(text: str) -> List[str]:
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; shared by keyword_boost and the BM25 index."""
     if not text:
         return []
     return [t.lower() for t in _TOKEN_RE.findall(text.lower())]
 
 
+_tokenize = tokenize
+
+
 def keyword_boost(
     hits: Sequence[RecallHit],
     query: str,
@@ -63,6 +63,14 @@ def _env_truthy(env: Dict[str, str], name: str, default: bool = False) -> bool:
     return str(v).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+def _env_int(env: Dict[str, str], name: str, default: int) -> int:
+    try:
+        v = int(str(env.get(name, "") or default).strip())
+    except Exception:
+        return int(default)
+    return v if v > 0 else int(default)
+
+
 @dataclass
 class VectorSearchRequest:
     query: str
@@ -168,6 +176,14 @@ class UnifiedVectorClient:
         # Qdrant direct client (lazy)
         self._qdr_client = None
 
+        # Query-embedding cache (shared per process; None when disabled)
+        try:
+            from vector.embedding_cache import cache_from_env as _cache_from_env
+
+            self._embed_cache = _cache_from_env(self._env)
+        except Exception:  # pragma: no cover - cache is best-effort
+            self._embed_cache = None
+
         # Resiliency controls
         self._cb_fail_count: int = 0
         self._cb_open_until: float = 0.0
@@ -178,6 +194,10 @@ class UnifiedVectorClient:
         self._cb_threshold: int = 3
         self._cb_open_seconds: float = 20.0
 
+        # Insert batching: texts per encode() call and points per upsert call
+        self._embed_batch_size: int = _env_int(env, "AXIOM_VECTOR_EMBED_BATCH", 64)
+        self._upsert_batch_size: int = _env_int(env, "AXIOM_VECTOR_UPSERT_BATCH", 256)
+
         # Optional Qdrant score threshold (unset by default → no server-side filtering)
         _thr_raw = str(env.get("AXIOM_VECTOR_SCORE_THRESHOLD", "")).strip()
         try:
@@ -270,8 +290,15 @@ class UnifiedVectorClient:
         if self._embedding_url:
             import requests
 
+            try:
+                from vector import embed_wire as _wire
+            except Exception:  # pragma: no cover - JSON wire only
+                _wire = None  # type: ignore
+            wire_dtype = _wire.client_dtype(self._env) if _wire else None
+
             class _RemoteEmbedderCompat:
                 def __init__(self, base: str, model: str, timeout_sec: float):
+                    self._wire_dtype = wire_dtype
                     self._base = str(base).strip().rstrip("/")
                     self._model = str(model or "").strip() or "BAAI/bge-small-en-v1.5"
                     try:
@@ -289,12 +316,16 @@ class UnifiedVectorClient:
                     if not batch:
                         return [] if not single else []
                     payload = {"texts": batch, "model": self._model}
-                    r = requests.post(f"{self._base}/embed", json=payload, timeout=self._timeout)
+                    headers = {"Accept": _wire.accept_header(self._wire_dtype)} if _wire else None
+                    r = requests.post(f"{self._base}/embed", json=payload, timeout=self._timeout, headers=headers)
                     r.raise_for_status()
-                    data = r.json() or {}
-                    vecs = data.get("vectors") or []
-                    if not isinstance(vecs, list) or len(vecs) != len(batch):
+                    # Binary wire decodes into a (rows, dims) matrix, like SentenceTransformer.encode; copied
+                    # below so callers never see the read-only view over the response body
+                    vecs = _wire.vectors_from_response(r) if _wire else (r.json() or {}).get("vectors")
+                    if vecs is None or isinstance(vecs, (str, dict)) or len(vecs) != len(batch):
                         raise RuntimeError("embeddings_invalid_response")
+                    if _wire:
+                        vecs = _wire.owned_vectors(vecs)
                     return vecs[0] if single else vecs
 
             timeout_sec = float(self._env.get("AXIOM_EMBEDDING_TIMEOUT_SEC", "12") or 12)
@@ -313,6 +344,23 @@ class UnifiedVectorClient:
         self._embedder = _SentenceTransformer(self._embed_model_name)
         return self._embedder
 
+    def _embed_query(self, embedder, text: str) -> List[float]:
+        """Encode a query, consulting the embedding cache first."""
+        cache = getattr(self, "_embed_cache", None)
+        if cache is not None:
+            cached = cache.get(self._embed_model_name, text)
+            if cached is not None:
+                return cached
+        # Build query vector (support numpy arrays and plain lists)
+        qv_raw = embedder.encode(text, normalize_embeddings=True)
+        try:
+            qv = qv_raw.tolist()  # type: ignore[union-attr]
+        except Exception:
+            qv = list(qv_raw or [])
+        if cache is not None and qv:
+            cache.put(self._embed_model_name, text, qv)
+        return qv
+
     def _get_qdrant(self):
         if self._qdr_client is not None:
             return self._qdr_client
@@ -629,12 +677,7 @@ class UnifiedVectorClient:
         except Exception:
             pass
 
-        # Build query vector (support numpy arrays and plain lists)
-        qv_raw = embedder.encode(req.query, normalize_embeddings=True)
-        try:
-            qv = qv_raw.tolist()  # type: ignore[union-attr]
-        except Exception:
-            qv = list(qv_raw or [])
+        qv = self._embed_query(embedder, req.query)
 
         def _qdrant_dense_search_points(
             *,
@@ -835,12 +878,7 @@ class UnifiedVectorClient:
         return VectorSearchResponse(hits=[])
 
     def _insert_via_qdrant(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
-        # Use axiom_qdrant_client wrapper for convenience
-        try:
-            from axiom_qdrant_client import QdrantClient as AxiomQdrantClient  # type: ignore
-        except Exception as e:  # pragma: no cover
-            return {"inserted": 0}
-
+        _lazy_imports()
         try:
             from uuid import uuid4
         except Exception:  # pragma: no cover
@@ -862,61 +900,122 @@ class UnifiedVectorClient:
         except Exception:
             pass
 
+        # Use axiom_qdrant_client wrapper for convenience; fall back to the direct client
         try:
-            ax = AxiomQdrantClient(url=self._qdrant_url)
-        except TypeError:
-            ax = AxiomQdrantClient(host=self.qdrant_host, port=self.qdrant_port)
+            from axiom_qdrant_client import QdrantClient as AxiomQdrantClient  # type: ignore
+
+            try:
+                ax = AxiomQdrantClient(url=self._qdrant_url)
+            except TypeError:
+                ax = AxiomQdrantClient(host=self.qdrant_host, port=self.qdrant_port)
+        except Exception:
+            try:
+                ax = self._get_qdrant()
+            except Exception:  # pragma: no cover
+                return {"inserted": 0}
         embedder = self._get_embedder()
-        inserted = 0
-        # Single upsert path with 3 attempts per item (keeps behavior identical otherwise)
+
+        # (point id, content, payload) for every non-empty item, in input order
+        pending: List[Tuple[str, str, Dict[str, Any]]] = []
         for it in items:
             try:
                 content = (it.get("content") or "").strip()
                 meta = it.get("metadata", {}) or {}
-                if not content:
-                    continue
-                vec = embedder.encode(content, normalize_embeddings=True).tolist()
-                pid = meta.get("memory_id") or (str(uuid4()) if uuid4 else None) or str(int(time.time()*1000))
-                payload = {
-                    "text": content,
-                    "content": content,
-                    "tags": meta.get("tags", []),
-                    "type": meta.get("type", "memory"),
-                    "timestamp": meta.get("timestamp"),
-                    "speaker": meta.get("speaker"),
-                    "persona": meta.get("persona"),
-                    "source": meta.get("source"),
-                }
-                success = False
-                for attempt in range(0, self._retry_attempts):
-                    try:
-                        ok = ax.upsert_memory(self._memory_collection, pid, vec, payload)
-                        if ok:
-                            success = True
-                            break
-                    except Exception:
-                        if attempt < self._retry_attempts - 1:
-                            self._jittered_sleep(attempt)
-                            continue
-                        else:
-                            pass
-                if success:
-                    inserted += 1
-                else:
-                    self._cb_record_failure("qdrant")
-                    try:
-                        _brk.failure()  # type: ignore[name-defined]
-                    except Exception:
-                        pass
             except Exception:  # pragma: no cover
                 continue
+            if not content:
+                continue
+            pid = meta.get("memory_id") or (str(uuid4()) if uuid4 else None) or str(int(time.time()*1000))
+            payload = {
+                "text": content,
+                "content": content,
+                "tags": meta.get("tags", []),
+                "type": meta.get("type", "memory"),
+                "timestamp": meta.get("timestamp"),
+                "speaker": meta.get("speaker"),
+                "persona": meta.get("persona"),
+                "source": meta.get("source"),
+            }
+            pending.append((str(pid), content, payload))
+
+        errors: List[Dict[str, Any]] = []
+
+        # Embed in chunks: one encode() call per chunk instead of per item
+        points: List[Tuple[str, List[float], Dict[str, Any]]] = []
+        for i in range(0, len(pending), self._embed_batch_size):
+            chunk = pending[i : i + self._embed_batch_size]
+            try:
+                raw = embedder.encode([c for _, c, _ in chunk], normalize_embeddings=True)
+                try:
+                    raw = raw.tolist()  # type: ignore[union-attr]
+                except Exception:
+                    raw = list(raw or [])
+                if len(raw) != len(chunk):
+                    raise RuntimeError("embeddings_count_mismatch")
+            except Exception as e:
+                errors.extend({"id": pid, "error": f"embed: {e}"} for pid, _, _ in chunk)
+                continue
+            for (pid, _, payload), vec in zip(chunk, raw):
+                try:
+                    vec_list = vec.tolist()  # type: ignore[union-attr]
+                except Exception:
+                    vec_list = list(vec or [])
+                points.append((pid, vec_list, payload))
+
+        def _upsert_batch(batch: List[Tuple[str, List[float], Dict[str, Any]]]) -> bool:
+            bulk = getattr(ax, "upsert_memories", None)
+            if callable(bulk):
+                return bool(bulk(collection_name=self._memory_collection, points=batch))
+            if _qmodels is not None and hasattr(_qmodels, "PointStruct") and callable(getattr(ax, "upsert", None)):
+                ax.upsert(
+                    collection_name=self._memory_collection,
+                    points=[_qmodels.PointStruct(id=pid, vector=vec, payload=payload) for pid, vec, payload in batch],
+                )
+                return True
+            return all(ax.upsert_memory(self._memory_collection, pid, vec, payload) for pid, vec, payload in batch)
+
+        # Bulk upsert in point-batches; retries apply to a whole batch
+        inserted = 0
+        for i in range(0, len(points), self._upsert_batch_size):
+            batch = points[i : i + self._upsert_batch_size]
+            last_err: Optional[str] = None
+            success = False
+            for attempt in range(0, self._retry_attempts):
+                try:
+                    if _upsert_batch(batch):
+                        success = True
+                        break
+                    last_err = "upsert_rejected"
+                except Exception as e:
+                    last_err = str(e) or type(e).__name__
+                if attempt < self._retry_attempts - 1:
+                    self._jittered_sleep(attempt)
+            if success:
+                inserted += len(batch)
+            else:
+                errors.extend({"id": pid, "error": f"upsert: {last_err}"} for pid, _, _ in batch)
+                self._cb_record_failure("qdrant")
+                try:
+                    _brk.failure()  # type: ignore[name-defined]
+                except Exception:
+                    pass
         if inserted > 0:
             self._cb_record_success()
             try:
                 _brk.success()  # type: ignore[name-defined]
             except Exception:
                 pass
-        return {"inserted": inserted}
+        with contextlib.suppress(Exception):
+            from observability import metrics as _m  # type: ignore
+
+            _m.inc("vector.upsert.ok", inserted)
+            if errors:
+                _m.inc("vector.upsert.err", len(errors))
+        out: Dict[str, Any] = {"inserted": inserted}
+        if errors:
+            out["failed"] = len(errors)
+            out["errors"] = errors
+        return out
 
 
 def _redact_host_port(url: Optional[str]) -> Optional[str]:
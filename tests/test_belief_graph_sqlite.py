@@ -0,0 +1,265 @@
+import json
+import sqlite3
+
+from belief_graph.sqlite_backend import SQLiteBeliefGraph
+
+
+def _indexes(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return {r[1]: r[2] for r in conn.execute("SELECT type, name, tbl_name FROM sqlite_master WHERE type='index'")}
+    finally:
+        conn.close()
+
+
+def test_upsert_reinforces_existing_triple(tmp_path):
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    a = g.upsert_belief("Alice", "likes", "tea", sources=["m1"])
+    b = g.upsert_belief(" Alice ", "likes", "tea", sources=["m2"])
+    assert a and a == b
+    row = g._conn.execute("SELECT reinforcement_count, sources FROM beliefs WHERE id=?", (int(a),)).fetchone()
+    assert row[0] == 2
+    assert sorted(json.loads(row[1])) == ["m1", "m2"]
+    assert g._conn.execute("SELECT COUNT(*) FROM beliefs").fetchone()[0] == 1
+
+
+def test_upsert_many_and_link_many_single_transaction(tmp_path):
+    db = tmp_path / "bg.sqlite"
+    g = SQLiteBeliefGraph(str(db))
+    ids = g.upsert_many(
+        [
+            {"subject": "rain", "predicate": "is", "object": "wet"},
+            ("traffic", "is", "slow", 0.7, ["m9"]),
+            {"subject": "", "predicate": "is", "object": "bad"},
+            ("rain", "is", "wet"),
+        ]
+    )
+    assert ids[0] and ids[1] and ids[2] is None
+    assert ids[3] == ids[0]
+    assert g._conn.execute("SELECT reinforcement_count FROM beliefs WHERE id=?", (int(ids[0]),)).fetchone()[0] == 2
+
+    # cause_of also writes the effect_of inverse
+    assert g.link_many([(ids[0], ids[1], "cause_of"), (ids[0], None, "cause_of")]) == 2
+    rels = g._conn.execute("SELECT belief_id1, belief_id2, relation_type FROM belief_relations ORDER BY id").fetchall()
+    assert rels == [(int(ids[0]), int(ids[1]), "cause_of"), (int(ids[1]), int(ids[0]), "effect_of")]
+
+    idx = _indexes(db)
+    assert {"idx_beliefs_triple", "idx_belief_relations_src", "idx_belief_relations_dst"} <= set(idx)
+
+
+def test_migration_merges_duplicate_triples(tmp_path):
+    db = tmp_path / "legacy.sqlite"
+    conn = sqlite3.connect(str(db))
+    conn.executescript(
+        """
+        CREATE TABLE beliefs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, subject TEXT NOT NULL, predicate TEXT NOT NULL,
+            object TEXT NOT NULL, confidence REAL NOT NULL, recency INTEGER NOT NULL, sources TEXT
+        );
+        CREATE TABLE belief_relations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, belief_id1 INTEGER NOT NULL,
+            belief_id2 INTEGER NOT NULL, relation_type TEXT NOT NULL
+        );
+        INSERT INTO beliefs (subject, predicate, object, confidence, recency, sources) VALUES
+            ('a', 'is', 'b', 0.4, 10, '["s1"]'),
+            ('a', 'is', 'b', 0.6, 20, '["s2"]'),
+            ('c', 'is', 'd', 0.5, 5, '[]');
+        INSERT INTO belief_relations (belief_id1, belief_id2, relation_type) VALUES (2, 3, 'enables');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    g = SQLiteBeliefGraph(str(db))
+    rows = g._conn.execute("SELECT id, confidence, recency, sources FROM beliefs ORDER BY id").fetchall()
+    assert [r[0] for r in rows] == [1, 3]
+    assert rows[0][1] == 0.6 and rows[0][2] == 20
+    assert sorted(json.loads(rows[0][3])) == ["s1", "s2"]
+    assert g._conn.execute("SELECT belief_id1 FROM belief_relations").fetchone()[0] == 1
+    assert g._conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+    assert g.upsert_belief("a", "is", "b") == "1"
+
+
+def _chain(g):
+    # A -cause_of-> B -enables-> C -cause_of-> A (cycle), plus D -results_in-> B
+    ids = g.upsert_many([("A", "is", "x"), ("B", "is", "y"), ("C", "is", "z"), ("D", "is", "w")])
+    a, b, c, d = ids
+    g.link_many([(a, b, "cause_of"), (b, c, "enables"), (c, a, "cause_of"), (d, b, "results_in")])
+    return a, b, c, d
+
+
+def test_recursive_traversal_depth_cycles_and_paths(tmp_path):
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    a, b, c, d = _chain(g)
+
+    one = {h["id"]: h for h in g.get_related_beliefs("A", depth=1)}
+    assert set(one) == {a, b, c}  # c is reached through its inverse/adjacent edge
+    assert one[a]["hops"] == 0 and one[a]["path"] == [a] and one[a]["via"] is None
+    assert one[b]["hops"] == 1 and one[b]["path"] == [a, b]
+
+    two = {h["id"]: h for h in g.get_related_beliefs("A", depth=5)}
+    assert set(two) == {a, b, c, d}  # cycle A→B→C→A terminates
+    assert two[d]["hops"] == 2 and two[d]["path"] == [a, b, d]
+
+    # D is only linked via results_in/enables, so a cause_of walk never reaches it
+    only_causes = {h["id"] for h in g.get_related_beliefs("B", depth=3, relation_types=["cause_of"])}
+    assert only_causes == {a, b, c}
+
+
+def test_causal_traversal_direction_and_cache_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOM_BELIEF_TRAVERSAL_CACHE", "8")
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    a, b, c, d = _chain(g)
+
+    fwd = {h["id"]: h for h in g.get_causal_beliefs("B", direction="forward", depth=1)}
+    # B enables C; D results_in B is followed backwards as well
+    assert set(fwd) == {b, c, d}
+    assert fwd[c]["via"] == "enables"
+
+    back = {h["id"] for h in g.get_causal_beliefs("B", direction="backward", depth=1)}
+    assert back == {a, b}
+    assert g._walk_cache
+
+    e = g.upsert_belief("E", "is", "v")
+    assert not g._walk_cache
+    g.link_beliefs(b, e, "cause_of")
+    assert e in {h["id"] for h in g.get_causal_beliefs("B", direction="forward", depth=1)}
+
+
+def test_get_beliefs_defers_decay_writes(tmp_path, monkeypatch):
+    import belief_graph.sqlite_backend as sb
+
+    monkeypatch.setenv("AXIOM_CONFIDENCE_ENABLED", "1")
+    monkeypatch.setenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.2")
+    monkeypatch.setenv("AXIOM_BELIEF_DECAY_FLUSH_SEC", "3600")
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    monkeypatch.setattr(sb, "calculate_confidence", lambda ctx, context=None: 0.9)
+    keep, fade = g.upsert_many([("sky", "is", "blue"), ("sky", "was", "green")])
+    monkeypatch.setattr(
+        sb, "calculate_confidence", lambda ctx, context=None: 0.1 if ctx["recency"] < 1000 else 0.9
+    )
+    g._conn.execute("UPDATE beliefs SET recency=1, last_updated=1 WHERE id=?", (int(fade),))
+    g._conn.commit()
+
+    hits = {h["id"]: h for h in g.get_beliefs(["sky"])}
+    assert hits[fade]["confidence"] == 0.1 and "inactive" in hits[fade]["tags"]
+    assert hits[keep]["confidence"] == 0.9
+    # The read itself wrote nothing
+    stored = g._conn.execute("SELECT confidence, inactive FROM beliefs WHERE id=?", (int(fade),)).fetchone()
+    assert stored == (0.9, 0)
+
+    assert g.flush_decay() == 1
+    stored = g._conn.execute("SELECT confidence, inactive FROM beliefs WHERE id=?", (int(fade),)).fetchone()
+    assert stored == (0.1, 1)
+
+    # A reinforcement after the read is never clobbered by the queued decay
+    g.get_beliefs(["sky"])
+    g.upsert_belief("sky", "was", "green")
+    assert g.flush_decay() == 0
+    assert g._conn.execute("SELECT confidence FROM beliefs WHERE id=?", (int(fade),)).fetchone()[0] == 0.9
+
+
+def test_get_beliefs_loads_child_snapshot_once(tmp_path, monkeypatch):
+    import sys
+    import types
+
+    monkeypatch.setenv("AXIOM_CONFIDENCE_ENABLED", "0")
+    monkeypatch.setenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.5")
+    calls = []
+
+    class FakeMemory:
+        def __init__(self):
+            calls.append(1)
+
+        def snapshot(self):
+            return [{"id": "c1", "confidence": 0.1}, {"id": "c2", "confidence": 0.2}, {"id": "c3", "confidence": 0.3}]
+
+    mod = types.ModuleType("pods.memory.memory_manager")
+    mod.Memory = FakeMemory
+    monkeypatch.setitem(sys.modules, "pods.memory.memory_manager", mod)
+
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    ep, proc = g.upsert_many(
+        [
+            {"subject": "kickoff", "predicate": "episode", "object": "e1", "confidence": 0.8, "sources": ["c1", "c2"]},
+            {"subject": "kickoff", "predicate": "procedure", "object": "p1", "confidence": 0.8, "sources": ["c2", "c3"]},
+        ]
+    )
+    g.set_belief_state(ep, "episode")
+    g.set_belief_state(proc, "procedure")
+
+    hits = {h["id"]: h for h in g.get_beliefs(["kickoff"])}
+    assert len(calls) == 1
+    assert "inactive" in hits[ep]["tags"]
+    assert abs(hits[proc]["confidence"] - 0.25) < 1e-9 and "inactive" in hits[proc]["tags"]
+
+
+def test_related_beliefs_batches_writes_and_reuses_child_map(tmp_path, monkeypatch):
+    import sys
+    import types
+
+    import belief_graph.sqlite_backend as sb
+
+    monkeypatch.setenv("AXIOM_CONFIDENCE_ENABLED", "1")
+    monkeypatch.setenv("AXIOM_CONFIDENCE_MIN_THRESHOLD", "0.5")
+    monkeypatch.setenv("AXIOM_BELIEF_CHILD_CONF_TTL_SEC", "3600")
+    calls = []
+
+    class FakeMemory:
+        def __init__(self):
+            calls.append(1)
+
+        def snapshot(self):
+            return [{"id": "c1", "confidence": 0.1}]
+
+    mod = types.ModuleType("pods.memory.memory_manager")
+    mod.Memory = FakeMemory
+    monkeypatch.setitem(sys.modules, "pods.memory.memory_manager", mod)
+    monkeypatch.setattr(sb, "calculate_confidence", lambda ctx, context=None: 0.9)
+
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    ep, a, b = g.upsert_many(
+        [
+            {"subject": "trip", "predicate": "episode", "object": "e1", "confidence": 0.8, "sources": ["c1"]},
+            ("trip", "has", "a"),
+            ("trip", "has", "b"),
+        ]
+    )
+    g.set_belief_state(ep, "episode")
+    monkeypatch.setattr(sb, "calculate_confidence", lambda ctx, context=None: 0.3)
+
+    executed = []
+
+    class _Conn:
+        def __init__(self, conn):
+            self._c = conn
+
+        def cursor(self):
+            cur = self._c.cursor()
+
+            class _Cur:
+                rowcount = -1
+
+                def executemany(_self, sql, rows):
+                    rows = list(rows)
+                    executed.append((sql, len(rows)))
+                    cur.executemany(sql, rows)
+                    _self.rowcount = cur.rowcount
+
+                def __getattr__(_self, name):
+                    return getattr(cur, name)
+
+            return _Cur()
+
+        def __getattr__(self, name):
+            return getattr(self._c, name)
+
+    g._conn = _Conn(g._conn)
+    hits = {h["id"]: h for h in g.get_related_beliefs("trip", depth=1)}
+    g.get_causal_beliefs("trip", depth=1)
+
+    assert len(calls) == 1
+    assert "inactive" in hits[ep]["tags"] and hits[a]["confidence"] == 0.3
+    assert [n for sql, n in executed if sql.startswith("UPDATE beliefs")] == [3]
+    stored = dict(g._conn.execute("SELECT id, inactive FROM beliefs").fetchall())
+    assert stored == {int(ep): 1, int(a): 1, int(b): 1}
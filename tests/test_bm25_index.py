@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+from retrieval.bm25_index import BM25Index
+from retrieval.hybrid import rrf_fuse
+
+
+def _docs():
+	return [
+		{"id": "m1", "content": "Deploy failed with error code E1234 on the vector pod", "tags": ["ops"]},
+		{"id": "m2", "content": "Alice prefers tea over coffee in the morning"},
+		{"id": "m3", "content": "The vector pod restarted cleanly after the deploy"},
+		{"id": "m4", "content": "Weekly planning notes about the garden"},
+	]
+
+
+def test_exact_terms_rank_first_and_carry_stored_fields(tmp_path):
+	idx = BM25Index(str(tmp_path), flush_docs=100)
+	idx.apply(puts=_docs())
+	hits = idx.search("E1234 error", k=3)
+	assert hits[0]["id"] == "m1"
+	assert hits[0]["content"].startswith("Deploy failed")
+	assert hits[0]["tags"] == ["ops"]
+	assert [h["id"] for h in idx.search("vector pod", k=5)][:2] in (["m1", "m3"], ["m3", "m1"])
+	assert idx.search("nonexistent", k=5) == []
+
+
+def test_replace_and_delete_use_tombstones_across_reopen(tmp_path):
+	idx = BM25Index(str(tmp_path), flush_docs=2)
+	idx.apply(puts=_docs())  # flushes two segments
+	idx.apply(puts=[{"id": "m2", "content": "Alice switched to coffee"}], deletes=["m4"])
+	assert [h["id"] for h in idx.search("tea", k=5)] == []
+	assert [h["id"] for h in idx.search("coffee", k=5)] == ["m2"]
+	assert idx.search("garden", k=5) == []
+
+	# Unflushed ops are replayed from ops.log on reopen
+	again = BM25Index(str(tmp_path), flush_docs=2)
+	assert again.doc_count() == 3
+	assert again.search("tea", k=5) == []
+	assert again.search("garden", k=5) == []
+	assert [h["id"] for h in again.search("coffee", k=5)] == ["m2"]
+
+
+def test_merge_drops_dead_postings_and_tombstones(tmp_path):
+	idx = BM25Index(str(tmp_path), flush_docs=1, max_segments=100, background_merge=False)
+	for d in _docs():
+		idx.apply(puts=[d])
+	idx.apply(deletes=["m1"])
+	idx.flush()
+	assert idx.stats()["segments"] == 4
+	idx.merge()
+	st = idx.stats()
+	assert st["segments"] == 1 and st["tombstones"] == 0 and st["docs"] == 3
+	segs = [f for f in os.listdir(tmp_path) if f.startswith("seg-")]
+	assert len(segs) == 1
+
+	reopened = BM25Index(str(tmp_path))
+	assert reopened.search("E1234", k=5) == []
+	assert [h["id"] for h in reopened.search("garden", k=5)] == ["m4"]
+
+
+def test_rrf_fuses_lexical_and_dense_ranks():
+	lex = [{"id": "a", "content": "a"}, {"id": "b", "content": "b"}]
+	dense = [{"id": "b", "content": "b", "score": 0.9}, {"id": "c", "content": "c"}]
+	out = rrf_fuse([("lexical", lex), ("dense", dense)], {"lexical": 1.0, "dense": 1.0}, k=3, rrf_k=60)
+	assert [o["id"] for o in out] == ["b", "a", "c"]
+	assert out[0]["_source"] == "hybrid" and out[0]["_ranks"] == {"lexical": 2, "dense": 1}
+	assert out[0]["score"] == 0.9
+
+
+def test_bm25_search_reads_env_index_and_memory_mirrors_writes(tmp_path, monkeypatch):
+	mm = pytest.importorskip("pods.memory.memory_manager")
+	import retrieval.bm25_index as bi
+	from retrieval.hybrid import bm25_search
+
+	monkeypatch.setenv("AXIOM_BM25_INDEX_DIR", str(tmp_path / "bm25"))
+	monkeypatch.setattr(bi, "_INDEX", None)
+	monkeypatch.setattr(mm, "MEMORY_FILE", str(tmp_path / "long_term_memory.json"))
+
+	mem = mm.Memory()
+	mem.store({"type": "note", "content": "ticket AX-42 is blocked on review", "importance": 0.5})
+	mid = mem.long_term_memory[-1]["id"]
+	hits = asyncio.run(bm25_search("AX-42", 5))
+	assert [h["id"] for h in hits] == [mid]
+
+	mem.prune(0.9)
+	assert asyncio.run(bm25_search("AX-42", 5)) == []
+
+
+def test_sync_reconciles_puts_deletes_and_edits(tmp_path):
+	idx = BM25Index(str(tmp_path), flush_docs=100)
+	idx.apply(puts=_docs())
+	docs = _docs()
+	docs[1] = {"id": "m2", "content": "Alice prefers coffee now"}
+	assert idx.sync(docs[:3] + [{"id": "m5", "content": "new garden shed"}]) == (2, 1)
+	assert idx.search("tea", k=5) == []
+	assert [h["id"] for h in idx.search("garden", k=5)] == ["m5"]
+	assert idx.sync(docs[:3] + [{"id": "m5", "content": "new garden shed"}]) == (0, 0)
+
+
+def test_memory_save_and_load_keep_lexical_index_in_sync(tmp_path, monkeypatch):
+	mm = pytest.importorskip("pods.memory.memory_manager")
+	import retrieval.bm25_index as bi
+	from retrieval.hybrid import bm25_search
+
+	monkeypatch.setenv("AXIOM_BM25_INDEX_DIR", str(tmp_path / "bm25"))
+	monkeypatch.setattr(bi, "_INDEX", None)
+	monkeypatch.setattr(mm, "MEMORY_FILE", str(tmp_path / "long_term_memory.json"))
+
+	mem = mm.Memory()
+	mem.store({"type": "note", "content": "ticket walrus archived", "importance": 0.5})
+	mem.store({"type": "note", "content": "ticket pelican open", "importance": 0.5})
+	# Whole-state save after an in-place removal (decay/prune fallback/guards path)
+	mem.long_term_memory = [m for m in mem.long_term_memory if "walrus" not in m["content"]]
+	mem.save()
+	assert asyncio.run(bm25_search("walrus", 5)) == []
+
+	# Out-of-band write to the store is picked up on the next load
+	other = mm.Memory()
+	other.long_term_memory.append({"id": "oob-1", "content": "ticket narwhal imported"})
+	other.storage.save_all(other.long_term_memory)
+	mm.Memory().load()
+	assert [h["id"] for h in asyncio.run(bm25_search("narwhal", 5))] == ["oob-1"]
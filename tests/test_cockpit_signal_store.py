@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import time
+
+
+def _sqlite_backend(monkeypatch, tmp_path):
+    monkeypatch.setenv("COCKPIT_SIGNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("COCKPIT_SIGNAL_BACKEND", "sqlite")
+    monkeypatch.setenv("COCKPIT_SIGNAL_DB", str(tmp_path / "signals.sqlite"))
+
+
+def test_write_signal_appends_to_store_and_aggregates(monkeypatch, tmp_path):
+    _sqlite_backend(monkeypatch, tmp_path)
+    from pods.cockpit import cockpit_reporter as reporter
+    from pods.cockpit.cockpit_aggregator import aggregate_status
+
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", tmp_path)
+    for _ in range(2):
+        reporter.report_blocked_write("memory", "role=discord_bot")
+    reporter.report_journal_write_failure("journal", "perm denied")
+    for _ in range(3):
+        reporter.report_vector_recall("vector", False, None, "timeout")
+    reporter.report_vector_recall("vector", True, 120, None)
+    reporter.report_degraded(True, 2)
+    reporter.write_signal("governor", "saga_begin.WriteMemorySaga", {})
+    reporter.write_signal("governor", "saga_end.WriteMemorySaga", {"ok": True})
+    reporter.write_signal("governor", "prompt_contracts.violation.schema", {})
+
+    # No per-signal files unless the export is enabled
+    assert not list(tmp_path.glob("*.json"))
+
+    # Counters see one record per <pod>.<signal>, as with the files backend
+    snap = aggregate_status()
+    assert snap["blocked_writes_by_role"] == 1
+    assert snap["journal_write_failures"] == 1
+    assert snap["vector_blackout_active"] is False
+    assert snap["last_vector_latency_ms"] == 120
+    assert snap["resilience"]["degraded"] == {"active": True, "depth": 2}
+    assert snap["governor"]["sagas"]["WriteMemorySaga"] == {"began": 1, "ended_ok": 1, "ended_err": 0}
+    assert snap["prompt_contracts"]["violations_last_5m"]["schema"] == 1
+
+
+def test_export_files_flag_keeps_legacy_layout(monkeypatch, tmp_path):
+    _sqlite_backend(monkeypatch, tmp_path)
+    monkeypatch.setenv("COCKPIT_SIGNAL_EXPORT_FILES", "1")
+    from pods.cockpit import cockpit_reporter as reporter
+
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", tmp_path)
+    reporter.write_signal("vector", "version_banner", {"v": "1"})
+    assert (tmp_path / "vector.version_banner.json").exists()
+
+
+def test_prune_keeps_rollup_totals(tmp_path):
+    from pods.cockpit.signal_store import SignalStore
+
+    st = SignalStore(str(tmp_path / "s.sqlite"))
+    st.max_per_key = 2
+    for i in range(5):
+        st.append({"pod": "eventlog", "signal": "processed", "data": {"i": i}})
+    st.append({"pod": "eventlog", "signal": "errors", "ts": "2000-01-01T00:00:00", "data": {}})
+    # 3 rows over the per-key cap + 1 past retention
+    assert st.prune() == 4
+    assert st.count("eventlog.errors*.json") == 1
+    assert [r["data"]["i"] for r in st.records("eventlog.processed*.json")] == [3, 4]
+    assert st.count("eventlog.processed*.json") == 5
+    assert st.count("eventlog.*.json", since=time.time() - 300) == 2
+    assert st.latest("eventlog.processed*.json")["data"] == {"i": 4}
+
+    out = tmp_path / "export"
+    assert st.export_files(out) == 2
+    assert sorted(p.name for p in out.iterdir()) == ["eventlog.errors.json", "eventlog.processed.json"]
+
+
+def test_naive_utc_timestamps_count_in_window_under_non_utc_tz(monkeypatch, tmp_path):
+    from datetime import datetime
+
+    from pods.cockpit.signal_store import SignalStore
+
+    if not hasattr(time, "tzset"):
+        return
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    try:
+        st = SignalStore(str(tmp_path / "s.sqlite"))
+        st.append({"pod": "eventlog", "signal": "errors", "ts": datetime.utcnow().isoformat(), "data": {}})
+        st.append({"pod": "eventlog", "signal": "errors", "ts": datetime.utcnow().isoformat(), "data": {}})
+        assert st.count("eventlog.errors*.json", since=time.time() - 300) == 2
+        assert st.count_keys("eventlog.errors*.json", since=time.time() - 300) == 1
+        assert st.prune() == 0
+    finally:
+        monkeypatch.delenv("TZ")
+        time.tzset()
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import importlib
 import json
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _signals_in_tmp(tmp_path, monkeypatch):
+    # Keep cockpit signals out of the repo's axiom_boot/
+    reporter = importlib.import_module("pods.cockpit.cockpit_reporter")
+    signals = tmp_path / "signals"
+    signals.mkdir()
+    monkeypatch.setenv("COCKPIT_SIGNAL_DIR", str(signals))
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", signals)
+
 
 def _write_memory(tmp_path: Path, records: list[dict]):
     mf = tmp_path / "memory" / "long_term_memory.json"
@@ -59,3 +72,118 @@ def test_run_compaction_dry_run_no_writes(tmp_path, monkeypatch):
     data = json.loads(mf.read_text())
     assert len(data) == 2
 
+
+
+def _execute_env(tmp_path, monkeypatch):
+    import lifecycle.compaction as lc
+
+    monkeypatch.setenv("JOURNAL_COMPACTION_DRY_RUN", "false")
+    monkeypatch.setattr(lc, "JOURNAL_COMPACTION_ENABLED", True)
+    monkeypatch.setattr(lc, "JOURNAL_RETENTION_DAYS", 180)
+    monkeypatch.setattr(lc, "JOURNAL_ARCHIVE_DIR", tmp_path / "archive")
+    monkeypatch.setattr(lc, "JOURNAL_MANIFEST_PATH", tmp_path / "archive" / "manifest.json")
+    monkeypatch.setattr(lc, "JOURNAL_COMPACTION_PIN_BLOOM_BITS", 1 << 12)
+    monkeypatch.setattr(lc, "_cockpit_signal", lambda *a, **k: None)
+    monkeypatch.delenv("AXIOM_MEMORY_ENGINE", raising=False)
+    return lc
+
+
+def test_execute_streams_archive_and_removes_in_batches(tmp_path, monkeypatch):
+    lc = _execute_env(tmp_path, monkeypatch)
+    monkeypatch.setattr(lc, "JOURNAL_COMPACTION_BATCH", 2)
+    records = [{"id": f"o{i}", "type": "journal_entry", "timestamp": _ts(400)} for i in range(5)]
+    records += [{"id": "r1", "type": "journal_entry", "timestamp": _ts(5)}]
+    # Pins that appear after the entry they protect still count
+    records += [{"id": "b1", "type": "belief", "related_journal_id": "o0", "timestamp": _ts(1)}]
+    records += [{"id": "g1", "type": "goal", "journal_id": "o1", "timestamp": _ts(1)}]
+    _write_memory(tmp_path, records)
+
+    res = lc.run_compaction(dry_run=False)
+    assert res["archived"] == 3 and res["removed"] == 3 and res["kept"] == 5
+    lines = Path(res["archive_path"]).read_text().splitlines()
+    assert sorted(json.loads(line)["id"] for line in lines) == ["o2", "o3", "o4"]
+    left = [r["id"] for r in json.loads(Path(os.environ["MEMORY_FILE"]).read_text())]
+    assert left == ["o0", "o1", "r1", "b1", "g1"]
+    assert sorted(p.name for p in (tmp_path / "archive").iterdir()) == sorted(["manifest.json", Path(res["archive_path"]).name])
+
+
+
+def test_json_engine_removes_archive_in_one_rewrite(tmp_path, monkeypatch):
+    lc = _execute_env(tmp_path, monkeypatch)
+    monkeypatch.setattr(lc, "JOURNAL_COMPACTION_BATCH", 2)
+    _write_memory(tmp_path, [{"id": f"o{i}", "timestamp": _ts(400)} for i in range(7)] + [{"id": "r1", "timestamp": _ts(1)}])
+
+    real = lc._memory_engine()
+    assert real.rewrites_on_delete
+    calls = []
+    real_delete = real.delete_ids
+    monkeypatch.setattr(real, "delete_ids", lambda ids: (calls.append(set(ids)), real_delete(ids))[1])
+    monkeypatch.setattr(lc, "_memory_engine", lambda: real)
+
+    res = lc.run_compaction(dry_run=False)
+    assert res["removed"] == 7
+    assert calls == [{f"o{i}" for i in range(7)}]
+    assert [r["id"] for r in json.loads(Path(os.environ["MEMORY_FILE"]).read_text())] == ["r1"]
+
+def test_execute_resumes_from_checkpoint(tmp_path, monkeypatch):
+    lc = _execute_env(tmp_path, monkeypatch)
+    monkeypatch.setattr(lc, "JOURNAL_COMPACTION_BATCH", 1)
+    _write_memory(tmp_path, [{"id": f"o{i}", "timestamp": _ts(400)} for i in range(4)])
+
+    real = lc._memory_engine()
+    calls = []
+
+    class Flaky:
+        def iter_records(self):
+            return real.iter_records()
+
+        def delete_ids(self, ids):
+            calls.append(list(ids))
+            if len(calls) > 1:
+                raise OSError("disk full")
+            return real.delete_ids(ids)
+
+    monkeypatch.setattr(lc, "_memory_engine", lambda: Flaky())
+    first = lc.run_compaction(dry_run=False)
+    assert first["skipped"] and first["resumable"]
+    ck = json.loads((tmp_path / "archive" / "compaction.checkpoint.json").read_text())
+    assert ck["phase"] == "remove" and ck["removed"] == 1 and ck["archived"] == 4
+
+    monkeypatch.setattr(lc, "_memory_engine", lambda: real)
+    res = lc.run_compaction(dry_run=False)
+    assert res["resumed"] and res["run_id"] == ck["run_id"]
+    assert res["removed"] == 4 and res["archived"] == 4
+    assert json.loads(Path(os.environ["MEMORY_FILE"]).read_text()) == []
+    assert not (tmp_path / "archive" / "compaction.checkpoint.json").exists()
+
+
+def test_scan_resumes_after_last_id_and_clears_lexical_index(tmp_path, monkeypatch):
+    lc = _execute_env(tmp_path, monkeypatch)
+    monkeypatch.setattr(lc, "JOURNAL_COMPACTION_CHECKPOINT_EVERY", 2)
+    _write_memory(tmp_path, [{"id": f"o{i}", "timestamp": _ts(400)} for i in range(6)])
+
+    real = lc._memory_engine()
+
+    class Interrupted:
+        def iter_records(self):
+            for n, rec in enumerate(real.iter_records()):
+                if n == 3:
+                    raise OSError("read error")
+                yield rec
+
+    monkeypatch.setattr(lc, "_memory_engine", lambda: Interrupted())
+    assert lc.run_compaction(dry_run=False)["resumable"]
+    ck = json.loads((tmp_path / "archive" / "compaction.checkpoint.json").read_text())
+    assert ck["last_id"] == "o1" and ck["scanned"] == 2
+
+    # A record before the checkpoint disappears: a position-based resume would skip o2
+    real.delete_ids(["o0"])
+    deleted = []
+    monkeypatch.setattr(lc, "_lexical_index", lambda: type("L", (), {"apply": lambda self, deletes: deleted.extend(deletes), "flush": lambda self: None})())
+    monkeypatch.setattr(lc, "_memory_engine", lambda: real)
+    res = lc.run_compaction(dry_run=False)
+    assert res["resumed"] and res["archived"] == 6
+    # o0 was already gone from the store, so only five removals count
+    assert res["removed"] == 5
+    assert sorted(deleted) == [f"o{i}" for i in range(6)]
+    assert json.loads(Path(os.environ["MEMORY_FILE"]).read_text()) == []
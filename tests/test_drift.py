@@ -5,6 +5,8 @@ import os
 import random
 from pathlib import Path
 
+import pytest
+
 
 def test_kl_and_shift_basic(tmp_path, monkeypatch):
 	# Arrange: independent reproducible RNG
@@ -34,6 +36,10 @@ def test_record_and_emit_fail_closed(tmp_path, monkeypatch):
 	# Redirect drift state dir
 	monkeypatch.setenv("DRIFT_STATE_DIR", str(tmp_path))
 	monkeypatch.setenv("RETRIEVAL_DRIFT_ENABLED", "true")
+	import importlib
+
+	reporter = importlib.import_module("pods.cockpit.cockpit_reporter")
+	monkeypatch.setattr(reporter, "SIGNAL_DIR", tmp_path)
 	from retrieval.drift import record_vector_sample, snapshot_stats, maybe_emit_drift
 
 	# Emit some vectors with small noise
@@ -50,3 +56,71 @@ def test_record_and_emit_fail_closed(tmp_path, monkeypatch):
 	# Emission should not throw even if cockpit disabled
 	maybe_emit_drift("test_ns")
 
+
+
+def test_accumulator_merge_and_binary_roundtrip():
+	from retrieval.drift import DriftAccumulator
+
+	rng = random.Random(7)
+	a, b, both = DriftAccumulator(cap=20), DriftAccumulator(cap=20), DriftAccumulator(cap=20)
+	for i in range(60):
+		v = [rng.uniform(0.5, 2.0), rng.uniform(-1.0, 1.0), 0.25]
+		(a if i % 3 else b).add(v, rng)
+		both.add(v, rng)
+
+	merged = DriftAccumulator.from_bytes(a.to_bytes()).merge(DriftAccumulator.from_bytes(b.to_bytes()), rng)
+	assert merged.n == both.n == 60 and merged.seen == 60
+	assert math.isclose(merged.mean, both.mean, rel_tol=1e-9)
+	assert math.isclose(merged.m2, both.m2, rel_tol=1e-6)
+	assert merged.norm_counts == both.norm_counts
+	assert len(merged.reservoir) == 20 and merged.dim == 3
+
+
+
+def test_reservoir_buffer_is_allocated_once():
+	np = pytest.importorskip("numpy")
+	from retrieval.drift import DriftAccumulator
+
+	acc = DriftAccumulator(cap=8)
+	acc.add([1.0, 0.0])
+	buf = acc._buf
+	assert buf.shape == (8, 2)
+	for i in range(1, 30):
+		acc.add([1.0, float(i)])
+	assert acc._buf is buf
+	assert acc.reservoir.shape == (8, 2)
+
+	# A restored accumulator grows to cap once, then keeps writing in place
+	src = DriftAccumulator(cap=8)
+	src.add([0.0, 1.0])
+	back = DriftAccumulator.from_bytes(src.to_bytes())
+	back.add([0.0, 2.0])
+	grown = back._buf
+	back.add([0.0, 3.0])
+	assert back._buf is grown and grown.shape == (8, 2)
+	assert np.array_equal(back.reservoir, [[0.0, 1.0], [0.0, 2.0], [0.0, 3.0]])
+
+def test_samples_stay_in_memory_until_flush(tmp_path, monkeypatch):
+	monkeypatch.setenv("DRIFT_STATE_DIR", str(tmp_path))
+	import retrieval.drift as drift
+
+	monkeypatch.setattr(drift, "_STATES", {})
+	monkeypatch.setattr(drift, "DRIFT_FLUSH_EVERY", 1000)
+	monkeypatch.setattr(drift, "DRIFT_FLUSH_SEC", 3600.0)
+	for _ in range(50):
+		drift.record_vector_sample("acc_ns", [1.0, random.uniform(-0.1, 0.1)])
+	assert not (tmp_path / "acc_ns.drift").exists()
+	assert drift.snapshot_stats("acc_ns")["stats"]["n"] == 50
+
+	drift.flush("acc_ns")
+	assert drift.load_accumulator("acc_ns").n == 50
+
+	# A second process starts from the flushed state and merges its own samples on flush
+	monkeypatch.setattr(drift, "_STATES", {})
+	for _ in range(30):
+		drift.record_vector_sample("acc_ns", [2.0, 0.0])
+	drift.flush()
+	assert sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock")) == ["acc_ns.drift"]
+	acc = drift.load_accumulator("acc_ns")
+	assert acc.n == 80 and acc.seen == 80
+	assert drift.snapshot_stats("acc_ns")["stats"]["n"] == 80
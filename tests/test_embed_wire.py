@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import importlib
+import struct
+
+import pytest
+
+from vector import embed_wire as wire
+
+
+def _rows(mat):
+    return mat.tolist() if hasattr(mat, "tolist") else mat
+
+
+def test_float32_round_trip_and_header():
+    vecs = [[0.5, -1.25, 3.0], [0.0, 2.5, -0.125]]
+    buf = wire.encode_vectors(vecs, "float32")
+    magic, version, code, _, rows, dims = struct.unpack_from("<4sBBHII", buf, 0)
+    assert (magic, version, code, rows, dims) == (b"AXVE", 1, 1, 2, 3)
+    assert len(buf) == 16 + 2 * 3 * 4
+    assert _rows(wire.decode_vectors(buf)) == vecs
+
+
+def test_float16_round_trip_is_half_size():
+    vecs = [[0.5, -1.25, 3.0, 1.0]]
+    buf = wire.encode_vectors(vecs, "float16")
+    assert len(buf) == 16 + 4 * 2
+    assert _rows(wire.decode_vectors(buf)) == vecs
+
+
+def test_decode_rejects_bad_bodies():
+    buf = wire.encode_vectors([[1.0, 2.0]], "float32")
+    with pytest.raises(wire.WireFormatError):
+        wire.decode_vectors(buf[:-1])
+    with pytest.raises(wire.WireFormatError):
+        wire.decode_vectors(b"XXXX" + buf[4:])
+    with pytest.raises(wire.WireFormatError):
+        wire.encode_vectors([[1.0, 2.0], [3.0]], "float32")
+
+
+def test_negotiation_and_client_preference():
+    assert wire.negotiate("application/json") is None
+    assert wire.negotiate(None) is None
+    assert wire.negotiate("application/x-axiom-vectors") == "float32"
+    assert wire.negotiate(wire.accept_header("float16")) == "float16"
+    assert wire.client_dtype({}) == "float32"
+    assert wire.client_dtype({"AXIOM_EMBEDDING_WIRE": "json"}) is None
+    assert wire.accept_header(None) == "application/json"
+
+
+def test_vectors_from_response_handles_both_wires():
+    class _Resp:
+        def __init__(self, ctype, content=b"", body=None):
+            self.headers = {"Content-Type": ctype}
+            self.content = content
+            self._body = body
+
+        def json(self):
+            return self._body
+
+    vecs = [[1.0, 2.0], [3.0, 4.0]]
+    binary = _Resp(wire.content_type("float32"), wire.encode_vectors(vecs))
+    assert _rows(wire.vectors_from_response(binary)) == vecs
+    assert wire.vectors_from_response(_Resp("application/json", body={"vectors": vecs})) == vecs
+
+
+def test_embed_endpoint_serves_binary_when_accepted(monkeypatch):
+    pytest.importorskip("flask")
+    monkeypatch.setenv("AXIOM_QDRANT_VECTOR_SIZE", "4")
+    mod = importlib.reload(importlib.import_module("pods.vector.embedding_service"))
+    monkeypatch.setattr(mod._BACKEND, "_has_fastembed", lambda: True)
+    monkeypatch.setattr(mod._BACKEND, "_init_fastembed", lambda _m: (lambda texts: [[0.25] * 4 for _ in texts]))
+    c = mod.app.test_client()
+
+    r = c.post("/embed", json={"texts": ["a", "b"]}, headers={"Accept": wire.accept_header("float16")})
+    assert r.status_code == 200
+    assert r.headers["Content-Type"].startswith(wire.MEDIA_TYPE)
+    assert _rows(wire.decode_vectors(r.data)) == [[0.25] * 4] * 2
+
+    r_json = c.post("/embed", json={"texts": ["a"]})
+    assert r_json.is_json and r_json.get_json()["vectors"] == [[0.25] * 4]
+
+
+def test_owned_vectors_are_writable_copies():
+    np = pytest.importorskip("numpy")
+    buf = wire.encode_vectors([[1.0, 2.0]])
+    view = wire.decode_vectors(buf)
+    assert not view.flags.writeable
+    owned = wire.owned_vectors(view)
+    assert isinstance(owned, np.ndarray) and owned.flags.writeable
+    owned /= 2.0
+    assert _rows(view) == [[1.0, 2.0]]
+    assert wire.owned_vectors([[1.0]]) == [[1.0]]
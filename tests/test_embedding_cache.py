@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import types
+
+from vector.embedding_cache import EmbeddingCache, cache_from_env, normalize_text
+from vector.unified_client import UnifiedVectorClient, VectorSearchRequest
+
+
+def test_normalized_key_and_byte_budget_eviction():
+    vec = [0.1] * 8
+    # Budget fits two entries but not three
+    cache = EmbeddingCache(max_bytes=350, ttl_sec=0)
+    cache.put("m", "  hello   world ", vec)
+    assert cache.get("m", "hello world") == vec
+    assert cache.get("other-model", "hello world") is None
+    assert normalize_text(" a\n b ") == "a b"
+
+    cache.put("m", "b", vec)
+    cache.get("m", "hello world")  # touch → "b" is now least recently used
+    cache.put("m", "c", vec)
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "hello world") == vec
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_ttl_expiry(monkeypatch):
+    import vector.embedding_cache as ec
+
+    now = [1000.0]
+    monkeypatch.setattr(ec.time, "time", lambda: now[0])
+    cache = EmbeddingCache(max_bytes=1 << 20, ttl_sec=10)
+    cache.put("m", "q", [1.0, 2.0])
+    now[0] += 5
+    assert cache.get("m", "q") == [1.0, 2.0]
+    now[0] += 10
+    assert cache.get("m", "q") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "embed_cache.sqlite")
+    first = EmbeddingCache(max_bytes=1 << 20, ttl_sec=60, path=path)
+    first.put("m", "persist me", [0.25, -0.5, 1.0])
+    first.close()
+
+    second = EmbeddingCache(max_bytes=1 << 20, ttl_sec=60, path=path)
+    assert second.stats()["entries"] == 0
+    assert second.get("m", "persist me") == [0.25, -0.5, 1.0]
+    assert second.stats()["entries"] == 1
+    second.close()
+
+
+def test_client_search_reuses_cached_query_vector():
+    import vector.unified_client as uv
+
+    calls = []
+
+    class CountingEmbedder:
+        def encode(self, text, normalize_embeddings=True):
+            calls.append(text)
+            return [0.5, 0.5, 0.0]
+
+    class FakeQdrant:
+        def search(self, **kwargs):
+            return [types.SimpleNamespace(payload={"text": "alpha", "tags": []}, score=0.9)]
+
+    env = {"VECTOR_PATH": "qdrant", "AXIOM_EMBEDDING_MODEL": "tests/embed-cache", "AXIOM_EMBED_CACHE_TTL_SEC": "77"}
+    cache = cache_from_env(env)
+    assert cache is not None
+    cache.clear()
+
+    client = UnifiedVectorClient(env)
+    client._embedder = CountingEmbedder()
+    client._get_qdrant = lambda: FakeQdrant()  # type: ignore
+    uv._qmodels = None
+
+    for q in ("what did we discuss?", "what did  we discuss? "):
+        resp = client.search(VectorSearchRequest(query=q))
+        assert [h.content for h in resp.hits] == ["alpha"]
+    assert calls == ["what did we discuss?"]
+
+    # Disabled cache falls through to the embedder every time
+    assert cache_from_env({"AXIOM_EMBED_CACHE_ENABLED": "false"}) is None
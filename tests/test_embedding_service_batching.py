@@ -0,0 +1,127 @@
+import importlib
+import threading
+
+import pytest
+
+
+def _load(monkeypatch, **env):
+    pytest.importorskip("flask")
+    monkeypatch.setenv("AXIOM_QDRANT_VECTOR_SIZE", "4")
+    for k, v in env.items():
+        monkeypatch.setenv(k, v)
+    mod = importlib.import_module("pods.vector.embedding_service")
+    return importlib.reload(mod)
+
+
+class _CountingBackend:
+    def __init__(self, gate=None):
+        self.calls = []
+        self._gate = gate
+
+    def embed(self, *, texts, model_name, backend_hint):
+        if self._gate is not None:
+            self._gate.wait(2)
+        self.calls.append((model_name, list(texts)))
+        return [[float(len(t))] * 4 for t in texts]
+
+
+def test_concurrent_requests_are_coalesced_and_fanned_out(monkeypatch):
+    mod = _load(monkeypatch)
+    gate = threading.Event()
+    backend = _CountingBackend(gate)
+    batcher = mod._MicroBatcher(backend, max_batch=64, max_wait_ms=50)
+
+    results = {}
+
+    def _call(i):
+        results[i] = batcher.embed(texts=["x" * i] * i, model_name="m", backend_hint="auto")
+
+    # First request occupies the worker; the rest queue up behind it and merge.
+    threads = [threading.Thread(target=_call, args=(i,)) for i in range(1, 7)]
+    threads[0].start()
+    while not batcher.stats()["batches"]:
+        pass
+    for t in threads[1:]:
+        t.start()
+    while batcher.stats()["queue_depth_requests"] < 5:
+        pass
+    gate.set()
+    for t in threads:
+        t.join(5)
+
+    for i in range(1, 7):
+        assert results[i] == [[float(i)] * 4] * i
+    assert len(backend.calls) == 2
+    stats = batcher.stats()
+    assert stats["batches"] == 2
+    assert stats["max_batch_size"] == sum(range(2, 7))
+    assert stats["queue_depth_texts"] == 0
+
+
+def test_batches_split_by_model_and_max_size(monkeypatch):
+    mod = _load(monkeypatch)
+    gate = threading.Event()
+    backend = _CountingBackend(gate)
+    batcher = mod._MicroBatcher(backend, max_batch=3, max_wait_ms=50)
+
+    out = []
+    jobs = [("warm", ["w"]), ("a", ["1", "2"]), ("a", ["3", "4"]), ("b", ["5"])]
+    threads = [
+        threading.Thread(target=lambda m=m, t=t: out.append(batcher.embed(texts=t, model_name=m, backend_hint="auto")))
+        for m, t in jobs
+    ]
+    threads[0].start()
+    while not batcher.stats()["batches"]:
+        pass
+    for t in threads[1:]:
+        t.start()
+        while batcher.stats()["queue_depth_requests"] < threads.index(t):
+            pass
+    gate.set()
+    for t in threads:
+        t.join(5)
+
+    assert [c[0] for c in backend.calls] == ["warm", "a", "a", "b"]
+    assert all(len(c[1]) <= 3 for c in backend.calls)
+
+
+def test_healthz_reports_batching_metrics(monkeypatch):
+    mod = _load(monkeypatch)
+    monkeypatch.setattr(mod._BACKEND, "_has_fastembed", lambda: True)
+    monkeypatch.setattr(mod._BACKEND, "_init_fastembed", lambda _m: (lambda texts: [[0.0] * mod.EXPECTED_DIMS for _ in texts]))
+    c = mod.app.test_client()
+    assert c.post("/embed", json={"texts": ["hi", "there"]}).status_code == 200
+    body = c.get("/healthz").get_json()
+    assert body["batching"]["batches"] >= 1
+    assert body["batching"]["queue_depth_requests"] == 0
+
+
+def test_wait_timeout_falls_back_to_direct_embed(monkeypatch):
+    mod = _load(monkeypatch)
+    release = threading.Event()
+    backend = _CountingBackend()
+    first_call = []
+
+    def _embed(*, texts, model_name, backend_hint):
+        if not first_call:
+            first_call.append(texts)
+            release.wait(2)  # wedge the worker on the first batch only
+        return _CountingBackend.embed(backend, texts=texts, model_name=model_name, backend_hint=backend_hint)
+
+    monkeypatch.setattr(backend, "embed", _embed)
+    batcher = mod._MicroBatcher(backend, max_batch=64, max_wait_ms=1, timeout_s=0.05)
+
+    results = {}
+    first = threading.Thread(target=lambda: results.update(slow=batcher.embed(texts=["slow"], model_name="m", backend_hint="auto")))
+    first.start()
+    while not first_call:
+        pass
+    # Queued behind the wedged batch: gives up, is cancelled and embeds directly.
+    assert batcher.embed(texts=["abc"], model_name="m", backend_hint="auto") == [[3.0] * 4]
+    first.join(5)
+    release.set()
+
+    assert results["slow"] == [[4.0] * 4]
+    stats = batcher.stats()
+    assert stats["timeouts"] == 2
+    assert stats["batches"] == 1
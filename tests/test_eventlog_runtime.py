@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+
+
+def _events_db(path, events):
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE events (seq_id INTEGER PRIMARY KEY AUTOINCREMENT, idem_key TEXT UNIQUE, cid TEXT,"
+        " kind TEXT, payload JSON, ts INT, status TEXT, last_error TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO events (idem_key, cid, kind, payload, ts, status) VALUES (?, ?, ?, ?, ?, 'pending')",
+        [(f"idem-{i}", f"cid-{i}", kind, json.dumps(p), int(time.time())) for i, (kind, p) in enumerate(events)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _statuses(path):
+    conn = sqlite3.connect(str(path))
+    try:
+        return dict(conn.execute("SELECT status, COUNT(*) FROM events GROUP BY status").fetchall())
+    finally:
+        conn.close()
+
+
+def test_batches_group_by_kind_and_ack_per_batch(monkeypatch, tmp_path):
+    import services.memory.eventlog_runner as er
+    from services.memory.eventlog_runner import BatchedEventRuntime
+
+    signals = []
+    monkeypatch.setattr(er, "_signal", lambda name, payload: signals.append((name, payload)))
+
+    db = tmp_path / "events.sqlite"
+    _events_db(
+        db,
+        [("memory.write", {"text": f"m{i}"}) for i in range(5)]
+        + [("journal.append", {"entry": "j"}), ("journal.append", {"entry": "boom"}), ("unknown.kind", {})],
+    )
+    batches, singles = [], []
+
+    def mem_batch(evs):
+        batches.append([e.payload["text"] for e in evs])
+        return {}
+
+    def journal(ev):
+        if ev.payload["entry"] == "boom":
+            raise RuntimeError("bad entry")
+        singles.append(ev.idem_key)
+
+    rt = BatchedEventRuntime(
+        {"journal.append": journal}, {"memory.write": mem_batch}, db_path=str(db), batch_size=4, workers=1, max_retries=0
+    )
+    assert rt.run_once() == 4
+    assert batches == [["m0", "m1", "m2", "m3"]]
+    assert rt.stats()["lag"] == 4
+
+    while rt.run_once():
+        pass
+    assert batches[1] == ["m4"] and singles == ["idem-5"]
+    assert _statuses(db) == {"done": 6, "error": 2}
+    st = rt.stats()
+    assert st["processed"] == 6 and st["errors"] == 2 and st["lag"] == 0 and st["inflight"] == 0
+    assert sum(p["count"] for n, p in signals if n == "processed") == 6
+    assert sum(p["count"] for n, p in signals if n == "errors") == 2
+    rt.stop()
+
+
+def test_worker_pool_drains_backlog_once(monkeypatch, tmp_path):
+    import threading
+
+    import services.memory.eventlog_runner as er
+    from services.memory.eventlog_runner import BatchedEventRuntime
+
+    monkeypatch.setattr(er, "_signal", lambda name, payload: None)
+
+    db = tmp_path / "events.sqlite"
+    _events_db(db, [("memory.write", {"text": f"m{i}"}) for i in range(50)])
+    seen, lock = [], threading.Lock()
+
+    def mem_batch(evs):
+        time.sleep(0.01)
+        with lock:
+            seen.extend(e.seq_id for e in evs)
+        return {}
+
+    rt = BatchedEventRuntime({}, {"memory.write": mem_batch}, db_path=str(db), batch_size=8, workers=3)
+    rt.tick_sec = 0.05
+    t = threading.Thread(target=rt.run_forever, daemon=True)
+    t.start()
+    deadline = time.time() + 5
+    while _statuses(db).get("done", 0) < 50 and time.time() < deadline:
+        time.sleep(0.02)
+    rt.stop()
+    t.join(timeout=2)
+    assert sorted(seen) == list(range(1, 51))
+    assert _statuses(db) == {"done": 50}
+
+
+def test_memory_write_batch_reuses_embedder_and_bulk_upserts(monkeypatch):
+    import services.memory.eventlog_runner as er
+    from services.memory.eventlog_runner import _Event
+
+    calls, upserts = [], []
+
+    class Emb:
+        def encode(self, texts, normalize_embeddings=True):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+    class Client:
+        def upsert_memories(self, collection_name, points):
+            upserts.append([pid for pid, _, _ in points])
+            return True
+
+    monkeypatch.setattr(er, "_EMBEDDER", Emb())
+    monkeypatch.setattr(er, "_CLIENT", Client())
+    evs = [_Event(i, f"idem-{i}", "c", "memory.write", {"text": f"t{i}", "id": f"m{i}"}, 0) for i in range(3)]
+    assert er._memory_write_batch(evs) == {}
+    assert er._memory_write_batch(evs[:1]) == {}
+    assert calls == [["t0", "t1", "t2"], ["t0"]]
+    assert upserts == [["m0", "m1", "m2"], ["m0"]]
+
+
+def test_failed_events_retry_with_backoff_then_error(monkeypatch, tmp_path):
+    import services.memory.eventlog_runner as er
+    from services.memory.eventlog_runner import BatchedEventRuntime
+
+    monkeypatch.setattr(er, "_signal", lambda name, payload: None)
+    db = tmp_path / "events.sqlite"
+    _events_db(db, [("journal.append", {"entry": "flaky"}), ("journal.append", {"entry": "broken"})])
+    attempts = {"flaky": 0, "broken": 0}
+
+    def journal(ev):
+        attempts[ev.payload["entry"]] += 1
+        if ev.payload["entry"] == "broken" or attempts["flaky"] < 2:
+            raise RuntimeError("transient")
+
+    rt = BatchedEventRuntime({"journal.append": journal}, db_path=str(db), workers=1, max_retries=2, retry_base_sec=0.0)
+    assert rt.run_once() == 0
+    assert _statuses(db) == {"pending": 2} and rt.stats()["retrying"] == 2
+    assert rt.run_once() == 1
+    assert rt.run_once() == 0
+    assert _statuses(db) == {"done": 1, "error": 1}
+    assert attempts == {"flaky": 2, "broken": 3}
+    st = rt.stats()
+    assert st["errors"] == 1 and st["retries"] == 3 and st["retrying"] == 0
+
+    # A pending retry is not claimed before its backoff elapses
+    _events_db(tmp_path / "later.sqlite", [("journal.append", {"entry": "broken"})])
+    slow = BatchedEventRuntime({"journal.append": journal}, db_path=str(tmp_path / "later.sqlite"), max_retries=1, retry_base_sec=60.0)
+    slow.run_once()
+    assert slow.claim() == [] and slow.stats()["retrying"] == 1
+    rt.stop()
+    slow.stop()
+
+
+def test_memory_write_batch_upserts_point_structs_on_qdrant_client(monkeypatch):
+    import types
+
+    import services.memory.eventlog_runner as er
+    from services.memory.eventlog_runner import _Event
+
+    class Emb:
+        def encode(self, texts, normalize_embeddings=True):
+            return [[1.0] for _ in texts]
+
+    calls = []
+
+    class Client:  # QdrantClient surface: upsert() only
+        def upsert(self, collection_name, points):
+            calls.append((collection_name, [(p.id, p.payload["id"]) for p in points]))
+
+    class Point:
+        def __init__(self, id, vector, payload):
+            self.id, self.vector, self.payload = id, vector, payload
+
+    monkeypatch.setattr(er, "_EMBEDDER", Emb())
+    monkeypatch.setattr(er, "_CLIENT", Client())
+    monkeypatch.setattr(er, "_point_models", lambda: types.SimpleNamespace(PointStruct=Point))
+    monkeypatch.setattr(er, "_memory_collection", lambda: "mem")
+    evs = [_Event(i, f"idem-{i}", "c", "memory.write", {"text": f"t{i}", "id": f"m{i}"}, 0) for i in range(2)]
+    assert er._memory_write_batch(evs) == {}
+    assert calls == [("mem", [("m0", "m0"), ("m1", "m1")])]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+def _memory(tmp_path, monkeypatch):
+    mm = pytest.importorskip("pods.memory.memory_manager")
+    monkeypatch.setattr(mm, "MEMORY_FILE", str(tmp_path / "long_term_memory.json"))
+    return mm.Memory()
+
+
+def test_store_many_single_commit_and_per_item_results(tmp_path, monkeypatch):
+    mem = _memory(tmp_path, monkeypatch)
+    commits = []
+    real_commit = mem.storage.commit
+    monkeypatch.setattr(
+        mem.storage,
+        "commit",
+        lambda state, puts=(), deletes=(): (commits.append(list(puts)), real_commit(state, puts, deletes)),
+    )
+
+    res = mem.store_many(
+        [
+            {"content": "first line", "type": "chat"},
+            "not a dict",
+            {"content": "second line", "type": "chat"},
+            {"content": "first line", "type": "chat"},
+        ]
+    )
+
+    assert len(commits) == 1 and len(commits[0]) == 3
+    assert "error" in res[1]
+    assert res[0]["id"] and res[2]["id"] and res[0]["id"] != res[2]["id"]
+    assert res[3] == {"id": res[0]["id"], "deduped": True}
+    assert len(mem) == 2
+    on_disk = json.loads((tmp_path / "long_term_memory.json").read_text())
+    assert [m["content"] for m in on_disk] == ["first line", "second line"]
+
+
+def test_add_batch_endpoint_json_mode(tmp_path, monkeypatch):
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setattr(api, "JSON_STORE_PATH", str(tmp_path / "store.json"))
+    monkeypatch.setattr(api, "_json_mode_enabled", lambda: True)
+    monkeypatch.setenv("AXIOM_PROVENANCE_REQUIRED", "true")
+    monkeypatch.setenv("EVENTLOG_ENABLED", "false")
+    saves = []
+    real_save = api._json_save
+    monkeypatch.setattr(api, "_json_save", lambda rows: (saves.append(len(rows)), real_save(rows)))
+
+    c = api.app.test_client()
+    r = c.post(
+        "/memory/add_batch",
+        json={
+            "items": [
+                {"content": "a", "provenance": "test"},
+                {"content": "b"},
+                {"text": "c", "provenance": "test"},
+                {"provenance": "test"},
+            ]
+        },
+    )
+    assert r.status_code in (200, 202)
+    results = r.get_json()["results"]
+    assert [bool(x.get("id")) for x in results] == [True, False, True, False]
+    assert results[1]["error"] == "provenance_required"
+    assert results[3]["error"] == "missing_content"
+    assert saves == [2]
+
+
+def test_add_batch_endpoint_rejects_non_list(monkeypatch):
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    c = api.app.test_client()
+    r = c.post("/memory/add_batch", json={"items": "nope"})
+    assert r.status_code == 400
+
+
+def test_add_batch_outbox_handoff_skips_direct_push(monkeypatch):
+    import sys
+    import types
+
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setattr(api, "_json_mode_enabled", lambda: False)
+    monkeypatch.setattr(api.args, "use_qdrant", False, raising=False)
+    monkeypatch.setattr(api, "ENABLE_PUSH", True)
+    monkeypatch.setattr(api, "vector_ready", True)
+    monkeypatch.setenv("EVENTLOG_ENABLED", "false")
+    monkeypatch.setenv("AXIOM_PROVENANCE_REQUIRED", "false")
+    monkeypatch.setenv("CONTRACTS_V2_ENABLED", "false")
+
+    class _Mem:
+        def store_many(self, entries):
+            return [{"id": f"m{i}"} for i, _ in enumerate(entries)]
+
+    monkeypatch.setattr(api, "memory", _Mem())
+    appended = []
+    outbox = types.ModuleType("outbox")
+    outbox.OUTBOX_ENABLED = True
+    models = types.ModuleType("outbox.models")
+    models.OutboxItem = lambda **kw: kw
+    store = types.ModuleType("outbox.store")
+    store.append = lambda item: (appended.append(item), len(appended))[1]
+    monkeypatch.setitem(sys.modules, "outbox", outbox)
+    monkeypatch.setitem(sys.modules, "outbox.models", models)
+    monkeypatch.setitem(sys.modules, "outbox.store", store)
+    posts = []
+    monkeypatch.setattr(api.requests, "post", lambda *a, **k: posts.append(a))
+
+    r = api.app.test_client().post("/memory/add_batch", json={"items": [{"content": "a"}, {"content": "b"}]})
+    assert r.status_code == 202
+    assert [it["type"] for it in appended] == ["vector_upsert", "belief_recompute"] * 2
+    assert posts == []
+
+
+def test_add_batch_outbox_rejects_when_nothing_accepted(monkeypatch):
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setattr(api, "_json_mode_enabled", lambda: False)
+    monkeypatch.setattr(api.args, "use_qdrant", False, raising=False)
+    monkeypatch.setenv("AXIOM_PROVENANCE_REQUIRED", "true")
+    stored = []
+    monkeypatch.setattr(api, "memory", type("_Mem", (), {"store_many": lambda self, e: stored.extend(e) or []})())
+
+    r = api.app.test_client().post("/memory/add_batch", json={"items": [{"content": "a"}, {"content": "b"}]})
+    assert r.status_code == 422
+    assert [x["error"] for x in r.get_json()["results"]] == ["provenance_required"] * 2
+    assert stored == []
+
+
+def test_add_batch_eventlog_failure_sends_only_unappended_items_direct(tmp_path, monkeypatch):
+    import sys
+    import types
+
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setattr(api, "JSON_STORE_PATH", str(tmp_path / "store.json"))
+    monkeypatch.setattr(api, "_json_mode_enabled", lambda: True)
+    monkeypatch.setenv("EVENTLOG_ENABLED", "true")
+    monkeypatch.setenv("AXIOM_PROVENANCE_REQUIRED", "false")
+
+    def _append(idem_key, cid, ev_type, payload):
+        if payload["entry"] == "b":
+            raise OSError("disk full")
+        return f"ev-{payload['entry']}"
+
+    store = types.ModuleType("eventlog.store")
+    store.append = _append
+    monkeypatch.setitem(sys.modules, "eventlog", types.ModuleType("eventlog"))
+    monkeypatch.setitem(sys.modules, "eventlog.store", store)
+    written = []
+    real_append_many = api._json_append_many
+    monkeypatch.setattr(api, "_json_append_many", lambda rows: (written.extend(rows), real_append_many(rows))[1])
+
+    r = api.app.test_client().post("/memory/add_batch", json={"items": [{"content": "a"}, {"content": "b"}, {"content": "c"}]})
+    assert r.status_code == 200
+    results = r.get_json()["results"]
+    assert [results[0].get("event_id"), results[2].get("event_id")] == ["ev-a", "ev-c"]
+    assert results[1].get("id") and "event_id" not in results[1]
+    assert [row["content"] for row in written] == ["b"]
+
+
+def test_add_batch_strict_governor_requires_headers(monkeypatch):
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setattr(api, "governor_enabled", lambda: True)
+    monkeypatch.setattr(api, "strict_mode", lambda: True)
+    monkeypatch.setattr(api, "ensure_correlation_and_idempotency", lambda h, p, **kw: h)
+    r = api.app.test_client().post("/memory/add_batch", json={"items": [{"content": "a"}]})
+    assert r.status_code == 400
+    assert r.get_json()["error"] == "missing_correlation_id"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from pods.memory.backfill_job import BackfillJob
+
+
+def _mems(n):
+    return [{"id": f"m{i}", "content": f"text {i}", "tags": ["t"]} for i in range(n)]
+
+
+def test_batches_pushed_concurrently_and_state_persisted(tmp_path):
+    seen = []
+    lock = threading.Lock()
+
+    def push(items):
+        with lock:
+            seen.append([it["metadata"]["memory_id"] for it in items])
+        return len(items)
+
+    recs = _mems(23) + [{"id": "empty", "content": ""}]
+    state = tmp_path / "state.json"
+    job = BackfillJob(lambda: recs, push, state_path=str(state), batch_size=5, workers=3)
+    st = job.start(background=False)
+
+    assert st["status"] == "completed"
+    assert st["pushed"] == 23 and st["skipped"] == 1 and st["cursor"] == 24
+    assert st["items_per_sec"] > 0
+    assert sorted(x for batch in seen for x in batch) == sorted(f"m{i}" for i in range(23))
+    assert max(len(b) for b in seen) == 5
+    assert json.loads(state.read_text())["status"] == "completed"
+
+
+def test_failed_batch_holds_cursor_and_resume_continues(tmp_path):
+    state = tmp_path / "state.json"
+    recs = _mems(20)
+    fail = {"on": True}
+
+    def push(items):
+        if fail["on"] and items[0]["metadata"]["memory_id"] == "m10":
+            raise RuntimeError("vector pod down")
+        return len(items)
+
+    job = BackfillJob(lambda: recs, push, state_path=str(state), batch_size=5, workers=2, retries=0)
+    st = job.start(background=False)
+    assert st["status"] == "completed_with_errors"
+    assert st["failed_batches"] == [10] and st["failed"] == 5
+    assert st["cursor"] == 10 and st["cursor_id"] == "m9"
+
+    # A record inserted before the cursor shifts offsets; the id anchor keeps the resume point.
+    recs.insert(0, {"id": "new", "content": "late arrival"})
+    fail["on"] = False
+    pushed = []
+    job2 = BackfillJob(
+        lambda: recs,
+        lambda items: pushed.extend(i["metadata"]["memory_id"] for i in items) or len(items),
+        state_path=str(state),
+        batch_size=5,
+    )
+    st2 = job2.start(background=False)
+    assert st2["resumed_from"] == 11
+    assert st2["status"] == "completed"
+    assert pushed == [f"m{i}" for i in range(10, 20)]
+
+
+def test_short_push_is_retried_then_fails_without_advancing(tmp_path):
+    calls = []
+
+    def push(items):
+        calls.append(len(items))
+        return 0  # e.g. /v1/memories answering 200 {"inserted": 0}
+
+    job = BackfillJob(lambda: _mems(4), push, state_path=str(tmp_path / "state.json"), batch_size=4, workers=1, retries=1)
+    st = job.start(background=False)
+
+    assert calls == [4, 4]
+    assert st["status"] == "completed_with_errors"
+    assert st["pushed"] == 0 and st["cursor"] == 0
+
+
+def test_backfill_endpoint_forwards_request_id(tmp_path, monkeypatch):
+    import pytest
+
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setenv("BACKFILL_STATE_PATH", str(tmp_path / "state.json"))
+    monkeypatch.setattr(api, "vector_ready", True)
+    monkeypatch.setattr(api, "_backfill_source", lambda: _mems(3))
+    sent = []
+
+    class _Resp:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"inserted": 3}
+
+    monkeypatch.setattr(api.requests, "post", lambda url, **kw: (sent.append(kw.get("headers")), _Resp())[1])
+    r = api.app.test_client().post("/backfill", json={"wait": True, "resume": False}, headers={api._REQID_HEADER: "rid-123"})
+
+    assert r.status_code == 200 and r.get_json()["pushed"] == 3
+    assert sent == [{api._REQID_HEADER: "rid-123"}]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from pods.memory.memory_index import MemoryIndex
+
+
+def _beliefs():
+    return [
+        {"id": "b1", "type": "belief", "tags": ["x"], "belief_type": "core", "importance": 0.9, "confidence": 0.5},
+        {"id": "g1", "type": "goal", "memory_type": "semantic", "importance": 0.7},
+        {"id": "b2", "type": "belief", "tags": ["x", "y"], "belief_type": "fact", "importance": 0.2},
+        {"id": "b3", "type": "belief", "tags": "y", "belief_type": "core", "importance": 0.85, "confidence": 0.6},
+    ]
+
+
+def test_lookups_preserve_list_order():
+    recs = _beliefs()
+    idx = MemoryIndex()
+    idx.ensure(recs)
+    assert idx.position("b2") == 2
+    assert idx.of_type("goal") == [1]
+    assert idx.beliefs_with_tag("x") == [0, 2]
+    assert idx.beliefs_with_tag("y") == [2, 3]
+    assert idx.beliefs_of_type("core") == [0, 3]
+    assert idx.beliefs_importance_at_least(0.8) == [0, 3]
+    assert idx.beliefs_confidence_between(0.3, 0.7) == [0, 3]
+
+
+def test_incremental_append_replace_and_rebuild():
+    recs = _beliefs()
+    idx = MemoryIndex()
+    idx.ensure(recs)
+
+    recs.append({"id": "b4", "type": "belief", "importance": 0.95})
+    idx.append(recs[-1])
+    assert idx.beliefs_importance_at_least(0.9) == [0, 4]
+
+    recs[0] = {"id": "b1", "type": "belief", "importance": 0.1}
+    idx.replace(0, recs[0])
+    assert idx.beliefs_importance_at_least(0.8) == [3, 4]
+    assert idx.beliefs_with_tag("x") == [2]
+
+    # In-place mutation picked up by refresh()
+    recs[2]["importance"] = 0.99
+    idx.refresh(2, recs[2])
+    assert idx.beliefs_importance_at_least(0.9) == [2, 4]
+
+    # Appends made behind the index's back are indexed incrementally,
+    # removals force a rebuild.
+    recs.append({"id": "g2", "type": "goal"})
+    idx.ensure(recs)
+    assert idx.of_type("goal") == [1, 5]
+    del recs[1]
+    idx.ensure(recs)
+    assert idx.of_type("goal") == [4]
+    assert idx.position("b4") == 3
+
+
+def test_memory_uses_index(tmp_path, monkeypatch):
+    mm = pytest.importorskip("pods.memory.memory_manager")
+    monkeypatch.setattr(mm, "MEMORY_FILE", str(tmp_path / "long_term_memory.json"))
+    mem = mm.Memory()
+    mem.long_term_memory = _beliefs()
+
+    assert [b["id"] for b in mem.find_beliefs_by_tag("x")] == ["b1", "b2"]
+    assert [b["id"] for b in mem.get_high_importance_beliefs(0.8)] == ["b1", "b3"]
+    assert mem.get("g1")["type"] == "goal"
+
+    # Re-storing identical content dedupes on the stable id via the index
+    mem.store({"type": "note", "content": "same text", "importance": 0.5})
+    mem.store({"type": "note", "content": "same text", "importance": 0.1})
+    assert len(mem) == 5
+    note = mem.long_term_memory[-1]
+    assert mem.get(note["id"])["importance"] == 0.1
+
+    mem.prune(0.15)
+    assert mem.get(note["id"]) is None
+    assert [b["id"] for b in mem.find_beliefs_by_tag("x")] == ["b1", "b2"]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def _mem(i, speaker="axiom", **kw):
+    return {"uuid": f"m{i:02d}", "speaker": speaker, "timestamp": f"2024-01-{i:02d}T00:00:00Z", "content": f"c{i}", "metadata": {"source": "s", "n": i}, **kw}
+
+
+def test_cursor_pages_are_stable_and_filtered():
+    from services.memory.memory_paging import MemoryQuery
+
+    data = [_mem(i, speaker="axiom" if i % 3 else "user") for i in range(1, 21)]
+    got, cursor = [], None
+    while True:
+        q = MemoryQuery.from_args({"limit": "4", "cursor": cursor or ""}.get, default_speaker="axiom")
+        page, cursor = q.select(data)
+        got.extend(m["uuid"] for m in page)
+        # A newer insert between pages must not shift the remaining pages
+        data.append(_mem(28, uuid=f"new{len(got)}"))
+        if cursor is None:
+            break
+    expected = [f"m{i:02d}" for i in range(20, 0, -1) if i % 3]
+    assert got == expected
+
+    page, nxt = MemoryQuery.from_args({"order": "asc", "limit": "2", "speaker": "*"}.get).select(data)
+    assert [m["uuid"] for m in page] == ["m01", "m02"] and nxt
+
+    # page= falls back to offset paging for older clients
+    page, _ = MemoryQuery.from_args({"page": "1", "limit": "3"}.get, default_speaker="axiom").select(data[:20])
+    assert [m["uuid"] for m in page] == expected[3:6]
+
+    with pytest.raises(ValueError):
+        MemoryQuery.from_args({"cursor": "not-a-cursor"}.get)
+
+
+def test_projection_time_window_and_mixed_timestamps():
+    from services.memory.memory_paging import MemoryQuery
+
+    rows = [_mem(1), _mem(2, tags=["x"]), {"uuid": "j1", "speaker": "axiom", "created_at": 1704412800.0, "content": "epoch"}]
+    q = MemoryQuery.from_args({"fields": "uuid,metadata.n,missing", "since": "2024-01-02", "speaker": "*"}.get)
+    page, _ = q.select(rows)
+    # 1704412800 == 2024-01-05T00:00:00Z sorts with the ISO timestamps
+    assert page == [{"uuid": "j1"}, {"uuid": "m02", "metadata": {"n": 2}}]
+
+    q = MemoryQuery.from_args({"tags": "x,y", "type": "", "speaker": "*"}.get)
+    assert [m["uuid"] for m in q.select(rows)[0]] == ["m02"]
+    assert q.filter_spec() == {"must": [{"key": "tags", "match": {"any": ["x", "y"]}}]}
+    assert MemoryQuery(speaker="axiom", fields=["content"]).payload_keys()[:3] == ["content", "created_at", "id"]
+
+
+def test_qdrant_scroll_iterator_is_lazy_and_pushes_filter():
+    from services.memory.memory_paging import MemoryQuery, iter_qdrant_items
+
+    calls = []
+
+    class Client:
+        def scroll(self, collection_name, limit, offset, with_payload, with_vectors, scroll_filter=None):
+            calls.append((offset, scroll_filter, with_payload, with_vectors))
+            start = offset or 0
+            pts = [SimpleNamespace(id=i, payload=_mem(i + 1)) for i in range(start, min(start + limit, 10))]
+            return pts, (start + limit if start + limit < 10 else None)
+
+    q = MemoryQuery(speaker="axiom", limit=2, order="asc", fields=["content"])
+    stream = iter_qdrant_items(Client(), "mem", scroll_filter="F", with_payload=q.payload_keys(), batch=4)
+    assert list(q.stream(stream, limit=3)) == [{"content": "c1"}, {"content": "c2"}, {"content": "c3"}]
+    assert len(calls) == 1 and calls[0][1] == "F" and calls[0][3] is False
+
+    page, cursor = q.select(iter_qdrant_items(Client(), "mem", batch=4))
+    assert page == [{"content": "c1"}, {"content": "c2"}] and cursor
+
+
+def test_ordered_scroll_stops_after_the_page_and_resumes_on_ties():
+    from services.memory.memory_paging import MemoryQuery, iter_qdrant_ordered
+
+    # Two points per day so page boundaries land inside timestamp ties
+    rows = [{"uuid": f"m{i:02d}", "speaker": "axiom", "timestamp": f"2024-01-{i // 2 + 1:02d}T00:00:00"} for i in range(20)]
+    calls = []
+
+    class Client:
+        def scroll(self, collection_name, scroll_filter, limit, order_by, with_payload, with_vectors):
+            calls.append((order_by, limit))
+            desc = sorted(rows, key=lambda r: r["timestamp"], reverse=True)
+            hits = [r for r in desc if order_by is None or r["timestamp"] <= order_by]
+            return [SimpleNamespace(id=r["uuid"], payload=r) for r in hits[:limit]], None
+
+    def source(q):
+        return q.bounded(iter_qdrant_ordered(Client(), "mem", order_by=lambda s: s, start_from=q.start_from(), batch=3))
+
+    q = MemoryQuery(limit=3)
+    page, cursor = q.select(source(q))
+    assert [m["uuid"] for m in page] == ["m19", "m18", "m17"]
+    # limit + 1 rows plus the tie at the boundary, not the whole collection
+    assert len(calls) == 2
+
+    got = [m["uuid"] for m in page]
+    while cursor:
+        q = MemoryQuery.from_args({"limit": "3", "cursor": cursor}.get)
+        page, cursor = q.select(source(q))
+        got.extend(m["uuid"] for m in page)
+    assert got == [f"m{i:02d}" for i in range(19, -1, -1)]
+
+    q = MemoryQuery(since="2024-01-08", until="2024-01-10")
+    assert q.filter_spec(time_range=True) == {
+        "must": [{"key": "timestamp", "range": {"gte": "2024-01-08", "lt": "2024-01-10"}}]
+    }
+    assert q.filter_spec() == {}
+
+
+def test_legacy_filters_keep_the_bare_list_response(monkeypatch):
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    monkeypatch.setattr(api, "_json_mode_enabled", lambda: False)
+    monkeypatch.setattr(api.args, "use_qdrant", False, raising=False)
+    monkeypatch.setattr(api, "memory", SimpleNamespace(snapshot=lambda: [_mem(1), _mem(2, tags=["x"])]))
+    c = api.app.test_client()
+
+    legacy = c.get("/memories?tags=x&type=chat&limit=5").get_json()
+    assert isinstance(legacy, list) and len(legacy) == 2
+
+    paged = c.get("/memories?order=asc&tags=x").get_json()
+    assert [m["uuid"] for m in paged["memories"]] == ["m02"]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+
+class _Store:
+    """In-memory stand-in with the outbox.store claim/ack/retry surface."""
+
+    def __init__(self, items):
+        self.items = {it.id: it for it in items}
+        self.status = {it.id: "PENDING" for it in items}
+        self.attempts = {}
+        self.claims = []
+
+    def claim(self, max_items=1):
+        ids = [i for i, s in self.status.items() if s == "PENDING"][:max_items]
+        for i in ids:
+            self.status[i] = "CLAIMED"
+        self.claims.append(len(ids))
+        return [self.items[i] for i in ids]
+
+    def ack_done(self, item_id):
+        self.status[item_id] = "DONE"
+
+    def fail_and_maybe_retry(self, item_id, err, max_retries):
+        self.attempts[item_id] = self.attempts.get(item_id, 0) + 1
+        self.status[item_id] = "DLQ" if self.attempts[item_id] > max_retries else "PENDING"
+        return self.status[item_id]
+
+
+def _item(i, typ, payload, age=0.0):
+    return SimpleNamespace(id=i, idem_key=f"idem_{i}", cid=f"cid_{i}", type=typ, payload=payload, created_at=time.time() - age)
+
+
+def test_coalesces_per_type_and_acks_per_item(monkeypatch):
+    import services.memory.outbox_drainer as od
+
+    monkeypatch.setattr(od, "_saga_step", lambda *a, **k: None)
+    items = [_item(i, "vector_upsert", {"content": f"c{i}", "metadata": {"memory_id": f"m{i}"}}, age=30) for i in range(1, 5)]
+    items += [_item(10 + i, "belief_recompute", {"memory_id": "m1" if i < 3 else "m2"}) for i in range(4)]
+    store = _Store(items)
+
+    vector_calls, recomputes = [], []
+
+    def vec_batch(group):
+        vector_calls.append([it.payload["metadata"]["memory_id"] for it in group])
+        return {3: "upsert: boom"}
+
+    drainer = od.BatchingOutboxDrainer(
+        handlers={"belief_recompute": lambda p: recomputes.append((p["memory_id"], p["coalesced"]))},
+        batch_handlers={"vector_upsert": vec_batch},
+        store=store,
+        batch_size=16,
+        max_retries=2,
+    )
+    assert drainer.drain_once() == 8
+    assert vector_calls == [["m1", "m2", "m3", "m4"]]
+    assert sorted(recomputes) == [("m1", 3), ("m2", 1)]
+    assert store.status[3] == "PENDING" and store.attempts == {3: 1}
+    assert sum(1 for s in store.status.values() if s == "DONE") == 7
+
+    st = drainer.stats()
+    assert st["last_batch_size"] == 8 and st["drained"] == 7 and st["failed"] == 1
+    assert st["backlog_age_sec"] >= 29 and st["drain_rate_per_sec"] > 0
+
+
+def test_batch_size_bounds_claims_and_failures_reach_dlq(monkeypatch):
+    import services.memory.outbox_drainer as od
+
+    monkeypatch.setattr(od, "_saga_step", lambda *a, **k: None)
+    store = _Store([_item(i, "custom", {"n": i}) for i in range(1, 6)])
+
+    def handler(payload):
+        if payload["n"] == 5:
+            raise RuntimeError("down")
+
+    drainer = od.BatchingOutboxDrainer(handlers={"custom": handler}, store=store, batch_size=2, max_retries=1)
+    while drainer.drain_once():
+        pass
+    assert max(store.claims) == 2
+    assert store.status[5] == "DLQ"
+    assert [store.status[i] for i in range(1, 5)] == ["DONE"] * 4
+
+
+def test_vector_batch_maps_client_errors_to_items(monkeypatch):
+    import services.memory.outbox_drainer as od
+
+    inserts = []
+
+    class Client:
+        def insert(self, docs):
+            inserts.append([d["metadata"]["memory_id"] for d in docs])
+            return {"inserted": 1, "failed": 1, "errors": [{"id": "m2", "error": "upsert: rejected"}]}
+
+    monkeypatch.setattr(od, "_VECTOR_CLIENT", Client())
+    items = [_item(1, "vector_upsert", {"content": "a", "metadata": {"memory_id": "m1"}}), _item(2, "vector_upsert", {"content": "b", "metadata": {"memory_id": "m2"}})]
+    assert od._vector_upsert_batch(items) == {2: "upsert: rejected"}
+    assert inserts == [["m1", "m2"]]
+
+
+def test_belief_recompute_coalesces_per_resolved_belief(monkeypatch):
+    import services.memory.outbox_drainer as od
+
+    monkeypatch.setattr(od, "_saga_step", lambda *a, **k: None)
+    items = [_item(i, "belief_recompute", {"memory_id": f"m{i}"}) for i in range(1, 5)]
+    items.append(_item(5, "belief_recompute", {"memory_id": "m5", "belief_id": "b9"}))
+    items.append(SimpleNamespace(id=None, idem_key="x", cid="c", type="belief_recompute", payload={"memory_id": "m1"}))
+    store = _Store([it for it in items if it.id is not None])
+    store.claim = lambda max_items=1: list(items)
+    lookups, recomputes = [], []
+
+    def resolver(mids):
+        lookups.append(list(mids))
+        return {"m1": ["b1"], "m2": ["b1"], "m3": ["b1", "b2"]}
+
+    drainer = od.BatchingOutboxDrainer(
+        handlers={"belief_recompute": lambda p: recomputes.append((p.get("belief_id"), p.get("memory_ids"), p["coalesced"]))},
+        store=store,
+        belief_resolver=resolver,
+    )
+    assert drainer.drain_once() == 5
+    assert lookups == [["m1", "m2", "m3", "m4"]]
+    assert sorted(recomputes, key=str) == sorted(
+        [("b1", ["m1", "m2", "m3"], 3), ("b2", ["m3"], 1), ("b9", ["m5"], 1), (None, None, 1)], key=str
+    )
+    assert all(store.status[i] == "DONE" for i in range(1, 6))
+
+
+def test_belief_graph_resolves_memories_to_citing_beliefs(tmp_path):
+    from belief_graph.sqlite_backend import SQLiteBeliefGraph
+
+    g = SQLiteBeliefGraph(str(tmp_path / "bg.sqlite"))
+    a, b = g.upsert_many([("sky", "is", "blue", 0.8, ["m1", "m2"]), ("sea", "is", "blue", 0.8, ["m2"])])
+    assert g.beliefs_for_sources(["m1", "m2", "m3"]) == {"m1": [a], "m2": [a, b]}
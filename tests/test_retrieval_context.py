@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import types
+
+import pytest
+
+from pods.memory import retrieval_context as rc
+
+
+def test_overrides_are_clamped_and_defaults_come_from_module():
+    mod = types.SimpleNamespace(_COMPOSITE=True, _PROFILE="p", _MMR=0.4, _TOP_N=8, TOP_K_FRAGMENTS=10)
+    base = rc.RetrievalContext.defaults(mod)
+    ctx = base.with_overrides({"mmr_lambda": 3, "top_n": 0, "top_k": "x", "scoring_profile": "fast"})
+    assert (ctx.composite_enabled, ctx.scoring_profile, ctx.mmr_lambda, ctx.top_n, ctx.top_k) == (
+        True,
+        "fast",
+        1.0,
+        1,
+        10,
+    )
+    assert rc.current(mod) == base
+
+
+def test_concurrent_requests_see_only_their_own_context():
+    seen = {}
+
+    async def pipeline(tag):
+        await asyncio.sleep(0.01)
+        ctx = rc.current()
+        ctx.debug["tag"] = tag
+        return ctx.top_k
+
+    def worker(i):
+        ctx = rc.RetrievalContext.defaults().with_overrides({"top_k": i + 1})
+        out = rc.run_with_context(ctx, lambda: pipeline(i), timeout=5)
+        seen[i] = (out, ctx.debug["tag"])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert seen == {i: (i + 1, i) for i in range(8)}
+    assert rc._CURRENT.get() is None
+
+
+def test_retrieve_route_does_not_mutate_pipeline_globals(monkeypatch):
+    api = pytest.importorskip("pods.memory.pod2_memory_api")
+    pipe = api.memory_response_pipeline
+    monkeypatch.setattr(pipe, "_MMR", 0.4, raising=False)
+
+    async def fake(user_question, retrieval_context=None):
+        assert getattr(pipe, "_MMR") == 0.4
+        retrieval_context.debug["mmr"] = retrieval_context.mmr_lambda
+        return f"answer:{user_question}"
+
+    monkeypatch.setattr(pipe, "generate_enhanced_context_response", fake, raising=False)
+    r = api.app.test_client().post("/retrieve", json={"question": "q", "mmr_lambda": 0.9})
+    assert r.status_code == 200
+    body = r.get_json()
+    assert body["response"] == "answer:q"
+    assert body["memory_debug"] == {"mmr": 0.9}
+
+
+def test_requests_on_different_threads_run_in_parallel():
+    import time
+
+    async def blocking():
+        time.sleep(0.2)  # pipeline coroutines still do sync I/O
+        return rc.current().top_k
+
+    out = {}
+
+    def worker(i):
+        out[i] = rc.run_with_context(rc.RetrievalContext.defaults().with_overrides({"top_k": i + 1}), blocking, timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    t0 = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert out == {i: i + 1 for i in range(4)}
+    assert time.monotonic() - t0 < 0.6
+
+
+def test_timeout_raises_timeout_error():
+    async def slow():
+        await asyncio.sleep(1)
+
+    with pytest.raises(TimeoutError):
+        rc.run_with_context(rc.RetrievalContext.defaults(), slow, timeout=0.05)
+
+
+def test_vector_recall_uses_context_top_k():
+    va = pytest.importorskip("services.vector.vector_adapter")
+    limits = []
+
+    class _Client:
+        def query_memory(self, **kw):
+            limits.append(kw["limit"])
+            return []
+
+    adapter = object.__new__(va.VectorAdapter)
+    adapter.qdrant_unavailable = False
+    adapter.qdrant_client = _Client()
+    adapter.embedder = types.SimpleNamespace(embed_text=lambda q: [0.0])
+
+    ctx = rc.RetrievalContext.defaults(va).with_overrides({"top_k": 3})
+    rc.run_with_context(ctx, lambda: adapter.recall_relevant_memories("q"), timeout=5)
+    assert limits == [3]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib
+import json
+import os
+
+import pytest
+
+
+def test_compiles_once_and_reloads_on_mtime(tmp_path):
+    pytest.importorskip("jsonschema")
+    from contracts.schema_registry import SchemaRegistry
+
+
+    path = tmp_path / "note.json"
+    path.write_text(json.dumps({"type": "object", "required": ["text"]}))
+    reg = SchemaRegistry(check_interval=0, flush_interval=0)
+    reg.register("note", path)
+
+    assert reg.validate("note", {"text": "x"}) == (True, "ok", None)
+    ok, outcome, err = reg.validate("note", {})
+    assert not ok and outcome == "schema_violation" and "text" in err
+    assert reg.loads == 1
+
+    path.write_text(json.dumps({"type": "object", "required": ["body"]}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert reg.validate("note", {"text": "x"})[0] is False
+    assert reg.loads == 2
+    assert reg.stats()["note"] == {"ok": 1, "schema_violation": 2}
+
+
+def test_outcomes_counted_and_flushed_as_one_signal(monkeypatch, tmp_path):
+    import contracts.schema_registry as sr
+    from contracts.schema_registry import SchemaRegistry
+
+    reporter = importlib.import_module("pods.cockpit.cockpit_reporter")
+
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", tmp_path)
+    reg = SchemaRegistry(check_interval=0, flush_interval=0)
+    reg.register("missing", tmp_path / "nope.json")
+    for _ in range(3):
+        ok, outcome, _err = reg.validate("missing", {"a": 1})
+        assert ok and outcome in ("schema_missing", "jsonschema_unavailable")
+    reg.record("contracts_v2.version", "v2")
+
+    # Nothing is written per call; flush publishes one rollup
+    assert not list(tmp_path.glob("contracts_v2.*.json"))
+    reg.flush()
+    files = list(tmp_path.glob("contracts_v2.*.json"))
+    assert [f.name for f in files] == [f"contracts_v2.schema_stats.{sr._process_key()}.json"]
+    counters = json.loads(files[0].read_text())["data"]["counters"]
+    assert sum(counters["missing"].values()) == 3
+    assert counters["contracts_v2.version"] == {"v2": 1}
+
+
+def test_contracts_v2_counts_versions_instead_of_signals(monkeypatch, tmp_path):
+    monkeypatch.setenv("CONTRACTS_V2_ENABLED", "true")
+    monkeypatch.setenv("CONTRACTS_REJECT_UNKNOWN", "true")
+    import contracts.schema_registry as sr
+    from contracts.v2.validator import validate
+
+    reporter = importlib.import_module("pods.cockpit.cockpit_reporter")
+
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", tmp_path)
+    before = sr.get_registry().stats().get("contracts_v2.version", {}).get("v2", 0)
+    assert validate({"schema_version": "v2", "entry": "hello"}, "journal")["ok"] is True
+    assert sr.get_registry().stats()["contracts_v2.version"]["v2"] == before + 1
+    assert not list(tmp_path.glob("contracts_v2.version_seen*.json"))
+
+
+def test_version_mix_sums_every_process_rollup(monkeypatch, tmp_path):
+    from datetime import datetime, timedelta
+
+    from pods.cockpit import cockpit_aggregator as agg
+
+    monkeypatch.delenv("COCKPIT_SIGNAL_BACKEND", raising=False)
+    monkeypatch.setattr(agg, "SIGNAL_DIR", tmp_path)
+    now = datetime.utcnow()
+    for proc, v2, v1, age in (("a-1", 3, 1, 0), ("b-2", 1, 3, 0), ("c-3", 50, 0, 7200)):
+        rec = {
+            "pod": "contracts_v2",
+            "signal": f"schema_stats.{proc}",
+            "ts": (now - timedelta(seconds=age)).isoformat(),
+            "data": {"counters": {"contracts_v2.version": {"v2": v2, "v1": v1}}},
+        }
+        (tmp_path / f"contracts_v2.schema_stats.{proc}.json").write_text(json.dumps(rec))
+
+    cv2 = agg.aggregate_status()["contracts_v2"]
+    # Both live processes count; the stale one does not
+    assert cv2["version_mix"] == {"v2": 0.5, "v1": 0.5}
+    assert cv2["schema_validation"]["contracts_v2.version"] == {"v2": 4, "v1": 4}
+
+
+def test_governor_fails_closed_on_unreadable_schema(monkeypatch, tmp_path):
+    pytest.importorskip("jsonschema")
+    import governor.validator as gv
+
+    bad = tmp_path / "journal.json"
+    bad.write_text("{not json")
+    monkeypatch.setattr(gv, "_schema_path", lambda kind: bad if kind == "journal" else tmp_path / "absent.json")
+    monkeypatch.setattr(gv, "_REGISTERED", False)
+    import contracts.schema_registry as sr
+
+    monkeypatch.setattr(sr, "_REGISTRY", sr.SchemaRegistry(check_interval=0, flush_interval=0))
+    assert gv.validate_payload("journal", {"entry": "x"}) == (False, "schema_violation:schema_unreadable")
+    assert gv.validate_payload("belief", {}) == (True, "schema_missing")
+
+
+def test_first_outcome_flushes_and_exit_flushes_the_rest(monkeypatch, tmp_path):
+    import contracts.schema_registry as sr
+
+    reporter = importlib.import_module("pods.cockpit.cockpit_reporter")
+
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", tmp_path)
+    reg = sr.SchemaRegistry(check_interval=0, flush_interval=3600)
+    monkeypatch.setattr(sr, "_REGISTRY", reg)
+    out = tmp_path / f"contracts_v2.schema_stats.{sr._process_key()}.json"
+
+    def versions():
+        return json.loads(out.read_text())["data"]["counters"]["contracts_v2.version"]
+
+    reg.record("contracts_v2.version", "v2")
+    assert versions() == {"v2": 1}
+
+    # Inside the interval nothing is published until the process exits
+    reg.record("contracts_v2.version", "v1")
+    assert versions() == {"v2": 1}
+    sr._flush_at_exit()
+    assert versions() == {"v2": 1, "v1": 1}
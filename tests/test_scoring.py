@@ -185,3 +185,31 @@ def test_beliefs_enabled_aligned_item_ranks_higher():
     finally:
         os.environ.pop("AXIOM_BELIEFS_ENABLED", None)
         os.environ.pop("AXIOM_ACTIVE_BELIEFS_JSON", None)
+
+
+def test_score_batch_matches_scalar_and_fallback(monkeypatch):
+    import memory.scoring as ms
+
+    now = datetime.now(timezone.utc)
+    qv = [1.0, 0.2, 0.0]
+    mems = [
+        _mk_mem([1.0, 0.0, 0.0], timestamp=now.isoformat(), times_used=3),
+        _mk_mem([0.9, 0.1, 0.1], timestamp=(now - timedelta(days=3)).isoformat()),
+        _mk_mem([0.0, 1.0, 0.0], timestamp=now.isoformat(), source_trust=0.9),
+        {"content": "no vector"},
+        _mk_mem([0.0, 0.0, 0.0], timestamp=now.isoformat()),
+    ]
+    selected = [mems[0]]
+    batch = ms.score_batch(mems, qv, selected=selected, now_fn=lambda: now, k=3)
+    for m, s, c in zip(mems, batch.scores, batch.components):
+        s1, c1 = composite_score(m, qv, selected=selected, now_fn=lambda: now)
+        assert math.isclose(s, s1, abs_tol=1e-12)
+        assert c.keys() == c1.keys()
+    assert batch.scores[3] == 0.0
+    assert batch.selected == mmr_select(mems, qv, k=3)
+    assert 3 not in batch.selected
+
+    monkeypatch.setattr(ms, "np", None)
+    plain = ms.score_batch(mems, qv, selected=selected, now_fn=lambda: now, k=3)
+    assert plain.selected == batch.selected
+    assert all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(plain.scores, batch.scores))
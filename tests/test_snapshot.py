@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+import importlib
 import json
 import os
 from pathlib import Path
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _signals_in_tmp(tmp_path, monkeypatch):
+    # Keep cockpit signals out of the repo's axiom_boot/
+    reporter = importlib.import_module("pods.cockpit.cockpit_reporter")
+    signals = tmp_path / "signals"
+    signals.mkdir()
+    monkeypatch.setenv("COCKPIT_SIGNAL_DIR", str(signals))
+    monkeypatch.setattr(reporter, "SIGNAL_DIR", signals)
+
 
 class _DummyQdrantClient:
     def __init__(self):
@@ -31,7 +44,6 @@ def test_take_snapshot_writes_metadata(tmp_path, monkeypatch):
     monkeypatch.setenv("QDRANT_SNAPSHOT_DIR", str(tmp_path))
     monkeypatch.setenv("QDRANT_SNAPSHOT_KEEP", "7")
     monkeypatch.setenv("QDRANT_URL", "http://localhost:6333")
-    monkeypatch.setenv("COCKPIT_SIGNAL_DIR", str(tmp_path / "signals"))
     monkeypatch.setattr("lifecycle.snapshot.make_qdrant_client", _mk, raising=False)
     monkeypatch.setattr("lifecycle.snapshot._make_client", lambda: _DummyQdrantClient())
 
@@ -55,3 +67,115 @@ def test_prune_snapshots_respects_keep(tmp_path):
     assert out["kept"] == 2
     assert len(list(tmp_path.glob("*.tar.gz"))) == 2
 
+
+
+class _MemClient:
+    """Scrollable in-memory collection: {id: (payload, vector)}."""
+
+    def __init__(self, points=None):
+        self.points = dict(points or {})
+        self.upserts = []
+
+    def scroll(self, collection_name: str, offset=None, limit=1000, with_payload=True, with_vectors=True):
+        ids = sorted(self.points)
+        start = offset or 0
+        page = [
+            type("P", (), {"id": i, "payload": self.points[i][0], "vector": self.points[i][1]})()
+            for i in ids[start : start + limit]
+        ]
+        return page, (start + limit if start + limit < len(ids) else None)
+
+    def upsert(self, collection_name: str, points):
+        self.upserts.append(len(points))
+        for p in points:
+            self.points[p["id"]] = (p["payload"], p["vector"])
+
+    def delete(self, collection_name: str, points_selector):
+        for i in points_selector:
+            self.points.pop(i, None)
+
+
+def _packed_env(monkeypatch, client):
+    import lifecycle.snapshot as snap
+
+    monkeypatch.setattr(snap, "QDRANT_SNAPSHOT_ENABLED", True)
+    monkeypatch.setattr(snap, "QDRANT_SNAPSHOT_CHUNK_POINTS", 4)
+    monkeypatch.setattr(snap, "QDRANT_RESTORE_BATCH", 3)
+    monkeypatch.setattr(snap, "_make_client", lambda: client)
+    monkeypatch.setattr(snap, "_collection_names", lambda c: ["mem"])
+    monkeypatch.setattr(snap, "_cockpit_signal", lambda *a, **k: None)
+    return snap
+
+
+def test_packed_incremental_snapshot_restores_chain(tmp_path, monkeypatch):
+    src = _MemClient({i: ({"n": i, "updated_at": f"2024-01-01T00:00:{i:02d}"}, [i / 8.0, 0.5, -1.0]) for i in range(10)})
+    snap = _packed_env(monkeypatch, src)
+
+    full = snap.take_snapshot(str(tmp_path), fmt="packed", workers=3)
+    art = full["artifacts"][0]
+    assert art["kind"] == "full" and art["points"] == 10
+    manifest = json.loads((Path(art["path"]) / "manifest.json").read_text())
+    assert [c["count"] for c in manifest["chunks"]] == [4, 4, 2]
+    assert (Path(art["path"]) / "chunk-000001.f32").stat().st_size == 4 * 3 * 4
+
+    src.points[3] = ({"n": 33, "updated_at": "2024-02-01T00:00:00"}, [1.0, 1.0, 1.0])
+    src.points[10] = ({"n": 10, "updated_at": "2024-02-01T00:00:01"}, {"text": [0.25]})
+    delta = snap.take_snapshot(str(tmp_path), fmt="packed", incremental=True)["artifacts"][0]
+    assert delta["kind"] == "incremental" and delta["points"] == 2
+
+    dst = _MemClient()
+    monkeypatch.setattr(snap, "_make_client", lambda: dst)
+    res = snap.restore_snapshot(delta["path"])
+    assert res["restored_to"] == "mem" and res["points"] == 12 and res["chunks_verified"] == 4
+    assert res["chain"] == [Path(art["path"]).name, Path(delta["path"]).name]
+    assert dst.points == src.points
+    assert max(dst.upserts) == 3
+
+    # Pruning to one snapshot keeps the full snapshot the delta depends on
+    assert snap.prune_snapshots(str(tmp_path), keep=1) == {"deleted": 0, "kept": 2}
+
+
+def test_packed_restore_rejects_corrupt_chunk(tmp_path, monkeypatch):
+    import pytest
+
+    src = _MemClient({i: ({"n": i}, [float(i), 1.0]) for i in range(5)})
+    snap = _packed_env(monkeypatch, src)
+    path = Path(snap.take_snapshot(str(tmp_path), fmt="packed")["artifacts"][0]["path"])
+    with open(path / "chunk-000002.f32", "r+b") as f:
+        f.write(b"\x00\x00\x80\x7f")
+
+    monkeypatch.setattr(snap, "_make_client", lambda: _MemClient())
+    with pytest.raises(RuntimeError, match="checksum_mismatch"):
+        snap.restore_snapshot(str(path))
+
+
+def test_packed_incremental_records_tombstones(tmp_path, monkeypatch):
+    src = _MemClient({i: ({"updated_at": f"2024-01-01T00:00:{i:02d}"}, [float(i), 1.0]) for i in range(6)})
+    snap = _packed_env(monkeypatch, src)
+    snap.take_snapshot(str(tmp_path), fmt="packed")
+
+    del src.points[2], src.points[4]
+    delta = snap.take_snapshot(str(tmp_path), fmt="packed", incremental=True)["artifacts"][0]
+    assert delta["kind"] == "incremental" and delta["points"] == 0 and delta["deleted"] == 2
+
+    dst = _MemClient({99: ({}, [0.0, 0.0])})
+    monkeypatch.setattr(snap, "_make_client", lambda: dst)
+    res = snap.restore_snapshot(delta["path"])
+    assert res["deleted"] == 2
+    assert dst.points == {**src.points, 99: ({}, [0.0, 0.0])}
+
+
+def test_packed_chain_is_capped_so_prune_bounds_disk(tmp_path, monkeypatch):
+    src = _MemClient({0: ({"updated_at": 0}, [0.0])})
+    snap = _packed_env(monkeypatch, src)
+    monkeypatch.setattr(snap, "QDRANT_SNAPSHOT_MAX_CHAIN", 10)
+    kinds = []
+    for n in range(1, 8):
+        src.points[n] = ({"updated_at": n}, [float(n)])
+        art = snap.take_snapshot(str(tmp_path), fmt="packed", incremental=True, keep=3)["artifacts"][0]
+        kinds.append(art["kind"])
+    assert kinds == ["full", "incremental", "incremental", "full", "incremental", "incremental", "full"]
+
+    # Newest three plus the full snapshot they depend on; the first chain is released
+    assert snap.prune_snapshots(str(tmp_path), keep=3) == {"deleted": 3, "kept": 4}
+    assert len(list(tmp_path.glob("*.axsnap"))) == 4
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sys
+import types
+
+from vector.unified_client import UnifiedVectorClient
+
+
+def _client(monkeypatch, fake_qdrant, env_extra=None):
+    env = {"VECTOR_PATH": "qdrant", "AXIOM_VECTOR_EMBED_BATCH": "3", "AXIOM_VECTOR_UPSERT_BATCH": "2"}
+    env.update(env_extra or {})
+    mod = types.ModuleType("axiom_qdrant_client")
+    mod.QdrantClient = lambda *a, **k: fake_qdrant
+    monkeypatch.setitem(sys.modules, "axiom_qdrant_client", mod)
+    client = UnifiedVectorClient(env)
+    client._jittered_sleep = lambda attempt: None  # type: ignore
+    return client
+
+
+class _BatchEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.0] for t in texts]
+
+
+def test_insert_embeds_in_chunks_and_upserts_in_batches(monkeypatch):
+    batches = []
+
+    class FakeQdrant:
+        def upsert_memories(self, collection_name, points):
+            batches.append([pid for pid, _, _ in points])
+            return True
+
+    client = _client(monkeypatch, FakeQdrant())
+    emb = _BatchEmbedder()
+    client._embedder = emb
+
+    items = [{"content": f"item {i}", "metadata": {"memory_id": f"m{i}"}} for i in range(5)]
+    items.insert(2, {"content": "   ", "metadata": {"memory_id": "blank"}})
+    out = client.insert(items)
+
+    assert out == {"inserted": 5}
+    assert [len(c) for c in emb.calls] == [3, 2]
+    assert batches == [["m0", "m1"], ["m2", "m3"], ["m4"]]
+
+
+def test_insert_retries_per_batch_and_reports_partial_failure(monkeypatch):
+    attempts = {}
+
+    class FlakyQdrant:
+        def upsert_memories(self, collection_name, points):
+            key = points[0][0]
+            attempts[key] = attempts.get(key, 0) + 1
+            if key == "m2":
+                raise RuntimeError("boom")
+            if key == "m0" and attempts[key] == 1:
+                raise RuntimeError("transient")
+            return True
+
+    client = _client(monkeypatch, FlakyQdrant())
+    client._embedder = _BatchEmbedder()
+
+    items = [{"content": f"item {i}", "metadata": {"memory_id": f"m{i}"}} for i in range(5)]
+    out = client.insert(items)
+
+    assert out["inserted"] == 3
+    assert out["failed"] == 2
+    assert [e["id"] for e in out["errors"]] == ["m2", "m3"]
+    assert attempts == {"m0": 2, "m2": client._retry_attempts, "m4": 1}
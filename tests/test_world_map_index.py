@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pods.memory.world_map_index import WorldMapIndex, file_signature
+from pods.memory.world_map_write import apply_ops_in_memory, atomic_write_world_map
+
+
+def _world_map():
+    return {
+        "entities": [
+            {"id": "example_person", "alias": "EP", "wife_name": "Old"},
+            {"id": "axiom", "aliases": ["Ax", "the agent"]},
+            {"id": "acme"},
+        ],
+        "relationships": [
+            {"id": "r3", "source": "example_person", "target": "acme", "type": "works_at"},
+            {"id": "r1", "source": "example_person", "target": "axiom", "type": "creator"},
+            {"id": "r2", "source": "axiom", "target": "example_person", "type": "assists"},
+            {"id": "r4", "source": "axiom", "target": "axiom", "type": "reflects"},
+        ],
+    }
+
+
+def test_lookups_and_sorted_views():
+    idx = WorldMapIndex(_world_map())
+    assert idx.get_entity("axiom")["id"] == "axiom"
+    assert idx.get_entity("ep")["id"] == "example_person"
+    assert idx.get_entity("THE AGENT")["id"] == "axiom"
+    assert idx.get_entity("missing") is None
+
+    ids = lambda rels: [r["id"] for r in rels]
+    assert ids(idx.relationships("example_person", "out")) == ["r1", "r3"]
+    assert ids(idx.relationships("example_person", "in")) == ["r2"]
+    assert ids(idx.relationships("example_person", "any")) == ["r2", "r1", "r3"]
+    assert ids(idx.relationships("axiom", "any")) == ["r2", "r1", "r4"]
+    assert ids(idx.relationships("example_person", "any", rel_type="works_at")) == ["r3"]
+    assert sorted(idx.adjacency("axiom", "out")) == ["assists", "reflects"]
+    # Views are computed once and reused
+    assert idx.relationships("axiom", "any") is idx.relationships("axiom", "any")
+
+
+def test_dict_shaped_sections():
+    idx = WorldMapIndex(
+        {
+            "entities": {"a": {"name": "A"}, "b": {"name": "B"}},
+            "relationships": {"ab": {"source": "a", "target": "b", "type": "knows"}},
+        }
+    )
+    assert idx.get_entity("a") == {"name": "A", "id": "a"}
+    assert [r["id"] for r in idx.relationships("b", "in")] == ["ab"]
+    assert (idx.entities_count, idx.relationships_count) == (2, 1)
+
+
+def test_entity_ops_apply_incrementally(tmp_path):
+    path = tmp_path / "world_map.json"
+    obj = _world_map()
+    path.write_text(json.dumps(obj))
+    idx = WorldMapIndex(obj, signature=file_signature(str(path)))
+    view = idx.relationships("example_person", "any")
+
+    new_obj, ent, changed = idx.apply_entity_ops(
+        "EP",
+        [{"op": "replace", "path": "/wife_name", "value": "New"}, {"op": "replace", "path": "/alias", "value": "Kay"}],
+        apply_ops_in_memory,
+    )
+    assert changed == ["alias", "wife_name"]
+    # Nothing live changes until the write is committed
+    assert obj["entities"][0]["wife_name"] == "Old" and idx.get_entity("ep")["wife_name"] == "Old"
+
+    atomic_write_world_map(world_map_path=str(path), new_obj=new_obj)
+    sig = file_signature(str(path))
+    assert sig != idx.signature
+    idx.replace_entity(ent["id"], ent, new_obj, signature=sig)
+    assert idx.get_entity("kay")["wife_name"] == "New"
+    assert idx.get_entity("ep") is None
+    assert idx.signature == sig
+    assert idx.relationships("example_person", "any") is view
+    assert json.loads(path.read_text())["entities"][0]["wife_name"] == "New"
+
+
+def test_failed_entity_ops_leave_index_untouched():
+    obj = _world_map()
+    obj["entities"][0]["worked_at"] = ["A"]
+    idx = WorldMapIndex(obj)
+
+    with pytest.raises(ValueError, match="invalid_op"):
+        idx.apply_entity_ops(
+            "example_person",
+            [{"op": "add", "path": "/worked_at", "value": "B"}, {"op": "bogus", "path": "/alias", "value": "x"}],
+            apply_ops_in_memory,
+        )
+    assert idx.get_entity("example_person")["worked_at"] == ["A"]
+    assert obj["entities"][0]["worked_at"] == ["A"]
+
+    # A successful apply that is never committed must not leak either
+    idx.apply_entity_ops("example_person", [{"op": "add", "path": "/worked_at", "value": "C"}], apply_ops_in_memory)
+    assert obj["entities"][0]["worked_at"] == ["A"]
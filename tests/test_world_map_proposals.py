@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta
+
+
+def _rec(pid, entity="ExamplePerson", status="pending", ts=None):
+    return {"proposal_id": pid, "ts": ts or datetime.utcnow().isoformat() + "Z", "entity_id": entity, "ops": [], "status": status, "applied_ts": None, "error": None}
+
+
+def test_updates_append_and_pending_pages_by_status(tmp_path):
+    from services.memory.world_map_proposals import ProposalStore
+
+    path = tmp_path / "proposals.jsonl"
+    store = ProposalStore(str(path), compact_min=10_000)
+    for i in range(6):
+        store.add(_rec(f"p{i}", entity="a" if i % 2 else "b"))
+    size = path.stat().st_size
+
+    merged = store.update("p1", {"status": "applied", "applied_ts": "2024-01-01T00:00:00Z"})
+    assert merged["status"] == "applied" and merged["entity_id"] == "a"
+    lines = path.read_text().splitlines()
+    # Status change is one appended line; earlier bytes are untouched
+    assert len(lines) == 7 and path.stat().st_size > size and json.loads(lines[-1])["_op"] == "set"
+    assert store.update("missing", {"status": "applied"}) is None
+
+    page, cursor = store.list("pending", limit=2)
+    assert [r["proposal_id"] for r in page] == ["p4", "p5"] and cursor == "p4"
+    page, cursor = store.list("pending", limit=2, before=cursor)
+    assert [r["proposal_id"] for r in page] == ["p2", "p3"] and cursor == "p2"
+    page, cursor = store.list("pending", limit=2, before=cursor)
+    assert [r["proposal_id"] for r in page] == ["p0"] and cursor is None
+    assert [r["proposal_id"] for r in store.list("applied")[0]] == ["p1"]
+    assert [r["proposal_id"] for r in store.list("pending", entity_id="a")[0]] == ["p3", "p5"]
+
+    # A second process (fresh index) sees the same state, including the legacy full-record format
+    with open(path, "a") as fh:
+        fh.write(json.dumps(_rec("legacy", status="rejected")) + "\n")
+    other = ProposalStore(str(path))
+    assert other.get("p1")["status"] == "applied"
+    assert other.counts() == {"pending": 5, "applied": 1, "rejected": 1}
+    # ...and the first store picks up the appended tail
+    assert store.get("legacy")["status"] == "rejected"
+
+
+def test_compaction_folds_updates_and_archives_old_settled(tmp_path):
+    from services.memory.world_map_proposals import ProposalStore
+
+    path = tmp_path / "proposals.jsonl"
+    old = (datetime.utcnow() - timedelta(days=90)).isoformat() + "Z"
+    with open(path, "w") as fh:
+        fh.write(json.dumps({**_rec("old", status="applied", ts=old), "applied_ts": old}) + "\n")
+    store = ProposalStore(str(path), retention_days=30, compact_min=2, background=False)
+    store.add(_rec("keep"))
+    store.add(_rec("done"))
+    store.update("done", {"status": "rejected", "error": "x"})
+    assert len(path.read_text().splitlines()) == 4
+
+    store.update("keep", {"confidence": 0.9})  # second status line triggers compaction
+    lines = [json.loads(x) for x in path.read_text().splitlines()]
+    assert [r["proposal_id"] for r in lines] == ["keep", "done"]
+    assert all("_op" not in r for r in lines) and lines[0]["confidence"] == 0.9 and lines[1]["status"] == "rejected"
+    archived = [json.loads(x) for x in open(str(path) + ".archive.jsonl")]
+    assert [r["proposal_id"] for r in archived] == ["old"]
+
+    assert store.get("old") is None and store.get("done")["error"] == "x"
+    store.add(_rec("after"))
+    assert [r["proposal_id"] for r in store.list("pending")[0]] == ["keep", "after"]
+    assert not os.path.exists(str(path) + ".compact.tmp")